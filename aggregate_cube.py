@@ -0,0 +1,127 @@
+"""
+Aggregate cube over card attributes.
+Sends are summarized per occasion x design style x color x typography cell (count, sum,
+max and the card holding the max); every coarser view is a rollup of those cells.
+"""
+
+from typing import Iterable, List
+
+import pandas as pd
+
+DIMENSIONS = ["occasion", "design_style", "color", "typography_style"]
+CARD_DIMENSIONS = ["occasion", "design_style", "typography_style"]
+STATS = ["count", "sum", "max", "argmax"]
+
+
+def card_frame(cards: Iterable[dict]) -> pd.DataFrame:
+    """
+    One row per card with its sends, attribute values and list of colors.
+    Cards are CardTable records, whose values were normalized at ingest; missing values become "".
+    """
+    rows = []
+    for card in cards:
+        colors = card.get("primary_colors", [])
+        rows.append({
+            "card_id": card.get("card_id"),
+            "card_name": card.get("card_name", ""),
+            "sends": card.get("sends_current", 0) or 0,
+            "occasion": card.get("occasion") or "",
+            "design_style": card.get("design_style") or "",
+            "typography_style": card.get("typography_style") or "",
+            "colors": [c for c in colors if c] if isinstance(colors, list) else [],
+        })
+    return pd.DataFrame(rows, columns=["card_id", "card_name", "sends", *CARD_DIMENSIONS, "colors"])
+
+
+def aggregate(facts: pd.DataFrame, dims: List[str]) -> pd.DataFrame:
+    """Count/sum/max of sends per cell plus the card ID with the max (first card on ties)."""
+    facts = facts.reset_index(drop=True)
+    grouped = facts.groupby(dims, sort=False)["sends"]
+    cells = grouped.agg(["count", "sum", "max"])
+    cells["argmax"] = facts.loc[grouped.idxmax(), "card_id"].to_numpy()
+    return cells
+
+
+def merge_cells(cells: pd.DataFrame, dims: List[str]) -> pd.DataFrame:
+    """Combine cells that share the same values for dims (a rollup, or merging an incremental update)."""
+    cells = cells.reset_index()
+    grouped = cells.groupby(dims, sort=False)
+    merged = grouped.agg(count=("count", "sum"), sum=("sum", "sum"), max=("max", "max"))
+    merged["argmax"] = cells.loc[grouped["max"].idxmax(), "argmax"].to_numpy()
+    return merged
+
+
+def combine_cells(existing: pd.DataFrame, new: pd.DataFrame, dims: List[str]) -> pd.DataFrame:
+    """Merge newly aggregated cells into existing ones."""
+    if existing.empty:
+        return new
+    if new.empty:
+        return existing
+    return merge_cells(pd.concat([existing, new]), dims)
+
+
+class AggregateCube:
+    """
+    Cached cell statistics over card attributes.
+
+    Colors are multi-valued, so two sets of cells are kept: card_cells (each card
+    counted once, color rolled up) and color_cells (each card counted once per
+    color). slice() picks whichever one the requested dimensions need.
+    """
+
+    def __init__(self):
+        self.cards = card_frame([])
+        self.card_cells = pd.DataFrame(columns=STATS)
+        self.color_cells = pd.DataFrame(columns=STATS)
+        self.card_names = {}
+
+    @classmethod
+    def from_cards(cls, cards: Iterable[dict]) -> "AggregateCube":
+        """Build a cube from CardTable records."""
+        cube = cls()
+        cube.add_cards(cards)
+        return cube
+
+    def add_cards(self, cards: Iterable[dict]) -> int:
+        """
+        Fold new cards into the existing cells without rebuilding them.
+        Cards already in the cube are skipped. Returns the number of cards added.
+        """
+        new = card_frame(cards)
+        new = new[~new["card_id"].isin(self.cards["card_id"])].drop_duplicates("card_id", keep="last")
+        if new.empty:
+            return 0
+
+        color_facts = new.explode("colors").rename(columns={"colors": "color"})
+        color_facts = color_facts[color_facts["color"].notna() & (color_facts["color"] != "")]
+
+        card_cells = aggregate(new, CARD_DIMENSIONS)
+        color_cells = aggregate(color_facts, DIMENSIONS) if not color_facts.empty else pd.DataFrame(columns=STATS)
+
+        self.card_cells = combine_cells(self.card_cells, card_cells, CARD_DIMENSIONS)
+        self.color_cells = combine_cells(self.color_cells, color_cells, DIMENSIONS)
+
+        self.cards = pd.concat([self.cards, new], ignore_index=True)
+        self.card_names.update(zip(new["card_id"], new["card_name"]))
+        return len(new)
+
+    def slice(self, dims: List[str]) -> pd.DataFrame:
+        """
+        Roll the cube up to the given dimensions, dropping cells where any of them is blank.
+        Returns a DataFrame indexed by dims with count, sum, max, argmax and mean columns.
+        """
+        cells = self.color_cells if "color" in dims else self.card_cells
+        if cells.empty:
+            return pd.DataFrame(columns=STATS + ["mean"])
+
+        cells = merge_cells(cells, dims)
+        keep = pd.Series(True, index=cells.index)
+        for dim in dims:
+            keep &= cells.index.get_level_values(dim) != ""
+        cells = cells[keep.to_numpy()].copy()
+        cells["mean"] = cells["sum"] / cells["count"]
+        return cells
+
+    def card_name(self, card_id) -> str:
+        """Card name for an argmax card ID."""
+        return self.card_names.get(card_id, "")
@@ -5,13 +5,31 @@ An editorial-style dashboard showcasing greeting card performance with magazine
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
+import io
 import json
 import base64
 import random
+import importlib.util
 from pathlib import Path
+from types import MappingProxyType
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from search_index import CardSearchIndex, TextSearchIndex
+from aggregate_cube import AggregateCube
+from color_matrix import ColorCooccurrence
+from card_model import CardRecord, CardTable
+from vocabulary import KNOWN_ARTISTS_LOWER, TITLE_SKIP_WORDS, chart_color, normalize_color, swatch_css
+from chart_configs import FigureCache, create_time_series_chart, create_trend_sparkline
+import trend_scoring
+from trend_scoring import CategoryScoreMatrix, TrendScoreCache, aggregate_portfolio_trends
+import timeseries_store
+import resampling
+import sprite_sheets
+import image_store
+from image_store import ImageCatalog, ImageStore
+import dashboard_styles
 
 # Page configuration
 st.set_page_config(
@@ -24,923 +42,35 @@ st.set_page_config(
 # =============================================================================
 # CUSTOM CSS - EDITORIAL MAGAZINE AESTHETIC
 # =============================================================================
-st.markdown("""
-<style>
-    /* Import Google Fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Playfair+Display:ital,wght@0,400;0,500;0,600;0,700;0,800;1,400;1,500&family=Source+Sans+3:ital,wght@0,300;0,400;0,500;0,600;0,700;1,400&display=swap');
-
-    /* ===========================================
-       HIDE STREAMLIT DEFAULT ELEMENTS
-    =========================================== */
-    #MainMenu {visibility: hidden !important;}
-    footer {visibility: hidden !important;}
-    header {visibility: hidden !important;}
-    .stDeployButton {display: none !important;}
-    [data-testid="stToolbar"] {display: none !important;}
-    [data-testid="stDecoration"] {display: none !important;}
-    [data-testid="stStatusWidget"] {display: none !important;}
-    .viewerBadge_container__r5tak {display: none !important;}
-    .styles_viewerBadge__CvC9N {display: none !important;}
-
-    /* ===========================================
-       BASE STYLES
-    =========================================== */
-    :root {
-        --cream: #FDFBF7;
-        --cream-dark: #F5F2EC;
-        --terracotta: #C65D3B;
-        --terracotta-light: #D4785C;
-        --terracotta-dark: #A84D2E;
-        --charcoal: #2D2A26;
-        --charcoal-light: #4A4641;
-        --gray: #8B8680;
-        --gray-light: #B8B4AE;
-        --white: #FFFFFF;
-    }
-
-    html, body, [data-testid="stAppViewContainer"] {
-        background-color: var(--cream) !important;
-        font-family: 'Source Sans 3', -apple-system, BlinkMacSystemFont, sans-serif;
-        color: var(--charcoal);
-    }
-
-    [data-testid="stAppViewContainer"] > .main {
-        background-color: var(--cream);
-    }
-
-    .main .block-container {
-        padding: 0 !important;
-        max-width: 100% !important;
-    }
-
-    /* ===========================================
-       CUSTOM SCROLLBAR
-    =========================================== */
-    ::-webkit-scrollbar {
-        width: 8px;
-        height: 8px;
-    }
-
-    ::-webkit-scrollbar-track {
-        background: var(--cream-dark);
-    }
-
-    ::-webkit-scrollbar-thumb {
-        background: var(--gray-light);
-        border-radius: 4px;
-    }
-
-    ::-webkit-scrollbar-thumb:hover {
-        background: var(--gray);
-    }
-
-    /* ===========================================
-       TYPOGRAPHY
-    =========================================== */
-    h1, h2, h3, h4, h5, h6 {
-        font-family: 'Playfair Display', Georgia, serif !important;
-        color: var(--charcoal);
-        font-weight: 600 !important;
-    }
-
-    p, span, div, label {
-        font-family: 'Source Sans 3', sans-serif;
-    }
-
-    /* ===========================================
-       HERO SECTION
-    =========================================== */
-    .hero-section {
-        background: linear-gradient(135deg, var(--cream) 0%, var(--cream-dark) 100%);
-        padding: 4rem 5%;
-        margin-bottom: 3rem;
-        border-bottom: 1px solid rgba(45, 42, 38, 0.1);
-        position: relative;
-        overflow: hidden;
-    }
-
-    .hero-section::before {
-        content: '';
-        position: absolute;
-        top: -50%;
-        right: -10%;
-        width: 500px;
-        height: 500px;
-        background: radial-gradient(circle, rgba(198, 93, 59, 0.08) 0%, transparent 70%);
-        border-radius: 50%;
-    }
-
-    .hero-section::after {
-        content: '';
-        position: absolute;
-        bottom: -30%;
-        left: -5%;
-        width: 300px;
-        height: 300px;
-        background: radial-gradient(circle, rgba(198, 93, 59, 0.05) 0%, transparent 70%);
-        border-radius: 50%;
-    }
-
-    .hero-masthead {
-        font-family: 'Playfair Display', Georgia, serif;
-        font-size: 0.85rem;
-        font-weight: 500;
-        letter-spacing: 3px;
-        text-transform: uppercase;
-        color: var(--terracotta);
-        margin-bottom: 1rem;
-    }
-
-    .hero-title {
-        font-family: 'Playfair Display', Georgia, serif;
-        font-size: 3.5rem;
-        font-weight: 700;
-        color: var(--charcoal);
-        margin: 0 0 1rem 0;
-        line-height: 1.1;
-        letter-spacing: -1px;
-    }
-
-    .hero-subtitle {
-        font-family: 'Source Sans 3', sans-serif;
-        font-size: 1.15rem;
-        color: var(--gray);
-        font-weight: 400;
-        max-width: 500px;
-        line-height: 1.6;
-    }
-
-    .hero-stats-container {
-        display: grid;
-        grid-template-columns: repeat(4, 1fr);
-        gap: 2rem;
-        margin-top: 3rem;
-        position: relative;
-        z-index: 1;
-    }
-
-    .hero-stat {
-        position: relative;
-        padding-left: 1.5rem;
-    }
-
-    .hero-stat::before {
-        content: '';
-        position: absolute;
-        left: 0;
-        top: 0;
-        height: 100%;
-        width: 2px;
-        background: linear-gradient(180deg, var(--terracotta) 0%, var(--terracotta-light) 100%);
-    }
-
-    .hero-stat-value {
-        font-family: 'Playfair Display', Georgia, serif;
-        font-size: 2.5rem;
-        font-weight: 700;
-        color: var(--charcoal);
-        line-height: 1;
-        margin-bottom: 0.5rem;
-    }
-
-    .hero-stat-label {
-        font-family: 'Source Sans 3', sans-serif;
-        font-size: 0.85rem;
-        color: var(--gray);
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        font-weight: 500;
-    }
-
-    /* ===========================================
-       SIDEBAR STYLES
-    =========================================== */
-    [data-testid="stSidebar"] {
-        background-color: var(--white) !important;
-        border-right: 1px solid rgba(45, 42, 38, 0.08);
-        min-width: 300px !important;
-        width: 300px !important;
-        transform: none !important;
-    }
-
-    /* Hide sidebar completely */
-    [data-testid="stSidebar"] {
-        display: none !important;
-    }
-
-    [data-testid="stSidebarCollapsedControl"] {
-        display: none !important;
-    }
-
-    .sidebar-subtitle {
-        font-family: 'Source Sans 3', sans-serif;
-        font-size: 0.85rem;
-        color: var(--gray);
-        margin-bottom: 2rem;
-    }
-
-    .sidebar-section-title {
-        font-family: 'Source Sans 3', sans-serif;
-        font-size: 0.7rem;
-        font-weight: 600;
-        text-transform: uppercase;
-        letter-spacing: 1.5px;
-        color: var(--gray);
-        margin: 1.5rem 0 0.75rem 0;
-    }
-
-    /* Custom select boxes */
-    [data-testid="stSidebar"] .stSelectbox > div > div {
-        background-color: var(--cream) !important;
-        border: 1px solid rgba(45, 42, 38, 0.15) !important;
-        border-radius: 8px !important;
-        font-family: 'Source Sans 3', sans-serif !important;
-        transition: all 0.2s ease !important;
-    }
-
-    [data-testid="stSidebar"] .stSelectbox > div > div:hover {
-        border-color: var(--terracotta) !important;
-    }
-
-    [data-testid="stSidebar"] .stSelectbox > div > div:focus-within {
-        border-color: var(--terracotta) !important;
-        box-shadow: 0 0 0 2px rgba(198, 93, 59, 0.15) !important;
-    }
-
-    /* Custom text input */
-    [data-testid="stSidebar"] .stTextInput > div > div > input {
-        background-color: var(--cream) !important;
-        border: 1px solid rgba(45, 42, 38, 0.15) !important;
-        border-radius: 8px !important;
-        font-family: 'Source Sans 3', sans-serif !important;
-        padding: 0.6rem 1rem !important;
-        transition: all 0.2s ease !important;
-    }
-
-    [data-testid="stSidebar"] .stTextInput > div > div > input:focus {
-        border-color: var(--terracotta) !important;
-        box-shadow: 0 0 0 2px rgba(198, 93, 59, 0.15) !important;
-    }
-
-    [data-testid="stSidebar"] .stTextInput > div > div > input::placeholder {
-        color: var(--gray-light) !important;
-    }
-
-    /* Custom slider */
-    [data-testid="stSidebar"] .stSlider > div > div > div > div {
-        background-color: var(--terracotta) !important;
-    }
-
-    [data-testid="stSidebar"] .stSlider [data-baseweb="slider"] > div:first-child {
-        background: linear-gradient(to right, var(--cream-dark), var(--cream-dark)) !important;
-    }
-
-    /* ===========================================
-       SECTION STYLES
-    =========================================== */
-    .section-container {
-        padding: 0 5% 4rem 5%;
-    }
-
-    .section-header {
-        display: flex;
-        align-items: baseline;
-        margin-bottom: 2rem;
-        gap: 1rem;
-    }
-
-    .section-title {
-        font-family: 'Playfair Display', Georgia, serif;
-        font-size: 1.8rem;
-        font-weight: 600;
-        color: var(--charcoal);
-        margin: 0;
-    }
-
-    .section-number {
-        font-family: 'Playfair Display', Georgia, serif;
-        font-size: 0.9rem;
-        color: var(--terracotta);
-        font-weight: 500;
-    }
-
-    .section-line {
-        flex-grow: 1;
-        height: 1px;
-        background: linear-gradient(90deg, rgba(45, 42, 38, 0.2) 0%, transparent 100%);
-        margin-left: 1rem;
-    }
-
-    /* ===========================================
-       CHART CONTAINER STYLES
-    =========================================== */
-    .chart-container {
-        background: var(--white);
-        border-radius: 12px;
-        padding: 2rem;
-        box-shadow: 0 4px 20px rgba(45, 42, 38, 0.06);
-        border: 1px solid rgba(45, 42, 38, 0.06);
-        transition: all 0.3s ease;
-    }
-
-    .chart-container:hover {
-        box-shadow: 0 8px 30px rgba(45, 42, 38, 0.1);
-    }
-
-    .chart-title {
-        font-family: 'Playfair Display', Georgia, serif;
-        font-size: 1.25rem;
-        font-weight: 600;
-        color: var(--charcoal);
-        margin-bottom: 0.5rem;
-    }
-
-    .chart-subtitle {
-        font-family: 'Source Sans 3', sans-serif;
-        font-size: 0.85rem;
-        color: var(--gray);
-        margin-bottom: 1.5rem;
-    }
-
-    /* ===========================================
-       CARD GALLERY STYLES
-    =========================================== */
-    .gallery-grid {
-        display: grid;
-        grid-template-columns: repeat(5, 1fr);
-        gap: 1.5rem;
-    }
-
-    .card-item {
-        background: var(--white);
-        border-radius: 10px;
-        overflow: hidden;
-        box-shadow: 0 4px 20px rgba(45, 42, 38, 0.06);
-        border: 1px solid rgba(45, 42, 38, 0.06);
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-        cursor: pointer;
-        position: relative;
-        display: flex;
-        flex-direction: column;
-        height: 100%;
-    }
-
-    .card-item:hover {
-        transform: translateY(-6px);
-        box-shadow: 0 16px 32px rgba(45, 42, 38, 0.12);
-    }
-
-    .card-image-container {
-        position: relative;
-        overflow: hidden;
-        aspect-ratio: 4/5;
-        background: var(--cream-dark);
-        flex-shrink: 0;
-    }
-
-    .card-image-container img {
-        width: 100%;
-        height: 100%;
-        object-fit: cover;
-        transition: transform 0.5s cubic-bezier(0.4, 0, 0.2, 1);
-    }
-
-    .card-item:hover .card-image-container img {
-        transform: scale(1.05);
-    }
-
-    .card-rank-badge {
-        position: absolute;
-        top: 0.6rem;
-        left: 0.6rem;
-        background: var(--white);
-        color: var(--charcoal);
-        font-family: 'Playfair Display', Georgia, serif;
-        font-size: 0.75rem;
-        font-weight: 600;
-        padding: 0.3rem 0.6rem;
-        border-radius: 5px;
-        box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);
-        z-index: 2;
-    }
-
-    .card-occasion-tag {
-        position: absolute;
-        top: 0.6rem;
-        right: 0.6rem;
-        background: var(--terracotta);
-        color: var(--white);
-        font-family: 'Source Sans 3', sans-serif;
-        font-size: 0.6rem;
-        font-weight: 600;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-        padding: 0.25rem 0.5rem;
-        border-radius: 4px;
-        z-index: 2;
-    }
-
-    .card-info {
-        padding: 0.875rem 1rem 1rem;
-        display: flex;
-        flex-direction: column;
-        flex-grow: 1;
-    }
-
-    .card-title {
-        font-family: 'Playfair Display', Georgia, serif;
-        font-size: 0.85rem;
-        font-weight: 600;
-        color: var(--charcoal);
-        margin-bottom: 0.5rem;
-        line-height: 1.35;
-        height: 2.3em;
-        display: -webkit-box;
-        -webkit-line-clamp: 2;
-        -webkit-box-orient: vertical;
-        overflow: hidden;
-    }
-
-    .card-sends {
-        display: flex;
-        align-items: center;
-        gap: 0.4rem;
-        margin-top: auto;
-    }
-
-    .card-sends-value {
-        font-family: 'Source Sans 3', sans-serif;
-        font-size: 0.95rem;
-        font-weight: 600;
-        color: var(--terracotta);
-    }
-
-    .card-sends-label {
-        font-family: 'Source Sans 3', sans-serif;
-        font-size: 0.7rem;
-        color: var(--gray);
-    }
-
-    /* ===========================================
-       PAGINATION
-    =========================================== */
-    .pagination-container {
-        display: flex;
-        justify-content: center;
-        align-items: center;
-        gap: 0.5rem;
-        margin-top: 3rem;
-    }
-
-    .page-indicator {
-        font-family: 'Source Sans 3', sans-serif;
-        font-size: 0.9rem;
-        color: var(--gray);
-    }
-
-    /* ===========================================
-       BUTTON STYLES
-    =========================================== */
-    .stButton > button {
-        background: var(--terracotta) !important;
-        color: var(--white) !important;
-        border: none !important;
-        border-radius: 8px !important;
-        font-family: 'Source Sans 3', sans-serif !important;
-        font-weight: 500 !important;
-        padding: 0.6rem 1.5rem !important;
-        transition: all 0.3s ease !important;
-    }
-
-    .stButton > button:hover {
-        background: var(--terracotta-dark) !important;
-        transform: translateY(-1px);
-        box-shadow: 0 4px 12px rgba(198, 93, 59, 0.3) !important;
-    }
-
-    /* Secondary button style */
-    [data-testid="stSidebar"] .stButton > button {
-        background: transparent !important;
-        color: var(--charcoal) !important;
-        border: 1px solid rgba(45, 42, 38, 0.2) !important;
-    }
-
-    [data-testid="stSidebar"] .stButton > button:hover {
-        background: var(--cream) !important;
-        border-color: var(--terracotta) !important;
-        color: var(--terracotta) !important;
-        box-shadow: none !important;
-    }
-
-    /* ===========================================
-       FILTER STATUS BAR
-    =========================================== */
-    .filter-status {
-        background: var(--cream-dark);
-        padding: 1rem 5%;
-        margin-bottom: 2rem;
-        border-top: 1px solid rgba(45, 42, 38, 0.06);
-        border-bottom: 1px solid rgba(45, 42, 38, 0.06);
-    }
-
-    .filter-status-text {
-        font-family: 'Source Sans 3', sans-serif;
-        font-size: 0.9rem;
-        color: var(--gray);
-    }
-
-    .filter-status-count {
-        font-weight: 600;
-        color: var(--terracotta);
-    }
-
-    /* ===========================================
-       TABS STYLING
-    =========================================== */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 0;
-        background: transparent;
-        border-bottom: 1px solid rgba(45, 42, 38, 0.1);
-    }
-
-    .stTabs [data-baseweb="tab"] {
-        font-family: 'Source Sans 3', sans-serif !important;
-        font-weight: 500;
-        color: var(--gray);
-        padding: 1rem 2rem;
-        background: transparent;
-        border: none;
-        transition: all 0.2s ease;
-    }
-
-    .stTabs [data-baseweb="tab"]:hover {
-        color: var(--charcoal);
-    }
-
-    .stTabs [aria-selected="true"] {
-        color: var(--terracotta) !important;
-        border-bottom: 2px solid var(--terracotta) !important;
-        background: transparent !important;
-    }
-
-    .stTabs [data-baseweb="tab-highlight"] {
-        background-color: var(--terracotta) !important;
-    }
-
-    /* ===========================================
-       DATA TABLE
-    =========================================== */
-    .stDataFrame {
-        border-radius: 12px !important;
-        overflow: hidden;
-        box-shadow: 0 4px 20px rgba(45, 42, 38, 0.06);
-    }
-
-    .stDataFrame [data-testid="stDataFrameContainer"] {
-        background: var(--white);
-    }
-
-    /* ===========================================
-       EXPANDER STYLING
-    =========================================== */
-    .streamlit-expanderHeader {
-        font-family: 'Source Sans 3', sans-serif !important;
-        font-weight: 500 !important;
-        color: var(--charcoal) !important;
-        background: var(--cream) !important;
-        border-radius: 8px !important;
-    }
-
-    /* ===========================================
-       RESPONSIVE
-    =========================================== */
-    @media (max-width: 1400px) {
-        .gallery-grid {
-            grid-template-columns: repeat(4, 1fr);
-        }
-    }
-
-    @media (max-width: 1200px) {
-        .gallery-grid {
-            grid-template-columns: repeat(3, 1fr);
-        }
-
-        .hero-stats-container {
-            grid-template-columns: repeat(2, 1fr);
-        }
-    }
-
-    @media (max-width: 900px) {
-        .gallery-grid {
-            grid-template-columns: repeat(2, 1fr);
-        }
-    }
-
-    @media (max-width: 768px) {
-        .gallery-grid {
-            grid-template-columns: 1fr;
-        }
-
-        .hero-stats-container {
-            grid-template-columns: 1fr;
-        }
-
-        .hero-title {
-            font-size: 2.5rem;
-        }
-    }
-
-    /* ===========================================
-       NO IMAGE PLACEHOLDER
-    =========================================== */
-    .no-image-placeholder {
-        width: 100%;
-        height: 100%;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        background: linear-gradient(135deg, var(--cream-dark) 0%, var(--cream) 100%);
-        color: var(--gray-light);
-        font-family: 'Playfair Display', Georgia, serif;
-        font-size: 1rem;
-        font-style: italic;
-    }
+STYLESHEET_URL = "app/static/css"  # Served from ./static when server.enableStaticServing is on
+FONTS_URL = "app/static/fonts"
+SPRITE_URL = "app/static/sprites"
 
-    /* ===========================================
-       CARD COMPARISON TOOL STYLES
-    =========================================== */
-    .comparison-header {
-        text-align: center;
-        padding: 2rem 0;
-        margin-bottom: 1.5rem;
-    }
-
-    .comparison-header h2 {
-        font-family: 'Playfair Display', Georgia, serif;
-        font-size: 2rem;
-        color: var(--charcoal);
-        margin-bottom: 0.5rem;
-    }
-
-    .comparison-header p {
-        font-family: 'Source Sans 3', sans-serif;
-        color: var(--gray);
-        font-size: 1rem;
-    }
-
-    .comparison-card {
-        background: var(--white);
-        border-radius: 12px;
-        overflow: hidden;
-        box-shadow: 0 4px 20px rgba(45, 42, 38, 0.08);
-        border: 1px solid rgba(45, 42, 38, 0.06);
-        height: 100%;
-        transition: all 0.3s ease;
-    }
-
-    .comparison-card:hover {
-        box-shadow: 0 8px 30px rgba(45, 42, 38, 0.12);
-    }
-
-    .comparison-card-image {
-        width: 100%;
-        aspect-ratio: 4/5;
-        object-fit: cover;
-        border-bottom: 1px solid rgba(45, 42, 38, 0.06);
-    }
-
-    .comparison-card-body {
-        padding: 1.5rem;
-    }
-
-    .comparison-card-rank {
-        display: inline-block;
-        background: var(--terracotta);
-        color: white;
-        font-family: 'Playfair Display', Georgia, serif;
-        font-size: 0.9rem;
-        font-weight: 600;
-        padding: 0.3rem 0.8rem;
-        border-radius: 4px;
-        margin-bottom: 1rem;
-    }
-
-    .comparison-card-title {
-        font-family: 'Playfair Display', Georgia, serif;
-        font-size: 1.1rem;
-        font-weight: 600;
-        color: var(--charcoal);
-        margin-bottom: 1rem;
-        line-height: 1.4;
-    }
-
-    .comparison-stat {
-        display: flex;
-        justify-content: space-between;
-        padding: 0.6rem 0;
-        border-bottom: 1px solid rgba(45, 42, 38, 0.06);
-        font-family: 'Source Sans 3', sans-serif;
-    }
-
-    .comparison-stat:last-child {
-        border-bottom: none;
-    }
-
-    .comparison-stat-label {
-        color: var(--gray);
-        font-size: 0.85rem;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }
-
-    .comparison-stat-value {
-        color: var(--charcoal);
-        font-weight: 600;
-        font-size: 0.9rem;
-    }
-
-    .comparison-stat-value.positive {
-        color: #4CAF50;
-    }
-
-    .comparison-stat-value.negative {
-        color: #F44336;
-    }
-
-    .comparison-attribute {
-        margin-bottom: 1rem;
-    }
-
-    .comparison-attribute-label {
-        font-family: 'Source Sans 3', sans-serif;
-        font-size: 0.7rem;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        color: var(--gray);
-        margin-bottom: 0.4rem;
-    }
-
-    .comparison-attribute-value {
-        font-family: 'Source Sans 3', sans-serif;
-        font-size: 0.9rem;
-        color: var(--charcoal);
-        font-weight: 500;
-    }
-
-    .comparison-tags {
-        display: flex;
-        flex-wrap: wrap;
-        gap: 0.4rem;
-    }
-
-    .comparison-tag {
-        background: var(--cream-dark);
-        color: var(--charcoal);
-        font-family: 'Source Sans 3', sans-serif;
-        font-size: 0.75rem;
-        padding: 0.25rem 0.6rem;
-        border-radius: 4px;
-    }
-
-    .comparison-summary-box {
-        background: linear-gradient(135deg, var(--cream) 0%, var(--cream-dark) 100%);
-        border-radius: 12px;
-        padding: 2rem;
-        margin-top: 2rem;
-        border: 1px solid rgba(198, 93, 59, 0.15);
-    }
-
-    .comparison-summary-title {
-        font-family: 'Playfair Display', Georgia, serif;
-        font-size: 1.4rem;
-        color: var(--charcoal);
-        margin-bottom: 1.5rem;
-        display: flex;
-        align-items: center;
-        gap: 0.75rem;
-    }
-
-    .comparison-summary-title::before {
-        content: '';
-        display: inline-block;
-        width: 4px;
-        height: 24px;
-        background: var(--terracotta);
-        border-radius: 2px;
-    }
-
-    .comparison-summary-section {
-        margin-bottom: 1.5rem;
-    }
-
-    .comparison-summary-section:last-child {
-        margin-bottom: 0;
-    }
-
-    .comparison-summary-section h4 {
-        font-family: 'Source Sans 3', sans-serif;
-        font-size: 0.8rem;
-        text-transform: uppercase;
-        letter-spacing: 1.5px;
-        color: var(--terracotta);
-        margin-bottom: 0.75rem;
-        font-weight: 600;
-    }
-
-    .comparison-summary-section ul {
-        margin: 0;
-        padding-left: 1.25rem;
-    }
-
-    .comparison-summary-section li {
-        font-family: 'Source Sans 3', sans-serif;
-        font-size: 0.95rem;
-        color: var(--charcoal);
-        margin-bottom: 0.5rem;
-        line-height: 1.5;
-    }
-
-    .comparison-insight-card {
-        background: var(--white);
-        border-radius: 8px;
-        padding: 1.25rem;
-        border-left: 3px solid var(--terracotta);
-        margin-bottom: 1rem;
-    }
-
-    .comparison-insight-card h5 {
-        font-family: 'Playfair Display', Georgia, serif;
-        font-size: 1rem;
-        color: var(--charcoal);
-        margin-bottom: 0.5rem;
-        font-weight: 600;
-    }
-
-    .comparison-insight-card p {
-        font-family: 'Source Sans 3', sans-serif;
-        font-size: 0.9rem;
-        color: var(--gray);
-        line-height: 1.5;
-        margin: 0;
-    }
-
-    .color-swatch {
-        display: inline-block;
-        width: 16px;
-        height: 16px;
-        border-radius: 50%;
-        margin-right: 4px;
-        vertical-align: middle;
-        border: 1px solid rgba(0,0,0,0.1);
-    }
 
-    .empty-comparison-state {
-        text-align: center;
-        padding: 4rem 2rem;
-        background: var(--cream-dark);
-        border-radius: 12px;
-        margin: 2rem 0;
-    }
-
-    .empty-comparison-state h3 {
-        font-family: 'Playfair Display', Georgia, serif;
-        font-size: 1.5rem;
-        color: var(--charcoal);
-        margin-bottom: 1rem;
-    }
+@st.cache_resource(show_spinner=False)
+def load_stylesheet() -> str:
+    """Build the minified, content-hashed stylesheet once per process and return its file name."""
+    return dashboard_styles.build_stylesheet().name
 
-    .empty-comparison-state p {
-        font-family: 'Source Sans 3', sans-serif;
-        color: var(--gray);
-        font-size: 1rem;
-        max-width: 400px;
-        margin: 0 auto;
-    }
 
-    .comparison-no-image {
-        width: 100%;
-        aspect-ratio: 4/5;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        background: linear-gradient(135deg, var(--cream-dark) 0%, var(--cream) 100%);
-        color: var(--gray-light);
-        font-family: 'Playfair Display', Georgia, serif;
-        font-size: 0.9rem;
-        font-style: italic;
-        border-bottom: 1px solid rgba(45, 42, 38, 0.06);
-    }
+def inject_styles():
+    """
+    Load the dashboard stylesheet. With static serving enabled (.streamlit/config.toml) the page
+    only links the hashed file, which the browser fetches once and caches; otherwise the
+    minified CSS is inlined.
+    """
+    if st.get_option("server.enableStaticServing"):
+        try:
+            st.markdown(f'<link rel="stylesheet" href="{STYLESHEET_URL}/{load_stylesheet()}">', unsafe_allow_html=True)
+            return
+        except OSError:
+            pass  # Read-only deployment: inline instead
+    font_url = FONTS_URL if st.get_option("server.enableStaticServing") else None  # None: system fonts
+    inline_css = dashboard_styles.minify_css(dashboard_styles.stylesheet_css(font_url))
+    st.markdown(f"<style>{inline_css}</style>", unsafe_allow_html=True)
 
-    .performance-winner {
-        background: linear-gradient(135deg, #E8F5E9 0%, #C8E6C9 100%);
-        border: 1px solid #4CAF50;
-    }
 
-    .performance-winner .comparison-card-rank {
-        background: #4CAF50;
-    }
-</style>
-""", unsafe_allow_html=True)
+inject_styles()
 
 # =============================================================================
 # CONSTANTS & CONFIGURATION
@@ -950,10 +80,15 @@ IMAGES_DIR = BASE_DIR / "card_images"
 CSV_FILE = BASE_DIR / "Top 300 Cards - 2025.csv"
 ANALYSIS_FILE = BASE_DIR / "card_analysis.json"
 TREND_DATA_FILE = BASE_DIR / "trend_data_2026.json"
-VALENTINE_CSV = BASE_DIR / "valentine_cards.csv"
-BIRTHDAY_CSV = BASE_DIR / "birthday_cards.csv"
-THANKYOU_CSV = BASE_DIR / "thankyou_cards.csv"
+CATEGORY_MANIFEST = BASE_DIR / "categories.json"
+CATEGORY_FILE_PATTERN = "*_cards.csv"  # Any matching report becomes a Category Breakdown tab
+CATEGORY_LOAD_WORKERS = 8
 CARDS_PER_PAGE = 15
+COMPARISON_SEARCH_LIMIT = 25  # Type-ahead matches offered in the comparison selector
+GALLERY_BATCH_SIZE = 30   # Cards appended per "Load more" on the scrolling gallery
+GALLERY_OVERSCAN = 5      # Cards past the loaded ones whose images are prefetched
+IMAGE_CHECK_INTERVAL = 5  # Seconds between checks of card_images for added, removed or rewritten files
+VIEW_MODEL_CACHE_SIZE = 8  # Filtered views whose derived models (cubes, artist and pattern stats) are kept
 
 # Warm color palette for charts
 CHART_COLORS = [
@@ -972,9 +107,12 @@ CHART_COLORS = [
 # =============================================================================
 # DATA LOADING FUNCTIONS
 # =============================================================================
-@st.cache_data(ttl=3600)
-def load_csv_data() -> pd.DataFrame:
-    """Load and process the CSV data."""
+# Loaded data and the models derived from it are immutable, so they are held once per
+# process with st.cache_resource and shared by every session rather than copied into
+# each one. Treat everything returned by the load_* functions as read-only.
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_csv_data(data_version: str) -> pd.DataFrame:
+    """Load and process the CSV data once per data version (shared across sessions; read-only)."""
     if not CSV_FILE.exists():
         return pd.DataFrame()
 
@@ -1000,22 +138,22 @@ def load_csv_data() -> pd.DataFrame:
         return pd.DataFrame()
 
 
-@st.cache_data(ttl=3600)
-def load_analysis_data() -> list:
-    """Load the analysis JSON data."""
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_analysis_data(data_version: str) -> CardTable:
+    """Load the analysis JSON data into a compact column-wise card table once per data version (frozen, shared)."""
     if not ANALYSIS_FILE.exists():
-        return []
+        return CardTable.from_records([]).freeze()
 
     try:
         with open(ANALYSIS_FILE, "r") as f:
-            return json.load(f)
+            return CardTable.from_records(json.load(f)).freeze()
     except Exception:
-        return []
+        return CardTable.from_records([]).freeze()
 
 
-@st.cache_data(ttl=3600)
-def load_trend_data() -> dict:
-    """Load 2026 trend data from JSON file."""
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_trend_data(trend_file_version: str) -> dict:
+    """Load 2026 trend data from JSON file once per trend file version (shared across sessions; read-only)."""
     if not TREND_DATA_FILE.exists():
         return get_default_trend_data()
 
@@ -1043,31 +181,257 @@ def get_default_trend_data() -> dict:
         },
         "illustration_trends": [],
         "typography_trends": [],
-        "theme_motif_trends": [],
-        "color_name_to_hex": {}
+        "theme_motif_trends": []
     }
 
 
-@st.cache_data(ttl=3600)
-def load_category_csv(filepath: Path) -> pd.DataFrame:
-    """Load a 3-column category CSV (Metric, Card Name, Sends) and return a clean DataFrame."""
-    if not filepath.exists():
-        return pd.DataFrame()
+def discover_categories() -> list:
+    """
+    Find category reports (*_cards.csv) next to the app.
+    categories.json can set labels, accent colors and order; unlisted files are picked up automatically.
+    """
+    overrides = {}
+    if CATEGORY_MANIFEST.exists():
+        try:
+            with open(CATEGORY_MANIFEST, "r") as f:
+                overrides = {entry["file"]: entry for entry in json.load(f).get("categories", [])}
+        except Exception:
+            overrides = {}
+
+    paths = {path.name: path for path in sorted(BASE_DIR.glob(CATEGORY_FILE_PATTERN))}
+    ordered = [name for name in overrides if name in paths] + [name for name in paths if name not in overrides]
+
+    categories = []
+    for i, name in enumerate(ordered):
+        entry = overrides.get(name, {})
+        key = name[:-len("_cards.csv")]
+        categories.append({
+            "key": key,
+            "label": entry.get("label", key.replace("_", " ").title()),
+            "path": paths[name],
+            "accent": entry.get("accent", CHART_COLORS[i % len(CHART_COLORS)]),
+        })
+    return categories
 
+
+def read_category_csv(occasion: str, filepath: str) -> pd.DataFrame:
+    """Read a 3-column category CSV (Metric, Card Name, Sends) into long-format rows."""
     try:
         df = pd.read_csv(filepath)
         # Third column is the date-range sends column (name varies)
         cols = df.columns.tolist()
-        df = df.rename(columns={cols[0]: "Metric", cols[1]: "Card Name", cols[2]: "Sends"})
-        df = df[df["Metric"] == "Total Events of Sent"].copy()
-        df["Sends"] = pd.to_numeric(df["Sends"], errors="coerce").fillna(0).astype(int)
-        df["Card ID"] = df["Card Name"].apply(lambda x: str(x).split("_")[0] if "_" in str(x) else "")
-        df["Display Name"] = df["Card Name"].apply(lambda x: "_".join(str(x).split("_")[1:]) if "_" in str(x) else str(x))
-        df = df.sort_values("Sends", ascending=False).reset_index(drop=True)
-        return df[["Card Name", "Card ID", "Display Name", "Sends"]]
+        df = df[df[cols[0]] == "Total Events of Sent"]
+        card_names = df[cols[1]].astype(str)
+        return pd.DataFrame({
+            "occasion": occasion,
+            "card_id": card_names.apply(lambda x: x.split("_")[0] if "_" in x else ""),
+            "card_name": card_names,
+            "sends": pd.to_numeric(df[cols[2]], errors="coerce").fillna(0).astype("int32"),
+        })
     except Exception:
+        return pd.DataFrame(columns=["occasion", "card_id", "card_name", "sends"])
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_category_table(category_files: tuple, category_version: str) -> pd.DataFrame:
+    """
+    Load every category report concurrently into one long-format table
+    (occasion, card_id, card_name, sends) with categorical columns.
+    """
+    if not category_files:
+        return pd.DataFrame(columns=["occasion", "card_id", "card_name", "sends"])
+
+    with ThreadPoolExecutor(max_workers=min(CATEGORY_LOAD_WORKERS, len(category_files))) as executor:
+        frames = list(executor.map(lambda item: read_category_csv(*item), category_files))
+
+    table = pd.concat(frames, ignore_index=True)
+    table["occasion"] = pd.Categorical(table["occasion"], categories=[key for key, _ in category_files])
+    table["card_id"] = table["card_id"].astype("category")
+    table["card_name"] = table["card_name"].astype("category")
+    table["sends"] = table["sends"].astype("int32")
+    return table
+
+
+def get_category_cards(category_table: pd.DataFrame, occasion: str) -> pd.DataFrame:
+    """One category's cards from the long-format table, sorted by sends."""
+    rows = category_table[category_table["occasion"] == occasion]
+    if rows.empty:
         return pd.DataFrame()
 
+    df = pd.DataFrame({
+        "Card Name": rows["card_name"].astype(str),
+        "Card ID": rows["card_id"].astype(str),
+        "Sends": rows["sends"].astype(int),
+    })
+    df["Display Name"] = df["Card Name"].apply(lambda x: "_".join(x.split("_")[1:]) if "_" in x else x)
+    df = df.sort_values("Sends", ascending=False).reset_index(drop=True)
+    return df[["Card Name", "Card ID", "Display Name", "Sends"]]
+
+
+def get_file_version(paths) -> str:
+    """Fingerprint (name, size, mtime) of a set of files, used to key caches of derived data."""
+    parts = []
+    for path in paths:
+        try:
+            stat = path.stat()
+            parts.append(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}")
+        except OSError:
+            parts.append(f"{path.name}:missing")
+    return "|".join(parts)
+
+
+def get_data_version() -> str:
+    """Fingerprint of the source data files, used to key caches of derived data."""
+    return get_file_version((CSV_FILE, ANALYSIS_FILE))
+
+
+def get_trend_file_version() -> str:
+    """Fingerprint of the trend data file, used to key the loaded trend data."""
+    return get_file_version((TREND_DATA_FILE,))
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_card_search_index(data_version: str) -> CardSearchIndex:
+    """Build the rank/ID/name search index once per data version and share it across sessions."""
+    return CardSearchIndex.from_dataframe(load_csv_data(data_version))
+
+
+@st.cache_resource(show_spinner=False)
+def load_text_search_index() -> TextSearchIndex:
+    """Process-wide full-text index; use get_text_search_index() to keep it current."""
+    return TextSearchIndex()
+
+
+def get_text_search_index(df: pd.DataFrame, analysis_lookup: dict, data_version: str) -> TextSearchIndex:
+    """Full-text index over the cards of data_version; a new data version only indexes the cards it adds."""
+    index = load_text_search_index()
+    if index.version != data_version:
+        index.update(build_search_documents(df, analysis_lookup), version=data_version)
+    return index
+
+
+def build_search_documents(df: pd.DataFrame, analysis_lookup: dict) -> list:
+    """(card_id, text) pairs covering each card's display name, artist, themes and occasion."""
+    documents = []
+    for card_id, display_name in zip(df["Card ID"], df["Display Name"]):
+        analysis = analysis_lookup.get(card_id) or {}
+        artist = extract_artist_from_card_name(str(display_name))
+        themes = analysis.get("themes")
+        documents.append((card_id, TextSearchIndex.document_text(
+            display_name,
+            artist if artist != "Unknown Artist" else "",
+            themes if isinstance(themes, list) else (),
+            analysis.get("occasion") or "",
+        )))
+    return documents
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_analysis_lookup(_analysis_data: CardTable, data_version: str) -> MappingProxyType:
+    """Read-only card_id -> record lookup, built once per data version."""
+    return MappingProxyType(create_analysis_lookup(_analysis_data))
+
+
+@st.cache_resource(max_entries=VIEW_MODEL_CACHE_SIZE, show_spinner=False)
+def load_artist_stats(_analysis_data: CardTable, _csv_df: pd.DataFrame, view_version: str) -> pd.DataFrame:
+    """Artist dimension table, built once per view version."""
+    return build_artist_stats(_analysis_data, _csv_df)
+
+
+@st.cache_resource(max_entries=VIEW_MODEL_CACHE_SIZE, show_spinner=False)
+def load_pattern_stats(_analysis_data: CardTable, view_version: str) -> dict:
+    """High-performing pattern statistics behind the creative briefs, built once per view version."""
+    return analyze_high_performing_patterns(_analysis_data)
+
+
+@st.cache_resource(max_entries=VIEW_MODEL_CACHE_SIZE, show_spinner=False)
+def load_portfolio_trends(_analysis_data: CardTable, _trend_data: dict, trend_version: str) -> dict:
+    """Portfolio trend alignment, scored once per view and trend file version."""
+    return aggregate_portfolio_trends(_analysis_data, _trend_data, score_cache=load_trend_score_cache())
+
+
+@st.cache_resource(max_entries=VIEW_MODEL_CACHE_SIZE, show_spinner=False)
+def load_category_score_matrix(_analysis_data: CardTable, _trend_data: dict, trend_version: str) -> CategoryScoreMatrix:
+    """Per-card category scores for the weight simulator, built from the shared score cache."""
+    tables = load_trend_score_cache().tables(_trend_data)
+    return CategoryScoreMatrix.from_cards(_analysis_data, _trend_data, tables)
+
+
+@st.cache_resource(show_spinner=False)
+def load_trend_score_cache() -> TrendScoreCache:
+    """Per-category trend scores kept across trend file edits, so only changed categories are rescored."""
+    return TrendScoreCache()
+
+
+@st.cache_resource(max_entries=VIEW_MODEL_CACHE_SIZE, show_spinner=False)
+def load_aggregate_cube(_analysis_data: CardTable, view_version: str) -> AggregateCube:
+    """Build the occasion x style x color x typography cube once per view version."""
+    return AggregateCube.from_cards(create_analysis_lookup(_analysis_data).values())
+
+
+@st.cache_resource(max_entries=VIEW_MODEL_CACHE_SIZE, show_spinner=False)
+def load_color_cooccurrence(_analysis_data: CardTable, view_version: str) -> ColorCooccurrence:
+    """Build the card x color membership matrix once per view version."""
+    return ColorCooccurrence.from_table(_analysis_data)
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def load_category_sprite(category_key: str, _card_names: tuple, category_version: str, images_version: str) -> dict | None:
+    """
+    Sprite sheet for a category's top cards, resolved once per category and image version
+    (rebuilt on disk only when the ranking changes). The sheet is linked by its static URL,
+    or inlined as a data URI when static serving is off or the sheet couldn't be written.
+    """
+    entries = [
+        (card_name, str(image_path) if image_path else None)
+        for card_name, image_path in ((name, get_card_image_path(name)) for name in _card_names)
+    ]
+    sprite = sprite_sheets.load_sprite_sheet(category_key, entries)
+    if sprite is None:
+        return None
+    if sprite["file"] is not None and st.get_option("server.enableStaticServing"):
+        sprite["url"] = f"{SPRITE_URL}/{sprite['file'].name}"
+    else:
+        sprite["url"] = f"data:{sprite['mime']};base64,{base64.b64encode(sprite['image']).decode()}"
+    sprite.pop("image")
+    return sprite
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_sends_history(history_version: str) -> dict | None:
+    """Weekly portfolio rollup of the sends history (None until `python timeseries_store.py ingest` has run)."""
+    return timeseries_store.load_rollup("weekly")
+
+
+def get_sends_history() -> dict | None:
+    """Weekly sends history rollup, reloaded when the rollup file changes."""
+    return load_sends_history(get_file_version((timeseries_store.rollup_path("weekly"),)))
+
+
+@st.cache_resource(show_spinner=False)
+def load_figure_cache() -> FigureCache:
+    """Process-wide cache of built Plotly figures, shared across sessions."""
+    return FigureCache(max_entries=256)
+
+
+def get_view_key(df: pd.DataFrame) -> int:
+    """Fingerprint of the cards a view shows, for keying figures built from a subset of the data."""
+    return hash(tuple(df["Card ID"]))
+
+
+def get_view_version(df: pd.DataFrame) -> str:
+    """Data version plus the view's cards, for keying models built from that view's analysis records."""
+    return f"{get_data_version()}|{get_view_key(df)}"
+
+
+def cached_figure(figure_id: str, build, *params) -> go.Figure | None:
+    """
+    Return the figure for (figure_id, data version, params), calling build() only on a miss.
+    params must cover every input of build() beyond the source data files.
+    """
+    key = (figure_id, get_data_version(), *params)
+    return load_figure_cache().get_or_build(key, build)
+
 
 def get_card_image_path(card_name: str) -> Path | None:
     """Get the image path for a card."""
@@ -1094,11 +458,102 @@ def get_image_base64(image_path: Path) -> str | None:
         return None
 
 
-def create_analysis_lookup(analysis_data: list) -> dict:
-    """Create a lookup dictionary from analysis data by card_id."""
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_image_store(image_version: str) -> ImageStore | None:
+    """Memory-mapped pack of the card images (None until `python image_store.py` has built it)."""
+    return ImageStore.open()
+
+
+@st.cache_data(ttl=IMAGE_CHECK_INTERVAL, show_spinner=False)
+def get_images_fingerprint() -> str:
+    """
+    Size and mtime fingerprint of every card image (a directory's own mtime misses files
+    rewritten in place). Rechecked at most every IMAGE_CHECK_INTERVAL seconds, not per card.
+    """
+    return image_store.directory_fingerprint(IMAGES_DIR)
+
+
+def get_image_store() -> ImageStore | None:
+    """Current image pack, reopened when its index or the card images change."""
+    return load_image_store(f"{get_file_version((image_store.INDEX_FILE,))}|{get_images_fingerprint()}")
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_image_catalog(image_version: str) -> ImageCatalog | None:
+    """Real formats, dimensions and corrupt flags of the card images (None until built by image_store.py)."""
+    return ImageCatalog.open()
+
+
+def get_image_catalog() -> ImageCatalog | None:
+    """Current image catalog, reopened when it or the card images change."""
+    return load_image_catalog(f"{get_file_version((image_store.CATALOG_FILE,))}|{get_images_fingerprint()}")
+
+
+def get_card_image_base64(card_name: str) -> str | None:
+    """
+    Base64 image for a card, read from the image pack when it is current (a slice of its
+    mmap, no file probing), otherwise from the loose file.
+    """
+    store = get_image_store()
+    if store is not None:
+        data = store.get(card_name)
+        if data is None:
+            data = store.get_by_id(card_name.split("_")[0] if "_" in card_name else "")
+        return base64.b64encode(data).decode() if data is not None else None
+    image_path = get_card_image_path(card_name)
+    return get_image_base64(image_path) if image_path else None
+
+
+def get_card_image_base64_by_id(card_id: str) -> str | None:
+    """Base64 image for a card ID, from the image pack when it is current."""
+    store = get_image_store()
+    if store is not None:
+        data = store.get_by_id(card_id)
+        return base64.b64encode(data).decode() if data is not None else None
+    image_path = get_card_image_by_id(card_id)
+    return get_image_base64(image_path) if image_path else None
+
+
+def image_data_uri(info: dict | None, img_base64: str | None) -> str | None:
+    """data: URI with the cataloged MIME type (JPEG if uncataloged)."""
+    if not img_base64:
+        return None
+    mime = (info or {}).get("mime") or "image/jpeg"
+    return f"data:{mime};base64,{img_base64}"
+
+
+def get_card_image_uri(card_name: str) -> str | None:
+    """data: URI of a card's image by card name."""
+    catalog = get_image_catalog()
+    info = catalog.info(card_name) if catalog is not None else None
+    if catalog is not None and info is None and "_" in card_name:
+        info = catalog.info_by_id(card_name.split("_")[0])
+    if info is not None and info.get("error"):
+        return None  # Truncated or undecodable: show the placeholder, not a broken tile
+    return image_data_uri(info, get_card_image_base64(card_name))
+
+
+def prefetch_card_images(card_names) -> None:
+    """Page in the pack images of cards about to be shown (no-op without a current pack)."""
+    store = get_image_store()
+    if store is not None:
+        store.prefetch(card_names)
+
+
+def get_card_image_uri_by_id(card_id: str) -> str | None:
+    """data: URI of a card's image by card ID."""
+    catalog = get_image_catalog()
+    info = catalog.info_by_id(card_id) if catalog is not None else None
+    if info is not None and info.get("error"):
+        return None
+    return image_data_uri(info, get_card_image_base64_by_id(card_id))
+
+
+def create_analysis_lookup(analysis_data: CardTable) -> dict:
+    """Create a lookup of card_id -> card record views (rows are not copied)."""
     lookup = {}
     for item in analysis_data:
-        if isinstance(item, dict):
+        if isinstance(item, (dict, CardRecord)):
             card_id = item.get("card_id", "")
             if card_id:
                 lookup[card_id] = item
@@ -1108,27 +563,6 @@ def create_analysis_lookup(analysis_data: list) -> dict:
 # =============================================================================
 # ARTIST EXTRACTION FUNCTIONS
 # =============================================================================
-# Known artist names and studio brands for extraction
-KNOWN_ARTISTS = [
-    "Paper&Stuff", "Spaghetti & Meatballs", "Karen Schipper", "Melanie Johnsson",
-    "Darlin' Spotted", "Aviva Atri", "Poketo", "jordan gadeke", "Jordan Gadeke",
-    "Lucy Maggie", "Emily McDowell", "Rifle Paper Co", "Lisa Congdon",
-    "Jess Phoenix", "Red Cap Cards", "Wrap Magazine", "1canoe2", "Egg Press",
-    "Idlewild Co", "Slightly Stationery", "Dahlia Press", "Clap Clap Design",
-    "Good Paper", "The Good Twin", "Belle & Union", "Bench Pressed",
-    "Ladyfingers Letterpress", "Paper Bandit Press", "Printerette Press",
-    "Blackbird Letterpress", "Hello Lucky", "Igloo Letterpress", "Paper Parasol Press",
-    "Sapling Press", "The Social Type", "Wit & Whistle", "Yellow Owl Workshop",
-    "Moglea", "Shorthand Press", "Thimblepress", "The Paper Cub",
-    "Antiquaria", "Ilee Papergoods", "Pike Street Press", "Fugu Fugu Press",
-    "The Little Red House", "Sycamore Street Press", "Happy Cactus Designs",
-    "Quill & Fox", "Calliope Paperie", "Olive & Company", "E. Frances Paper",
-    "Bloomwolf Studio", "Girl w/ Knife", "Elana Gabrielle", "Hatch Inc",
-    "Fifty Five Hi's", "Ramona & Ruth", "And Here We Are", "Ohh Deer",
-    "Gemma Correll", "Able & Game", "La Familia Green", "Near Modern Disaster"
-]
-
-
 def extract_artist_from_card_name(card_name: str) -> str:
     """
     Extract artist/studio name from card_name field.
@@ -1141,8 +575,8 @@ def extract_artist_from_card_name(card_name: str) -> str:
 
     # First, check for known artists/studios (case-insensitive matching)
     card_name_lower = card_name.lower()
-    for artist in KNOWN_ARTISTS:
-        if artist.lower() in card_name_lower:
+    for artist, artist_lower in KNOWN_ARTISTS_LOWER:
+        if artist_lower in card_name_lower:
             return artist
 
     # Fallback: Try to extract artist using common patterns
@@ -1154,11 +588,8 @@ def extract_artist_from_card_name(card_name: str) -> str:
             potential_artist = " ".join(words[-end_pos:])
 
             # Skip common card title endings
-            skip_words = ["birthday", "cake", "wishes", "day", "happy", "you", "love",
-                         "thanks", "thank", "card", "gradient", "balloon", "floral",
-                         "flowers", "hearts", "confetti", "party", "celebration"]
-
-            if any(skip.lower() in potential_artist.lower() for skip in skip_words):
+            potential_lower = potential_artist.lower()
+            if any(skip in potential_lower for skip in TITLE_SKIP_WORDS):
                 continue
 
             # Check if it looks like a name (capitalized, contains & or has multiple caps)
@@ -1169,7 +600,7 @@ def extract_artist_from_card_name(card_name: str) -> str:
     return "Unknown Artist"
 
 
-def build_artist_stats(analysis_data: list, csv_df) -> "pd.DataFrame":
+def build_artist_stats(analysis_data: CardTable, csv_df) -> "pd.DataFrame":
     """
     Build comprehensive artist statistics from analysis data.
     Returns a DataFrame with artist metrics including:
@@ -1187,9 +618,6 @@ def build_artist_stats(analysis_data: list, csv_df) -> "pd.DataFrame":
             sends_lookup[card_id] = row.get("Current Period", 0)
 
     for card in analysis_data:
-        if not isinstance(card, dict):
-            continue
-
         card_name = card.get("card_name", "")
         card_id = card.get("card_id", "")
 
@@ -1243,15 +671,7 @@ def build_artist_stats(analysis_data: list, csv_df) -> "pd.DataFrame":
 # =============================================================================
 # UI COMPONENT FUNCTIONS
 # =============================================================================
-def render_hero(df: pd.DataFrame):
-    """Render the hero section with key statistics."""
-    total_cards = len(df)
-    total_sends = int(df["Current Period"].sum()) if not df.empty else 0
-    avg_sends = int(df["Current Period"].mean()) if not df.empty else 0
-    top_performer = int(df["Current Period"].max()) if not df.empty else 0
-
-    # Hero header section
-    hero_header = """
+HERO_HEADER = """
     <div class="hero-section">
         <div class="hero-masthead">Analytics Dashboard</div>
         <h1 class="hero-title">Greeting Cards<br/>Performance Report</h1>
@@ -1261,21 +681,62 @@ def render_hero(df: pd.DataFrame):
         </p>
     </div>
     """
-    st.markdown(hero_header, unsafe_allow_html=True)
 
-    # Stats using native Streamlit columns for reliable rendering
-    st.markdown('<div class="hero-stats-container">', unsafe_allow_html=True)
-    cols = st.columns(4)
-    stats = [
+
+def get_hero_stats(df: pd.DataFrame) -> list:
+    """(value, label) pairs for the hero statistics row."""
+    total_cards = len(df)
+    total_sends = int(df["Current Period"].sum()) if not df.empty else 0
+    avg_sends = int(df["Current Period"].mean()) if not df.empty else 0
+    top_performer = int(df["Current Period"].max()) if not df.empty else 0
+    return [
         (f"{total_cards:,}", "Total Cards Tracked"),
         (f"{total_sends:,}", "Total Sends"),
         (f"{avg_sends:,}", "Average per Card"),
         (f"{top_performer:,}", "Top Performer Sends"),
     ]
+
+
+def render_hero(df: pd.DataFrame):
+    """Render the hero section with key statistics."""
+    # Hero header section
+    st.markdown(HERO_HEADER, unsafe_allow_html=True)
+
+    # Stats using native Streamlit columns for reliable rendering
+    st.markdown('<div class="hero-stats-container">', unsafe_allow_html=True)
+    cols = st.columns(4)
+    stats = get_hero_stats(df)
     for col, (value, label) in zip(cols, stats):
         with col:
             st.markdown(f'<div class="hero-stat"><div class="hero-stat-value">{value}</div><div class="hero-stat-label">{label}</div></div>', unsafe_allow_html=True)
     st.markdown('</div>', unsafe_allow_html=True)
+    # The hero paints before the sidebar filters exist, so its totals are always portfolio-wide
+    st.markdown('<div class="filter-status"><span class="filter-status-text">Entire portfolio; sidebar filters apply to the sections below</span></div>', unsafe_allow_html=True)
+
+
+FILTER_WIDGET_KEYS = ("search", "occasion_filter", "style_filter", "rank_filter")
+FILTER_VIEW_CACHE_SIZE = 32  # Recently used filter combinations kept per process
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_filter_options(_analysis_lookup: dict, data_version: str) -> tuple:
+    """Occasion and design style choices for the sidebar, built once per data version."""
+    occasions = set()
+    styles = set()
+    for item in _analysis_lookup.values():
+        occ = item.get("occasion", "")
+        if occ:
+            occasions.add(occ.title())
+        style = item.get("design_style", "")
+        if style:
+            styles.add(style.replace("_", " ").title())
+    return ["All Occasions"] + sorted(occasions), ["All Styles"] + sorted(styles)
+
+
+def reset_filters():
+    """Clear the sidebar widgets so they fall back to their defaults (all cards)."""
+    for key in FILTER_WIDGET_KEYS:
+        st.session_state.pop(key, None)
 
 
 def render_sidebar_filters(df: pd.DataFrame, analysis_lookup: dict) -> dict:
@@ -1286,25 +747,18 @@ def render_sidebar_filters(df: pd.DataFrame, analysis_lookup: dict) -> dict:
     st.sidebar.markdown('<div class="sidebar-subtitle">Refine your card selection</div>', unsafe_allow_html=True)
 
     filters = {}
+    occasions, styles = load_filter_options(analysis_lookup, get_data_version())
 
     # Search
     st.sidebar.markdown('<div class="sidebar-section-title">Search</div>', unsafe_allow_html=True)
     search_query = st.sidebar.text_input(
         "Search",
-        placeholder="Card name or artist...",
+        placeholder="Card name, artist, theme or occasion...",
         key="search",
         label_visibility="collapsed"
     )
     filters["search"] = search_query
 
-    # Get unique occasions from analysis data
-    occasions = set()
-    for item in analysis_lookup.values():
-        occ = item.get("occasion", "")
-        if occ:
-            occasions.add(occ.title())
-    occasions = ["All Occasions"] + sorted(list(occasions))
-
     st.sidebar.markdown('<div class="sidebar-section-title">Occasion</div>', unsafe_allow_html=True)
     selected_occasion = st.sidebar.selectbox(
         "Occasion",
@@ -1315,13 +769,6 @@ def render_sidebar_filters(df: pd.DataFrame, analysis_lookup: dict) -> dict:
     filters["occasion"] = None if selected_occasion == "All Occasions" else selected_occasion.lower()
 
     # Design Style filter
-    styles = set()
-    for item in analysis_lookup.values():
-        style = item.get("design_style", "")
-        if style:
-            styles.add(style.replace("_", " ").title())
-    styles = ["All Styles"] + sorted(list(styles))
-
     st.sidebar.markdown('<div class="sidebar-section-title">Design Style</div>', unsafe_allow_html=True)
     selected_style = st.sidebar.selectbox(
         "Style",
@@ -1331,65 +778,197 @@ def render_sidebar_filters(df: pd.DataFrame, analysis_lookup: dict) -> dict:
     )
     filters["style"] = None if selected_style == "All Styles" else selected_style.lower().replace(" ", "_")
 
-    # Rank Range
+    # Rank Range (defaults to every card, so the unfiltered view is the full catalog)
     st.sidebar.markdown('<div class="sidebar-section-title">Rank Range</div>', unsafe_allow_html=True)
     max_rank = int(df["Rank"].max()) if not df.empty else 300
     rank_range = st.sidebar.slider(
         "Rank",
         min_value=1,
         max_value=max_rank,
-        value=(1, min(50, max_rank)),
+        value=(1, max_rank),
         key="rank_filter",
         label_visibility="collapsed"
     )
-    filters["rank_range"] = rank_range
+    filters["rank_range"] = None if tuple(rank_range) == (1, max_rank) else tuple(rank_range)
 
     # Divider
     st.sidebar.markdown("---")
 
     # Reset button
-    if st.sidebar.button("Reset All Filters", use_container_width=True):
-        st.rerun()
+    st.sidebar.button("Reset All Filters", use_container_width=True, on_click=reset_filters)
 
     return filters
 
 
-def apply_filters(df: pd.DataFrame, filters: dict, analysis_lookup: dict) -> pd.DataFrame:
-    """Apply filters to the dataframe."""
-    filtered_df = df.copy()
+def get_filter_key(filters: dict) -> tuple:
+    """
+    Normalized (search, occasion, style, rank_range) tuple for a filter combination.
+    Equivalent selections (e.g. searches differing only in case or spacing) map to the same key.
+    """
+    search = " ".join(str(filters.get("search") or "").lower().split())
+    rank_range = filters.get("rank_range")
+    return (
+        search,
+        filters.get("occasion") or None,
+        filters.get("style") or None,
+        tuple(rank_range) if rank_range else None,
+    )
+
 
-    # Search filter
-    if filters.get("search"):
-        search_term = filters["search"].lower()
-        filtered_df = filtered_df[
-            filtered_df["Card Name"].str.lower().str.contains(search_term, na=False)
-        ]
+def apply_filters(df: pd.DataFrame, filter_key: tuple, analysis_lookup: dict,
+                  text_index: TextSearchIndex) -> pd.DataFrame:
+    """Apply a normalized filter key to the dataframe through a boolean card bitmap."""
+    search, occasion, style, rank_range = filter_key
+    mask = pd.Series(True, index=df.index)
 
-    # Occasion filter
-    if filters.get("occasion"):
-        card_ids_with_occasion = set()
-        for card_id, data in analysis_lookup.items():
-            if data.get("occasion", "").lower() == filters["occasion"]:
-                card_ids_with_occasion.add(card_id)
-        filtered_df = filtered_df[filtered_df["Card ID"].isin(card_ids_with_occasion)]
-
-    # Style filter
-    if filters.get("style"):
-        card_ids_with_style = set()
-        for card_id, data in analysis_lookup.items():
-            if data.get("design_style", "").lower() == filters["style"]:
-                card_ids_with_style.add(card_id)
-        filtered_df = filtered_df[filtered_df["Card ID"].isin(card_ids_with_style)]
+    # Search filter (typo-tolerant full-text match on name, artist, themes and occasion)
+    if search:
+        mask &= df["Card ID"].isin(text_index.search(search))
+
+    # Occasion and style filters
+    for field, value in (("occasion", occasion), ("design_style", style)):
+        if value:
+            card_values = df["Card ID"].map(
+                lambda card_id: str((analysis_lookup.get(card_id) or {}).get(field) or "").lower()
+            )
+            mask &= card_values == value
 
     # Rank range filter
-    if filters.get("rank_range"):
-        rank_min, rank_max = filters["rank_range"]
-        filtered_df = filtered_df[
-            (filtered_df["Rank"] >= rank_min) &
-            (filtered_df["Rank"] <= rank_max)
-        ]
+    if rank_range:
+        rank_min, rank_max = rank_range
+        mask &= df["Rank"].between(rank_min, rank_max)
+
+    return df if mask.all() else df[mask]
 
-    return filtered_df
+
+@st.cache_resource(max_entries=FILTER_VIEW_CACHE_SIZE, show_spinner=False)
+def load_filtered_view(filter_key: tuple, data_version: str) -> pd.DataFrame:
+    """
+    Cards matching a filter key, shared read-only by every section and session.
+    The least recently used views are evicted, so switching back to a recent filter is a cache hit.
+    """
+    df = load_csv_data(data_version)
+    analysis_lookup = load_analysis_lookup(load_analysis_data(data_version), data_version)
+    return apply_filters(df, filter_key, analysis_lookup, get_text_search_index(df, analysis_lookup, data_version))
+
+
+@st.cache_resource(max_entries=FILTER_VIEW_CACHE_SIZE, show_spinner=False)
+def load_filtered_analysis(filter_key: tuple, data_version: str) -> tuple:
+    """
+    (analysis table, lookup) of the cards in a filtered view, cached alongside the view itself.
+    The unfiltered view shares the full table; a filtered one gets a read-only subset.
+    """
+    analysis_data = load_analysis_data(data_version)
+    analysis_lookup = load_analysis_lookup(analysis_data, data_version)
+    df = load_filtered_view(filter_key, data_version)
+    if df is load_csv_data(data_version):
+        return analysis_data, analysis_lookup
+    card_ids = set(df["Card ID"])
+    rows = [i for i, card_id in enumerate(analysis_data.card_ids) if card_id in card_ids]
+    view_data = analysis_data.take(rows).freeze()
+    return view_data, MappingProxyType(create_analysis_lookup(view_data))
+
+
+def build_top_performers_figure(df: pd.DataFrame) -> go.Figure:
+    """Horizontal bar chart of the ten most-sent cards."""
+    top_10 = df.head(10).copy()
+    top_10["Short Name"] = top_10["Display Name"].apply(
+        lambda x: x[:35] + "..." if len(str(x)) > 35 else x
+    )
+
+    fig_bar = go.Figure()
+    fig_bar.add_trace(go.Bar(
+        x=top_10["Current Period"].values[::-1],
+        y=top_10["Short Name"].values[::-1],
+        orientation='h',
+        marker=dict(
+            color=CHART_COLORS[:10][::-1],
+            line=dict(width=0)
+        ),
+        hovertemplate="<b>%{y}</b><br>Sends: %{x:,.0f}<extra></extra>"
+    ))
+
+    fig_bar.update_layout(
+        height=400,
+        margin=dict(l=0, r=20, t=10, b=10),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        font=dict(family="Source Sans 3, sans-serif", color="#2D2A26"),
+        xaxis=dict(
+            showgrid=True,
+            gridcolor="rgba(45, 42, 38, 0.06)",
+            zeroline=False,
+        ),
+        yaxis=dict(
+            showgrid=False,
+            zeroline=False,
+        ),
+        showlegend=False,
+    )
+    return fig_bar
+
+
+def build_occasion_donut_figure(df: pd.DataFrame, analysis_lookup: dict) -> go.Figure | None:
+    """Donut of sends by occasion (top 8 plus Other), or None if there are no cards."""
+    # Aggregate by occasion from analysis data
+    occasion_sends = {}
+    for _, row in df.iterrows():
+        card_id = row["Card ID"]
+        sends = row["Current Period"]
+
+        if card_id in analysis_lookup:
+            occasion = analysis_lookup[card_id].get("occasion", "other")
+        else:
+            occasion = "other"
+
+        occasion = occasion.title() if occasion else "Other"
+        occasion_sends[occasion] = occasion_sends.get(occasion, 0) + sends
+
+    if not occasion_sends:
+        return None
+
+    occasion_df = pd.DataFrame([
+        {"Occasion": k, "Sends": v} for k, v in occasion_sends.items()
+    ]).sort_values("Sends", ascending=False)
+
+    # Limit to top 8 categories + Other
+    if len(occasion_df) > 8:
+        top_occasions = occasion_df.head(8)
+        other_sends = occasion_df.iloc[8:]["Sends"].sum()
+        top_occasions = pd.concat([
+            top_occasions,
+            pd.DataFrame([{"Occasion": "Other", "Sends": other_sends}])
+        ], ignore_index=True)
+        occasion_df = top_occasions
+
+    fig_donut = go.Figure(data=[go.Pie(
+        labels=occasion_df["Occasion"],
+        values=occasion_df["Sends"],
+        hole=0.55,
+        marker=dict(
+            colors=CHART_COLORS[:len(occasion_df)],
+            line=dict(color='#FDFBF7', width=2)
+        ),
+        textposition='outside',
+        textinfo='label+percent',
+        textfont=dict(size=11),
+        hovertemplate="<b>%{label}</b><br>Sends: %{value:,.0f}<br>Share: %{percent}<extra></extra>"
+    )])
+
+    fig_donut.update_layout(
+        height=400,
+        margin=dict(l=20, r=20, t=20, b=20),
+        paper_bgcolor="rgba(0,0,0,0)",
+        font=dict(family="Source Sans 3, sans-serif", color="#2D2A26"),
+        showlegend=False,
+        annotations=[dict(
+            text=f'<b>{len(df)}</b><br>Cards',
+            x=0.5, y=0.5,
+            font=dict(size=16, family="Playfair Display, Source Serif 4, serif", color="#2D2A26"),
+            showarrow=False
+        )]
+    )
+    return fig_donut
 
 
 def render_charts(df: pd.DataFrame, analysis_lookup: dict):
@@ -1416,42 +995,8 @@ def render_charts(df: pd.DataFrame, analysis_lookup: dict):
         </div>
         """, unsafe_allow_html=True)
 
-        top_10 = df.head(10).copy()
-        if not top_10.empty:
-            top_10["Short Name"] = top_10["Display Name"].apply(
-                lambda x: x[:35] + "..." if len(str(x)) > 35 else x
-            )
-
-            fig_bar = go.Figure()
-            fig_bar.add_trace(go.Bar(
-                x=top_10["Current Period"].values[::-1],
-                y=top_10["Short Name"].values[::-1],
-                orientation='h',
-                marker=dict(
-                    color=CHART_COLORS[:10][::-1],
-                    line=dict(width=0)
-                ),
-                hovertemplate="<b>%{y}</b><br>Sends: %{x:,.0f}<extra></extra>"
-            ))
-
-            fig_bar.update_layout(
-                height=400,
-                margin=dict(l=0, r=20, t=10, b=10),
-                paper_bgcolor="rgba(0,0,0,0)",
-                plot_bgcolor="rgba(0,0,0,0)",
-                font=dict(family="Source Sans 3, sans-serif", color="#2D2A26"),
-                xaxis=dict(
-                    showgrid=True,
-                    gridcolor="rgba(45, 42, 38, 0.06)",
-                    zeroline=False,
-                ),
-                yaxis=dict(
-                    showgrid=False,
-                    zeroline=False,
-                ),
-                showlegend=False,
-            )
-
+        if not df.empty:
+            fig_bar = cached_figure("top_performers", lambda: build_top_performers_figure(df), get_view_key(df))
             st.plotly_chart(fig_bar, use_container_width=True, config={"displayModeBar": False})
 
     with col2:
@@ -1463,80 +1008,30 @@ def render_charts(df: pd.DataFrame, analysis_lookup: dict):
         </div>
         """, unsafe_allow_html=True)
 
-        # Aggregate by occasion from analysis data
-        occasion_sends = {}
-        for _, row in df.iterrows():
-            card_id = row["Card ID"]
-            sends = row["Current Period"]
-
-            if card_id in analysis_lookup:
-                occasion = analysis_lookup[card_id].get("occasion", "other")
-            else:
-                occasion = "other"
-
-            occasion = occasion.title() if occasion else "Other"
-            occasion_sends[occasion] = occasion_sends.get(occasion, 0) + sends
-
-        if occasion_sends:
-            occasion_df = pd.DataFrame([
-                {"Occasion": k, "Sends": v} for k, v in occasion_sends.items()
-            ]).sort_values("Sends", ascending=False)
-
-            # Limit to top 8 categories + Other
-            if len(occasion_df) > 8:
-                top_occasions = occasion_df.head(8)
-                other_sends = occasion_df.iloc[8:]["Sends"].sum()
-                top_occasions = pd.concat([
-                    top_occasions,
-                    pd.DataFrame([{"Occasion": "Other", "Sends": other_sends}])
-                ], ignore_index=True)
-                occasion_df = top_occasions
-
-            fig_donut = go.Figure(data=[go.Pie(
-                labels=occasion_df["Occasion"],
-                values=occasion_df["Sends"],
-                hole=0.55,
-                marker=dict(
-                    colors=CHART_COLORS[:len(occasion_df)],
-                    line=dict(color='#FDFBF7', width=2)
-                ),
-                textposition='outside',
-                textinfo='label+percent',
-                textfont=dict(size=11),
-                hovertemplate="<b>%{label}</b><br>Sends: %{value:,.0f}<br>Share: %{percent}<extra></extra>"
-            )])
-
-            fig_donut.update_layout(
-                height=400,
-                margin=dict(l=20, r=20, t=20, b=20),
-                paper_bgcolor="rgba(0,0,0,0)",
-                font=dict(family="Source Sans 3, sans-serif", color="#2D2A26"),
-                showlegend=False,
-                annotations=[dict(
-                    text=f'<b>{len(df)}</b><br>Cards',
-                    x=0.5, y=0.5,
-                    font=dict(size=16, family="Playfair Display, serif", color="#2D2A26"),
-                    showarrow=False
-                )]
-            )
-
+        fig_donut = cached_figure(
+            "occasion_donut", lambda: build_occasion_donut_figure(df, analysis_lookup), get_view_key(df)
+        )
+        if fig_donut is not None:
             st.plotly_chart(fig_donut, use_container_width=True, config={"displayModeBar": False})
 
+    # Portfolio trend across every export ingested into the sends history
+    history = get_sends_history()
+    if history is not None and len(history["periods"]) >= 2:
+        st.markdown("""
+        <div class="chart-container">
+            <div class="chart-title">Portfolio Trend</div>
+            <div class="chart-subtitle">Trailing-year sends across all cards, by weekly export</div>
+        </div>
+        """, unsafe_allow_html=True)
 
-def render_executive_summary(df: pd.DataFrame, analysis_lookup: dict):
-    """Render deep executive insights and analysis."""
+        fig_trend = cached_figure(
+            "portfolio_trend", lambda: create_time_series_chart(timeseries_store.portfolio_series(history), title="")
+        )
+        st.plotly_chart(fig_trend, use_container_width=True, config={"displayModeBar": False})
 
-    st.markdown("""
-    <div class="section-container">
-        <div class="section-header">
-            <span class="section-number">02</span>
-            <h2 class="section-title">Executive Insights</h2>
-            <div class="section-line"></div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
 
-    # Gather statistics from analysis data
+def count_card_attributes(analysis_lookup: dict) -> dict:
+    """Card counts per design style, typography style, color, theme and artist."""
     design_styles = {}
     typography_styles = {}
     colors = {}
@@ -1576,34 +1071,105 @@ def render_executive_summary(df: pd.DataFrame, analysis_lookup: dict):
                     artists[artist] = artists.get(artist, 0) + 1
                     break
 
-    # Key insights cards
-    st.markdown("""
-    <div style="background: linear-gradient(135deg, #FDF8F3 0%, #FDFBF7 100%);
-                border-radius: 12px; padding: 2rem; margin-bottom: 2rem;
-                border: 1px solid rgba(198, 93, 59, 0.1);">
-        <h3 style="font-family: 'Playfair Display', serif; color: #C65D3B; margin-bottom: 1rem; font-size: 1.4rem;">
-            Key Findings at a Glance
-        </h3>
-        <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 1rem;">
-    """, unsafe_allow_html=True)
+    return {
+        "design_styles": design_styles,
+        "typography_styles": typography_styles,
+        "colors": colors,
+        "themes": themes,
+        "artists": artists,
+    }
+
+
+def get_key_findings(attribute_counts: dict, card_count: int) -> list:
+    """(value, label, detail) rows for the Key Findings panel."""
+    design_styles = attribute_counts["design_styles"]
+    colors = attribute_counts["colors"]
+    themes = attribute_counts["themes"]
+    typography_styles = attribute_counts["typography_styles"]
 
-    # Calculate key metrics
     top_style = max(design_styles.items(), key=lambda x: x[1]) if design_styles else ("N/A", 0)
     top_color = max(colors.items(), key=lambda x: x[1]) if colors else ("N/A", 0)
     top_theme = max(themes.items(), key=lambda x: x[1]) if themes else ("N/A", 0)
     top_typo = max(typography_styles.items(), key=lambda x: x[1]) if typography_styles else ("N/A", 0)
 
-    insights = [
-        (f"🎨 {top_style[0].replace('_', ' ').title()}", "Dominant Design Style", f"{top_style[1]} cards ({100*top_style[1]/len(analysis_lookup):.0f}%)"),
+    return [
+        (f"🎨 {top_style[0].replace('_', ' ').title()}", "Dominant Design Style", f"{top_style[1]} cards ({100*top_style[1]/card_count:.0f}%)"),
         (f"🎯 {top_color[0].title()}", "Most Used Color", f"Appears in {top_color[1]} cards"),
         (f"📝 {top_typo[0].replace('_', ' ').title()}", "Leading Typography", f"{top_typo[1]} cards use this style"),
         (f"✨ {top_theme[0].title()}", "Top Theme", f"Featured in {top_theme[1]} designs"),
     ]
 
-    for value, label, detail in insights:
+
+def build_style_breakdown_figure(design_styles: dict) -> go.Figure:
+    """Horizontal bar chart of the ten most common design styles."""
+    style_df = pd.DataFrame([
+        {"Style": k.replace("_", " ").title(), "Count": v}
+        for k, v in sorted(design_styles.items(), key=lambda x: -x[1])[:10]
+    ])
+
+    fig_style = go.Figure()
+    fig_style.add_trace(go.Bar(
+        x=style_df["Count"],
+        y=style_df["Style"],
+        orientation='h',
+        marker=dict(
+            color=['#C65D3B', '#D4846A', '#E0A48F', '#8B7355', '#A69076',
+                   '#5C8A6E', '#7BA393', '#98BBB0', '#6B8E9B', '#8AABB5'][:len(style_df)],
+            line=dict(width=0)
+        ),
+        text=style_df["Count"],
+        textposition='outside',
+        hovertemplate="<b>%{y}</b><br>Cards: %{x}<extra></extra>"
+    ))
+
+    fig_style.update_layout(
+        height=350,
+        margin=dict(l=0, r=40, t=10, b=10),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        font=dict(family="Source Sans 3, sans-serif", color="#2D2A26"),
+        xaxis=dict(showgrid=True, gridcolor="rgba(45,42,38,0.06)", zeroline=False),
+        yaxis=dict(showgrid=False, zeroline=False, autorange="reversed"),
+        showlegend=False,
+    )
+    return fig_style
+
+
+def render_executive_summary(df: pd.DataFrame, analysis_lookup: dict, analysis_data: CardTable):
+    """Render deep executive insights and analysis."""
+
+    st.markdown("""
+    <div class="section-container">
+        <div class="section-header">
+            <span class="section-number">02</span>
+            <h2 class="section-title">Executive Insights</h2>
+            <div class="section-line"></div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Gather statistics from analysis data
+    attribute_counts = count_card_attributes(analysis_lookup)
+    design_styles = attribute_counts["design_styles"]
+    typography_styles = attribute_counts["typography_styles"]
+    colors = attribute_counts["colors"]
+    themes = attribute_counts["themes"]
+
+    # Key insights cards
+    st.markdown("""
+    <div style="background: linear-gradient(135deg, #FDF8F3 0%, #FDFBF7 100%);
+                border-radius: 12px; padding: 2rem; margin-bottom: 2rem;
+                border: 1px solid rgba(198, 93, 59, 0.1);">
+        <h3 style="font-family: 'Playfair Display', 'Source Serif 4', serif; color: #C65D3B; margin-bottom: 1rem; font-size: 1.4rem;">
+            Key Findings at a Glance
+        </h3>
+        <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 1rem;">
+    """, unsafe_allow_html=True)
+
+    for value, label, detail in get_key_findings(attribute_counts, len(analysis_lookup)):
         st.markdown(f"""
         <div style="background: white; padding: 1rem; border-radius: 8px; border-left: 3px solid #C65D3B;">
-            <div style="font-family: 'Playfair Display', serif; font-size: 1.1rem; color: #2D2A26; font-weight: 600;">{value}</div>
+            <div style="font-family: 'Playfair Display', 'Source Serif 4', serif; font-size: 1.1rem; color: #2D2A26; font-weight: 600;">{value}</div>
             <div style="font-size: 0.75rem; color: #8B8680; text-transform: uppercase; letter-spacing: 0.5px;">{label}</div>
             <div style="font-size: 0.85rem; color: #5C5955; margin-top: 0.25rem;">{detail}</div>
         </div>
@@ -1623,35 +1189,8 @@ def render_executive_summary(df: pd.DataFrame, analysis_lookup: dict):
         """, unsafe_allow_html=True)
 
         if design_styles:
-            style_df = pd.DataFrame([
-                {"Style": k.replace("_", " ").title(), "Count": v}
-                for k, v in sorted(design_styles.items(), key=lambda x: -x[1])[:10]
-            ])
-
-            fig_style = go.Figure()
-            fig_style.add_trace(go.Bar(
-                x=style_df["Count"],
-                y=style_df["Style"],
-                orientation='h',
-                marker=dict(
-                    color=['#C65D3B', '#D4846A', '#E0A48F', '#8B7355', '#A69076',
-                           '#5C8A6E', '#7BA393', '#98BBB0', '#6B8E9B', '#8AABB5'][:len(style_df)],
-                    line=dict(width=0)
-                ),
-                text=style_df["Count"],
-                textposition='outside',
-                hovertemplate="<b>%{y}</b><br>Cards: %{x}<extra></extra>"
-            ))
-
-            fig_style.update_layout(
-                height=350,
-                margin=dict(l=0, r=40, t=10, b=10),
-                paper_bgcolor="rgba(0,0,0,0)",
-                plot_bgcolor="rgba(0,0,0,0)",
-                font=dict(family="Source Sans 3, sans-serif", color="#2D2A26"),
-                xaxis=dict(showgrid=True, gridcolor="rgba(45,42,38,0.06)", zeroline=False),
-                yaxis=dict(showgrid=False, zeroline=False, autorange="reversed"),
-                showlegend=False,
+            fig_style = cached_figure(
+                "design_style_breakdown", lambda: build_style_breakdown_figure(design_styles), get_view_key(df)
             )
             st.plotly_chart(fig_style, use_container_width=True, config={"displayModeBar": False})
 
@@ -1664,33 +1203,37 @@ def render_executive_summary(df: pd.DataFrame, analysis_lookup: dict):
         """, unsafe_allow_html=True)
 
         if typography_styles:
-            typo_df = pd.DataFrame([
-                {"Typography": k.replace("_", " ").title(), "Count": v}
-                for k, v in sorted(typography_styles.items(), key=lambda x: -x[1])
-            ])
+            def build_typography_chart() -> go.Figure:
+                typo_df = pd.DataFrame([
+                    {"Typography": k.replace("_", " ").title(), "Count": v}
+                    for k, v in sorted(typography_styles.items(), key=lambda x: -x[1])
+                ])
 
-            fig_typo = go.Figure(data=[go.Pie(
-                labels=typo_df["Typography"],
-                values=typo_df["Count"],
-                hole=0.4,
-                marker=dict(
-                    colors=['#C65D3B', '#5C8A6E', '#6B8E9B', '#8B7355', '#A69076',
-                            '#D4846A', '#7BA393', '#98BBB0'][:len(typo_df)],
-                    line=dict(color='#FDFBF7', width=2)
-                ),
-                textposition='outside',
-                textinfo='label+percent',
-                textfont=dict(size=10),
-                hovertemplate="<b>%{label}</b><br>Cards: %{value}<br>Share: %{percent}<extra></extra>"
-            )])
-
-            fig_typo.update_layout(
-                height=350,
-                margin=dict(l=20, r=20, t=20, b=20),
-                paper_bgcolor="rgba(0,0,0,0)",
-                font=dict(family="Source Sans 3, sans-serif", color="#2D2A26"),
-                showlegend=False,
-            )
+                fig_typo = go.Figure(data=[go.Pie(
+                    labels=typo_df["Typography"],
+                    values=typo_df["Count"],
+                    hole=0.4,
+                    marker=dict(
+                        colors=['#C65D3B', '#5C8A6E', '#6B8E9B', '#8B7355', '#A69076',
+                                '#D4846A', '#7BA393', '#98BBB0'][:len(typo_df)],
+                        line=dict(color='#FDFBF7', width=2)
+                    ),
+                    textposition='outside',
+                    textinfo='label+percent',
+                    textfont=dict(size=10),
+                    hovertemplate="<b>%{label}</b><br>Cards: %{value}<br>Share: %{percent}<extra></extra>"
+                )])
+
+                fig_typo.update_layout(
+                    height=350,
+                    margin=dict(l=20, r=20, t=20, b=20),
+                    paper_bgcolor="rgba(0,0,0,0)",
+                    font=dict(family="Source Sans 3, sans-serif", color="#2D2A26"),
+                    showlegend=False,
+                )
+                return fig_typo
+
+            fig_typo = cached_figure("typography_breakdown", build_typography_chart, get_view_key(df))
             st.plotly_chart(fig_typo, use_container_width=True, config={"displayModeBar": False})
 
     # Color Palette Section
@@ -1701,29 +1244,16 @@ def render_executive_summary(df: pd.DataFrame, analysis_lookup: dict):
     </div>
     """, unsafe_allow_html=True)
 
-    # Color mapping for display
-    color_hex = {
-        "pink": "#FFB6C1", "white": "#FFFFFF", "orange": "#FF8C42", "green": "#5C8A6E",
-        "blue": "#6B8E9B", "yellow": "#F4D03F", "red": "#C0392B", "cream": "#FDF8F3",
-        "black": "#2D2A26", "teal": "#008080", "multicolor": "linear-gradient(90deg, #FF6B6B, #4ECDC4, #45B7D1)",
-        "brown": "#8B7355", "gold": "#D4AF37", "coral": "#FF7F50", "purple": "#9B59B6",
-        "navy": "#34495E", "tan": "#D2B48C", "mint": "#98D8C8", "lavender": "#E6E6FA",
-        "peach": "#FFCBA4", "sage": "#9CAF88", "sage green": "#9CAF88"
-    }
-
     top_colors = sorted(colors.items(), key=lambda x: -x[1])[:12]
 
     # Use st.columns for reliable rendering
     cols = st.columns(6)
     for idx, (color_name, count) in enumerate(top_colors):
-        hex_color = color_hex.get(color_name.lower(), "#CCC")
-        is_gradient = "gradient" in hex_color
-        bg_style = f"background: {hex_color};" if is_gradient else f"background-color: {hex_color};"
-        border_style = "border: 1px solid #DDD;" if color_name.lower() in ["white", "cream"] else ""
+        swatch_style = swatch_css(color_name)
 
         with cols[idx % 6]:
             st.markdown(f'''<div style="text-align: center; padding: 0.5rem;">
-<div style="width: 50px; height: 50px; border-radius: 50%; {bg_style} {border_style} margin: 0 auto; box-shadow: 0 2px 8px rgba(0,0,0,0.1);"></div>
+<div style="width: 50px; height: 50px; border-radius: 50%; {swatch_style} margin: 0 auto; box-shadow: 0 2px 8px rgba(0,0,0,0.1);"></div>
 <div style="font-size: 0.8rem; color: #2D2A26; margin-top: 0.5rem; font-weight: 500;">{color_name.title()}</div>
 <div style="font-size: 0.7rem; color: #8B8680;">{count} cards</div>
 </div>''', unsafe_allow_html=True)
@@ -1731,7 +1261,7 @@ def render_executive_summary(df: pd.DataFrame, analysis_lookup: dict):
     # ==========================================================================
     # COLOR PERFORMANCE BY OCCASION ANALYSIS
     # ==========================================================================
-    render_color_performance_by_occasion(df, analysis_lookup, color_hex)
+    render_color_performance_by_occasion(df, analysis_lookup, analysis_data)
 
     # Theme Analysis
     st.markdown("""
@@ -1745,40 +1275,44 @@ def render_executive_summary(df: pd.DataFrame, analysis_lookup: dict):
 
     with col1:
         if themes:
-            theme_df = pd.DataFrame([
-                {"Theme": k.title(), "Count": v}
-                for k, v in sorted(themes.items(), key=lambda x: -x[1])[:15]
-            ])
+            def build_theme_chart() -> go.Figure:
+                theme_df = pd.DataFrame([
+                    {"Theme": k.title(), "Count": v}
+                    for k, v in sorted(themes.items(), key=lambda x: -x[1])[:15]
+                ])
 
-            fig_theme = go.Figure()
-            fig_theme.add_trace(go.Bar(
-                x=theme_df["Theme"],
-                y=theme_df["Count"],
-                marker=dict(
-                    color='#C65D3B',
-                    line=dict(width=0)
-                ),
-                text=theme_df["Count"],
-                textposition='outside',
-                hovertemplate="<b>%{x}</b><br>Appears in %{y} cards<extra></extra>"
-            ))
+                fig_theme = go.Figure()
+                fig_theme.add_trace(go.Bar(
+                    x=theme_df["Theme"],
+                    y=theme_df["Count"],
+                    marker=dict(
+                        color='#C65D3B',
+                        line=dict(width=0)
+                    ),
+                    text=theme_df["Count"],
+                    textposition='outside',
+                    hovertemplate="<b>%{x}</b><br>Appears in %{y} cards<extra></extra>"
+                ))
 
-            fig_theme.update_layout(
-                height=300,
-                margin=dict(l=0, r=0, t=10, b=60),
-                paper_bgcolor="rgba(0,0,0,0)",
-                plot_bgcolor="rgba(0,0,0,0)",
-                font=dict(family="Source Sans 3, sans-serif", color="#2D2A26"),
-                xaxis=dict(showgrid=False, zeroline=False, tickangle=-45),
-                yaxis=dict(showgrid=True, gridcolor="rgba(45,42,38,0.06)", zeroline=False),
-                showlegend=False,
-            )
+                fig_theme.update_layout(
+                    height=300,
+                    margin=dict(l=0, r=0, t=10, b=60),
+                    paper_bgcolor="rgba(0,0,0,0)",
+                    plot_bgcolor="rgba(0,0,0,0)",
+                    font=dict(family="Source Sans 3, sans-serif", color="#2D2A26"),
+                    xaxis=dict(showgrid=False, zeroline=False, tickangle=-45),
+                    yaxis=dict(showgrid=True, gridcolor="rgba(45,42,38,0.06)", zeroline=False),
+                    showlegend=False,
+                )
+                return fig_theme
+
+            fig_theme = cached_figure("theme_breakdown", build_theme_chart, get_view_key(df))
             st.plotly_chart(fig_theme, use_container_width=True, config={"displayModeBar": False})
 
     with col2:
         st.markdown("""
         <div style="background: #FDF8F3; padding: 1.5rem; border-radius: 8px; height: 100%;">
-            <h4 style="font-family: 'Playfair Display', serif; color: #C65D3B; margin-bottom: 1rem; font-size: 1rem;">
+            <h4 style="font-family: 'Playfair Display', 'Source Serif 4', serif; color: #C65D3B; margin-bottom: 1rem; font-size: 1rem;">
                 Theme Insights
             </h4>
         """, unsafe_allow_html=True)
@@ -1798,7 +1332,7 @@ def render_executive_summary(df: pd.DataFrame, analysis_lookup: dict):
     st.markdown("""
     <div style="background: linear-gradient(135deg, #2D2A26 0%, #3D3A36 100%);
                 border-radius: 12px; padding: 2rem; margin-top: 2rem; color: white;">
-        <h3 style="font-family: 'Playfair Display', serif; color: #F4D03F; margin-bottom: 1.5rem; font-size: 1.3rem;">
+        <h3 style="font-family: 'Playfair Display', 'Source Serif 4', serif; color: #F4D03F; margin-bottom: 1.5rem; font-size: 1.3rem;">
             Strategic Recommendations
         </h3>
         <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1.5rem;">
@@ -1827,7 +1361,53 @@ def render_executive_summary(df: pd.DataFrame, analysis_lookup: dict):
 
 
 
-def render_artist_performance(analysis_data: list, csv_df: pd.DataFrame):
+def build_artist_bar_figure(top_artists: pd.DataFrame) -> go.Figure:
+    """Horizontal bar chart of artists by total sends."""
+    chart_data = top_artists.copy()
+    chart_data = chart_data.sort_values('Total Sends', ascending=True)
+
+    # Truncate long artist names
+    chart_data['Display Name'] = chart_data['Artist'].apply(
+        lambda x: x[:25] + '...' if len(str(x)) > 25 else x
+    )
+
+    fig_bar = go.Figure()
+    fig_bar.add_trace(go.Bar(
+        x=chart_data['Total Sends'],
+        y=chart_data['Display Name'],
+        orientation='h',
+        marker=dict(
+            color=['#C65D3B', '#D4785C', '#E8A87C', '#DEB887', '#B8860B',
+                   '#CD853F', '#8B7355', '#A0522D', '#BC8F8F', '#C4A484',
+                   '#D2B48C', '#DAA520', '#E9967A', '#F4A460', '#FFDAB9'][:len(chart_data)][::-1],
+            line=dict(width=0)
+        ),
+        text=chart_data['Total Sends'].apply(lambda x: f'{x:,}'),
+        textposition='outside',
+        hovertemplate="<b>%{y}</b><br>Total Sends: %{x:,.0f}<extra></extra>"
+    ))
+
+    fig_bar.update_layout(
+        height=500,
+        margin=dict(l=0, r=60, t=10, b=10),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        font=dict(family="Source Sans 3, sans-serif", color="#2D2A26"),
+        xaxis=dict(
+            showgrid=True,
+            gridcolor="rgba(45, 42, 38, 0.06)",
+            zeroline=False,
+        ),
+        yaxis=dict(
+            showgrid=False,
+            zeroline=False,
+        ),
+        showlegend=False,
+    )
+    return fig_bar
+
+
+def render_artist_performance(analysis_data: CardTable, csv_df: pd.DataFrame):
     """Render the Artist Performance Intelligence section with leaderboard and charts."""
 
     st.markdown("""
@@ -1841,7 +1421,7 @@ def render_artist_performance(analysis_data: list, csv_df: pd.DataFrame):
     """, unsafe_allow_html=True)
 
     # Build artist statistics
-    artist_df = build_artist_stats(analysis_data, csv_df)
+    artist_df = load_artist_stats(analysis_data, csv_df, get_view_version(csv_df))
 
     if artist_df.empty:
         st.info("No artist data available for analysis.")
@@ -1858,7 +1438,7 @@ def render_artist_performance(analysis_data: list, csv_df: pd.DataFrame):
     <div style="background: linear-gradient(135deg, #FDF8F3 0%, #FDFBF7 100%);
                 border-radius: 12px; padding: 2rem; margin-bottom: 2rem;
                 border: 1px solid rgba(198, 93, 59, 0.1);">
-        <h3 style="font-family: 'Playfair Display', serif; color: #C65D3B; margin-bottom: 1rem; font-size: 1.4rem;">
+        <h3 style="font-family: 'Playfair Display', 'Source Serif 4', serif; color: #C65D3B; margin-bottom: 1rem; font-size: 1.4rem;">
             Creative Talent Overview
         </h3>
         <p style="font-family: 'Source Sans 3', sans-serif; font-size: 1rem; color: #5C5955; line-height: 1.6; margin-bottom: 1.5rem;">
@@ -1867,7 +1447,7 @@ def render_artist_performance(analysis_data: list, csv_df: pd.DataFrame):
         </p>
         <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem;">
             <div style="background: white; padding: 1rem; border-radius: 8px; border-left: 3px solid #C65D3B;">
-                <div style="font-family: 'Playfair Display', serif; font-size: 1.1rem; color: #2D2A26; font-weight: 600;">
+                <div style="font-family: 'Playfair Display', 'Source Serif 4', serif; font-size: 1.1rem; color: #2D2A26; font-weight: 600;">
                     {top_artist['Artist'] if top_artist is not None else 'N/A'}
                 </div>
                 <div style="font-size: 0.75rem; color: #8B8680; text-transform: uppercase; letter-spacing: 0.5px;">Top Artist</div>
@@ -1876,7 +1456,7 @@ def render_artist_performance(analysis_data: list, csv_df: pd.DataFrame):
                 </div>
             </div>
             <div style="background: white; padding: 1rem; border-radius: 8px; border-left: 3px solid #5C8A6E;">
-                <div style="font-family: 'Playfair Display', serif; font-size: 1.1rem; color: #2D2A26; font-weight: 600;">
+                <div style="font-family: 'Playfair Display', 'Source Serif 4', serif; font-size: 1.1rem; color: #2D2A26; font-weight: 600;">
                     {total_artists}
                 </div>
                 <div style="font-size: 0.75rem; color: #8B8680; text-transform: uppercase; letter-spacing: 0.5px;">Total Artists</div>
@@ -1885,7 +1465,7 @@ def render_artist_performance(analysis_data: list, csv_df: pd.DataFrame):
                 </div>
             </div>
             <div style="background: white; padding: 1rem; border-radius: 8px; border-left: 3px solid #6B8E9B;">
-                <div style="font-family: 'Playfair Display', serif; font-size: 1.1rem; color: #2D2A26; font-weight: 600;">
+                <div style="font-family: 'Playfair Display', 'Source Serif 4', serif; font-size: 1.1rem; color: #2D2A26; font-weight: 600;">
                     {int(artist_df['Avg Sends per Card'].mean()):,}
                 </div>
                 <div style="font-size: 0.75rem; color: #8B8680; text-transform: uppercase; letter-spacing: 0.5px;">Avg Sends/Card</div>
@@ -1937,17 +1517,17 @@ def render_artist_performance(analysis_data: list, csv_df: pd.DataFrame):
                 c1, c2, c3 = st.columns([1, 6, 2])
                 with c1:
                     st.markdown(f'''<div style="width: 32px; height: 32px; border-radius: 50%; display: flex;
-                        align-items: center; justify-content: center; font-family: Playfair Display, serif;
+                        align-items: center; justify-content: center; font-family: Playfair Display, Source Serif 4, serif;
                         font-size: 0.85rem; font-weight: 600; background: {rank_bg}; color: {rank_color};">{rank}</div>''',
                         unsafe_allow_html=True)
                 with c2:
-                    st.markdown(f'''<div style="font-family: Playfair Display, serif; font-size: 0.95rem;
+                    st.markdown(f'''<div style="font-family: Playfair Display, Source Serif 4, serif; font-size: 0.95rem;
                         color: #2D2A26; font-weight: 600;">{artist}</div>
                         <div style="font-size: 0.75rem; color: #8B8680;">{card_count} cards · {avg_sends:,} avg/card · <span style="color: #C65D3B;">{style}</span></div>''',
                         unsafe_allow_html=True)
                 with c3:
                     st.markdown(f'''<div style="text-align: right;">
-                        <div style="font-family: Playfair Display, serif; font-size: 1.1rem; color: #C65D3B; font-weight: 600;">{total_sends:,}</div>
+                        <div style="font-family: Playfair Display, Source Serif 4, serif; font-size: 1.1rem; color: #C65D3B; font-weight: 600;">{total_sends:,}</div>
                         <div style="font-size: 0.7rem; color: #8B8680; text-transform: uppercase;">sends</div>
                     </div>''', unsafe_allow_html=True)
 
@@ -1960,48 +1540,7 @@ def render_artist_performance(analysis_data: list, csv_df: pd.DataFrame):
         """, unsafe_allow_html=True)
 
         # Create horizontal bar chart
-        chart_data = top_15_artists.copy()
-        chart_data = chart_data.sort_values('Total Sends', ascending=True)
-
-        # Truncate long artist names
-        chart_data['Display Name'] = chart_data['Artist'].apply(
-            lambda x: x[:25] + '...' if len(str(x)) > 25 else x
-        )
-
-        fig_bar = go.Figure()
-        fig_bar.add_trace(go.Bar(
-            x=chart_data['Total Sends'],
-            y=chart_data['Display Name'],
-            orientation='h',
-            marker=dict(
-                color=['#C65D3B', '#D4785C', '#E8A87C', '#DEB887', '#B8860B',
-                       '#CD853F', '#8B7355', '#A0522D', '#BC8F8F', '#C4A484',
-                       '#D2B48C', '#DAA520', '#E9967A', '#F4A460', '#FFDAB9'][:len(chart_data)][::-1],
-                line=dict(width=0)
-            ),
-            text=chart_data['Total Sends'].apply(lambda x: f'{x:,}'),
-            textposition='outside',
-            hovertemplate="<b>%{y}</b><br>Total Sends: %{x:,.0f}<extra></extra>"
-        ))
-
-        fig_bar.update_layout(
-            height=500,
-            margin=dict(l=0, r=60, t=10, b=10),
-            paper_bgcolor="rgba(0,0,0,0)",
-            plot_bgcolor="rgba(0,0,0,0)",
-            font=dict(family="Source Sans 3, sans-serif", color="#2D2A26"),
-            xaxis=dict(
-                showgrid=True,
-                gridcolor="rgba(45, 42, 38, 0.06)",
-                zeroline=False,
-            ),
-            yaxis=dict(
-                showgrid=False,
-                zeroline=False,
-            ),
-            showlegend=False,
-        )
-
+        fig_bar = cached_figure("top_artists", lambda: build_artist_bar_figure(top_15_artists), get_view_key(csv_df))
         st.plotly_chart(fig_bar, use_container_width=True, config={"displayModeBar": False})
 
     # Style specialty breakdown
@@ -2021,7 +1560,7 @@ def render_artist_performance(analysis_data: list, csv_df: pd.DataFrame):
             st.markdown(f'''
             <div style="text-align: center; padding: 1rem; background: white; border-radius: 8px;
                         border: 1px solid rgba(45, 42, 38, 0.06);">
-                <div style="font-family: \'Playfair Display\', serif; font-size: 1.5rem;
+                <div style="font-family: \'Playfair Display\', \'Source Serif 4\', serif; font-size: 1.5rem;
                             color: #C65D3B; font-weight: 600;">{count}</div>
                 <div style="font-size: 0.8rem; color: #2D2A26; font-weight: 500;">{style}</div>
                 <div style="font-size: 0.7rem; color: #8B8680;">artists</div>
@@ -2029,6 +1568,13 @@ def render_artist_performance(analysis_data: list, csv_df: pd.DataFrame):
             ''', unsafe_allow_html=True)
 
 
+def load_more_gallery_cards(total_cards: int):
+    """Append the next batch to the scrolling gallery, capped at the portfolio."""
+    loaded = st.session_state.get("gallery_loaded", GALLERY_BATCH_SIZE) + GALLERY_BATCH_SIZE
+    st.session_state.gallery_loaded = min(loaded, total_cards)
+
+
+@st.fragment
 def render_gallery(df: pd.DataFrame, analysis_lookup: dict):
     """Render the card gallery with beautiful styling."""
 
@@ -2049,15 +1595,25 @@ def render_gallery(df: pd.DataFrame, analysis_lookup: dict):
     # Pagination settings
     total_cards = len(df)
 
+    # A different filter or sort starts the gallery over from its first card
+    view_key = get_view_key(df)
+    if st.session_state.get("gallery_view_key") != view_key:
+        st.session_state.gallery_view_key = view_key
+        st.session_state.gallery_loaded = GALLERY_BATCH_SIZE
+        st.session_state.gallery_page_num = 1
+
     # Display options at the top
     col1, col2, col3 = st.columns([1, 1, 1])
     with col2:
-        show_all = st.checkbox("Show all cards on one page", key="gallery_show_all")
+        show_all = st.checkbox("Show cards on one scrolling page", key="gallery_show_all")
 
     if show_all:
-        page_df = df
+        # Scrolling view: cards are materialized in batches that "Load more" appends to,
+        # and the images of the next few are paged in so the next batch renders quickly
         start_idx = 0
-        end_idx = total_cards
+        end_idx = min(st.session_state.get("gallery_loaded", GALLERY_BATCH_SIZE), total_cards)
+        page_df = df.iloc[:end_idx]
+        prefetch_card_images(df["Card Name"].iloc[end_idx:end_idx + GALLERY_OVERSCAN])
         total_pages = 1
         current_page = 1
     else:
@@ -2101,14 +1657,9 @@ def render_gallery(df: pd.DataFrame, analysis_lookup: dict):
             occasion = analysis_lookup[card_id].get("occasion", "general").title()
 
         # Get image
-        image_path = get_card_image_path(card_name)
-
-        if image_path:
-            img_base64 = get_image_base64(image_path)
-            if img_base64:
-                img_html = f'<img src="data:image/jpeg;base64,{img_base64}" alt="{display_name}">'
-            else:
-                img_html = '<div class="no-image-placeholder">No Preview</div>'
+        img_uri = get_card_image_uri(card_name)
+        if img_uri:
+            img_html = f'<img src="{img_uri}" alt="{display_name}">'
         else:
             img_html = '<div class="no-image-placeholder">No Preview</div>'
 
@@ -2135,6 +1686,24 @@ def render_gallery(df: pd.DataFrame, analysis_lookup: dict):
 
     st.markdown("<br>", unsafe_allow_html=True)
 
+    # Load-more control for the scrolling view
+    if show_all and end_idx < total_cards:
+        more_col1, more_col2, more_col3 = st.columns([1, 2, 1])
+
+        with more_col2:
+            remaining = total_cards - end_idx
+            st.markdown(f"""
+            <div style="text-align: center; padding: 8px; font-family: 'Source Sans 3', sans-serif; font-size: 0.95rem; color: #1a1a1a;">
+                <strong>{remaining:,}</strong> more cards below
+            </div>
+            """, unsafe_allow_html=True)
+
+        with more_col3:
+            st.button(
+                f"Load {min(GALLERY_BATCH_SIZE, remaining)} more ▼", key="gallery_load_more",
+                on_click=load_more_gallery_cards, args=(total_cards,)
+            )
+
     # Bottom pagination navigation (only show if not showing all)
     if not show_all and total_pages > 1:
         st.markdown("<br>", unsafe_allow_html=True)
@@ -2166,11 +1735,10 @@ def render_gallery(df: pd.DataFrame, analysis_lookup: dict):
                 st.session_state.gallery_page_num = total_pages
 
 
-def render_color_performance_by_occasion(df: pd.DataFrame, analysis_lookup: dict, color_hex: dict):
+def render_color_performance_by_occasion(df: pd.DataFrame, analysis_lookup: dict, analysis_data: CardTable):
     """Render the Color Performance by Occasion analysis section."""
     import numpy as np
     from collections import defaultdict
-    from itertools import combinations
 
     st.markdown("""
     <div class="chart-container" style="margin-top: 2.5rem;">
@@ -2179,73 +1747,52 @@ def render_color_performance_by_occasion(df: pd.DataFrame, analysis_lookup: dict
     </div>
     """, unsafe_allow_html=True)
 
-    # Build data structures for analysis
-    # occasion -> color -> list of sends
-    occasion_color_sends = defaultdict(lambda: defaultdict(list))
+    # Per occasion/color statistics come from the shared aggregate cube
+    view_version = get_view_version(df)
+    cube = load_aggregate_cube(analysis_data, view_version)
+    occasion_colors = cube.slice(["occasion", "color"])
+    color_totals = occasion_colors.groupby(level="color", sort=False)[["count", "sum"]].sum()
+    color_totals["mean"] = color_totals["sum"] / color_totals["count"]
+    occasion_card_count = cube.slice(["occasion"])["count"]
+
+    # Color pair counts and average sends are products of the card x color one-hot matrix
+    color_pairs = load_color_cooccurrence(analysis_data, view_version)
+    pair_means, pair_counts = color_pairs.pair_means()
+
+    # Build data structures for palette analysis
     # occasion -> list of (color_combo_tuple, sends)
     occasion_palette_sends = defaultdict(list)
-    # color pair -> total sends (for correlation)
-    color_pair_sends = defaultdict(list)
-    # all color pairs that appear together
-    color_cooccurrence = defaultdict(int)
-    # color -> occasion -> count (for underutilized analysis)
-    color_occasion_count = defaultdict(lambda: defaultdict(int))
-    # occasion -> total cards
-    occasion_card_count = defaultdict(int)
 
     for card_id, analysis in analysis_lookup.items():
         occasion = analysis.get("occasion", "").lower()
         if not occasion:
             continue
 
-        occasion_card_count[occasion] += 1
         card_colors = analysis.get("primary_colors", [])
         sends = analysis.get("sends_current", 0)
 
         if not card_colors or not isinstance(card_colors, list):
             continue
 
-        # Track individual color performance per occasion
-        for color in card_colors:
-            color_lower = color.lower()
-            occasion_color_sends[occasion][color_lower].append(sends)
-            color_occasion_count[color_lower][occasion] += 1
-
         # Track color combinations (palette) performance
         # Sort colors to create consistent palette keys
         sorted_colors = tuple(sorted([c.lower() for c in card_colors]))
         if len(sorted_colors) >= 2:
             occasion_palette_sends[occasion].append((sorted_colors, sends))
 
-        # Track color co-occurrence for correlation matrix
-        for c1, c2 in combinations(sorted([c.lower() for c in card_colors]), 2):
-            color_cooccurrence[(c1, c2)] += 1
-            color_pair_sends[(c1, c2)].append(sends)
-
     # Get top 5 occasions by total sends
-    occasion_total_sends = {}
-    for occasion in occasion_color_sends.keys():
-        total = sum(sum(sends_list) for sends_list in occasion_color_sends[occasion].values())
-        occasion_total_sends[occasion] = total
-
-    top_occasions = sorted(occasion_total_sends.items(), key=lambda x: -x[1])[:5]
-    top_occasion_names = [occ[0] for occ in top_occasions]
+    occasion_total_sends = occasion_colors.groupby(level="occasion", sort=False)["sum"].sum()
+    top_occasion_names = occasion_total_sends.sort_values(ascending=False, kind="stable").index[:5].tolist()
 
     # Get top colors across all occasions
-    all_color_sends = defaultdict(list)
-    for occasion_data in occasion_color_sends.values():
-        for color, sends_list in occasion_data.items():
-            all_color_sends[color].extend(sends_list)
-
-    top_colors = sorted(all_color_sends.items(), key=lambda x: -sum(x[1]))[:8]
-    top_color_names = [c[0] for c in top_colors]
+    top_color_names = color_totals["sum"].sort_values(ascending=False, kind="stable").index[:8].tolist()
 
     # =========================================================================
     # 1. GROUPED BAR CHART: Average sends by color for top 5 occasions
     # =========================================================================
     st.markdown("""
     <div style="margin-top: 1.5rem; margin-bottom: 0.5rem;">
-        <h4 style="font-family: 'Playfair Display', serif; color: #2D2A26; font-size: 1.1rem; margin-bottom: 0.25rem;">
+        <h4 style="font-family: 'Playfair Display', 'Source Serif 4', serif; color: #2D2A26; font-size: 1.1rem; margin-bottom: 0.25rem;">
             Average Sends by Color & Occasion
         </h4>
         <p style="font-size: 0.85rem; color: #8B8680; margin-bottom: 1rem;">
@@ -2255,64 +1802,57 @@ def render_color_performance_by_occasion(df: pd.DataFrame, analysis_lookup: dict
     """, unsafe_allow_html=True)
 
     # Build data for grouped bar chart
-    bar_data = []
-    for occasion in top_occasion_names:
-        for color in top_color_names:
-            sends_list = occasion_color_sends[occasion].get(color, [])
-            avg_sends = np.mean(sends_list) if sends_list else 0
-            bar_data.append({
-                "Occasion": occasion.replace("_", " ").title(),
-                "Color": color.title(),
-                "Average Sends": round(avg_sends),
-                "Card Count": len(sends_list)
-            })
+    def build_grouped_chart() -> go.Figure:
+        bar_data = []
+        for occasion in top_occasion_names:
+            for color in top_color_names:
+                has_cell = (occasion, color) in occasion_colors.index
+                bar_data.append({
+                    "Occasion": occasion.replace("_", " ").title(),
+                    "Color": color.title(),
+                    "Average Sends": round(occasion_colors.at[(occasion, color), "mean"]) if has_cell else 0,
+                    "Card Count": int(occasion_colors.at[(occasion, color), "count"]) if has_cell else 0
+                })
 
-    bar_df = pd.DataFrame(bar_data)
+        bar_df = pd.DataFrame(bar_data)
 
-    # Create grouped bar chart
-    fig_grouped = go.Figure()
+        # Create grouped bar chart
+        fig_grouped = go.Figure()
 
-    # Color palette for the chart bars
-    bar_colors = {
-        "Pink": "#FFB6C1", "White": "#E8E8E8", "Orange": "#FF8C42", "Green": "#5C8A6E",
-        "Blue": "#6B8E9B", "Yellow": "#F4D03F", "Red": "#C0392B", "Cream": "#FDF8F3",
-        "Black": "#2D2A26", "Teal": "#008080", "Multicolor": "#9B59B6",
-        "Brown": "#8B7355", "Gold": "#D4AF37", "Coral": "#FF7F50", "Purple": "#9B59B6",
-        "Mint": "#98D8C8", "Peach": "#FFCBA4"
-    }
+        for color in [c.title() for c in top_color_names]:
+            color_data = bar_df[bar_df["Color"] == color]
+            fig_grouped.add_trace(go.Bar(
+                name=color,
+                x=color_data["Occasion"],
+                y=color_data["Average Sends"],
+                marker_color=chart_color(color),
+                marker_line_width=0,
+                hovertemplate=f"<b>{color}</b><br>%{{x}}<br>Avg: %{{y:,.0f}} sends<extra></extra>"
+            ))
 
-    for color in [c.title() for c in top_color_names]:
-        color_data = bar_df[bar_df["Color"] == color]
-        fig_grouped.add_trace(go.Bar(
-            name=color,
-            x=color_data["Occasion"],
-            y=color_data["Average Sends"],
-            marker_color=bar_colors.get(color, "#CCC"),
-            marker_line_width=0,
-            hovertemplate=f"<b>{color}</b><br>%{{x}}<br>Avg: %{{y:,.0f}} sends<extra></extra>"
-        ))
-
-    fig_grouped.update_layout(
-        barmode='group',
-        height=350,
-        margin=dict(l=0, r=0, t=10, b=60),
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-        font=dict(family="Source Sans 3, sans-serif", color="#2D2A26"),
-        xaxis=dict(showgrid=False, zeroline=False, tickangle=-15),
-        yaxis=dict(showgrid=True, gridcolor="rgba(45,42,38,0.06)", zeroline=False, title="Average Sends"),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="center",
-            x=0.5,
-            font=dict(size=10)
-        ),
-        bargap=0.15,
-        bargroupgap=0.1
-    )
+        fig_grouped.update_layout(
+            barmode='group',
+            height=350,
+            margin=dict(l=0, r=0, t=10, b=60),
+            paper_bgcolor="rgba(0,0,0,0)",
+            plot_bgcolor="rgba(0,0,0,0)",
+            font=dict(family="Source Sans 3, sans-serif", color="#2D2A26"),
+            xaxis=dict(showgrid=False, zeroline=False, tickangle=-15),
+            yaxis=dict(showgrid=True, gridcolor="rgba(45,42,38,0.06)", zeroline=False, title="Average Sends"),
+            legend=dict(
+                orientation="h",
+                yanchor="bottom",
+                y=1.02,
+                xanchor="center",
+                x=0.5,
+                font=dict(size=10)
+            ),
+            bargap=0.15,
+            bargroupgap=0.1
+        )
+        return fig_grouped
 
+    fig_grouped = cached_figure("color_by_occasion", build_grouped_chart, get_view_key(df))
     st.plotly_chart(fig_grouped, use_container_width=True, config={"displayModeBar": False})
 
     # =========================================================================
@@ -2323,7 +1863,7 @@ def render_color_performance_by_occasion(df: pd.DataFrame, analysis_lookup: dict
     with col1:
         st.markdown("""
         <div style="margin-top: 1rem; margin-bottom: 0.5rem;">
-            <h4 style="font-family: 'Playfair Display', serif; color: #2D2A26; font-size: 1.1rem; margin-bottom: 0.25rem;">
+            <h4 style="font-family: 'Playfair Display', 'Source Serif 4', serif; color: #2D2A26; font-size: 1.1rem; margin-bottom: 0.25rem;">
                 Color Correlation Matrix
             </h4>
             <p style="font-size: 0.85rem; color: #8B8680; margin-bottom: 1rem;">
@@ -2333,69 +1873,62 @@ def render_color_performance_by_occasion(df: pd.DataFrame, analysis_lookup: dict
         """, unsafe_allow_html=True)
 
         # Build correlation matrix for top colors
-        matrix_colors = top_color_names[:6]  # Limit to 6 for readability
-        matrix_size = len(matrix_colors)
-        correlation_matrix = np.zeros((matrix_size, matrix_size))
-
-        # Calculate average sends for each color pair
-        for i, c1 in enumerate(matrix_colors):
-            for j, c2 in enumerate(matrix_colors):
-                if i == j:
-                    # Diagonal: average sends for this color alone
-                    correlation_matrix[i][j] = np.mean(all_color_sends.get(c1, [0])) if all_color_sends.get(c1) else 0
-                else:
-                    # Off-diagonal: average sends when these colors appear together
-                    pair_key = tuple(sorted([c1, c2]))
-                    pair_sends = color_pair_sends.get(pair_key, [])
-                    correlation_matrix[i][j] = np.mean(pair_sends) if pair_sends else 0
-
-        # Create heatmap
-        fig_heatmap = go.Figure(data=go.Heatmap(
-            z=correlation_matrix,
-            x=[c.title() for c in matrix_colors],
-            y=[c.title() for c in matrix_colors],
-            colorscale=[
-                [0, "#FDF8F3"],
-                [0.25, "#FFCBA4"],
-                [0.5, "#E8A87C"],
-                [0.75, "#D4785C"],
-                [1, "#C65D3B"]
-            ],
-            hovertemplate="<b>%{y} + %{x}</b><br>Avg Sends: %{z:,.0f}<extra></extra>",
-            showscale=True,
-            colorbar=dict(
-                title=dict(text="Avg Sends", side="right"),
-                tickformat=",.0f"
-            )
-        ))
-
-        # Add text annotations
-        annotations = []
-        for i, row in enumerate(correlation_matrix):
-            for j, val in enumerate(row):
-                annotations.append(dict(
-                    x=matrix_colors[j].title(),
-                    y=matrix_colors[i].title(),
-                    text=f"{int(val):,}" if val > 0 else "-",
-                    showarrow=False,
-                    font=dict(size=9, color="#2D2A26" if val < np.max(correlation_matrix) * 0.7 else "#FFF")
-                ))
+        def build_correlation_heatmap() -> go.Figure:
+            matrix_colors = [c for c in top_color_names if c in color_pairs.column][:6]  # Limit to 6 for readability
+
+            # Average sends when both colors appear together (diagonal: the color alone)
+            positions = color_pairs.indices(matrix_colors)
+            correlation_matrix = pair_means[np.ix_(positions, positions)]
+
+            # Create heatmap
+            fig_heatmap = go.Figure(data=go.Heatmap(
+                z=correlation_matrix,
+                x=[c.title() for c in matrix_colors],
+                y=[c.title() for c in matrix_colors],
+                colorscale=[
+                    [0, "#FDF8F3"],
+                    [0.25, "#FFCBA4"],
+                    [0.5, "#E8A87C"],
+                    [0.75, "#D4785C"],
+                    [1, "#C65D3B"]
+                ],
+                hovertemplate="<b>%{y} + %{x}</b><br>Avg Sends: %{z:,.0f}<extra></extra>",
+                showscale=True,
+                colorbar=dict(
+                    title=dict(text="Avg Sends", side="right"),
+                    tickformat=",.0f"
+                )
+            ))
 
-        fig_heatmap.update_layout(
-            height=300,
-            margin=dict(l=0, r=0, t=10, b=10),
-            paper_bgcolor="rgba(0,0,0,0)",
-            font=dict(family="Source Sans 3, sans-serif", color="#2D2A26"),
-            xaxis=dict(side="bottom"),
-            annotations=annotations
-        )
+            # Add text annotations
+            annotations = []
+            for i, row in enumerate(correlation_matrix):
+                for j, val in enumerate(row):
+                    annotations.append(dict(
+                        x=matrix_colors[j].title(),
+                        y=matrix_colors[i].title(),
+                        text=f"{int(val):,}" if val > 0 else "-",
+                        showarrow=False,
+                        font=dict(size=9, color="#2D2A26" if val < np.max(correlation_matrix) * 0.7 else "#FFF")
+                    ))
+
+            fig_heatmap.update_layout(
+                height=300,
+                margin=dict(l=0, r=0, t=10, b=10),
+                paper_bgcolor="rgba(0,0,0,0)",
+                font=dict(family="Source Sans 3, sans-serif", color="#2D2A26"),
+                xaxis=dict(side="bottom"),
+                annotations=annotations
+            )
+            return fig_heatmap
 
+        fig_heatmap = cached_figure("color_correlation_heatmap", build_correlation_heatmap, get_view_key(df))
         st.plotly_chart(fig_heatmap, use_container_width=True, config={"displayModeBar": False})
 
     with col2:
         st.markdown("""
         <div style="margin-top: 1rem; margin-bottom: 0.5rem;">
-            <h4 style="font-family: 'Playfair Display', serif; color: #2D2A26; font-size: 1.1rem; margin-bottom: 0.25rem;">
+            <h4 style="font-family: 'Playfair Display', 'Source Serif 4', serif; color: #2D2A26; font-size: 1.1rem; margin-bottom: 0.25rem;">
                 Winning Palettes
             </h4>
             <p style="font-size: 0.85rem; color: #8B8680; margin-bottom: 1rem;">
@@ -2434,17 +1967,13 @@ def render_color_performance_by_occasion(df: pd.DataFrame, analysis_lookup: dict
             # Create color swatches HTML
             swatches_html = ""
             for color in palette_colors:
-                hex_val = color_hex.get(color, "#CCC")
-                is_gradient = "gradient" in str(hex_val)
-                bg = f"background: {hex_val};" if is_gradient else f"background-color: {hex_val};"
-                border = "border: 1px solid #DDD;" if color in ["white", "cream"] else ""
-                swatches_html += f'<div style="width: 24px; height: 24px; border-radius: 50%; {bg} {border} display: inline-block; margin-right: 4px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);"></div>'
+                swatches_html += f'<div style="width: 24px; height: 24px; border-radius: 50%; {swatch_css(color)} display: inline-block; margin-right: 4px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);"></div>'
 
             palette_name = " + ".join([c.title() for c in palette_colors])
 
             st.markdown(f"""
             <div style="display: flex; align-items: center; padding: 0.75rem; background: {'#FDF8F3' if i % 2 == 1 else '#FFF'}; border-radius: 8px; margin-bottom: 0.5rem; border-left: 3px solid #C65D3B;">
-                <div style="font-family: 'Playfair Display', serif; font-size: 1.1rem; color: #C65D3B; font-weight: 600; width: 24px;">#{i}</div>
+                <div style="font-family: 'Playfair Display', 'Source Serif 4', serif; font-size: 1.1rem; color: #C65D3B; font-weight: 600; width: 24px;">#{i}</div>
                 <div style="flex: 1; margin-left: 0.75rem;">
                     <div style="display: flex; align-items: center; margin-bottom: 0.25rem;">
                         {swatches_html}
@@ -2452,7 +1981,7 @@ def render_color_performance_by_occasion(df: pd.DataFrame, analysis_lookup: dict
                     <div style="font-size: 0.8rem; color: #5C5955;">{palette_name}</div>
                 </div>
                 <div style="text-align: right;">
-                    <div style="font-family: 'Playfair Display', serif; font-size: 1rem; color: #2D2A26; font-weight: 600;">{avg_sends:,.0f}</div>
+                    <div style="font-family: 'Playfair Display', 'Source Serif 4', serif; font-size: 1rem; color: #2D2A26; font-weight: 600;">{avg_sends:,.0f}</div>
                     <div style="font-size: 0.7rem; color: #8B8680;">avg sends ({card_count} cards)</div>
                 </div>
             </div>
@@ -2465,7 +1994,7 @@ def render_color_performance_by_occasion(df: pd.DataFrame, analysis_lookup: dict
     <div style="background: linear-gradient(135deg, #FDF8F3 0%, #FDFBF7 100%);
                 border-radius: 12px; padding: 1.5rem; margin-top: 1.5rem;
                 border: 1px solid rgba(198, 93, 59, 0.15);">
-        <h4 style="font-family: 'Playfair Display', serif; color: #C65D3B; margin-bottom: 1rem; font-size: 1.1rem;">
+        <h4 style="font-family: 'Playfair Display', 'Source Serif 4', serif; color: #C65D3B; margin-bottom: 1rem; font-size: 1.1rem;">
             Color-Occasion Insights
         </h4>
     """, unsafe_allow_html=True)
@@ -2496,14 +2025,13 @@ def render_color_performance_by_occasion(df: pd.DataFrame, analysis_lookup: dict
             })
 
     # Insight 2: Find best color for Birthday (most common occasion)
-    if "birthday" in occasion_color_sends:
-        birthday_colors = occasion_color_sends["birthday"]
-        best_birthday_color = max(birthday_colors.items(), key=lambda x: np.mean(x[1]) if x[1] else 0)
-        avg_birthday = np.mean(best_birthday_color[1]) if best_birthday_color[1] else 0
+    if "birthday" in occasion_total_sends.index:
+        birthday_colors = occasion_colors.xs("birthday", level="occasion")
+        best_birthday_color = birthday_colors["mean"].idxmax()
         insights.append({
-            "text": f"{best_birthday_color[0].title()} leads Birthday cards with {avg_birthday:,.0f} avg sends",
-            "subtext": f"Featured in {len(best_birthday_color[1])} birthday designs",
-            "colors": [best_birthday_color[0]],
+            "text": f"{best_birthday_color.title()} leads Birthday cards with {birthday_colors.at[best_birthday_color, 'mean']:,.0f} avg sends",
+            "subtext": f"Featured in {int(birthday_colors.at[best_birthday_color, 'count'])} birthday designs",
+            "colors": [best_birthday_color],
             "type": "highlight"
         })
 
@@ -2511,20 +2039,20 @@ def render_color_performance_by_occasion(df: pd.DataFrame, analysis_lookup: dict
     # Look for colors that are popular overall but underused in certain occasions
     underutilized = []
     for color in top_color_names[:5]:
-        total_usage = sum(color_occasion_count[color].values())
+        total_usage = color_totals.at[color, "count"]
         for occasion in top_occasion_names:
-            occasion_usage = color_occasion_count[color].get(occasion, 0)
-            occasion_total = occasion_card_count.get(occasion, 1)
+            has_cell = (occasion, color) in occasion_colors.index
+            occasion_usage = int(occasion_colors.at[(occasion, color), "count"]) if has_cell else 0
+            occasion_total = int(occasion_card_count.get(occasion, 1))
             usage_rate = occasion_usage / occasion_total if occasion_total > 0 else 0
 
             # If this color is used in less than 10% of cards for this occasion
             # but is popular overall
             if usage_rate < 0.1 and total_usage > 20 and occasion_usage < 5:
                 # Check if the color actually performs well when used
-                sends_when_used = occasion_color_sends[occasion].get(color, [])
-                if sends_when_used:
-                    avg_when_used = np.mean(sends_when_used)
-                    overall_avg = np.mean(all_color_sends[color]) if all_color_sends[color] else 0
+                if has_cell:
+                    avg_when_used = occasion_colors.at[(occasion, color), "mean"]
+                    overall_avg = color_totals.at[color, "mean"]
                     if avg_when_used >= overall_avg * 0.8:  # Performs reasonably well
                         underutilized.append({
                             "color": color,
@@ -2543,15 +2071,17 @@ def render_color_performance_by_occasion(df: pd.DataFrame, analysis_lookup: dict
         })
 
     # Insight 4: High-performing color pair
-    if color_pair_sends:
-        best_pair = max(color_pair_sends.items(), key=lambda x: np.mean(x[1]) if x[1] else 0)
-        pair_avg = np.mean(best_pair[1]) if best_pair[1] else 0
-        pair_count = len(best_pair[1])
+    co_occurring = np.triu(pair_counts > 0, k=1)
+    if co_occurring.any():
+        i, j = np.unravel_index(np.argmax(np.where(co_occurring, pair_means, -1)), pair_means.shape)
+        best_pair = sorted((color_pairs.colors[i], color_pairs.colors[j]))
+        pair_avg = pair_means[i, j]
+        pair_count = int(pair_counts[i, j])
         if pair_count >= 3:
             insights.append({
-                "text": f"{best_pair[0][0].title()} + {best_pair[0][1].title()} combo averages {pair_avg:,.0f} sends",
+                "text": f"{best_pair[0].title()} + {best_pair[1].title()} combo averages {pair_avg:,.0f} sends",
                 "subtext": f"A winning duo appearing in {pair_count} top cards",
-                "colors": list(best_pair[0]),
+                "colors": best_pair,
                 "type": "success"
             })
 
@@ -2562,11 +2092,7 @@ def render_color_performance_by_occasion(df: pd.DataFrame, analysis_lookup: dict
             # Create color swatches for insight
             swatches = ""
             for color in insight.get("colors", []):
-                hex_val = color_hex.get(color, "#CCC")
-                is_gradient = "gradient" in str(hex_val)
-                bg = f"background: {hex_val};" if is_gradient else f"background-color: {hex_val};"
-                border = "border: 1px solid #DDD;" if color in ["white", "cream"] else ""
-                swatches += f'<div style="width: 18px; height: 18px; border-radius: 50%; {bg} {border} display: inline-block; margin-right: 4px;"></div>'
+                swatches += f'<div style="width: 18px; height: 18px; border-radius: 50%; {swatch_css(color)} display: inline-block; margin-right: 4px;"></div>'
 
             type_colors = {
                 "success": "#5C8A6E",
@@ -2618,16 +2144,6 @@ def get_card_image_by_id(card_id: str) -> Path | None:
 def render_card_comparison(df: pd.DataFrame, analysis_lookup: dict):
     """Render the Card Comparison Tool section."""
 
-    # Color mapping for display
-    color_hex = {
-        "pink": "#FFB6C1", "white": "#FFFFFF", "orange": "#FF8C42", "green": "#5C8A6E",
-        "blue": "#6B8E9B", "yellow": "#F4D03F", "red": "#C0392B", "cream": "#FDF8F3",
-        "black": "#2D2A26", "teal": "#008080", "multicolor": "#9B59B6",
-        "brown": "#8B7355", "gold": "#D4AF37", "coral": "#FF7F50", "purple": "#9B59B6",
-        "navy": "#34495E", "tan": "#D2B48C", "mint": "#98D8C8", "lavender": "#E6E6FA",
-        "peach": "#FFCBA4", "sage": "#9CAF88", "sage green": "#9CAF88"
-    }
-
     st.markdown("""
     <div class="section-container">
         <div class="section-header">
@@ -2648,29 +2164,38 @@ def render_card_comparison(df: pd.DataFrame, analysis_lookup: dict):
         st.info("No cards available in the current filter. Adjust your filters to see cards.")
         return
 
-    # Create card options for multiselect
-    card_options = []
-    for _, row in df.iterrows():
-        card_id = row["Card ID"]
-        display_name = row["Display Name"]
-        rank = int(row["Rank"])
-        # Format: "Rank #X - Card Name"
-        card_options.append(f"#{rank} - {display_name[:50]}{'...' if len(display_name) > 50 else ''}")
+    # Type-ahead search: only the top matches (plus current picks) are sent to the browser
+    search_index = load_card_search_index(get_data_version())
+    available_ids = set(df["Card ID"])
+
+    search_query = st.text_input(
+        "Search cards",
+        placeholder="Type a rank (#12), card ID or card name...",
+        key="comparison_search"
+    )
 
-    # Create mapping from display option to card data
-    option_to_card = {opt: df.iloc[idx] for idx, opt in enumerate(card_options)}
+    # Current picks stay at the front of the options, so the keyed widget keeps them
+    # while the search matches around them change
+    picked_ids = [
+        card_id for card_id in st.session_state.get("comparison_selected_ids", [])
+        if card_id in available_ids
+    ]
+    matches = search_index.search(search_query, limit=COMPARISON_SEARCH_LIMIT, allowed=available_ids)
+    card_options = picked_ids + [card_id for card_id in matches if card_id not in picked_ids]
 
-    # Multiselect for choosing cards
-    selected_options = st.multiselect(
+    # Multiselect for choosing cards (values are card IDs)
+    selected_ids = st.multiselect(
         "Select Cards to Compare",
         options=card_options,
+        format_func=search_index.label,
         max_selections=4,
         placeholder="Choose 2-4 cards to compare...",
-        help="Select between 2 and 4 cards to see a detailed comparison"
+        help="Select between 2 and 4 cards to see a detailed comparison",
+        key="comparison_selected_ids"
     )
 
     # Validate selection
-    if len(selected_options) < 2:
+    if len(selected_ids) < 2:
         st.markdown("""
         <div class="empty-comparison-state">
             <h3>Select Cards to Compare</h3>
@@ -2679,8 +2204,12 @@ def render_card_comparison(df: pd.DataFrame, analysis_lookup: dict):
         """, unsafe_allow_html=True)
         return
 
-    # Get selected card data
-    selected_cards = [option_to_card[opt] for opt in selected_options]
+    # Get selected card data, resolved by card ID
+    selected_rows = df[df["Card ID"].isin(selected_ids)].drop_duplicates("Card ID")
+    rows_by_id = {row["Card ID"]: row for _, row in selected_rows.iterrows()}
+    selected_cards = [rows_by_id[card_id] for card_id in selected_ids if card_id in rows_by_id]
+
+    history = get_sends_history()
 
     # Determine winner (highest current sends)
     max_sends = max(card["Current Period"] for card in selected_cards)
@@ -2713,13 +2242,9 @@ def render_card_comparison(df: pd.DataFrame, analysis_lookup: dict):
             typography = analysis.get("typography_style", "N/A")
 
             # Get image
-            image_path = get_card_image_by_id(card_id)
-            if image_path:
-                img_base64 = get_image_base64(image_path)
-                if img_base64:
-                    img_html = f'<img class="comparison-card-image" src="data:image/png;base64,{img_base64}" alt="{display_name}">'
-                else:
-                    img_html = '<div class="comparison-no-image">No Preview Available</div>'
+            img_uri = get_card_image_uri_by_id(card_id)
+            if img_uri:
+                img_html = f'<img class="comparison-card-image" src="{img_uri}" alt="{display_name}">'
             else:
                 img_html = '<div class="comparison-no-image">No Preview Available</div>'
 
@@ -2730,9 +2255,7 @@ def render_card_comparison(df: pd.DataFrame, analysis_lookup: dict):
             # Build color swatches HTML
             color_swatches = ""
             for color in primary_colors[:5]:
-                hex_val = color_hex.get(color.lower(), "#CCC")
-                border = "border: 1px solid #DDD;" if color.lower() in ["white", "cream"] else ""
-                color_swatches += f'<span class="color-swatch" style="background-color: {hex_val}; {border}"></span>'
+                color_swatches += f'<span class="color-swatch" style="{swatch_css(color)}"></span>'
 
             # Build themes tags
             themes_html = ""
@@ -2790,6 +2313,16 @@ def render_card_comparison(df: pd.DataFrame, analysis_lookup: dict):
             """
             st.markdown(card_html, unsafe_allow_html=True)
 
+            # Weekly sends sparkline from the sends history
+            series = timeseries_store.card_series(history, card_id) if history else []
+            if len(series) >= 2:
+                st.plotly_chart(
+                    cached_figure("comparison_sparkline", lambda: create_trend_sparkline(series, width=240), card_id),
+                    use_container_width=True,
+                    config={"displayModeBar": False},
+                    key=f"comparison_sparkline_{card_id}"
+                )
+
     # Generate comparison summary
     render_comparison_summary(selected_cards, analysis_lookup)
 
@@ -2943,6 +2476,70 @@ def render_comparison_summary(selected_cards: list, analysis_lookup: dict):
     """, unsafe_allow_html=True)
 
 
+EXPORT_ROW_GROUP_ROWS = 50_000  # Parquet row group size of exports
+
+# Export formats: label -> (file extension, MIME type, required module or None)
+EXPORT_FORMATS = {
+    "CSV": ("csv", "text/csv", None),
+    "Parquet": ("parquet", "application/vnd.apache.parquet", "pyarrow"),
+    "XLSX": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", "openpyxl"),
+}
+
+
+def get_available_export_formats() -> list:
+    """Export formats whose optional writer dependency is installed."""
+    return [
+        label for label, (_, _, module) in EXPORT_FORMATS.items()
+        if module is None or importlib.util.find_spec(module) is not None
+    ]
+
+
+def build_export_frame(card_ids: tuple, data_version: str) -> pd.DataFrame:
+    """Join the CSV performance data with analysis attributes for the given cards."""
+    df = load_csv_data(data_version)
+    df = df[df["Card ID"].isin(card_ids)]
+
+    analysis_df = pd.DataFrame([
+        {
+            "Card ID": card.get("card_id", ""),
+            "Occasion": card.get("occasion") or "",
+            "Design Style": card.get("design_style") or "",
+            "Typography": card.get("typography_style") or "",
+            "Primary Colors": "; ".join(card.get("primary_colors") or []),
+            "Themes": "; ".join(card.get("themes") or []),
+        }
+        for card in load_analysis_data(data_version) if card.get("card_id")
+    ], columns=["Card ID", "Occasion", "Design Style", "Typography", "Primary Colors", "Themes"])
+    analysis_df = analysis_df.drop_duplicates("Card ID")
+
+    return df.merge(analysis_df, on="Card ID", how="left").fillna({
+        col: "" for col in analysis_df.columns if col != "Card ID"
+    })
+
+
+@st.cache_data(ttl=3600, max_entries=12, show_spinner=False)
+def export_dataset(export_format: str, card_ids: tuple, data_version: str) -> bytes:
+    """
+    Serialize the joined dataset in the requested format. The file is built in memory
+    (download_button serves bytes), only when a download is requested, and cached per
+    (format, selection, data version).
+    """
+    export_df = build_export_frame(card_ids, data_version)
+    buffer = io.BytesIO()
+
+    if export_format == "CSV":
+        export_df.to_csv(buffer, index=False, encoding="utf-8")
+    elif export_format == "Parquet":
+        export_df.to_parquet(buffer, index=False, row_group_size=EXPORT_ROW_GROUP_ROWS)
+    elif export_format == "XLSX":
+        with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
+            export_df.to_excel(writer, sheet_name="Cards", index=False)
+    else:
+        raise ValueError(f"Unsupported export format: {export_format}")
+
+    return buffer.getvalue()
+
+
 def render_data_table(df: pd.DataFrame, analysis_lookup: dict):
     """Render the data table view."""
 
@@ -2965,9 +2562,10 @@ def render_data_table(df: pd.DataFrame, analysis_lookup: dict):
     display_df.columns = ["Rank", "Card Name", "Current Sends", "Previous Sends", "Change", "Change %"]
 
     # Add occasion column
-    display_df["Occasion"] = df["Card ID"].apply(
-        lambda x: analysis_lookup.get(x, {}).get("occasion", "").title() if x in analysis_lookup else ""
-    )
+    occasion_by_id = {
+        card_id: (data.get("occasion") or "").title() for card_id, data in analysis_lookup.items()
+    }
+    display_df["Occasion"] = df["Card ID"].map(occasion_by_id).fillna("")
 
     st.dataframe(
         display_df,
@@ -2985,66 +2583,35 @@ def render_data_table(df: pd.DataFrame, analysis_lookup: dict):
         hide_index=True
     )
 
-    # Download button
-    csv = df.to_csv(index=False)
-    st.download_button(
-        label="Download Full Dataset",
-        data=csv,
-        file_name="greeting_card_analytics.csv",
-        mime="text/csv"
-    )
+    # Download button - the file is only generated when the button is clicked
+    export_col1, export_col2 = st.columns([1, 3])
+    with export_col1:
+        export_format = st.selectbox(
+            "Export format",
+            options=get_available_export_formats(),
+            key="export_format",
+            label_visibility="collapsed"
+        )
+    extension, mime, _ = EXPORT_FORMATS[export_format]
+    card_ids = tuple(df["Card ID"])
+    with export_col2:
+        st.download_button(
+            label="Download Full Dataset",
+            data=lambda: export_dataset(export_format, card_ids, get_data_version()),
+            file_name=f"greeting_card_analytics.{extension}",
+            mime=mime,
+            on_click="ignore"
+        )
 
 
 # =============================================================================
 # PORTFOLIO GAP ANALYSIS
 # =============================================================================
-def render_portfolio_gap_analysis(df: pd.DataFrame, analysis_lookup: dict, analysis_data: list):
-    """Render the Portfolio Gap Analysis section with interactive heatmap."""
-    import numpy as np
-
-    st.markdown("""
-    <div class="section-container">
-        <div class="section-header">
-            <span class="section-number">06</span>
-            <h2 class="section-title">Portfolio Gap Analysis</h2>
-            <div class="section-line"></div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-
-    st.markdown("""
-    <div style="background: linear-gradient(135deg, #FDF8F3 0%, #FDFBF7 100%);
-                border-radius: 12px; padding: 1.5rem 2rem; margin-bottom: 2rem;
-                border: 1px solid rgba(198, 93, 59, 0.1);">
-        <p style="font-family: 'Source Sans 3', sans-serif; font-size: 1rem; color: #5C5955; line-height: 1.6; margin: 0;">
-            This analysis reveals <strong>coverage gaps</strong> in your portfolio by cross-tabulating
-            <em>occasions</em> with <em>design styles</em>. Identify untapped opportunities where demand
-            may exist but inventory is sparse.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    # Build cross-tabulation data
-    # Collect all occasions and styles
-    occasions = set()
-    styles = set()
-    combo_cards = {}  # (occasion, style) -> list of card data
-
-    for card in analysis_data:
-        occasion = card.get("occasion", "")
-        style = card.get("design_style", "")
-        if occasion and style:
-            occasions.add(occasion)
-            styles.add(style)
-            key = (occasion, style)
-            if key not in combo_cards:
-                combo_cards[key] = []
-            combo_cards[key].append({
-                "card_id": card.get("card_id"),
-                "card_name": card.get("card_name"),
-                "sends_current": card.get("sends_current", 0),
-                "sends_previous": card.get("sends_previous", 0)
-            })
+def build_coverage_matrices(cube: AggregateCube) -> tuple:
+    """(occasion x style cells, card count matrix, sends sum matrix), rows and columns in display order."""
+    combo_cells = cube.slice(["occasion", "design_style"])
+    occasions = set(combo_cells.index.get_level_values("occasion"))
+    styles = set(combo_cells.index.get_level_values("design_style"))
 
     # Sort occasions and styles for display
     occasion_order = [
@@ -3065,23 +2632,33 @@ def render_portfolio_gap_analysis(df: pd.DataFrame, analysis_lookup: dict, analy
     styles_sorted += [s for s in sorted(styles) if s not in style_order]
 
     # Build matrix data
-    z_values = []  # counts
+    count_matrix = combo_cells["count"].unstack(fill_value=0).reindex(
+        index=occasions_sorted, columns=styles_sorted, fill_value=0
+    )
+    sum_matrix = combo_cells["sum"].unstack(fill_value=0).reindex(
+        index=occasions_sorted, columns=styles_sorted, fill_value=0
+    )
+    return combo_cells, count_matrix, sum_matrix
+
+
+def build_coverage_heatmap_figure(cube: AggregateCube, combo_cells: pd.DataFrame,
+                                  count_matrix: pd.DataFrame, sum_matrix: pd.DataFrame) -> go.Figure:
+    """Occasion x design style heatmap of card counts, with per-cell hover details."""
+    occasions_sorted = count_matrix.index.tolist()
+    styles_sorted = count_matrix.columns.tolist()
+    z_values = count_matrix.values.tolist()  # counts
     hover_texts = []  # hover information
 
     for occasion in occasions_sorted:
-        row_counts = []
         row_hover = []
         for style in styles_sorted:
-            key = (occasion, style)
-            cards = combo_cards.get(key, [])
-            count = len(cards)
-            row_counts.append(count)
+            count = count_matrix.at[occasion, style]
 
             if count > 0:
-                avg_sends = sum(c["sends_current"] for c in cards) / count
-                total_sends = sum(c["sends_current"] for c in cards)
-                top_card = max(cards, key=lambda x: x["sends_current"])
-                top_card_name = top_card['card_name'][:30] + "..." if len(top_card['card_name']) > 30 else top_card['card_name']
+                total_sends = sum_matrix.at[occasion, style]
+                avg_sends = total_sends / count
+                top_card = cube.card_name(combo_cells.at[(occasion, style), "argmax"])
+                top_card_name = top_card[:30] + "..." if len(top_card) > 30 else top_card
                 hover = (
                     f"<b>{occasion.replace('_', ' ').title()} x {style.replace('_', ' ').title()}</b><br>"
                     f"Cards: {count}<br>"
@@ -3096,7 +2673,6 @@ def render_portfolio_gap_analysis(df: pd.DataFrame, analysis_lookup: dict, analy
                 )
             row_hover.append(hover)
 
-        z_values.append(row_counts)
         hover_texts.append(row_hover)
 
     # Create formatted labels
@@ -3155,6 +2731,44 @@ def render_portfolio_gap_analysis(df: pd.DataFrame, analysis_lookup: dict, analy
             autorange="reversed"
         ),
     )
+    return fig_heatmap
+
+
+def render_portfolio_gap_analysis(df: pd.DataFrame, analysis_lookup: dict, analysis_data: CardTable):
+    """Render the Portfolio Gap Analysis section with interactive heatmap."""
+    import numpy as np
+
+    st.markdown("""
+    <div class="section-container">
+        <div class="section-header">
+            <span class="section-number">06</span>
+            <h2 class="section-title">Portfolio Gap Analysis</h2>
+            <div class="section-line"></div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div style="background: linear-gradient(135deg, #FDF8F3 0%, #FDFBF7 100%);
+                border-radius: 12px; padding: 1.5rem 2rem; margin-bottom: 2rem;
+                border: 1px solid rgba(198, 93, 59, 0.1);">
+        <p style="font-family: 'Source Sans 3', sans-serif; font-size: 1rem; color: #5C5955; line-height: 1.6; margin: 0;">
+            This analysis reveals <strong>coverage gaps</strong> in your portfolio by cross-tabulating
+            <em>occasions</em> with <em>design styles</em>. Identify untapped opportunities where demand
+            may exist but inventory is sparse.
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Cross-tabulation is the occasion x style slice of the shared aggregate cube
+    cube = load_aggregate_cube(analysis_data, get_view_version(df))
+    combo_cells, count_matrix, sum_matrix = build_coverage_matrices(cube)
+    occasions_sorted = count_matrix.index.tolist()
+    styles_sorted = count_matrix.columns.tolist()
+    fig_heatmap = cached_figure(
+        "coverage_heatmap", lambda: build_coverage_heatmap_figure(cube, combo_cells, count_matrix, sum_matrix),
+        get_view_key(df)
+    )
 
     # Display heatmap in chart container
     st.markdown("""
@@ -3169,7 +2783,7 @@ def render_portfolio_gap_analysis(df: pd.DataFrame, analysis_lookup: dict, analy
     # Calculate insights
     st.markdown("""
     <div style="margin-top: 2rem;">
-        <h3 style="font-family: 'Playfair Display', serif; font-size: 1.4rem; color: #2D2A26; margin-bottom: 1.5rem;">
+        <h3 style="font-family: 'Playfair Display', 'Source Serif 4', serif; font-size: 1.4rem; color: #2D2A26; margin-bottom: 1.5rem;">
             Strategic Insights
         </h3>
     </div>
@@ -3184,16 +2798,17 @@ def render_portfolio_gap_analysis(df: pd.DataFrame, analysis_lookup: dict, analy
     all_sends = [c.get("sends_current", 0) for c in analysis_data if c.get("sends_current")]
     overall_avg = sum(all_sends) / len(all_sends) if all_sends else 0
 
+    occasion_totals = count_matrix.sum(axis=1)
+    style_totals = count_matrix.sum(axis=0)
+
     for i, occasion in enumerate(occasions_sorted):
         for j, style in enumerate(styles_sorted):
-            key = (occasion, style)
-            cards = combo_cards.get(key, [])
-            count = len(cards)
+            count = int(count_matrix.at[occasion, style])
 
             if count <= 1:
                 # Check if it's a meaningful gap (not just obscure combos)
-                occasion_total = sum(len(combo_cards.get((occasion, s), [])) for s in styles_sorted)
-                style_total = sum(len(combo_cards.get((o, style), [])) for o in occasions_sorted)
+                occasion_total = int(occasion_totals[occasion])
+                style_total = int(style_totals[style])
 
                 if occasion_total >= 3 and style_total >= 3:  # Both have some presence
                     biggest_gaps.append({
@@ -3205,7 +2820,7 @@ def render_portfolio_gap_analysis(df: pd.DataFrame, analysis_lookup: dict, analy
                     })
 
             if count >= 10:
-                avg_sends = sum(c["sends_current"] for c in cards) / count
+                avg_sends = sum_matrix.at[occasion, style] / count
                 saturated_areas.append({
                     "occasion": occasion.replace("_", " ").title(),
                     "style": style.replace("_", " ").title(),
@@ -3214,7 +2829,7 @@ def render_portfolio_gap_analysis(df: pd.DataFrame, analysis_lookup: dict, analy
                 })
 
             if 1 <= count <= 3:
-                avg_sends = sum(c["sends_current"] for c in cards) / count
+                avg_sends = sum_matrix.at[occasion, style] / count
                 if avg_sends > overall_avg * 1.2:  # 20% above average
                     high_performing_gaps.append({
                         "occasion": occasion.replace("_", " ").title(),
@@ -3235,7 +2850,7 @@ def render_portfolio_gap_analysis(df: pd.DataFrame, analysis_lookup: dict, analy
     with col1:
         st.markdown("""
         <div style="background: #FFF8F5; border-radius: 12px; padding: 1.5rem; border-left: 4px solid #C65D3B; height: 100%;">
-            <h4 style="font-family: 'Playfair Display', serif; color: #C65D3B; margin-bottom: 1rem; font-size: 1.1rem;">
+            <h4 style="font-family: 'Playfair Display', 'Source Serif 4', serif; color: #C65D3B; margin-bottom: 1rem; font-size: 1.1rem;">
                 Biggest Gaps
             </h4>
             <p style="font-size: 0.8rem; color: #8B8680; margin-bottom: 1rem;">
@@ -3260,7 +2875,7 @@ def render_portfolio_gap_analysis(df: pd.DataFrame, analysis_lookup: dict, analy
     with col2:
         st.markdown("""
         <div style="background: #F5F9F7; border-radius: 12px; padding: 1.5rem; border-left: 4px solid #5C8A6E; height: 100%;">
-            <h4 style="font-family: 'Playfair Display', serif; color: #5C8A6E; margin-bottom: 1rem; font-size: 1.1rem;">
+            <h4 style="font-family: 'Playfair Display', 'Source Serif 4', serif; color: #5C8A6E; margin-bottom: 1rem; font-size: 1.1rem;">
                 Saturated Areas
             </h4>
             <p style="font-size: 0.8rem; color: #8B8680; margin-bottom: 1rem;">
@@ -3284,7 +2899,7 @@ def render_portfolio_gap_analysis(df: pd.DataFrame, analysis_lookup: dict, analy
     with col3:
         st.markdown("""
         <div style="background: #F5F7FA; border-radius: 12px; padding: 1.5rem; border-left: 4px solid #6B8E9B; height: 100%;">
-            <h4 style="font-family: 'Playfair Display', serif; color: #6B8E9B; margin-bottom: 1rem; font-size: 1.1rem;">
+            <h4 style="font-family: 'Playfair Display', 'Source Serif 4', serif; color: #6B8E9B; margin-bottom: 1rem; font-size: 1.1rem;">
                 High-Performing Gaps
             </h4>
             <p style="font-size: 0.8rem; color: #8B8680; margin-bottom: 1rem;">
@@ -3309,7 +2924,7 @@ def render_portfolio_gap_analysis(df: pd.DataFrame, analysis_lookup: dict, analy
     st.markdown(f"""
     <div style="background: linear-gradient(135deg, #2D2A26 0%, #3D3A36 100%);
                 border-radius: 12px; padding: 2rem; margin-top: 2rem; color: white;">
-        <h3 style="font-family: 'Playfair Display', serif; color: #F4D03F; margin-bottom: 1rem; font-size: 1.2rem;">
+        <h3 style="font-family: 'Playfair Display', 'Source Serif 4', serif; color: #F4D03F; margin-bottom: 1rem; font-size: 1.2rem;">
             Portfolio Optimization Summary
         </h3>
         <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 2rem; font-size: 0.9rem;">
@@ -3334,7 +2949,7 @@ def render_portfolio_gap_analysis(df: pd.DataFrame, analysis_lookup: dict, analy
 # =============================================================================
 # AI CREATIVE BRIEF GENERATOR
 # =============================================================================
-def analyze_high_performing_patterns(analysis_data: list) -> dict:
+def analyze_high_performing_patterns(analysis_data: CardTable) -> dict:
     """
     Analyze the card_analysis.json data to find high-performing pattern combinations.
     Returns a dictionary with pattern statistics and top combinations.
@@ -3346,7 +2961,7 @@ def analyze_high_performing_patterns(analysis_data: list) -> dict:
     total_sends = sum(card.get("sends_current", 0) for card in analysis_data)
     avg_sends = total_sends / len(analysis_data) if analysis_data else 0
 
-    # Track performance by various combinations
+    # Track performance by various combinations; "cards" holds row indices into analysis_data
     occasion_stats = defaultdict(lambda: {"total_sends": 0, "count": 0, "cards": []})
     style_stats = defaultdict(lambda: {"total_sends": 0, "count": 0, "cards": []})
     color_stats = defaultdict(lambda: {"total_sends": 0, "count": 0, "cards": []})
@@ -3357,44 +2972,42 @@ def analyze_high_performing_patterns(analysis_data: list) -> dict:
     # Combination tracking: occasion + style + dominant color
     full_combo_stats = defaultdict(lambda: {"total_sends": 0, "count": 0, "cards": []})
 
-    for card in analysis_data:
+    for index, card in enumerate(analysis_data):
         sends = card.get("sends_current", 0)
         occasion = card.get("occasion") or "general"
         style = card.get("design_style") or "unknown"
         colors = card.get("primary_colors") or []
         themes = card.get("themes") or []
-        card_name = card.get("card_name", "")
-        rank = card.get("rank", 999)
 
         # Occasion stats
         occasion_stats[occasion]["total_sends"] += sends
         occasion_stats[occasion]["count"] += 1
-        occasion_stats[occasion]["cards"].append({"name": card_name, "sends": sends, "rank": rank})
+        occasion_stats[occasion]["cards"].append(index)
 
         # Style stats
         style_stats[style]["total_sends"] += sends
         style_stats[style]["count"] += 1
-        style_stats[style]["cards"].append({"name": card_name, "sends": sends, "rank": rank})
+        style_stats[style]["cards"].append(index)
 
         # Color stats (for each color in the card)
         if colors:
             for color in colors[:2]:  # Focus on top 2 colors
                 color_stats[color]["total_sends"] += sends
                 color_stats[color]["count"] += 1
-                color_stats[color]["cards"].append({"name": card_name, "sends": sends, "rank": rank})
+                color_stats[color]["cards"].append(index)
 
         # Theme stats
         if themes:
             for theme in themes:
                 theme_stats[theme]["total_sends"] += sends
                 theme_stats[theme]["count"] += 1
-                theme_stats[theme]["cards"].append({"name": card_name, "sends": sends, "rank": rank})
+                theme_stats[theme]["cards"].append(index)
 
         # Occasion + Style combination
         combo_key = f"{occasion}|{style}"
         occasion_style_stats[combo_key]["total_sends"] += sends
         occasion_style_stats[combo_key]["count"] += 1
-        occasion_style_stats[combo_key]["cards"].append({"name": card_name, "sends": sends, "rank": rank, "colors": colors, "themes": themes})
+        occasion_style_stats[combo_key]["cards"].append(index)
 
         # Full combination: occasion + style + dominant colors + themes
         color_key = "/".join(sorted(colors[:2])) if colors else "mixed"
@@ -3402,18 +3015,27 @@ def analyze_high_performing_patterns(analysis_data: list) -> dict:
         full_key = f"{occasion}|{style}|{color_key}|{theme_key}"
         full_combo_stats[full_key]["total_sends"] += sends
         full_combo_stats[full_key]["count"] += 1
-        full_combo_stats[full_key]["cards"].append({"name": card_name, "sends": sends, "rank": rank})
+        full_combo_stats[full_key]["cards"].append(index)
 
     # Calculate averages for each category
-    for stats_dict in [occasion_stats, style_stats, color_stats, theme_stats, occasion_style_stats, full_combo_stats]:
+    all_stats = [occasion_stats, style_stats, color_stats, theme_stats, occasion_style_stats, full_combo_stats]
+    for stats_dict in all_stats:
         for key in stats_dict:
             if stats_dict[key]["count"] > 0:
                 stats_dict[key]["avg_sends"] = stats_dict[key]["total_sends"] / stats_dict[key]["count"]
             else:
                 stats_dict[key]["avg_sends"] = 0
 
+    # Bootstrap confidence intervals on lift over the overall average, all combinations in one batch
+    card_sends = [card.get("sends_current", 0) for card in analysis_data]
+    entries = [stats for stats_dict in all_stats for stats in stats_dict.values()]
+    intervals = resampling.lift_intervals(card_sends, [stats["cards"] for stats in entries], avg_sends)
+    for stats, (low, high) in zip(entries, intervals.tolist()):
+        stats["lift_ci"] = (low, high)
+
     return {
         "overall_avg": avg_sends,
+        "analysis_data": analysis_data,
         "occasion_stats": dict(occasion_stats),
         "style_stats": dict(style_stats),
         "color_stats": dict(color_stats),
@@ -3435,6 +3057,7 @@ def generate_creative_briefs(pattern_stats: dict, num_briefs: int = 5, seed: int
         random.seed(seed)
 
     overall_avg = pattern_stats.get("overall_avg", 0)
+    analysis_data = pattern_stats.get("analysis_data", [])
     occasion_style_stats = pattern_stats.get("occasion_style_stats", {})
 
     briefs = []
@@ -3450,9 +3073,10 @@ def generate_creative_briefs(pattern_stats: dict, num_briefs: int = 5, seed: int
                 # Get top colors from these cards
                 all_colors = []
                 all_themes = []
-                for card in stats["cards"]:
-                    all_colors.extend(card.get("colors", []))
-                    all_themes.extend(card.get("themes", []))
+                combo_cards = [analysis_data[index] for index in stats["cards"]]
+                for card in combo_cards:
+                    all_colors.extend(card.get("primary_colors") or [])
+                    all_themes.extend(card.get("themes") or [])
 
                 # Count color frequency
                 color_freq = defaultdict(int)
@@ -3472,19 +3096,27 @@ def generate_creative_briefs(pattern_stats: dict, num_briefs: int = 5, seed: int
                     "avg_sends": stats["avg_sends"],
                     "count": stats["count"],
                     "pct_above_avg": ((stats["avg_sends"] - overall_avg) / overall_avg * 100) if overall_avg > 0 else 0,
+                    "lift_ci": stats.get("lift_ci", (float("nan"), float("nan"))),
                     "top_colors": [c[0] for c in top_colors],
                     "top_themes": [t[0] for t in top_themes],
-                    "example_cards": sorted(stats["cards"], key=lambda x: x["rank"])[:3]
+                    "example_cards": [
+                        {"name": card.get("card_name", ""), "sends": card.get("sends_current", 0), "rank": card.get("rank", 999)}
+                        for card in sorted(combo_cards, key=lambda card: card.get("rank", 999))[:3]
+                    ]
                 })
 
-    # Sort by performance and select top combinations
-    high_performers.sort(key=lambda x: -x["avg_sends"])
+    # Rank by the lower bound of the lift interval, so small lucky samples don't dominate
+    def evidence_key(x):
+        low = x["lift_ci"][0]
+        return (-low if low == low else float("inf"), -x["avg_sends"])  # NaN bounds sort last
 
-    # Shuffle slightly to add variety while keeping top performers prominent
-    if len(high_performers) > num_briefs:
-        top_tier = high_performers[:num_briefs * 2]
-        random.shuffle(top_tier)
-        selected = top_tier[:num_briefs]
+    high_performers.sort(key=evidence_key)
+
+    # Add variety only among combinations whose lift is positive even at the lower bound,
+    # then show the selection strongest evidence first
+    confident = [x for x in high_performers if x["lift_ci"][0] > 0]
+    if len(confident) > num_briefs:
+        selected = sorted(random.sample(confident[:num_briefs * 2], num_briefs), key=evidence_key)
     else:
         selected = high_performers[:num_briefs]
 
@@ -3512,6 +3144,7 @@ def generate_creative_briefs(pattern_stats: dict, num_briefs: int = 5, seed: int
             "themes": themes_display,
             "avg_sends": int(combo["avg_sends"]),
             "pct_above_avg": round(combo["pct_above_avg"], 1),
+            "lift_ci": tuple(round(bound, 1) for bound in combo["lift_ci"]),
             "sample_size": combo["count"],
             "example_cards": combo["example_cards"]
         }
@@ -3520,7 +3153,16 @@ def generate_creative_briefs(pattern_stats: dict, num_briefs: int = 5, seed: int
     return briefs
 
 
-def render_creative_brief_generator(analysis_data: list):
+def format_lift_interval(lift_ci: tuple) -> str:
+    """Small caption with a brief's 90% lift interval (empty when there is no interval)."""
+    low, high = lift_ci
+    if low != low or high != high:  # NaN: sample too small to resample
+        return ""
+    return (f'<div style="font-size: 0.7rem; color: #8B8680; margin-top: 0.2rem;">'
+            f'{resampling.DEFAULT_CONFIDENCE:.0%} CI {low:+.0f}% to {high:+.0f}%</div>')
+
+
+def render_creative_brief_generator(df: pd.DataFrame, analysis_data: CardTable):
     """Render the AI Creative Brief Generator section."""
 
     st.markdown("""
@@ -3560,7 +3202,7 @@ def render_creative_brief_generator(analysis_data: list):
     st.markdown("<br>", unsafe_allow_html=True)
 
     # Analyze patterns and generate briefs
-    pattern_stats = analyze_high_performing_patterns(analysis_data)
+    pattern_stats = load_pattern_stats(analysis_data, get_view_version(df))
     briefs = generate_creative_briefs(pattern_stats, num_briefs=5, seed=st.session_state.brief_seed)
 
     if not briefs:
@@ -3607,7 +3249,7 @@ def render_creative_brief_generator(analysis_data: list):
         .brief-number {
             background: linear-gradient(135deg, #C65D3B 0%, #D4785C 100%);
             color: white;
-            font-family: 'Playfair Display', serif;
+            font-family: 'Playfair Display', 'Source Serif 4', serif;
             font-size: 1rem;
             font-weight: 600;
             width: 36px;
@@ -3620,7 +3262,7 @@ def render_creative_brief_generator(analysis_data: list):
         }
 
         .brief-title {
-            font-family: 'Playfair Display', serif;
+            font-family: 'Playfair Display', 'Source Serif 4', serif;
             font-size: 1.25rem;
             font-weight: 600;
             color: #2D2A26;
@@ -3662,7 +3304,7 @@ def render_creative_brief_generator(analysis_data: list):
         }
 
         .brief-stat-value {
-            font-family: 'Playfair Display', serif;
+            font-family: 'Playfair Display', 'Source Serif 4', serif;
             font-size: 1.4rem;
             font-weight: 600;
             color: #C65D3B;
@@ -3745,10 +3387,10 @@ def render_creative_brief_generator(analysis_data: list):
             # Brief header
             st.markdown(f'''<div style="display: flex; align-items: center; gap: 1rem; margin-bottom: 0.5rem;">
                 <div style="width: 36px; height: 36px; border-radius: 50%; background: #C65D3B; color: white;
-                    display: flex; align-items: center; justify-content: center; font-family: Playfair Display, serif;
+                    display: flex; align-items: center; justify-content: center; font-family: Playfair Display, Source Serif 4, serif;
                     font-size: 1rem; font-weight: 600;">{brief["number"]}</div>
                 <div>
-                    <div style="font-family: Playfair Display, serif; font-size: 1.15rem; font-weight: 600; color: #2D2A26;">{brief["title"]}</div>
+                    <div style="font-family: Playfair Display, Source Serif 4, serif; font-size: 1.15rem; font-weight: 600; color: #2D2A26;">{brief["title"]}</div>
                     <div style="font-size: 0.8rem; color: #8B8680; text-transform: uppercase; letter-spacing: 0.5px;">Creative Brief</div>
                 </div>
             </div>''', unsafe_allow_html=True)
@@ -3767,13 +3409,14 @@ def render_creative_brief_generator(analysis_data: list):
             stat_cols = st.columns(2)
             with stat_cols[0]:
                 st.markdown(f'''<div style="background: white; padding: 0.5rem; border-radius: 8px; text-align: center; border: 1px solid rgba(45,42,38,0.08);">
-                    <div style="font-family: Playfair Display, serif; font-size: 1.3rem; color: #C65D3B; font-weight: 600;">{brief["avg_sends"]:,}</div>
+                    <div style="font-family: Playfair Display, Source Serif 4, serif; font-size: 1.3rem; color: #C65D3B; font-weight: 600;">{brief["avg_sends"]:,}</div>
                     <div style="font-size: 0.7rem; color: #8B8680; text-transform: uppercase;">Average Sends</div>
                 </div>''', unsafe_allow_html=True)
             with stat_cols[1]:
                 st.markdown(f'''<div style="background: white; padding: 0.5rem; border-radius: 8px; text-align: center; border: 1px solid rgba(45,42,38,0.08);">
-                    <div style="font-family: Playfair Display, serif; font-size: 1.3rem; color: #C65D3B; font-weight: 600;">{brief["pct_above_avg"]:+.0f}%</div>
+                    <div style="font-family: Playfair Display, Source Serif 4, serif; font-size: 1.3rem; color: #C65D3B; font-weight: 600;">{brief["pct_above_avg"]:+.0f}%</div>
                     <div style="font-size: 0.7rem; color: #8B8680; text-transform: uppercase;">vs. Category Avg</div>
+                    {format_lift_interval(brief["lift_ci"])}
                 </div>''', unsafe_allow_html=True)
 
             # Tags
@@ -3802,7 +3445,7 @@ def render_creative_brief_generator(analysis_data: list):
     st.markdown("""
     <div style="background: linear-gradient(135deg, #2D2A26 0%, #3D3A36 100%);
                 border-radius: 12px; padding: 2rem; margin-top: 2rem; color: white;">
-        <h3 style="font-family: 'Playfair Display', serif; color: #F4D03F; margin-bottom: 1rem; font-size: 1.2rem;">
+        <h3 style="font-family: 'Playfair Display', 'Source Serif 4', serif; color: #F4D03F; margin-bottom: 1rem; font-size: 1.2rem;">
             How These Briefs Are Generated
         </h3>
         <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1.5rem;">
@@ -3833,227 +3476,160 @@ def render_creative_brief_generator(analysis_data: list):
 # TREND INTELLIGENCE HUB
 # =============================================================================
 
-def hex_to_rgb(hex_color: str) -> tuple:
-    """Convert hex color to RGB tuple."""
-    hex_color = hex_color.lstrip('#')
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+def build_alignment_donut_figure(portfolio_stats: dict) -> go.Figure:
+    """Donut of cards per trend alignment tier, labelled with the strongly aligned share."""
+    fig = go.Figure(data=[go.Pie(
+        labels=["Strong", "Moderate", "Weak", "Not Aligned"],
+        values=[
+            portfolio_stats.get("strong_aligned", 0),
+            portfolio_stats.get("moderate_aligned", 0),
+            portfolio_stats.get("weak_aligned", 0),
+            portfolio_stats.get("not_aligned", 0)
+        ],
+        hole=0.65,
+        marker=dict(colors=["#4CAF50", "#FF9800", "#FFC107", "#E8E4DE"]),
+        textposition='outside',
+        textinfo='percent',
+        sort=False
+    )])
+    fig.update_layout(
+        height=250,
+        margin=dict(l=20, r=20, t=20, b=20),
+        paper_bgcolor="rgba(0,0,0,0)",
+        showlegend=False,
+        annotations=[dict(
+            text=f'<b>{portfolio_stats["aligned_pct"]:.0f}%</b><br>Strong',
+            x=0.5, y=0.5,
+            font=dict(size=14, family="Playfair Display, Source Serif 4, serif", color="#2D2A26"),
+            showarrow=False
+        )]
+    )
+    return fig
 
 
-def calculate_color_similarity(hex1: str, hex2: str) -> float:
-    """Calculate similarity between two hex colors (0-100 scale)."""
-    try:
-        r1, g1, b1 = hex_to_rgb(hex1)
-        r2, g2, b2 = hex_to_rgb(hex2)
-        distance = ((r1-r2)**2 + (g1-g2)**2 + (b1-b2)**2) ** 0.5
-        # Max distance is ~441 (black to white), normalize to 0-100
-        return max(0, 100 - (distance / 441 * 100))
-    except:
-        return 0
-
-
-def get_card_trend_alignment(card_data: dict, trend_data: dict) -> dict:
-    """Calculate how well a card aligns with current trends.
-
-    Scoring methodology:
-    - Each category scored 0-100 based on match quality
-    - No match = 0, partial match = 30-60, strong match = 60-90, exact match = 90-100
-    - Overall score is weighted average requiring multiple category matches for high scores
+WEIGHT_SWEEP_STEP = 0.05  # Grid spacing of the weight sweep heatmap
+
+
+def build_weight_sweep_figure(score_matrix: CategoryScoreMatrix, typography_weight: float, penalty: float,
+                              current: tuple) -> go.Figure:
     """
-    color_scores = []
-    style_scores = []
-    typo_scores = []
-    theme_scores = []
-    matching_trends = []
-
-    # Get color name to hex mapping
-    color_map = trend_data.get("color_name_to_hex", {}) or {}
-
-    # Color trend alignment - check Pantone 2026 match
-    card_colors = card_data.get("primary_colors") or []
-    pantone = trend_data.get("color_trends", {}).get("pantone_color_of_year", {}) or {}
-    pantone_hex = pantone.get("hex", "#888888")
-
-    for color_name in card_colors:
-        card_hex = color_map.get(color_name.lower(), "#888888")
-        if card_hex != "#RAINBOW":
-            sim = calculate_color_similarity(card_hex, pantone_hex)
-            # Only count strong color matches (>70% similarity)
-            if sim > 70:
-                color_scores.append(sim)
-                matching_trends.append(f"Pantone {pantone.get('name', '')}")
-
-    # Check emerging palettes - require strong match
-    for palette in (trend_data.get("color_trends", {}).get("emerging_palettes") or []):
-        palette_matches = 0
-        for p_color in (palette.get("colors") or []):
-            for color_name in card_colors:
-                card_hex = color_map.get(color_name.lower(), "#888888")
-                if card_hex != "#RAINBOW":
-                    sim = calculate_color_similarity(card_hex, p_color.get("hex", "#888888"))
-                    if sim > 75:
-                        palette_matches += 1
-        # Award points based on how many palette colors match
-        if palette_matches >= 2:
-            color_scores.append(min(90, 50 + palette_matches * 15))
-            matching_trends.append(palette.get("name", ""))
-        elif palette_matches == 1:
-            color_scores.append(40)
-
-    # Style trend alignment - stricter matching
-    card_style = (card_data.get("design_style") or "").lower()
-    if card_style:
-        for trend in (trend_data.get("illustration_trends") or []):
-            compatible = [s.lower() for s in (trend.get("compatible_styles") or [])]
-            # Exact match in compatible styles
-            if card_style in compatible:
-                # Score based on how specific the match is (not just raw weight)
-                base_score = 70 + (len(compatible) <= 3) * 15  # More specific = higher score
-                style_scores.append(base_score)
-                matching_trends.append(trend.get("name", ""))
-            # Partial match
-            elif any(card_style in c or c in card_style for c in compatible):
-                style_scores.append(40)
-
-    # Typography trend alignment
-    card_typo = (card_data.get("typography_style") or "").lower()
-    if card_typo:
-        for trend in (trend_data.get("typography_trends") or []):
-            compatible = [t.lower() for t in (trend.get("compatible_typography") or [])]
-            if card_typo in compatible:
-                typo_scores.append(75)
-                matching_trends.append(trend.get("name", ""))
-            elif any(card_typo in c or c in card_typo for c in compatible):
-                typo_scores.append(40)
-
-    # Theme trend alignment - based on keyword overlap percentage
-    card_themes = [t.lower() for t in (card_data.get("themes") or [])]
-    if card_themes:
-        for trend in (trend_data.get("theme_motif_trends") or []):
-            keywords = [k.lower() for k in (trend.get("keywords") or [])]
-            compatible = [t.lower() for t in (trend.get("compatible_themes") or [])]
-            all_trend_terms = set(keywords) | set(compatible)
-            matches = set(card_themes) & all_trend_terms
-
-            if matches:
-                # Score based on match percentage, not raw weight
-                match_ratio = len(matches) / max(len(card_themes), 1)
-                coverage_ratio = len(matches) / max(len(all_trend_terms), 1)
-
-                # Require meaningful overlap
-                if match_ratio >= 0.3 and len(matches) >= 2:
-                    score = min(85, 40 + match_ratio * 30 + coverage_ratio * 20)
-                    theme_scores.append(score)
-                    matching_trends.append(trend.get("name", ""))
-                elif len(matches) >= 1:
-                    theme_scores.append(25 + match_ratio * 20)
-
-    # Calculate category scores - default to 0 for no match
-    color_score = max(color_scores) if color_scores else 0
-    style_score = max(style_scores) if style_scores else 0
-    typo_score = max(typo_scores) if typo_scores else 0
-    theme_score = max(theme_scores) if theme_scores else 0
-
-    # Count how many categories have meaningful matches
-    categories_matched = sum([
-        color_score >= 40,
-        style_score >= 40,
-        typo_score >= 40,
-        theme_score >= 40
-    ])
+    Strongly aligned share over color x style weights, typography held at typography_weight
+    and theme taking the remainder. The whole grid is scored in one matrix product.
+    """
+    import numpy as np
 
-    # Weighted overall score with bonus for multi-category alignment
-    base_overall = (color_score * 0.30 + style_score * 0.30 +
-                    typo_score * 0.15 + theme_score * 0.25)
+    steps = np.round(np.arange(0, 1 + WEIGHT_SWEEP_STEP / 2, WEIGHT_SWEEP_STEP), 2)
+    color, style = np.meshgrid(steps, steps)  # rows: style weight, columns: color weight
+    theme = 1 - typography_weight - color - style
+    valid = theme >= -1e-9
+    grid = np.column_stack([color[valid], style[valid], np.full(valid.sum(), typography_weight), theme[valid].clip(0)])
+
+    strong = np.full(color.shape, np.nan)
+    if len(grid) and len(score_matrix):
+        strong[valid] = score_matrix.sweep(grid, penalty)["strong_aligned"] / len(score_matrix) * 100
+
+    fig = go.Figure(data=go.Heatmap(
+        z=strong,
+        x=steps,
+        y=steps,
+        colorscale=[[0.0, "#FDFBF7"], [0.3, "#EBCCB5"], [0.6, "#D4785C"], [1.0, "#A84D2E"]],
+        hovertemplate="Color %{x:.2f} · Style %{y:.2f}<br>Strongly aligned: %{z:.1f}%<extra></extra>",
+        colorbar=dict(title=dict(text="Strong %", font=dict(size=12, family="Source Sans 3")), thickness=15, len=0.7),
+        xgap=1,
+        ygap=1,
+    ))
+    fig.add_trace(go.Scatter(
+        x=[current[0]], y=[current[1]], mode="markers",
+        marker=dict(symbol="x", size=12, color="#2D2A26"),
+        hovertemplate="Current weights<extra></extra>", showlegend=False,
+    ))
+    fig.update_layout(
+        height=380,
+        margin=dict(l=10, r=10, t=10, b=10),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        font=dict(family="Source Sans 3, sans-serif", color="#2D2A26"),
+        xaxis=dict(title="Color weight", range=[-0.025, 1.025]),
+        yaxis=dict(title="Style weight", range=[-0.025, 1.025]),
+    )
+    return fig
 
-    # Apply penalty if only 1 category matches (single-dimension alignment)
-    if categories_matched <= 1:
-        overall = base_overall * 0.7
-    else:
-        overall = base_overall
 
-    return {
-        "color_score": round(color_score, 1),
-        "style_score": round(style_score, 1),
-        "typography_score": round(typo_score, 1),
-        "theme_score": round(theme_score, 1),
-        "overall_score": round(overall, 1),
-        "categories_matched": categories_matched,
-        "matching_trends": list(set(matching_trends))[:5]
-    }
+@st.fragment
+def render_weight_simulator(analysis_data: CardTable, trend_data: dict, trend_version: str):
+    """Re-weight the alignment categories live; only this fragment reruns while sliders move."""
+    st.markdown("""
+    <div class="chart-container" style="margin-top: 2rem;">
+        <div class="chart-title">Weight Simulator</div>
+        <div class="chart-subtitle">Explore how alternative category weights and the single-category penalty change alignment tiers</div>
+    </div>
+    """, unsafe_allow_html=True)
 
+    score_matrix = load_category_score_matrix(analysis_data, trend_data, trend_version)
+    defaults = trend_scoring.CATEGORY_WEIGHTS
 
-def aggregate_portfolio_trends(analysis_data: list, trend_data: dict) -> dict:
-    """Analyze entire portfolio against trends."""
-    alignments = []
+    cols = st.columns(5)
+    raw_weights = [
+        cols[i].slider(label, 0.0, 1.0, defaults[category], 0.05, key=f"trend_weight_{category}")
+        for i, (category, label) in enumerate([
+            ("color", "Color"), ("style", "Style"), ("typography", "Typography"), ("theme", "Theme")
+        ])
+    ]
+    penalty = cols[4].slider("Single-category penalty", 0.0, 1.0, trend_scoring.SINGLE_CATEGORY_PENALTY, 0.05,
+                             key="trend_weight_penalty")
 
-    for card in analysis_data:
-        alignment = get_card_trend_alignment(card, trend_data)
-        alignments.append({
-            "card_name": card.get("card_name", "Unknown"),
-            "card_id": card.get("card_id", ""),
-            "sends": card.get("sends_current", 0),
-            "rank": card.get("rank", 999),
-            **alignment
-        })
+    total = sum(raw_weights)
+    if total <= 0:
+        st.info("Give at least one category a weight above zero.")
+        return
+    weights = [w / total for w in raw_weights]  # Normalized so scores stay on the 0-100 scale
+    st.caption("Normalized weights: " + " · ".join(
+        f"{label} {w:.2f}" for label, w in zip(("Color", "Style", "Typography", "Theme"), weights)
+    ))
 
-    # Sort by overall score
-    alignments.sort(key=lambda x: x["overall_score"], reverse=True)
-
-    # Calculate stats
-    scores = [a["overall_score"] for a in alignments]
-    avg_score = sum(scores) / len(scores) if scores else 0
-
-    # Tiered alignment counts (stricter thresholds)
-    strong_aligned = sum(1 for a in alignments if a["overall_score"] >= 60 and a.get("categories_matched", 0) >= 2)
-    moderate_aligned = sum(1 for a in alignments if 40 <= a["overall_score"] < 60 or
-                          (a["overall_score"] >= 60 and a.get("categories_matched", 0) < 2))
-    weak_aligned = sum(1 for a in alignments if 20 <= a["overall_score"] < 40)
-    not_aligned = sum(1 for a in alignments if a["overall_score"] < 20)
-
-    # Find opportunities - trends with high relevance but low card coverage
-    opportunities = []
-    for trend in trend_data.get("illustration_trends", [])[:3]:
-        trend_cards = [a for a in alignments if trend.get("name", "") in a.get("matching_trends", [])]
-        relevance = trend.get("relevance_weight", trend.get("popularity_score", 0))
-        if len(trend_cards) < 10:
-            opportunities.append({
-                "trend": trend.get("name", ""),
-                "relevance": relevance,
-                "your_cards": len(trend_cards),
-                "opportunity": "High" if relevance > 85 else "Medium"
-            })
+    baseline = score_matrix.summarize(list(defaults.values()))
+    simulated = score_matrix.summarize(weights, penalty)
 
-    for trend in trend_data.get("theme_motif_trends", [])[:3]:
-        trend_cards = [a for a in alignments if trend.get("name", "") in a.get("matching_trends", [])]
-        relevance = trend.get("relevance_weight", trend.get("popularity_score", 0))
-        if len(trend_cards) < 15:
-            opportunities.append({
-                "trend": trend.get("name", ""),
-                "relevance": relevance,
-                "your_cards": len(trend_cards),
-                "opportunity": "High" if relevance > 85 else "Medium"
-            })
+    col1, col2 = st.columns([1, 1], gap="large")
+    with col1:
+        metric_cols = st.columns(4)
+        for metric_col, (key, label) in zip(metric_cols, [
+            ("strong_aligned", "Strong"), ("moderate_aligned", "Moderate"),
+            ("weak_aligned", "Weak"), ("not_aligned", "Not Aligned"),
+        ]):
+            metric_col.metric(label, simulated[key], simulated[key] - baseline[key])
+        st.metric("Avg Score", simulated["average_score"],
+                  round(simulated["average_score"] - baseline["average_score"], 1))
+
+        for title, cards in (("Leaders", simulated["trend_leaders"][:5]), ("Laggards", simulated["trend_laggards"][-5:])):
+            rows = "".join(
+                f'<div style="display: flex; justify-content: space-between; font-size: 0.8rem; color: #5C5955; padding: 0.2rem 0;">'
+                f'<span>#{card["rank"]} {str(card["card_name"])[:40]}</span>'
+                f'<span style="font-weight: 600; color: #2D2A26;">{card["overall_score"]:.0f}</span></div>'
+                for card in cards
+            )
+            st.markdown(f"""
+            <div style="font-family: 'Playfair Display', 'Source Serif 4', serif; font-size: 1rem; margin: 1rem 0 0.25rem;">{title}</div>
+            {rows}
+            """, unsafe_allow_html=True)
 
-    return {
-        "total_cards": len(alignments),
-        "average_score": round(avg_score, 1),
-        "strong_aligned": strong_aligned,
-        "moderate_aligned": moderate_aligned,
-        "weak_aligned": weak_aligned,
-        "not_aligned": not_aligned,
-        "aligned_count": strong_aligned,  # For backward compat, use strong as "aligned"
-        "aligned_pct": round(strong_aligned / len(alignments) * 100, 1) if alignments else 0,
-        "trend_leaders": alignments[:10],
-        "trend_laggards": alignments[-10:],
-        "opportunities": opportunities[:5]
-    }
+    with col2:
+        fig = cached_figure(
+            "trend_weight_sweep",
+            lambda: build_weight_sweep_figure(score_matrix, round(weights[2], 2), penalty, (weights[0], weights[1])),
+            trend_version, tuple(round(w, 4) for w in weights), penalty,
+        )
+        st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
+        st.caption(f"Typography held at {weights[2]:.2f}; theme takes the remaining weight. "
+                   "The x marks the current weights.")
 
 
-def render_trend_intelligence_hub(df: pd.DataFrame, analysis_lookup: dict, analysis_data: list):
+def render_trend_intelligence_hub(df: pd.DataFrame, analysis_lookup: dict, analysis_data: CardTable):
     """Render the Trend Intelligence Hub tab."""
 
-    # Load trend data
-    trend_data = load_trend_data()
+    # Load trend data (scored below against the same file version it was read from)
+    trend_file_version = get_trend_file_version()
+    trend_data = load_trend_data(trend_file_version)
 
     # Section header
     st.markdown("""
@@ -4113,7 +3689,7 @@ def render_trend_intelligence_hub(df: pd.DataFrame, analysis_lookup: dict, analy
             <div style="width: 70px; height: 70px; background: {pantone.get('hex', '#888')};
                         border-radius: 50%; margin: 0 auto 1rem;
                         box-shadow: 0 4px 20px {pantone.get('hex', '#888')}50;"></div>
-            <div style="font-family: 'Playfair Display', serif; font-size: 1.1rem; color: #2D2A26; font-weight: 600;">
+            <div style="font-family: 'Playfair Display', 'Source Serif 4', serif; font-size: 1.1rem; color: #2D2A26; font-weight: 600;">
                 {pantone.get('name', 'N/A')}
             </div>
             <div style="font-size: 0.75rem; color: #8B8680; margin-top: 0.25rem;">{pantone.get('hex', '')}</div>
@@ -4132,7 +3708,7 @@ def render_trend_intelligence_hub(df: pd.DataFrame, analysis_lookup: dict, analy
                 Top Illustration Style
             </div>
             <div style="font-size: 2rem; margin: 0.5rem 0;">🎨</div>
-            <div style="font-family: 'Playfair Display', serif; font-size: 1rem; color: #2D2A26; font-weight: 600;">
+            <div style="font-family: 'Playfair Display', 'Source Serif 4', serif; font-size: 1rem; color: #2D2A26; font-weight: 600;">
                 {top_illust.get('name', 'N/A')}
             </div>
             <div style="background: #E8E4DE; border-radius: 10px; height: 8px; margin-top: 0.75rem; overflow: hidden;">
@@ -4154,7 +3730,7 @@ def render_trend_intelligence_hub(df: pd.DataFrame, analysis_lookup: dict, analy
                 Typography Trend
             </div>
             <div style="font-size: 2rem; margin: 0.5rem 0;">Aa</div>
-            <div style="font-family: 'Playfair Display', serif; font-size: 1rem; color: #2D2A26; font-weight: 600;">
+            <div style="font-family: 'Playfair Display', 'Source Serif 4', serif; font-size: 1rem; color: #2D2A26; font-weight: 600;">
                 {top_typo.get('name', 'N/A')}
             </div>
             <div style="font-size: 0.8rem; color: #5C5955; margin-top: 0.5rem; font-style: italic;">
@@ -4177,7 +3753,7 @@ def render_trend_intelligence_hub(df: pd.DataFrame, analysis_lookup: dict, analy
                 Trending Theme
             </div>
             <div style="font-size: 2rem; margin: 0.5rem 0;">🌸</div>
-            <div style="font-family: 'Playfair Display', serif; font-size: 1rem; color: #2D2A26; font-weight: 600;">
+            <div style="font-family: 'Playfair Display', 'Source Serif 4', serif; font-size: 1rem; color: #2D2A26; font-weight: 600;">
                 {top_theme.get('name', 'N/A')}
             </div>
             <div style="font-size: 0.75rem; color: #8B8680; margin-top: 0.5rem;">{keywords}</div>
@@ -4191,12 +3767,12 @@ def render_trend_intelligence_hub(df: pd.DataFrame, analysis_lookup: dict, analy
     with st.expander("🎨 Color Trends", expanded=True):
         st.markdown(f"""
         <div style="padding: 1rem 0;">
-            <h4 style="font-family: 'Playfair Display', serif; margin-bottom: 1rem;">Pantone Color of the Year 2026</h4>
+            <h4 style="font-family: 'Playfair Display', 'Source Serif 4', serif; margin-bottom: 1rem;">Pantone Color of the Year 2026</h4>
             <div style="display: flex; align-items: center; gap: 2rem; margin-bottom: 2rem;">
                 <div style="width: 120px; height: 120px; background: {pantone.get('hex', '#888')};
                             border-radius: 16px; box-shadow: 0 8px 32px {pantone.get('hex', '#888')}40;"></div>
                 <div>
-                    <div style="font-family: 'Playfair Display', serif; font-size: 1.5rem; font-weight: 600; color: #2D2A26;">
+                    <div style="font-family: 'Playfair Display', 'Source Serif 4', serif; font-size: 1.5rem; font-weight: 600; color: #2D2A26;">
                         {pantone.get('name', 'N/A')}
                     </div>
                     <div style="color: #8B8680; margin: 0.5rem 0;">{pantone.get('hex', '')}</div>
@@ -4207,7 +3783,7 @@ def render_trend_intelligence_hub(df: pd.DataFrame, analysis_lookup: dict, analy
         """, unsafe_allow_html=True)
 
         # Emerging Palettes
-        st.markdown("<h4 style='font-family: Playfair Display, serif; margin: 1.5rem 0 1rem;'>Emerging Color Palettes</h4>", unsafe_allow_html=True)
+        st.markdown("<h4 style='font-family: Playfair Display, Source Serif 4, serif; margin: 1.5rem 0 1rem;'>Emerging Color Palettes</h4>", unsafe_allow_html=True)
         palette_cols = st.columns(4)
         for idx, palette in enumerate(trend_data.get("color_trends", {}).get("emerging_palettes", [])[:4]):
             with palette_cols[idx]:
@@ -4228,7 +3804,7 @@ def render_trend_intelligence_hub(df: pd.DataFrame, analysis_lookup: dict, analy
         col1, col2 = st.columns(2)
 
         with col1:
-            st.markdown("<h4 style='font-family: Playfair Display, serif;'>Illustration Trends</h4>", unsafe_allow_html=True)
+            st.markdown("<h4 style='font-family: Playfair Display, Source Serif 4, serif;'>Illustration Trends</h4>", unsafe_allow_html=True)
             for trend in illust_trends[:5]:
                 trend_weight = trend.get('relevance_weight', trend.get('popularity_score', 0))
                 trend_source = trend.get('source', '')
@@ -4247,7 +3823,7 @@ def render_trend_intelligence_hub(df: pd.DataFrame, analysis_lookup: dict, analy
                 """, unsafe_allow_html=True)
 
         with col2:
-            st.markdown("<h4 style='font-family: Playfair Display, serif;'>Theme & Motif Trends</h4>", unsafe_allow_html=True)
+            st.markdown("<h4 style='font-family: Playfair Display, Source Serif 4, serif;'>Theme & Motif Trends</h4>", unsafe_allow_html=True)
             for trend in theme_trends[:5]:
                 keywords = " • ".join(trend.get("keywords", [])[:4])
                 trend_weight = trend.get('relevance_weight', trend.get('popularity_score', 0))
@@ -4275,44 +3851,20 @@ def render_trend_intelligence_hub(df: pd.DataFrame, analysis_lookup: dict, analy
     """, unsafe_allow_html=True)
 
     # Calculate portfolio alignment
-    portfolio_stats = aggregate_portfolio_trends(analysis_data, trend_data)
+    trend_version = f"{get_view_version(df)}|{trend_file_version}"
+    portfolio_stats = load_portfolio_trends(analysis_data, trend_data, trend_version)
 
     col1, col2, col3 = st.columns([1, 1, 1])
 
     with col1:
         # Tiered alignment donut chart
-        fig = go.Figure(data=[go.Pie(
-            labels=["Strong", "Moderate", "Weak", "Not Aligned"],
-            values=[
-                portfolio_stats.get("strong_aligned", 0),
-                portfolio_stats.get("moderate_aligned", 0),
-                portfolio_stats.get("weak_aligned", 0),
-                portfolio_stats.get("not_aligned", 0)
-            ],
-            hole=0.65,
-            marker=dict(colors=["#4CAF50", "#FF9800", "#FFC107", "#E8E4DE"]),
-            textposition='outside',
-            textinfo='percent',
-            sort=False
-        )])
-        fig.update_layout(
-            height=250,
-            margin=dict(l=20, r=20, t=20, b=20),
-            paper_bgcolor="rgba(0,0,0,0)",
-            showlegend=False,
-            annotations=[dict(
-                text=f'<b>{portfolio_stats["aligned_pct"]:.0f}%</b><br>Strong',
-                x=0.5, y=0.5,
-                font=dict(size=14, family="Playfair Display, serif", color="#2D2A26"),
-                showarrow=False
-            )]
-        )
+        fig = cached_figure("trend_alignment_donut", lambda: build_alignment_donut_figure(portfolio_stats), trend_version)
         st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
 
     with col2:
         st.markdown(f"""
         <div style="padding: 1rem;">
-            <div style="font-family: 'Playfair Display', serif; font-size: 1.2rem; margin-bottom: 1rem;">Alignment Breakdown</div>
+            <div style="font-family: 'Playfair Display', 'Source Serif 4', serif; font-size: 1.2rem; margin-bottom: 1rem;">Alignment Breakdown</div>
             <div style="margin-bottom: 0.5rem; display: flex; justify-content: space-between; align-items: center;">
                 <span style="color: #8B8680; display: flex; align-items: center;">
                     <span style="width: 10px; height: 10px; background: #4CAF50; border-radius: 2px; margin-right: 0.5rem;"></span>
@@ -4351,7 +3903,7 @@ def render_trend_intelligence_hub(df: pd.DataFrame, analysis_lookup: dict, analy
         """, unsafe_allow_html=True)
 
     with col3:
-        st.markdown("<div style='font-family: Playfair Display, serif; font-size: 1.2rem; margin-bottom: 1rem;'>Opportunities</div>", unsafe_allow_html=True)
+        st.markdown("<div style='font-family: Playfair Display, Source Serif 4, serif; font-size: 1.2rem; margin-bottom: 1rem;'>Opportunities</div>", unsafe_allow_html=True)
         for opp in portfolio_stats.get("opportunities", [])[:3]:
             color = "#C65D3B" if opp["opportunity"] == "High" else "#FF9800"
             relevance = opp.get('relevance', opp.get('popularity', 0))
@@ -4364,7 +3916,7 @@ def render_trend_intelligence_hub(df: pd.DataFrame, analysis_lookup: dict, analy
 
     # Top Trend-Aligned Cards
     st.markdown("<br>", unsafe_allow_html=True)
-    st.markdown("<h4 style='font-family: Playfair Display, serif;'>Top Trend-Aligned Cards</h4>", unsafe_allow_html=True)
+    st.markdown("<h4 style='font-family: Playfair Display, Source Serif 4, serif;'>Top Trend-Aligned Cards</h4>", unsafe_allow_html=True)
 
     leader_cols = st.columns(5)
     for idx, card in enumerate(portfolio_stats.get("trend_leaders", [])[:5]):
@@ -4386,6 +3938,8 @@ def render_trend_intelligence_hub(df: pd.DataFrame, analysis_lookup: dict, analy
             </div>
             """, unsafe_allow_html=True)
 
+    render_weight_simulator(analysis_data, trend_data, trend_version)
+
     # Methodology & Sources Footer
     methodology = trend_data.get("methodology", {})
     sources = trend_data.get("sources", [])
@@ -4395,7 +3949,7 @@ def render_trend_intelligence_hub(df: pd.DataFrame, analysis_lookup: dict, analy
     with st.expander("📚 Sources & Methodology", expanded=False):
         st.markdown("""
         <div style="padding: 1rem 0;">
-            <h4 style="font-family: 'Playfair Display', serif; margin-bottom: 1rem; color: #2D2A26;">Data Sources</h4>
+            <h4 style="font-family: 'Playfair Display', 'Source Serif 4', serif; margin-bottom: 1rem; color: #2D2A26;">Data Sources</h4>
         </div>
         """, unsafe_allow_html=True)
 
@@ -4419,7 +3973,7 @@ def render_trend_intelligence_hub(df: pd.DataFrame, analysis_lookup: dict, analy
 
         st.markdown("""
         <div style="padding: 1.5rem 0 1rem;">
-            <h4 style="font-family: 'Playfair Display', serif; margin-bottom: 1rem; color: #2D2A26;">Methodology</h4>
+            <h4 style="font-family: 'Playfair Display', 'Source Serif 4', serif; margin-bottom: 1rem; color: #2D2A26;">Methodology</h4>
         </div>
         """, unsafe_allow_html=True)
 
@@ -4446,7 +4000,7 @@ def render_trend_intelligence_hub(df: pd.DataFrame, analysis_lookup: dict, analy
 # CATEGORY BREAKDOWN
 # =============================================================================
 def render_category_breakdown(analysis_lookup: dict):
-    """Render the Category Breakdown section for Valentine, Birthday, and Thank You."""
+    """Render the Category Breakdown section with one sub-tab per discovered category report."""
 
     st.markdown("""
     <div class="section-container">
@@ -4458,38 +4012,43 @@ def render_category_breakdown(analysis_lookup: dict):
     </div>
     """, unsafe_allow_html=True)
 
-    st.markdown("""
+    categories = discover_categories()
+    if not categories:
+        st.info(f"No category reports found. Add {CATEGORY_FILE_PATTERN} files next to the app.")
+        return
+
+    category_labels = [category["label"] for category in categories]
+    if len(category_labels) > 1:
+        category_list = ", ".join(category_labels[:-1]) + f", and {category_labels[-1]}"
+    else:
+        category_list = category_labels[0]
+
+    st.markdown(f"""
     <p style="font-family: 'Source Sans 3', sans-serif; font-size: 1rem; color: #5C5955;
               line-height: 1.6; margin-bottom: 1.5rem; max-width: 700px;">
-        Deep-dive performance data for three key occasions — Valentine's Day, Birthday, and Thank You —
-        sourced from dedicated category reports.
+        Deep-dive performance data for {len(categories)} key occasions — {category_list} —
+        sourced from dedicated category reports (sidebar filters don't apply here).
     </p>
     """, unsafe_allow_html=True)
 
-    # Color hex mapping (same as executive summary)
-    color_hex = {
-        "pink": "#FFB6C1", "white": "#FFFFFF", "orange": "#FF8C42", "green": "#5C8A6E",
-        "blue": "#6B8E9B", "yellow": "#F4D03F", "red": "#C0392B", "cream": "#FDF8F3",
-        "black": "#2D2A26", "teal": "#008080", "multicolor": "linear-gradient(90deg, #FF6B6B, #4ECDC4, #45B7D1)",
-        "brown": "#8B7355", "gold": "#D4AF37", "coral": "#FF7F50", "purple": "#9B59B6",
-        "navy": "#34495E", "tan": "#D2B48C", "mint": "#98D8C8", "lavender": "#E6E6FA",
-        "peach": "#FFCBA4", "sage": "#9CAF88", "sage green": "#9CAF88"
-    }
-
-    categories = [
-        ("Valentine's Day", VALENTINE_CSV, "#C65D3B"),
-        ("Birthday", BIRTHDAY_CSV, "#5C8A6E"),
-        ("Thank You", THANKYOU_CSV, "#6B8E9B"),
-    ]
+    # All reports are read in parallel up front; each sub-tab is a slice of the long table
+    category_paths = [category["path"] for category in categories]
+    category_version = get_file_version(category_paths)
+    category_table = load_category_table(
+        tuple((category["key"], str(category["path"])) for category in categories),
+        category_version
+    )
 
-    sub_tabs = st.tabs([cat[0] for cat in categories])
+    sub_tabs = st.tabs(category_labels)
 
-    for tab, (cat_name, csv_path, accent_color) in zip(sub_tabs, categories):
+    for tab, category in zip(sub_tabs, categories):
+        cat_name = category["label"]
+        accent_color = category["accent"]
         with tab:
-            cat_df = load_category_csv(csv_path)
+            cat_df = get_category_cards(category_table, category["key"])
 
             if cat_df.empty:
-                st.info(f"No data available for {cat_name}. Ensure {csv_path.name} exists.")
+                st.info(f"No data available for {cat_name}. Check that {category['path'].name} has sends data.")
                 continue
 
             # ── Hero stat row ──────────────────────────────────────────────
@@ -4510,7 +4069,7 @@ def render_category_breakdown(analysis_lookup: dict):
                 with col:
                     st.markdown(f"""
                     <div style="background: white; padding: 1rem; border-radius: 8px; border-left: 3px solid {border_color};">
-                        <div style="font-family: 'Playfair Display', serif; font-size: 1.1rem; color: #2D2A26; font-weight: 600;">
+                        <div style="font-family: 'Playfair Display', 'Source Serif 4', serif; font-size: 1.1rem; color: #2D2A26; font-weight: 600;">
                             {value}
                         </div>
                         <div style="font-size: 0.75rem; color: #8B8680; text-transform: uppercase; letter-spacing: 0.5px;">
@@ -4532,28 +4091,32 @@ def render_category_breakdown(analysis_lookup: dict):
             </div>
             """, unsafe_allow_html=True)
 
-            fig_bar = go.Figure()
-            fig_bar.add_trace(go.Bar(
-                x=top_10["Sends"].values[::-1],
-                y=top_10["Short Name"].values[::-1],
-                orientation='h',
-                marker=dict(
-                    color=CHART_COLORS[:10][::-1],
-                    line=dict(width=0)
-                ),
-                hovertemplate="<b>%{y}</b><br>Sends: %{x:,.0f}<extra></extra>"
-            ))
+            def build_top_10_chart() -> go.Figure:
+                fig_bar = go.Figure()
+                fig_bar.add_trace(go.Bar(
+                    x=top_10["Sends"].values[::-1],
+                    y=top_10["Short Name"].values[::-1],
+                    orientation='h',
+                    marker=dict(
+                        color=CHART_COLORS[:10][::-1],
+                        line=dict(width=0)
+                    ),
+                    hovertemplate="<b>%{y}</b><br>Sends: %{x:,.0f}<extra></extra>"
+                ))
 
-            fig_bar.update_layout(
-                height=400,
-                margin=dict(l=0, r=20, t=10, b=10),
-                paper_bgcolor="rgba(0,0,0,0)",
-                plot_bgcolor="rgba(0,0,0,0)",
-                font=dict(family="Source Sans 3, sans-serif", color="#2D2A26"),
-                xaxis=dict(showgrid=True, gridcolor="rgba(45, 42, 38, 0.06)", zeroline=False),
-                yaxis=dict(showgrid=False, zeroline=False),
-                showlegend=False,
-            )
+                fig_bar.update_layout(
+                    height=400,
+                    margin=dict(l=0, r=20, t=10, b=10),
+                    paper_bgcolor="rgba(0,0,0,0)",
+                    plot_bgcolor="rgba(0,0,0,0)",
+                    font=dict(family="Source Sans 3, sans-serif", color="#2D2A26"),
+                    xaxis=dict(showgrid=True, gridcolor="rgba(45, 42, 38, 0.06)", zeroline=False),
+                    yaxis=dict(showgrid=False, zeroline=False),
+                    showlegend=False,
+                )
+                return fig_bar
+
+            fig_bar = cached_figure("category_top_10", build_top_10_chart, category["key"], category_version)
             st.plotly_chart(fig_bar, use_container_width=True, config={"displayModeBar": False})
 
             # ── Top Cards Visual Gallery ───────────────────────────────────
@@ -4565,6 +4128,12 @@ def render_category_breakdown(analysis_lookup: dict):
             </div>
             """, unsafe_allow_html=True)
 
+            # All thumbnails come from one cached sprite sheet instead of 50 embedded images
+            sprite = load_category_sprite(
+                category["key"], tuple(top_50["Card Name"]), category_version, get_images_fingerprint()
+            )
+            sprite_class = f"sprite-{category['key']}"
+
             gallery_cards_html = []
             for _, grow in top_50.iterrows():
                 card_name = grow["Card Name"]
@@ -4572,19 +4141,15 @@ def render_category_breakdown(analysis_lookup: dict):
                 display_name = grow["Display Name"]
                 sends = int(grow["Sends"])
 
-                image_path = get_card_image_path(card_name)
-                if image_path:
-                    img_b64 = get_image_base64(image_path)
-                    if img_b64:
-                        img_html = f'<img src="data:image/jpeg;base64,{img_b64}" alt="{display_name}">'
-                    else:
-                        img_html = '<div class="no-image-placeholder">No Preview</div>'
-                else:
-                    img_html = '<div class="no-image-placeholder">No Preview</div>'
-
                 title_display = str(display_name)[:45] + ("..." if len(str(display_name)) > 45 else "")
                 title_display = title_display.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
 
+                tile_position = sprite_sheets.tile_position(sprite, card_name) if sprite else None
+                if tile_position:
+                    img_html = f'<div class="sprite-tile {sprite_class}" role="img" aria-label="{title_display}" style="background-position: {tile_position};"></div>'
+                else:
+                    img_html = '<div class="no-image-placeholder">No Preview</div>'
+
                 gallery_cards_html.append(
                     f'<div class="card-item">'
                     f'<div class="card-image-container">{img_html}'
@@ -4597,7 +4162,13 @@ def render_category_breakdown(analysis_lookup: dict):
                     f'</div></div>'
                 )
 
-            st.markdown(f'<div class="gallery-grid">{"".join(gallery_cards_html)}</div>', unsafe_allow_html=True)
+            sprite_style = ""
+            if sprite:
+                sprite_style = (
+                    f'<style>.{sprite_class} {{ background-image: url({sprite["url"]}); '
+                    f'background-size: {sprite["columns"] * 100}% {sprite["rows"] * 100}%; }}</style>'
+                )
+            st.markdown(f'{sprite_style}<div class="gallery-grid">{"".join(gallery_cards_html)}</div>', unsafe_allow_html=True)
 
             # ── Gather analysis metadata for this category ─────────────────
             cat_design_styles = {}
@@ -4642,33 +4213,37 @@ def render_category_breakdown(analysis_lookup: dict):
                 """, unsafe_allow_html=True)
 
                 if cat_design_styles:
-                    style_df = pd.DataFrame([
-                        {"Style": k.replace("_", " ").title(), "Count": v}
-                        for k, v in sorted(cat_design_styles.items(), key=lambda x: -x[1])[:8]
-                    ])
-
-                    fig_donut = go.Figure(data=[go.Pie(
-                        labels=style_df["Style"],
-                        values=style_df["Count"],
-                        hole=0.4,
-                        marker=dict(
-                            colors=['#C65D3B', '#5C8A6E', '#6B8E9B', '#8B7355', '#A69076',
-                                    '#D4846A', '#7BA393', '#98BBB0'][:len(style_df)],
-                            line=dict(color='#FDFBF7', width=2)
-                        ),
-                        textposition='outside',
-                        textinfo='label+percent',
-                        textfont=dict(size=10),
-                        hovertemplate="<b>%{label}</b><br>Cards: %{value}<br>Share: %{percent}<extra></extra>"
-                    )])
-
-                    fig_donut.update_layout(
-                        height=350,
-                        margin=dict(l=20, r=20, t=20, b=20),
-                        paper_bgcolor="rgba(0,0,0,0)",
-                        font=dict(family="Source Sans 3, sans-serif", color="#2D2A26"),
-                        showlegend=False,
-                    )
+                    def build_style_donut() -> go.Figure:
+                        style_df = pd.DataFrame([
+                            {"Style": k.replace("_", " ").title(), "Count": v}
+                            for k, v in sorted(cat_design_styles.items(), key=lambda x: -x[1])[:8]
+                        ])
+
+                        fig_donut = go.Figure(data=[go.Pie(
+                            labels=style_df["Style"],
+                            values=style_df["Count"],
+                            hole=0.4,
+                            marker=dict(
+                                colors=['#C65D3B', '#5C8A6E', '#6B8E9B', '#8B7355', '#A69076',
+                                        '#D4846A', '#7BA393', '#98BBB0'][:len(style_df)],
+                                line=dict(color='#FDFBF7', width=2)
+                            ),
+                            textposition='outside',
+                            textinfo='label+percent',
+                            textfont=dict(size=10),
+                            hovertemplate="<b>%{label}</b><br>Cards: %{value}<br>Share: %{percent}<extra></extra>"
+                        )])
+
+                        fig_donut.update_layout(
+                            height=350,
+                            margin=dict(l=20, r=20, t=20, b=20),
+                            paper_bgcolor="rgba(0,0,0,0)",
+                            font=dict(family="Source Sans 3, sans-serif", color="#2D2A26"),
+                            showlegend=False,
+                        )
+                        return fig_donut
+
+                    fig_donut = cached_figure("category_design_styles", build_style_donut, category["key"], category_version)
                     st.plotly_chart(fig_donut, use_container_width=True, config={"displayModeBar": False})
                 else:
                     st.caption("No design style data available.")
@@ -4685,14 +4260,11 @@ def render_category_breakdown(analysis_lookup: dict):
                 if top_cat_colors:
                     swatch_cols = st.columns(4)
                     for idx, (color_name, count) in enumerate(top_cat_colors):
-                        hex_val = color_hex.get(color_name.lower(), "#CCC")
-                        is_gradient = "gradient" in hex_val
-                        bg_style = f"background: {hex_val};" if is_gradient else f"background-color: {hex_val};"
-                        border_style = "border: 1px solid #DDD;" if color_name.lower() in ["white", "cream"] else ""
+                        swatch_style = swatch_css(color_name)
 
                         with swatch_cols[idx % 4]:
                             st.markdown(f'''<div style="text-align: center; padding: 0.5rem;">
-<div style="width: 50px; height: 50px; border-radius: 50%; {bg_style} {border_style} margin: 0 auto; box-shadow: 0 2px 8px rgba(0,0,0,0.1);"></div>
+<div style="width: 50px; height: 50px; border-radius: 50%; {swatch_style} margin: 0 auto; box-shadow: 0 2px 8px rgba(0,0,0,0.1);"></div>
 <div style="font-size: 0.8rem; color: #2D2A26; margin-top: 0.5rem; font-weight: 500;">{color_name.title()}</div>
 <div style="font-size: 0.7rem; color: #8B8680;">{count} cards</div>
 </div>''', unsafe_allow_html=True)
@@ -4708,31 +4280,35 @@ def render_category_breakdown(analysis_lookup: dict):
             """, unsafe_allow_html=True)
 
             if cat_themes:
-                theme_df = pd.DataFrame([
-                    {"Theme": k.title(), "Count": v}
-                    for k, v in sorted(cat_themes.items(), key=lambda x: -x[1])[:12]
-                ])
+                def build_theme_chart() -> go.Figure:
+                    theme_df = pd.DataFrame([
+                        {"Theme": k.title(), "Count": v}
+                        for k, v in sorted(cat_themes.items(), key=lambda x: -x[1])[:12]
+                    ])
 
-                fig_theme = go.Figure()
-                fig_theme.add_trace(go.Bar(
-                    x=theme_df["Theme"],
-                    y=theme_df["Count"],
-                    marker=dict(color=accent_color, line=dict(width=0)),
-                    text=theme_df["Count"],
-                    textposition='outside',
-                    hovertemplate="<b>%{x}</b><br>Appears in %{y} cards<extra></extra>"
-                ))
+                    fig_theme = go.Figure()
+                    fig_theme.add_trace(go.Bar(
+                        x=theme_df["Theme"],
+                        y=theme_df["Count"],
+                        marker=dict(color=accent_color, line=dict(width=0)),
+                        text=theme_df["Count"],
+                        textposition='outside',
+                        hovertemplate="<b>%{x}</b><br>Appears in %{y} cards<extra></extra>"
+                    ))
 
-                fig_theme.update_layout(
-                    height=300,
-                    margin=dict(l=0, r=0, t=10, b=60),
-                    paper_bgcolor="rgba(0,0,0,0)",
-                    plot_bgcolor="rgba(0,0,0,0)",
-                    font=dict(family="Source Sans 3, sans-serif", color="#2D2A26"),
-                    xaxis=dict(showgrid=False, zeroline=False, tickangle=-45),
-                    yaxis=dict(showgrid=True, gridcolor="rgba(45,42,38,0.06)", zeroline=False),
-                    showlegend=False,
-                )
+                    fig_theme.update_layout(
+                        height=300,
+                        margin=dict(l=0, r=0, t=10, b=60),
+                        paper_bgcolor="rgba(0,0,0,0)",
+                        plot_bgcolor="rgba(0,0,0,0)",
+                        font=dict(family="Source Sans 3, sans-serif", color="#2D2A26"),
+                        xaxis=dict(showgrid=False, zeroline=False, tickangle=-45),
+                        yaxis=dict(showgrid=True, gridcolor="rgba(45,42,38,0.06)", zeroline=False),
+                        showlegend=False,
+                    )
+                    return fig_theme
+
+                fig_theme = cached_figure("category_themes", build_theme_chart, category["key"], category_version)
                 st.plotly_chart(fig_theme, use_container_width=True, config={"displayModeBar": False})
             else:
                 st.caption("No theme data available.")
@@ -4753,9 +4329,9 @@ def render_category_breakdown(analysis_lookup: dict):
                     rank_style = f"color: {accent_color}; font-weight: 700;" if rank <= 3 else "color: #8B8680;"
                     table_rows += f"""
                     <tr style="border-bottom: 1px solid rgba(45, 42, 38, 0.06);">
-                        <td style="padding: 0.6rem 0.75rem; font-family: 'Playfair Display', serif; {rank_style} font-size: 0.9rem;">{rank}</td>
+                        <td style="padding: 0.6rem 0.75rem; font-family: 'Playfair Display', 'Source Serif 4', serif; {rank_style} font-size: 0.9rem;">{rank}</td>
                         <td style="padding: 0.6rem 0.75rem; font-family: 'Source Sans 3', sans-serif; color: #2D2A26; font-weight: 500;">{artist}</td>
-                        <td style="padding: 0.6rem 0.75rem; font-family: 'Playfair Display', serif; color: #2D2A26; font-weight: 600; text-align: right;">{sends:,}</td>
+                        <td style="padding: 0.6rem 0.75rem; font-family: 'Playfair Display', 'Source Serif 4', serif; color: #2D2A26; font-weight: 600; text-align: right;">{sends:,}</td>
                     </tr>"""
 
                 st.markdown(f"""
@@ -4780,11 +4356,11 @@ def render_category_breakdown(analysis_lookup: dict):
 def main():
     """Main application entry point."""
 
-    # Load data
+    # Load only what the hero needs, so it paints before the heavier models are built.
+    # One data version per run, so every cache below is built from the same files
+    data_version = get_data_version()
     with st.spinner("Loading data..."):
-        df = load_csv_data()
-        analysis_data = load_analysis_data()
-        analysis_lookup = create_analysis_lookup(analysis_data)
+        df = load_csv_data(data_version)
 
     # Check if data loaded
     if df.empty:
@@ -4795,17 +4371,27 @@ def main():
     # Render hero section
     render_hero(df)
 
-    # Show all 301 cards by default (no filtering)
-    filtered_df = df
+    with st.spinner("Loading card analysis..."):
+        analysis_data = load_analysis_data(data_version)
+        analysis_lookup = load_analysis_lookup(analysis_data, data_version)
+
+    # Sidebar filters select a cached view, and its analysis records, that every section below renders from
+    filters = render_sidebar_filters(df, analysis_lookup)
+    filter_key = get_filter_key(filters)
+    filtered_df = load_filtered_view(filter_key, data_version)
+    view_analysis, view_lookup = load_filtered_analysis(filter_key, data_version)
+    if filtered_df.empty:
+        st.info("No cards match the current filters. Use Reset All Filters in the sidebar to see every card.")
+        return
 
     # Render charts
-    render_charts(filtered_df, analysis_lookup)
+    render_charts(filtered_df, view_lookup)
 
     # Render executive insights
-    render_executive_summary(filtered_df, analysis_lookup)
+    render_executive_summary(filtered_df, view_lookup, view_analysis)
 
     # Render artist performance intelligence
-    render_artist_performance(analysis_data, df)
+    render_artist_performance(view_analysis, filtered_df)
 
     # Tabs for Gallery, Data Table, Card Comparison, Portfolio Gap Analysis, Creative Briefs, Trend Intelligence, and Category Breakdown
     tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
@@ -4815,22 +4401,22 @@ def main():
     ])
 
     with tab1:
-        render_gallery(filtered_df, analysis_lookup)
+        render_gallery(filtered_df, view_lookup)
 
     with tab2:
-        render_data_table(filtered_df, analysis_lookup)
+        render_data_table(filtered_df, view_lookup)
 
     with tab3:
-        render_card_comparison(filtered_df, analysis_lookup)
+        render_card_comparison(filtered_df, view_lookup)
 
     with tab4:
-        render_portfolio_gap_analysis(filtered_df, analysis_lookup, analysis_data)
+        render_portfolio_gap_analysis(filtered_df, view_lookup, view_analysis)
 
     with tab5:
-        render_creative_brief_generator(analysis_data)
+        render_creative_brief_generator(filtered_df, view_analysis)
 
     with tab6:
-        render_trend_intelligence_hub(filtered_df, analysis_lookup, analysis_data)
+        render_trend_intelligence_hub(filtered_df, view_lookup, view_analysis)
 
     with tab7:
         render_category_breakdown(analysis_lookup)
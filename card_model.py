@@ -0,0 +1,230 @@
+"""
+Compact in-memory model for card_analysis.json.
+Cards are stored column-wise: numeric fields as numpy arrays, categorical fields
+(occasion, style, typography) as vocabulary codes, and color/theme lists as code
+arrays with offsets. Values are normalized through the vocabulary module at ingest.
+CardRecord is a read-only view of one row that behaves like the original dict for
+.get() and [] access.
+"""
+
+import sys
+from typing import Dict, Iterable, Iterator, List
+
+import numpy as np
+
+from vocabulary import NORMALIZERS, VOCABULARIES, Vocabulary
+
+INT_FIELDS = ("rank", "sends_current", "sends_previous", "current_sends", "previous_sends")
+CATEGORY_FIELDS = ("occasion", "design_style", "typography_style")
+LIST_FIELDS = ("primary_colors", "themes")
+TEXT_FIELDS = ("card_id", "card_name")
+
+MISSING_INT = np.iinfo(np.int64).min
+
+
+class _Missing:
+    """Sentinel for absent keys; pickles by reference so cached tables keep identity checks working."""
+
+    def __reduce__(self):
+        return "_MISSING"
+
+
+_MISSING = _Missing()
+
+# List field states
+LIST_MISSING, LIST_PRESENT, LIST_NULL = 0, 1, 2
+
+
+class CardRecord:
+    """Read-only, dict-like view of one card in a CardTable."""
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table: "CardTable", index: int):
+        self.table = table
+        self.index = index
+
+    def get(self, key: str, default=None):
+        return self.table.value(self.index, key, default)
+
+    def __getitem__(self, key: str):
+        value = self.table.value(self.index, key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return self.table.value(self.index, key, _MISSING) is not _MISSING
+
+    def keys(self) -> List[str]:
+        return [key for key in self.table.field_names() if key in self]
+
+    def to_dict(self) -> dict:
+        """Materialize the record as a plain dict (e.g. for JSON export)."""
+        return {key: self[key] for key in self.keys()}
+
+    def __repr__(self):
+        return f"CardRecord({self.to_dict()!r})"
+
+
+class CardTable:
+    """
+    Column store of card analysis records.
+
+    Rows are addressed by position; iterate to get CardRecord views, or read the
+    numpy columns (ints, codes, list_codes/list_offsets) directly for vectorized work.
+    Values that don't fit a column's type are kept per row in `extras`.
+    """
+
+    def __init__(self, size: int = 0):
+        self.size = size
+        self.card_ids: List = []
+        self.card_names: List = []
+        self.ints: Dict[str, np.ndarray] = {}
+        self.vocab: Dict[str, Vocabulary] = {field: VOCABULARIES[field] for field in CATEGORY_FIELDS + LIST_FIELDS}
+        self.codes: Dict[str, np.ndarray] = {}
+        self.list_codes: Dict[str, np.ndarray] = {}
+        self.list_offsets: Dict[str, np.ndarray] = {}
+        self.list_state: Dict[str, np.ndarray] = {}
+        self.extras: Dict[int, dict] = {}
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict]) -> "CardTable":
+        """Build a table from card analysis dicts (non-dict entries are skipped)."""
+        records = [record for record in records if isinstance(record, dict)]
+        table = cls(len(records))
+        n = len(records)
+
+        for field in INT_FIELDS:
+            table.ints[field] = np.full(n, MISSING_INT, dtype=np.int64)
+        for field in CATEGORY_FIELDS:
+            table.codes[field] = np.full(n, -1, dtype=np.int32)
+        list_codes = {field: [] for field in LIST_FIELDS}
+        for field in LIST_FIELDS:
+            table.list_offsets[field] = np.zeros(n + 1, dtype=np.int64)
+            table.list_state[field] = np.zeros(n, dtype=np.int8)
+
+        known = set(INT_FIELDS + CATEGORY_FIELDS + LIST_FIELDS + TEXT_FIELDS)
+        for i, record in enumerate(records):
+            extra = {}
+            table.card_ids.append(record.get("card_id", _MISSING))
+            name = record.get("card_name", _MISSING)
+            table.card_names.append(sys.intern(name) if isinstance(name, str) else name)
+
+            for field in INT_FIELDS:
+                if field in record:
+                    value = record[field]
+                    if isinstance(value, int) and not isinstance(value, bool):
+                        table.ints[field][i] = value
+                    else:
+                        extra[field] = value
+
+            for field in CATEGORY_FIELDS:
+                if field in record:
+                    value = record[field]
+                    if value is None or isinstance(value, str):
+                        value = NORMALIZERS[field](value) if value is not None else None
+                        table.codes[field][i] = table.vocab[field].code(value)
+                    else:
+                        extra[field] = value
+
+            for field in LIST_FIELDS:
+                if field in record:
+                    value = record[field]
+                    if value is None:
+                        table.list_state[field][i] = LIST_NULL
+                    elif isinstance(value, list) and all(isinstance(v, str) for v in value):
+                        table.list_state[field][i] = LIST_PRESENT
+                        normalize = NORMALIZERS[field]
+                        list_codes[field].extend(table.vocab[field].code(normalize(v)) for v in value)
+                    else:
+                        extra[field] = value
+                table.list_offsets[field][i + 1] = len(list_codes[field])
+
+            for key in record.keys() - known:
+                extra[key] = record[key]
+            if extra:
+                table.extras[i] = extra
+
+        for field in LIST_FIELDS:
+            table.list_codes[field] = np.array(list_codes[field], dtype=np.int32)
+        return table
+
+    def freeze(self) -> "CardTable":
+        """
+        Make the table read-only so one instance can be shared safely (e.g. across
+        dashboard sessions): numpy columns become non-writeable and text columns tuples.
+        """
+        for columns in (self.ints, self.codes, self.list_codes, self.list_offsets, self.list_state):
+            for array in columns.values():
+                array.flags.writeable = False
+        self.card_ids = tuple(self.card_ids)
+        self.card_names = tuple(self.card_names)
+        return self
+
+    def take(self, rows) -> "CardTable":
+        """New table of the given row positions, in that order (columns are copied, vocabularies shared)."""
+        rows = np.asarray(rows, dtype=np.int64)
+        table = CardTable(len(rows))
+        table.vocab = self.vocab
+        table.card_ids = [self.card_ids[i] for i in rows.tolist()]
+        table.card_names = [self.card_names[i] for i in rows.tolist()]
+        table.ints = {field: column[rows] for field, column in self.ints.items()}
+        table.codes = {field: column[rows] for field, column in self.codes.items()}
+        for field, offsets in self.list_offsets.items():
+            starts = offsets[rows]
+            lengths = offsets[rows + 1] - starts
+            new_offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=new_offsets[1:])
+            positions = np.repeat(starts - new_offsets[:-1], lengths) + np.arange(new_offsets[-1])
+            table.list_codes[field] = self.list_codes[field][positions]
+            table.list_offsets[field] = new_offsets
+            table.list_state[field] = self.list_state[field][rows]
+        table.extras = {new: self.extras[old] for new, old in enumerate(rows.tolist()) if old in self.extras}
+        return table
+
+    def field_names(self) -> List[str]:
+        names = list(TEXT_FIELDS + INT_FIELDS + CATEGORY_FIELDS + LIST_FIELDS)
+        extra_names = {key for extra in self.extras.values() for key in extra}
+        return names + sorted(extra_names - set(names))
+
+    def value(self, index: int, key: str, default=None):
+        """Value of a field for one row, or default if the card doesn't have it."""
+        extra = self.extras.get(index)
+        if extra is not None and key in extra:
+            return extra[key]
+
+        if key == "card_id" or key == "card_name":
+            value = (self.card_ids if key == "card_id" else self.card_names)[index]
+            return default if value is _MISSING else value
+
+        if key in self.ints:
+            value = self.ints[key][index]
+            return default if value == MISSING_INT else int(value)
+
+        if key in self.codes:
+            code = self.codes[key][index]
+            return default if code < 0 else self.vocab[key].values[code]
+
+        if key in self.list_state:
+            state = self.list_state[key][index]
+            if state == LIST_MISSING:
+                return default
+            if state == LIST_NULL:
+                return None
+            offsets = self.list_offsets[key]
+            values = self.vocab[key].values
+            return [values[code] for code in self.list_codes[key][offsets[index]:offsets[index + 1]].tolist()]
+
+        return default
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> CardRecord:
+        if not -self.size <= index < self.size:
+            raise IndexError(index)
+        return CardRecord(self, index % self.size)
+
+    def __iter__(self) -> Iterator[CardRecord]:
+        return (CardRecord(self, i) for i in range(self.size))
@@ -3,10 +3,12 @@ Plotly Chart Configurations for Greeting Card Analytics Dashboard
 Editorial/Magazine Aesthetic with Terracotta Color Palette
 """
 
+import threading
+from collections import OrderedDict
+
 import plotly.graph_objects as go
-import plotly.express as px
 import pandas as pd
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 
 
 # =============================================================================
@@ -672,6 +674,48 @@ def create_comparison_bars(
     return fig
 
 
+# =============================================================================
+# FIGURE CACHE
+# =============================================================================
+
+class FigureCache:
+    """
+    Thread-safe LRU cache of built figures.
+
+    Keys should include everything a figure depends on (figure id, data version,
+    view parameters). Cached figures are shared between callers, so treat them as
+    read-only.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._figures: "OrderedDict[Any, Optional[go.Figure]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key, build: Callable[[], Optional[go.Figure]]) -> Optional[go.Figure]:
+        """Return the cached figure for key, calling build() on a miss (None results are cached too)."""
+        with self._lock:
+            if key in self._figures:
+                self._figures.move_to_end(key)
+                return self._figures[key]
+
+        # Build outside the lock so a slow figure doesn't block other sessions
+        fig = build()
+        with self._lock:
+            self._figures[key] = fig
+            self._figures.move_to_end(key)
+            while len(self._figures) > self.max_entries:
+                self._figures.popitem(last=False)
+        return fig
+
+    def clear(self):
+        with self._lock:
+            self._figures.clear()
+
+    def __len__(self) -> int:
+        return len(self._figures)
+
+
 # =============================================================================
 # EXAMPLE USAGE / DEMO
 # =============================================================================
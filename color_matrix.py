@@ -0,0 +1,97 @@
+"""
+Color co-occurrence as matrix products.
+Each card is a one-hot row over the color vocabulary (X, cards x colors). Pair counts are
+X^T X and pair send totals are X^T diag(sends) X, so the full color-pair matrix for the
+whole catalog or any occasion slice comes out of two products.
+"""
+
+from typing import List, Optional
+
+import numpy as np
+
+from card_model import LIST_PRESENT, MISSING_INT, CardTable
+
+
+class ColorCooccurrence:
+    """
+    Card x color membership matrix with per-card sends and occasions.
+
+    Only cards with an occasion are included, once per card ID. A color listed twice on one
+    card counts once.
+    Rows and columns of the pair matrices follow `colors`.
+    """
+
+    def __init__(self, membership: np.ndarray, sends: np.ndarray, occasions: np.ndarray, colors: List[str]):
+        self.membership = membership  # float64 one-hot, cards x colors
+        self.sends = sends
+        self.occasions = occasions
+        self.colors = colors
+        self.column = {color: i for i, color in enumerate(colors)}
+
+    @classmethod
+    def from_table(cls, table: CardTable) -> "ColorCooccurrence":
+        """Build the membership matrix straight from a CardTable's color code columns."""
+        occasion_codes = table.codes["occasion"]
+        occasion_values = table.vocab["occasion"].values
+        named = np.array([bool(value) for value in occasion_values] + [False], dtype=bool)
+        has_occasion = named[occasion_codes]  # Code -1 (no occasion) hits the trailing False
+        # One row per card ID, the last record winning (as in the dashboard's analysis lookup)
+        latest = {}
+        for index in range(len(table)):
+            card_id = table.value(index, "card_id", "")
+            if card_id:
+                latest[card_id] = index
+        has_occasion &= np.isin(np.arange(len(table)), list(latest.values()))
+        # Cards whose fields didn't fit the columns are kept aside in extras; leave them out
+        for index, extra in table.extras.items():
+            if "occasion" in extra or "primary_colors" in extra:
+                has_occasion[index] = False
+
+        offsets = table.list_offsets["primary_colors"]
+        present = table.list_state["primary_colors"] == LIST_PRESENT
+        rows = np.repeat(np.arange(len(table)), np.diff(offsets))
+        codes = table.list_codes["primary_colors"]
+        keep = (present & has_occasion)[rows]
+        rows, codes = rows[keep], codes[keep]
+
+        used = np.unique(codes)
+        colors = [table.vocab["primary_colors"].values[code] for code in used.tolist()]
+        cards = np.flatnonzero(has_occasion)
+        row_of = np.full(len(table), -1, dtype=np.int64)
+        row_of[cards] = np.arange(len(cards))
+
+        membership = np.zeros((len(cards), len(colors)))
+        membership[row_of[rows], np.searchsorted(used, codes)] = 1.0
+
+        sends = table.ints["sends_current"][cards]
+        sends = np.where(sends == MISSING_INT, 0, sends).astype(np.float64)
+        occasions = np.array([occasion_values[code] for code in occasion_codes[cards].tolist()], dtype=object)
+        return cls(membership, sends, occasions, colors)
+
+    def _rows(self, occasion: Optional[str]) -> np.ndarray:
+        return self.membership if occasion is None else self.membership[self.occasions == occasion]
+
+    def pair_counts(self, occasion: Optional[str] = None) -> np.ndarray:
+        """X^T X: cards containing both colors (diagonal: cards containing the color)."""
+        x = self._rows(occasion)
+        return x.T @ x
+
+    def pair_sums(self, occasion: Optional[str] = None) -> np.ndarray:
+        """X^T diag(sends) X: total sends of cards containing both colors."""
+        if occasion is None:
+            x, sends = self.membership, self.sends
+        else:
+            rows = self.occasions == occasion
+            x, sends = self.membership[rows], self.sends[rows]
+        return (x * sends[:, None]).T @ x
+
+    def pair_means(self, occasion: Optional[str] = None) -> tuple:
+        """(average sends, card counts) per color pair; pairs that never co-occur average 0."""
+        counts = self.pair_counts(occasion)
+        sums = self.pair_sums(occasion)
+        means = np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+        return means, counts
+
+    def indices(self, colors: List[str]) -> List[int]:
+        """Matrix positions of the given colors (colors no card uses are skipped)."""
+        return [self.column[color] for color in colors if color in self.column]
@@ -1,1171 +1,1057 @@
 """
-Comprehensive CSS stylesheet for Streamlit Greeting Card Analytics Dashboard
-Editorial/Magazine aesthetic with warm, sophisticated design
+Stylesheet for the Greeting Card Analytics Dashboard.
+Editorial/magazine aesthetic with warm, sophisticated design.
+
+CSS_STYLES is the source; build_stylesheet() minifies it once into a content-hashed
+file under static/css/, which Streamlit serves (server.enableStaticServing) so the
+browser downloads and caches it instead of receiving the CSS on every rerun. Fonts
+are self-hosted from static/fonts/, with no network requests: Source Sans 3 and
+Source Serif 4 are committed there (OFL, see static/fonts/OFL.txt), and Playfair
+Display is added for headings when this module has downloaded it. Until then
+headings render in Source Serif 4.
+
+Usage:
+    python dashboard_styles.py
 """
 
+import base64
+import hashlib
+import re
+import sys
+import urllib.request
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+STATIC_DIR = BASE_DIR / "static"
+CSS_DIR = STATIC_DIR / "css"
+FONTS_DIR = STATIC_DIR / "fonts"
+STYLESHEET_NAME = "dashboard"
+
+# Optional display font downloaded by main() (variable fonts from the Google Fonts repository)
+FONT_SOURCE = "https://github.com/google/fonts/raw/main/ofl"
+FONT_FILES = {
+    "PlayfairDisplay.ttf": "playfairdisplay/PlayfairDisplay%5Bwght%5D.ttf",
+    "PlayfairDisplay-Italic.ttf": "playfairdisplay/PlayfairDisplay-Italic%5Bwght%5D.ttf",
+}
+
+# Self-hosted font faces as (family, file in static/fonts, weight range, style); one variable
+# file per family and style covers every weight. Faces whose file is missing are left out.
+FONT_FACES = (
+    ("Playfair Display", "PlayfairDisplay.ttf", "400 900", "normal"),
+    ("Playfair Display", "PlayfairDisplay-Italic.ttf", "400 900", "italic"),
+    ("Source Serif 4", "SourceSerif4.woff2", "200 900", "normal"),
+    ("Source Serif 4", "SourceSerif4-Italic.woff2", "200 900", "italic"),
+    ("Source Sans 3", "SourceSans3.woff2", "200 900", "normal"),
+    ("Source Sans 3", "SourceSans3-Italic.woff2", "200 900", "italic"),
+)
+FONT_FORMATS = {".woff2": "woff2", ".ttf": "truetype"}
+
 CSS_STYLES = """
-/* ==========================================================================
-   GOOGLE FONTS IMPORT
-   ========================================================================== */
-@import url('https://fonts.googleapis.com/css2?family=Playfair+Display:wght@400;600;700&family=Source+Sans+3:wght@300;400;600&display=swap');
-
-/* ==========================================================================
-   CSS CUSTOM PROPERTIES (DESIGN TOKENS)
-   ========================================================================== */
+/* ===========================================
+   HIDE STREAMLIT DEFAULT ELEMENTS
+=========================================== */
+#MainMenu {visibility: hidden !important;}
+footer {visibility: hidden !important;}
+header {visibility: hidden !important;}
+.stDeployButton {display: none !important;}
+[data-testid="stToolbar"] {display: none !important;}
+[data-testid="stDecoration"] {display: none !important;}
+[data-testid="stStatusWidget"] {display: none !important;}
+.viewerBadge_container__r5tak {display: none !important;}
+.styles_viewerBadge__CvC9N {display: none !important;}
+
+/* ===========================================
+   BASE STYLES
+=========================================== */
 :root {
-    /* Color Palette */
-    --color-background: #FDFBF7;
-    --color-primary: #C65D3B;
-    --color-primary-dark: #A84D2F;
-    --color-primary-light: #D97B5C;
-    --color-secondary: #8B7355;
-    --color-secondary-dark: #6E5A43;
-    --color-text: #2D2A26;
-    --color-text-muted: #5A5651;
-    --color-light-gray: #E8E4DE;
-    --color-card-bg: #FFFFFF;
-    --color-success: #5B8C5A;
-    --color-warning: #D4A84B;
-
-    /* Typography */
-    --font-heading: 'Playfair Display', Georgia, serif;
-    --font-body: 'Source Sans 3', -apple-system, BlinkMacSystemFont, sans-serif;
-
-    /* Spacing */
-    --spacing-xs: 4px;
-    --spacing-sm: 8px;
-    --spacing-md: 16px;
-    --spacing-lg: 24px;
-    --spacing-xl: 32px;
-    --spacing-2xl: 48px;
-    --spacing-3xl: 64px;
-
-    /* Shadows */
-    --shadow-sm: 0 1px 3px rgba(45, 42, 38, 0.06);
-    --shadow-md: 0 4px 12px rgba(45, 42, 38, 0.08);
-    --shadow-lg: 0 8px 24px rgba(45, 42, 38, 0.12);
-    --shadow-xl: 0 16px 48px rgba(45, 42, 38, 0.16);
-
-    /* Border Radius */
-    --radius-sm: 4px;
-    --radius-md: 8px;
-    --radius-lg: 12px;
-    --radius-xl: 16px;
-    --radius-full: 9999px;
-
-    /* Transitions */
-    --transition-fast: 0.2s ease;
-    --transition-normal: 0.3s ease;
-    --transition-slow: 0.5s ease;
-}
-
-/* ==========================================================================
-   HIDE STREAMLIT DEFAULTS
-   ========================================================================== */
-#MainMenu {
-    visibility: hidden !important;
-}
-
-footer {
-    visibility: hidden !important;
-}
-
-header[data-testid="stHeader"] {
-    visibility: hidden !important;
-    height: 0 !important;
-}
-
-.stDeployButton {
-    display: none !important;
+    --cream: #FDFBF7;
+    --cream-dark: #F5F2EC;
+    --terracotta: #C65D3B;
+    --terracotta-light: #D4785C;
+    --terracotta-dark: #A84D2E;
+    --charcoal: #2D2A26;
+    --charcoal-light: #4A4641;
+    --gray: #8B8680;
+    --gray-light: #B8B4AE;
+    --white: #FFFFFF;
 }
 
-div[data-testid="stToolbar"] {
-    display: none !important;
+html, body, [data-testid="stAppViewContainer"] {
+    background-color: var(--cream) !important;
+    font-family: 'Source Sans 3', -apple-system, BlinkMacSystemFont, sans-serif;
+    color: var(--charcoal);
 }
 
-div[data-testid="stDecoration"] {
-    display: none !important;
+[data-testid="stAppViewContainer"] > .main {
+    background-color: var(--cream);
 }
 
-/* ==========================================================================
-   CUSTOM SCROLLBAR (WEBKIT)
-   ========================================================================== */
+.main .block-container {
+    padding: 0 !important;
+    max-width: 100% !important;
+}
+
+/* ===========================================
+   CUSTOM SCROLLBAR
+=========================================== */
 ::-webkit-scrollbar {
     width: 8px;
     height: 8px;
 }
 
 ::-webkit-scrollbar-track {
-    background: var(--color-light-gray);
-    border-radius: var(--radius-full);
+    background: var(--cream-dark);
 }
 
 ::-webkit-scrollbar-thumb {
-    background: var(--color-secondary);
-    border-radius: var(--radius-full);
-    transition: background var(--transition-fast);
+    background: var(--gray-light);
+    border-radius: 4px;
 }
 
 ::-webkit-scrollbar-thumb:hover {
-    background: var(--color-secondary-dark);
-}
-
-/* ==========================================================================
-   BASE STYLES & PAGE CONTAINER
-   ========================================================================== */
-.stApp {
-    background-color: var(--color-background) !important;
-    font-family: var(--font-body) !important;
-    color: var(--color-text) !important;
-}
-
-.main .block-container {
-    max-width: 1400px !important;
-    padding: var(--spacing-xl) var(--spacing-2xl) var(--spacing-3xl) !important;
-    margin: 0 auto !important;
-}
-
-/* Page load animation */
-@keyframes fadeInUp {
-    from {
-        opacity: 0;
-        transform: translateY(20px);
-    }
-    to {
-        opacity: 1;
-        transform: translateY(0);
-    }
-}
-
-@keyframes fadeIn {
-    from { opacity: 0; }
-    to { opacity: 1; }
-}
-
-.main .block-container > div {
-    animation: fadeInUp 0.6s ease-out forwards;
+    background: var(--gray);
 }
 
-.main .block-container > div:nth-child(1) { animation-delay: 0.1s; }
-.main .block-container > div:nth-child(2) { animation-delay: 0.15s; }
-.main .block-container > div:nth-child(3) { animation-delay: 0.2s; }
-.main .block-container > div:nth-child(4) { animation-delay: 0.25s; }
-.main .block-container > div:nth-child(5) { animation-delay: 0.3s; }
-.main .block-container > div:nth-child(6) { animation-delay: 0.35s; }
-
-/* ==========================================================================
+/* ===========================================
    TYPOGRAPHY
-   ========================================================================== */
-h1, h2, h3, h4, h5, h6,
-.stMarkdown h1, .stMarkdown h2, .stMarkdown h3,
-.stMarkdown h4, .stMarkdown h5, .stMarkdown h6 {
-    font-family: var(--font-heading) !important;
-    color: var(--color-text) !important;
+=========================================== */
+h1, h2, h3, h4, h5, h6 {
+    font-family: 'Playfair Display', 'Source Serif 4', Georgia, serif !important;
+    color: var(--charcoal);
     font-weight: 600 !important;
-    letter-spacing: -0.02em !important;
-    line-height: 1.2 !important;
 }
 
-h1, .stMarkdown h1 {
-    font-size: 3rem !important;
-    font-weight: 700 !important;
-    margin-bottom: var(--spacing-lg) !important;
+p, span, div, label {
+    font-family: 'Source Sans 3', sans-serif;
 }
 
-h2, .stMarkdown h2 {
-    font-size: 2.25rem !important;
-    margin-bottom: var(--spacing-md) !important;
-}
-
-h3, .stMarkdown h3 {
-    font-size: 1.75rem !important;
-    margin-bottom: var(--spacing-md) !important;
-}
-
-h4, .stMarkdown h4 {
-    font-size: 1.25rem !important;
-}
-
-p, .stMarkdown p {
-    font-family: var(--font-body) !important;
-    font-size: 1rem !important;
-    line-height: 1.7 !important;
-    color: var(--color-text-muted) !important;
-    font-weight: 400 !important;
-}
-
-/* ==========================================================================
-   HERO HEADER
-   ========================================================================== */
-.hero-header {
-    background: linear-gradient(135deg, var(--color-background) 0%, #F5F0E8 50%, var(--color-light-gray) 100%);
-    padding: var(--spacing-3xl) var(--spacing-2xl);
-    margin: calc(-1 * var(--spacing-xl)) calc(-1 * var(--spacing-2xl)) var(--spacing-2xl);
-    border-bottom: 1px solid var(--color-light-gray);
+/* ===========================================
+   HERO SECTION
+=========================================== */
+.hero-section {
+    background: linear-gradient(135deg, var(--cream) 0%, var(--cream-dark) 100%);
+    padding: 4rem 5%;
+    margin-bottom: 3rem;
+    border-bottom: 1px solid rgba(45, 42, 38, 0.1);
     position: relative;
     overflow: hidden;
 }
 
-.hero-header::before {
+.hero-section::before {
     content: '';
     position: absolute;
-    top: 0;
-    right: 0;
-    width: 40%;
-    height: 100%;
-    background: linear-gradient(135deg, transparent 0%, rgba(198, 93, 59, 0.05) 100%);
-    pointer-events: none;
-}
-
-.hero-header h1 {
-    font-size: 3.5rem !important;
-    font-weight: 700 !important;
-    background: linear-gradient(135deg, var(--color-text) 0%, var(--color-primary) 100%);
-    -webkit-background-clip: text;
-    -webkit-text-fill-color: transparent;
-    background-clip: text;
-    margin-bottom: var(--spacing-sm) !important;
-}
-
-.hero-header .subtitle {
-    font-family: var(--font-body);
-    font-size: 1.25rem;
-    font-weight: 300;
-    color: var(--color-text-muted);
-    letter-spacing: 0.02em;
-}
-
-/* ==========================================================================
-   METRIC DISPLAYS (Elegant Inline Stats)
-   ========================================================================== */
-div[data-testid="stMetric"] {
-    background: transparent !important;
-    padding: var(--spacing-md) 0 !important;
-    border-bottom: 1px solid var(--color-light-gray);
-}
-
-div[data-testid="stMetric"] > div {
-    display: flex;
-    flex-direction: column;
-    gap: var(--spacing-xs);
-}
-
-div[data-testid="stMetric"] label {
-    font-family: var(--font-body) !important;
-    font-size: 0.75rem !important;
-    font-weight: 600 !important;
-    text-transform: uppercase !important;
-    letter-spacing: 0.1em !important;
-    color: var(--color-secondary) !important;
-}
-
-div[data-testid="stMetric"] div[data-testid="stMetricValue"] {
-    font-family: var(--font-heading) !important;
-    font-size: 2.5rem !important;
-    font-weight: 700 !important;
-    color: var(--color-text) !important;
-    line-height: 1 !important;
-}
-
-div[data-testid="stMetric"] div[data-testid="stMetricDelta"] {
-    font-family: var(--font-body) !important;
-    font-size: 0.875rem !important;
-    font-weight: 600 !important;
+    top: -50%;
+    right: -10%;
+    width: 500px;
+    height: 500px;
+    background: radial-gradient(circle, rgba(198, 93, 59, 0.08) 0%, transparent 70%);
+    border-radius: 50%;
 }
 
-div[data-testid="stMetric"] div[data-testid="stMetricDelta"] svg {
-    width: 14px;
-    height: 14px;
+.hero-section::after {
+    content: '';
+    position: absolute;
+    bottom: -30%;
+    left: -5%;
+    width: 300px;
+    height: 300px;
+    background: radial-gradient(circle, rgba(198, 93, 59, 0.05) 0%, transparent 70%);
+    border-radius: 50%;
 }
 
-/* Positive delta (success) */
-div[data-testid="stMetric"] div[data-testid="stMetricDelta"][data-testid-delta-type="positive"] {
-    color: var(--color-success) !important;
+.hero-masthead {
+    font-family: 'Playfair Display', 'Source Serif 4', Georgia, serif;
+    font-size: 0.85rem;
+    font-weight: 500;
+    letter-spacing: 3px;
+    text-transform: uppercase;
+    color: var(--terracotta);
+    margin-bottom: 1rem;
 }
 
-/* Negative delta (warning) */
-div[data-testid="stMetric"] div[data-testid="stMetricDelta"][data-testid-delta-type="negative"] {
-    color: var(--color-primary) !important;
+.hero-title {
+    font-family: 'Playfair Display', 'Source Serif 4', Georgia, serif;
+    font-size: 3.5rem;
+    font-weight: 700;
+    color: var(--charcoal);
+    margin: 0 0 1rem 0;
+    line-height: 1.1;
+    letter-spacing: -1px;
+}
+
+.hero-subtitle {
+    font-family: 'Source Sans 3', sans-serif;
+    font-size: 1.15rem;
+    color: var(--gray);
+    font-weight: 400;
+    max-width: 500px;
+    line-height: 1.6;
 }
 
-/* Custom metric container class */
-.metric-container {
-    display: flex;
-    gap: var(--spacing-2xl);
-    padding: var(--spacing-lg) 0;
-    border-bottom: 2px solid var(--color-light-gray);
-    margin-bottom: var(--spacing-xl);
+.hero-stats-container {
+    display: grid;
+    grid-template-columns: repeat(4, 1fr);
+    gap: 2rem;
+    margin-top: 3rem;
+    position: relative;
+    z-index: 1;
 }
 
-.metric-item {
-    flex: 1;
-    text-align: left;
+.hero-stat {
+    position: relative;
+    padding-left: 1.5rem;
 }
 
-.metric-label {
-    font-family: var(--font-body);
-    font-size: 0.75rem;
-    font-weight: 600;
-    text-transform: uppercase;
-    letter-spacing: 0.1em;
-    color: var(--color-secondary);
-    margin-bottom: var(--spacing-xs);
+.hero-stat::before {
+    content: '';
+    position: absolute;
+    left: 0;
+    top: 0;
+    height: 100%;
+    width: 2px;
+    background: linear-gradient(180deg, var(--terracotta) 0%, var(--terracotta-light) 100%);
 }
 
-.metric-value {
-    font-family: var(--font-heading);
+.hero-stat-value {
+    font-family: 'Playfair Display', 'Source Serif 4', Georgia, serif;
     font-size: 2.5rem;
     font-weight: 700;
-    color: var(--color-text);
+    color: var(--charcoal);
     line-height: 1;
+    margin-bottom: 0.5rem;
 }
 
-.metric-delta {
-    font-family: var(--font-body);
-    font-size: 0.875rem;
-    font-weight: 600;
-    margin-top: var(--spacing-xs);
+.hero-stat-label {
+    font-family: 'Source Sans 3', sans-serif;
+    font-size: 0.85rem;
+    color: var(--gray);
+    text-transform: uppercase;
+    letter-spacing: 1px;
+    font-weight: 500;
 }
 
-.metric-delta.positive { color: var(--color-success); }
-.metric-delta.negative { color: var(--color-primary); }
-
-/* ==========================================================================
+/* ===========================================
    SIDEBAR STYLES
-   ========================================================================== */
-section[data-testid="stSidebar"] {
-    background-color: var(--color-card-bg) !important;
-    border-right: 1px solid var(--color-light-gray) !important;
-    padding-top: var(--spacing-xl) !important;
+=========================================== */
+[data-testid="stSidebar"] {
+    background-color: var(--white) !important;
+    border-right: 1px solid rgba(45, 42, 38, 0.08);
+    min-width: 300px !important;
+    width: 300px !important;
+    transform: none !important;
 }
 
-section[data-testid="stSidebar"] .block-container {
-    padding: var(--spacing-lg) !important;
+/* Hide sidebar completely */
+[data-testid="stSidebar"] {
+    display: none !important;
 }
 
-section[data-testid="stSidebar"] h1,
-section[data-testid="stSidebar"] h2,
-section[data-testid="stSidebar"] h3 {
-    font-size: 1.25rem !important;
-    color: var(--color-text) !important;
-    padding-bottom: var(--spacing-sm);
-    border-bottom: 2px solid var(--color-primary);
-    margin-bottom: var(--spacing-md) !important;
+[data-testid="stSidebarCollapsedControl"] {
+    display: none !important;
 }
 
-/* Sidebar section labels */
-.sidebar-section-label {
-    font-family: var(--font-body);
+.sidebar-subtitle {
+    font-family: 'Source Sans 3', sans-serif;
+    font-size: 0.85rem;
+    color: var(--gray);
+    margin-bottom: 2rem;
+}
+
+.sidebar-section-title {
+    font-family: 'Source Sans 3', sans-serif;
     font-size: 0.7rem;
     font-weight: 600;
     text-transform: uppercase;
-    letter-spacing: 0.12em;
-    color: var(--color-secondary);
-    margin-top: var(--spacing-lg);
-    margin-bottom: var(--spacing-sm);
-}
-
-/* ==========================================================================
-   SELECT / DROPDOWN STYLING
-   ========================================================================== */
-div[data-baseweb="select"] {
-    font-family: var(--font-body) !important;
+    letter-spacing: 1.5px;
+    color: var(--gray);
+    margin: 1.5rem 0 0.75rem 0;
 }
 
-div[data-baseweb="select"] > div {
-    background-color: var(--color-card-bg) !important;
-    border: 1px solid var(--color-light-gray) !important;
-    border-radius: var(--radius-md) !important;
-    transition: all var(--transition-fast) !important;
+/* Custom select boxes */
+[data-testid="stSidebar"] .stSelectbox > div > div {
+    background-color: var(--cream) !important;
+    border: 1px solid rgba(45, 42, 38, 0.15) !important;
+    border-radius: 8px !important;
+    font-family: 'Source Sans 3', sans-serif !important;
+    transition: all 0.2s ease !important;
 }
 
-div[data-baseweb="select"] > div:hover {
-    border-color: var(--color-secondary) !important;
+[data-testid="stSidebar"] .stSelectbox > div > div:hover {
+    border-color: var(--terracotta) !important;
 }
 
-div[data-baseweb="select"] > div:focus-within {
-    border-color: var(--color-primary) !important;
+[data-testid="stSidebar"] .stSelectbox > div > div:focus-within {
+    border-color: var(--terracotta) !important;
     box-shadow: 0 0 0 2px rgba(198, 93, 59, 0.15) !important;
 }
 
-div[data-baseweb="select"] span {
-    font-family: var(--font-body) !important;
-    color: var(--color-text) !important;
+/* Custom text input */
+[data-testid="stSidebar"] .stTextInput > div > div > input {
+    background-color: var(--cream) !important;
+    border: 1px solid rgba(45, 42, 38, 0.15) !important;
+    border-radius: 8px !important;
+    font-family: 'Source Sans 3', sans-serif !important;
+    padding: 0.6rem 1rem !important;
+    transition: all 0.2s ease !important;
 }
 
-/* Dropdown menu */
-div[data-baseweb="popover"] {
-    border-radius: var(--radius-md) !important;
-    box-shadow: var(--shadow-lg) !important;
-    border: 1px solid var(--color-light-gray) !important;
+[data-testid="stSidebar"] .stTextInput > div > div > input:focus {
+    border-color: var(--terracotta) !important;
+    box-shadow: 0 0 0 2px rgba(198, 93, 59, 0.15) !important;
 }
 
-div[data-baseweb="popover"] ul {
-    padding: var(--spacing-sm) !important;
+[data-testid="stSidebar"] .stTextInput > div > div > input::placeholder {
+    color: var(--gray-light) !important;
 }
 
-div[data-baseweb="popover"] li {
-    font-family: var(--font-body) !important;
-    border-radius: var(--radius-sm) !important;
-    transition: background var(--transition-fast) !important;
+/* Custom slider */
+[data-testid="stSidebar"] .stSlider > div > div > div > div {
+    background-color: var(--terracotta) !important;
 }
 
-div[data-baseweb="popover"] li:hover {
-    background-color: var(--color-light-gray) !important;
+[data-testid="stSidebar"] .stSlider [data-baseweb="slider"] > div:first-child {
+    background: linear-gradient(to right, var(--cream-dark), var(--cream-dark)) !important;
 }
 
-/* Multiselect tags */
-span[data-baseweb="tag"] {
-    background-color: var(--color-primary) !important;
-    border-radius: var(--radius-full) !important;
-    font-family: var(--font-body) !important;
-    font-size: 0.8rem !important;
+/* ===========================================
+   SECTION STYLES
+=========================================== */
+.section-container {
+    padding: 0 5% 4rem 5%;
 }
 
-/* ==========================================================================
-   INPUT FIELDS
-   ========================================================================== */
-input[type="text"],
-input[type="number"],
-div[data-baseweb="input"] input {
-    font-family: var(--font-body) !important;
-    background-color: var(--color-card-bg) !important;
-    border: 1px solid var(--color-light-gray) !important;
-    border-radius: var(--radius-md) !important;
-    padding: var(--spacing-sm) var(--spacing-md) !important;
-    transition: all var(--transition-fast) !important;
+.section-header {
+    display: flex;
+    align-items: baseline;
+    margin-bottom: 2rem;
+    gap: 1rem;
 }
 
-input[type="text"]:focus,
-input[type="number"]:focus,
-div[data-baseweb="input"] input:focus {
-    border-color: var(--color-primary) !important;
-    box-shadow: 0 0 0 2px rgba(198, 93, 59, 0.15) !important;
-    outline: none !important;
+.section-title {
+    font-family: 'Playfair Display', 'Source Serif 4', Georgia, serif;
+    font-size: 1.8rem;
+    font-weight: 600;
+    color: var(--charcoal);
+    margin: 0;
 }
 
-/* Slider styling */
-div[data-baseweb="slider"] div[role="slider"] {
-    background-color: var(--color-primary) !important;
+.section-number {
+    font-family: 'Playfair Display', 'Source Serif 4', Georgia, serif;
+    font-size: 0.9rem;
+    color: var(--terracotta);
+    font-weight: 500;
 }
 
-div[data-baseweb="slider"] div[data-testid="stTickBar"] > div {
-    background-color: var(--color-primary) !important;
+.section-line {
+    flex-grow: 1;
+    height: 1px;
+    background: linear-gradient(90deg, rgba(45, 42, 38, 0.2) 0%, transparent 100%);
+    margin-left: 1rem;
 }
 
-/* ==========================================================================
-   CHART CONTAINERS
-   ========================================================================== */
-div[data-testid="stPlotlyChart"],
-div[data-testid="stVegaLiteChart"],
-div[data-testid="stArrowVegaLiteChart"],
+/* ===========================================
+   CHART CONTAINER STYLES
+=========================================== */
 .chart-container {
-    background-color: var(--color-card-bg) !important;
-    border-radius: var(--radius-lg) !important;
-    box-shadow: var(--shadow-md) !important;
-    padding: var(--spacing-lg) !important;
-    margin: var(--spacing-md) 0 !important;
-    border: 1px solid var(--color-light-gray) !important;
-    transition: box-shadow var(--transition-normal) !important;
+    background: var(--white);
+    border-radius: 12px;
+    padding: 2rem;
+    box-shadow: 0 4px 20px rgba(45, 42, 38, 0.06);
+    border: 1px solid rgba(45, 42, 38, 0.06);
+    transition: all 0.3s ease;
 }
 
-div[data-testid="stPlotlyChart"]:hover,
-div[data-testid="stVegaLiteChart"]:hover,
 .chart-container:hover {
-    box-shadow: var(--shadow-lg) !important;
+    box-shadow: 0 8px 30px rgba(45, 42, 38, 0.1);
 }
 
-/* Chart title styling */
 .chart-title {
-    font-family: var(--font-heading);
+    font-family: 'Playfair Display', 'Source Serif 4', Georgia, serif;
     font-size: 1.25rem;
     font-weight: 600;
-    color: var(--color-text);
-    margin-bottom: var(--spacing-md);
-    padding-bottom: var(--spacing-sm);
-    border-bottom: 1px solid var(--color-light-gray);
+    color: var(--charcoal);
+    margin-bottom: 0.5rem;
 }
 
-/* ==========================================================================
-   CARD GRID SYSTEM
-   ========================================================================== */
-.card-grid {
-    display: grid;
-    grid-template-columns: repeat(3, 1fr);
-    gap: var(--spacing-lg);
-    margin: var(--spacing-xl) 0;
+.chart-subtitle {
+    font-family: 'Source Sans 3', sans-serif;
+    font-size: 0.85rem;
+    color: var(--gray);
+    margin-bottom: 1.5rem;
 }
 
-@media (max-width: 1200px) {
-    .card-grid {
-        grid-template-columns: repeat(2, 1fr);
-    }
-}
-
-@media (max-width: 768px) {
-    .card-grid {
-        grid-template-columns: 1fr;
-    }
+/* ===========================================
+   CARD GALLERY STYLES
+=========================================== */
+.gallery-grid {
+    display: grid;
+    grid-template-columns: repeat(5, 1fr);
+    gap: 1.5rem;
 }
 
-/* ==========================================================================
-   CARD ITEMS
-   ========================================================================== */
 .card-item {
-    background-color: var(--color-card-bg);
-    border-radius: var(--radius-lg);
-    box-shadow: var(--shadow-md);
+    background: var(--white);
+    border-radius: 10px;
     overflow: hidden;
-    position: relative;
-    transition: transform var(--transition-normal), box-shadow var(--transition-normal);
+    box-shadow: 0 4px 20px rgba(45, 42, 38, 0.06);
+    border: 1px solid rgba(45, 42, 38, 0.06);
+    transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
     cursor: pointer;
+    position: relative;
+    display: flex;
+    flex-direction: column;
+    height: 100%;
 }
 
 .card-item:hover {
-    transform: translateY(-8px);
-    box-shadow: var(--shadow-xl);
+    transform: translateY(-6px);
+    box-shadow: 0 16px 32px rgba(45, 42, 38, 0.12);
 }
 
-/* Card image */
-.card-image {
+.card-image-container {
+    position: relative;
+    overflow: hidden;
+    aspect-ratio: 4/5;
+    background: var(--cream-dark);
+    flex-shrink: 0;
+}
+
+.card-image-container img {
     width: 100%;
-    height: 200px;
+    height: 100%;
     object-fit: cover;
-    display: block;
+    transition: transform 0.5s cubic-bezier(0.4, 0, 0.2, 1);
 }
 
-.card-image-container {
-    position: relative;
-    overflow: hidden;
+.card-item:hover .card-image-container img {
+    transform: scale(1.05);
 }
 
-.card-image-container::after {
-    content: '';
-    position: absolute;
-    bottom: 0;
-    left: 0;
-    right: 0;
-    height: 60px;
-    background: linear-gradient(to top, rgba(0,0,0,0.1), transparent);
-    pointer-events: none;
+/* Thumbnail cut from a sprite sheet (category grids) */
+.sprite-tile {
+    width: 100%;
+    height: 100%;
+    background-repeat: no-repeat;
+    transition: transform 0.5s cubic-bezier(0.4, 0, 0.2, 1);
 }
 
-/* Card content */
-.card-content {
-    padding: var(--spacing-lg);
+.card-item:hover .card-image-container .sprite-tile {
+    transform: scale(1.05);
 }
 
-.card-title {
-    font-family: var(--font-heading);
-    font-size: 1.125rem;
+.card-rank-badge {
+    position: absolute;
+    top: 0.6rem;
+    left: 0.6rem;
+    background: var(--white);
+    color: var(--charcoal);
+    font-family: 'Playfair Display', 'Source Serif 4', Georgia, serif;
+    font-size: 0.75rem;
     font-weight: 600;
-    color: var(--color-text);
-    margin-bottom: var(--spacing-sm);
-    line-height: 1.3;
+    padding: 0.3rem 0.6rem;
+    border-radius: 5px;
+    box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);
+    z-index: 2;
 }
 
-.card-description {
-    font-family: var(--font-body);
-    font-size: 0.875rem;
-    color: var(--color-text-muted);
-    line-height: 1.6;
-    margin-bottom: var(--spacing-md);
+.card-occasion-tag {
+    position: absolute;
+    top: 0.6rem;
+    right: 0.6rem;
+    background: var(--terracotta);
+    color: var(--white);
+    font-family: 'Source Sans 3', sans-serif;
+    font-size: 0.6rem;
+    font-weight: 600;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+    padding: 0.25rem 0.5rem;
+    border-radius: 4px;
+    z-index: 2;
 }
 
-.card-meta {
+.card-info {
+    padding: 0.875rem 1rem 1rem;
     display: flex;
-    justify-content: space-between;
-    align-items: center;
-    font-family: var(--font-body);
-    font-size: 0.75rem;
-    color: var(--color-secondary);
+    flex-direction: column;
+    flex-grow: 1;
 }
 
-/* Rank badge overlay */
-.rank-badge {
-    position: absolute;
-    top: var(--spacing-md);
-    left: var(--spacing-md);
-    background: var(--color-card-bg);
-    color: var(--color-primary);
-    font-family: var(--font-heading);
-    font-size: 1rem;
-    font-weight: 700;
-    width: 36px;
-    height: 36px;
-    border-radius: 50%;
+.card-title {
+    font-family: 'Playfair Display', 'Source Serif 4', Georgia, serif;
+    font-size: 0.85rem;
+    font-weight: 600;
+    color: var(--charcoal);
+    margin-bottom: 0.5rem;
+    line-height: 1.35;
+    height: 2.3em;
+    display: -webkit-box;
+    -webkit-line-clamp: 2;
+    -webkit-box-orient: vertical;
+    overflow: hidden;
+}
+
+.card-sends {
     display: flex;
     align-items: center;
-    justify-content: center;
-    box-shadow: var(--shadow-md);
-    z-index: 2;
+    gap: 0.4rem;
+    margin-top: auto;
 }
 
-/* Occasion tag */
-.occasion-tag {
-    position: absolute;
-    top: var(--spacing-md);
-    right: var(--spacing-md);
-    background: var(--color-primary);
-    color: white;
-    font-family: var(--font-body);
-    font-size: 0.7rem;
+.card-sends-value {
+    font-family: 'Source Sans 3', sans-serif;
+    font-size: 0.95rem;
     font-weight: 600;
-    text-transform: uppercase;
-    letter-spacing: 0.05em;
-    padding: var(--spacing-xs) var(--spacing-sm);
-    border-radius: var(--radius-full);
-    z-index: 2;
+    color: var(--terracotta);
 }
 
-.occasion-tag.birthday { background: var(--color-primary); }
-.occasion-tag.holiday { background: var(--color-success); }
-.occasion-tag.wedding { background: var(--color-secondary); }
-.occasion-tag.thank-you { background: var(--color-warning); }
+.card-sends-label {
+    font-family: 'Source Sans 3', sans-serif;
+    font-size: 0.7rem;
+    color: var(--gray);
+}
 
-/* ==========================================================================
-   BUTTONS
-   ========================================================================== */
-button[kind="primary"],
-.stButton > button,
-button[data-testid="baseButton-primary"] {
-    font-family: var(--font-body) !important;
-    font-weight: 600 !important;
-    font-size: 0.875rem !important;
-    background-color: var(--color-primary) !important;
-    color: white !important;
+/* ===========================================
+   PAGINATION
+=========================================== */
+.pagination-container {
+    display: flex;
+    justify-content: center;
+    align-items: center;
+    gap: 0.5rem;
+    margin-top: 3rem;
+}
+
+.page-indicator {
+    font-family: 'Source Sans 3', sans-serif;
+    font-size: 0.9rem;
+    color: var(--gray);
+}
+
+/* ===========================================
+   BUTTON STYLES
+=========================================== */
+.stButton > button {
+    background: var(--terracotta) !important;
+    color: var(--white) !important;
     border: none !important;
-    border-radius: var(--radius-full) !important;
-    padding: var(--spacing-sm) var(--spacing-lg) !important;
-    transition: all var(--transition-fast) !important;
-    text-transform: none !important;
-    letter-spacing: 0.02em !important;
+    border-radius: 8px !important;
+    font-family: 'Source Sans 3', sans-serif !important;
+    font-weight: 500 !important;
+    padding: 0.6rem 1.5rem !important;
+    transition: all 0.3s ease !important;
 }
 
-button[kind="primary"]:hover,
-.stButton > button:hover,
-button[data-testid="baseButton-primary"]:hover {
-    background-color: var(--color-primary-dark) !important;
-    box-shadow: var(--shadow-md) !important;
-    transform: translateY(-1px) !important;
+.stButton > button:hover {
+    background: var(--terracotta-dark) !important;
+    transform: translateY(-1px);
+    box-shadow: 0 4px 12px rgba(198, 93, 59, 0.3) !important;
 }
 
-button[kind="primary"]:active,
-.stButton > button:active {
-    transform: translateY(0) !important;
+/* Secondary button style */
+[data-testid="stSidebar"] .stButton > button {
+    background: transparent !important;
+    color: var(--charcoal) !important;
+    border: 1px solid rgba(45, 42, 38, 0.2) !important;
 }
 
-/* Secondary button */
-button[kind="secondary"],
-button[data-testid="baseButton-secondary"] {
-    font-family: var(--font-body) !important;
-    font-weight: 600 !important;
-    background-color: transparent !important;
-    color: var(--color-primary) !important;
-    border: 2px solid var(--color-primary) !important;
-    border-radius: var(--radius-full) !important;
-    padding: var(--spacing-sm) var(--spacing-lg) !important;
-    transition: all var(--transition-fast) !important;
+[data-testid="stSidebar"] .stButton > button:hover {
+    background: var(--cream) !important;
+    border-color: var(--terracotta) !important;
+    color: var(--terracotta) !important;
+    box-shadow: none !important;
 }
 
-button[kind="secondary"]:hover,
-button[data-testid="baseButton-secondary"]:hover {
-    background-color: var(--color-primary) !important;
-    color: white !important;
+/* ===========================================
+   FILTER STATUS BAR
+=========================================== */
+.filter-status {
+    background: var(--cream-dark);
+    padding: 1rem 5%;
+    margin-bottom: 2rem;
+    border-top: 1px solid rgba(45, 42, 38, 0.06);
+    border-bottom: 1px solid rgba(45, 42, 38, 0.06);
 }
 
-/* Custom button classes */
-.btn-primary {
-    display: inline-block;
-    font-family: var(--font-body);
+.filter-status-text {
+    font-family: 'Source Sans 3', sans-serif;
+    font-size: 0.9rem;
+    color: var(--gray);
+}
+
+.filter-status-count {
     font-weight: 600;
-    font-size: 0.875rem;
-    background-color: var(--color-primary);
-    color: white;
+    color: var(--terracotta);
+}
+
+/* ===========================================
+   TABS STYLING
+=========================================== */
+.stTabs [data-baseweb="tab-list"] {
+    gap: 0;
+    background: transparent;
+    border-bottom: 1px solid rgba(45, 42, 38, 0.1);
+}
+
+.stTabs [data-baseweb="tab"] {
+    font-family: 'Source Sans 3', sans-serif !important;
+    font-weight: 500;
+    color: var(--gray);
+    padding: 1rem 2rem;
+    background: transparent;
     border: none;
-    border-radius: var(--radius-full);
-    padding: var(--spacing-sm) var(--spacing-lg);
-    cursor: pointer;
-    transition: all var(--transition-fast);
-    text-decoration: none;
+    transition: all 0.2s ease;
 }
 
-.btn-primary:hover {
-    background-color: var(--color-primary-dark);
-    box-shadow: var(--shadow-md);
-    transform: translateY(-1px);
+.stTabs [data-baseweb="tab"]:hover {
+    color: var(--charcoal);
 }
 
-.btn-secondary {
-    display: inline-block;
-    font-family: var(--font-body);
-    font-weight: 600;
-    font-size: 0.875rem;
-    background-color: transparent;
-    color: var(--color-primary);
-    border: 2px solid var(--color-primary);
-    border-radius: var(--radius-full);
-    padding: var(--spacing-sm) var(--spacing-lg);
-    cursor: pointer;
-    transition: all var(--transition-fast);
-    text-decoration: none;
+.stTabs [aria-selected="true"] {
+    color: var(--terracotta) !important;
+    border-bottom: 2px solid var(--terracotta) !important;
+    background: transparent !important;
 }
 
-.btn-secondary:hover {
-    background-color: var(--color-primary);
-    color: white;
+.stTabs [data-baseweb="tab-highlight"] {
+    background-color: var(--terracotta) !important;
 }
 
-/* ==========================================================================
+/* ===========================================
    DATA TABLE
-   ========================================================================== */
-div[data-testid="stDataFrame"],
-div[data-testid="stTable"] {
-    background-color: var(--color-card-bg) !important;
-    border-radius: var(--radius-lg) !important;
-    box-shadow: var(--shadow-md) !important;
-    overflow: hidden !important;
-    border: 1px solid var(--color-light-gray) !important;
-}
-
-div[data-testid="stDataFrame"] table,
-div[data-testid="stTable"] table {
-    font-family: var(--font-body) !important;
-    border-collapse: collapse !important;
-    width: 100% !important;
-}
-
-/* Table header */
-div[data-testid="stDataFrame"] thead th,
-div[data-testid="stTable"] thead th {
-    font-family: var(--font-body) !important;
-    font-weight: 600 !important;
-    font-size: 0.75rem !important;
-    text-transform: uppercase !important;
-    letter-spacing: 0.08em !important;
-    color: var(--color-secondary) !important;
-    background-color: var(--color-light-gray) !important;
-    padding: var(--spacing-md) var(--spacing-lg) !important;
-    text-align: left !important;
-    position: sticky !important;
-    top: 0 !important;
-    z-index: 1 !important;
-    border-bottom: 2px solid var(--color-secondary) !important;
+=========================================== */
+.stDataFrame {
+    border-radius: 12px !important;
+    overflow: hidden;
+    box-shadow: 0 4px 20px rgba(45, 42, 38, 0.06);
 }
 
-/* Table rows */
-div[data-testid="stDataFrame"] tbody tr,
-div[data-testid="stTable"] tbody tr {
-    transition: background-color var(--transition-fast) !important;
+.stDataFrame [data-testid="stDataFrameContainer"] {
+    background: var(--white);
 }
 
-/* Alternating row colors */
-div[data-testid="stDataFrame"] tbody tr:nth-child(even),
-div[data-testid="stTable"] tbody tr:nth-child(even) {
-    background-color: rgba(232, 228, 222, 0.3) !important;
+/* ===========================================
+   EXPANDER STYLING
+=========================================== */
+.streamlit-expanderHeader {
+    font-family: 'Source Sans 3', sans-serif !important;
+    font-weight: 500 !important;
+    color: var(--charcoal) !important;
+    background: var(--cream) !important;
+    border-radius: 8px !important;
+}
+
+/* ===========================================
+   RESPONSIVE
+=========================================== */
+@media (max-width: 1400px) {
+    .gallery-grid {
+        grid-template-columns: repeat(4, 1fr);
+    }
 }
 
-div[data-testid="stDataFrame"] tbody tr:hover,
-div[data-testid="stTable"] tbody tr:hover {
-    background-color: rgba(198, 93, 59, 0.05) !important;
-}
+@media (max-width: 1200px) {
+    .gallery-grid {
+        grid-template-columns: repeat(3, 1fr);
+    }
 
-/* Table cells */
-div[data-testid="stDataFrame"] tbody td,
-div[data-testid="stTable"] tbody td {
-    font-family: var(--font-body) !important;
-    font-size: 0.875rem !important;
-    color: var(--color-text) !important;
-    padding: var(--spacing-md) var(--spacing-lg) !important;
-    border-bottom: 1px solid var(--color-light-gray) !important;
+    .hero-stats-container {
+        grid-template-columns: repeat(2, 1fr);
+    }
 }
 
-/* Custom table class */
-.data-table {
-    width: 100%;
-    border-collapse: collapse;
-    font-family: var(--font-body);
-    background: var(--color-card-bg);
-    border-radius: var(--radius-lg);
-    overflow: hidden;
-    box-shadow: var(--shadow-md);
+@media (max-width: 900px) {
+    .gallery-grid {
+        grid-template-columns: repeat(2, 1fr);
+    }
 }
 
-.data-table thead {
-    background: var(--color-light-gray);
-    position: sticky;
-    top: 0;
+@media (max-width: 768px) {
+    .gallery-grid {
+        grid-template-columns: 1fr;
+    }
+
+    .hero-stats-container {
+        grid-template-columns: 1fr;
+    }
+
+    .hero-title {
+        font-size: 2.5rem;
+    }
 }
 
-.data-table th {
-    font-weight: 600;
-    font-size: 0.75rem;
-    text-transform: uppercase;
-    letter-spacing: 0.08em;
-    color: var(--color-secondary);
-    padding: var(--spacing-md) var(--spacing-lg);
-    text-align: left;
-    border-bottom: 2px solid var(--color-secondary);
+/* ===========================================
+   NO IMAGE PLACEHOLDER
+=========================================== */
+.no-image-placeholder {
+    width: 100%;
+    height: 100%;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    background: linear-gradient(135deg, var(--cream-dark) 0%, var(--cream) 100%);
+    color: var(--gray-light);
+    font-family: 'Playfair Display', 'Source Serif 4', Georgia, serif;
+    font-size: 1rem;
+    font-style: italic;
 }
 
-.data-table td {
-    font-size: 0.875rem;
-    color: var(--color-text);
-    padding: var(--spacing-md) var(--spacing-lg);
-    border-bottom: 1px solid var(--color-light-gray);
+/* ===========================================
+   CARD COMPARISON TOOL STYLES
+=========================================== */
+.comparison-header {
+    text-align: center;
+    padding: 2rem 0;
+    margin-bottom: 1.5rem;
 }
 
-.data-table tr:nth-child(even) {
-    background: rgba(232, 228, 222, 0.3);
+.comparison-header h2 {
+    font-family: 'Playfair Display', 'Source Serif 4', Georgia, serif;
+    font-size: 2rem;
+    color: var(--charcoal);
+    margin-bottom: 0.5rem;
 }
 
-.data-table tr:hover {
-    background: rgba(198, 93, 59, 0.05);
+.comparison-header p {
+    font-family: 'Source Sans 3', sans-serif;
+    color: var(--gray);
+    font-size: 1rem;
 }
 
-/* ==========================================================================
-   TABS STYLING
-   ========================================================================== */
-div[data-baseweb="tab-list"] {
-    background-color: transparent !important;
-    border-bottom: 2px solid var(--color-light-gray) !important;
-    gap: var(--spacing-md) !important;
+.comparison-card {
+    background: var(--white);
+    border-radius: 12px;
+    overflow: hidden;
+    box-shadow: 0 4px 20px rgba(45, 42, 38, 0.08);
+    border: 1px solid rgba(45, 42, 38, 0.06);
+    height: 100%;
+    transition: all 0.3s ease;
 }
 
-button[data-baseweb="tab"] {
-    font-family: var(--font-body) !important;
-    font-weight: 600 !important;
-    font-size: 0.875rem !important;
-    color: var(--color-text-muted) !important;
-    background-color: transparent !important;
-    border: none !important;
-    padding: var(--spacing-md) var(--spacing-lg) !important;
-    transition: all var(--transition-fast) !important;
-    position: relative !important;
+.comparison-card:hover {
+    box-shadow: 0 8px 30px rgba(45, 42, 38, 0.12);
 }
 
-button[data-baseweb="tab"]:hover {
-    color: var(--color-primary) !important;
+.comparison-card-image {
+    width: 100%;
+    aspect-ratio: 4/5;
+    object-fit: cover;
+    border-bottom: 1px solid rgba(45, 42, 38, 0.06);
 }
 
-button[data-baseweb="tab"][aria-selected="true"] {
-    color: var(--color-primary) !important;
+.comparison-card-body {
+    padding: 1.5rem;
 }
 
-button[data-baseweb="tab"][aria-selected="true"]::after {
-    content: '';
-    position: absolute;
-    bottom: -2px;
-    left: 0;
-    right: 0;
-    height: 3px;
-    background-color: var(--color-primary);
-    border-radius: var(--radius-full);
+.comparison-card-rank {
+    display: inline-block;
+    background: var(--terracotta);
+    color: white;
+    font-family: 'Playfair Display', 'Source Serif 4', Georgia, serif;
+    font-size: 0.9rem;
+    font-weight: 600;
+    padding: 0.3rem 0.8rem;
+    border-radius: 4px;
+    margin-bottom: 1rem;
 }
 
-div[data-baseweb="tab-highlight"] {
-    background-color: var(--color-primary) !important;
+.comparison-card-title {
+    font-family: 'Playfair Display', 'Source Serif 4', Georgia, serif;
+    font-size: 1.1rem;
+    font-weight: 600;
+    color: var(--charcoal);
+    margin-bottom: 1rem;
+    line-height: 1.4;
 }
 
-/* ==========================================================================
-   EXPANDER STYLING
-   ========================================================================== */
-div[data-testid="stExpander"] {
-    background-color: var(--color-card-bg) !important;
-    border: 1px solid var(--color-light-gray) !important;
-    border-radius: var(--radius-lg) !important;
-    overflow: hidden !important;
-    margin: var(--spacing-sm) 0 !important;
+.comparison-stat {
+    display: flex;
+    justify-content: space-between;
+    padding: 0.6rem 0;
+    border-bottom: 1px solid rgba(45, 42, 38, 0.06);
+    font-family: 'Source Sans 3', sans-serif;
 }
 
-div[data-testid="stExpander"] summary {
-    font-family: var(--font-body) !important;
-    font-weight: 600 !important;
-    color: var(--color-text) !important;
-    padding: var(--spacing-md) var(--spacing-lg) !important;
-    transition: background-color var(--transition-fast) !important;
+.comparison-stat:last-child {
+    border-bottom: none;
 }
 
-div[data-testid="stExpander"] summary:hover {
-    background-color: var(--color-light-gray) !important;
+.comparison-stat-label {
+    color: var(--gray);
+    font-size: 0.85rem;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
 }
 
-div[data-testid="stExpander"] div[data-testid="stExpanderDetails"] {
-    padding: var(--spacing-lg) !important;
-    border-top: 1px solid var(--color-light-gray) !important;
+.comparison-stat-value {
+    color: var(--charcoal);
+    font-weight: 600;
+    font-size: 0.9rem;
 }
 
-/* ==========================================================================
-   ALERT / INFO BOXES
-   ========================================================================== */
-div[data-testid="stAlert"] {
-    font-family: var(--font-body) !important;
-    border-radius: var(--radius-md) !important;
-    border-left-width: 4px !important;
-    padding: var(--spacing-md) var(--spacing-lg) !important;
+.comparison-stat-value.positive {
+    color: #4CAF50;
 }
 
-/* Success alert */
-div[data-testid="stAlert"][data-baseweb-alert-kind="success"],
-.stSuccess {
-    background-color: rgba(91, 140, 90, 0.1) !important;
-    border-left-color: var(--color-success) !important;
+.comparison-stat-value.negative {
+    color: #F44336;
 }
 
-/* Warning alert */
-div[data-testid="stAlert"][data-baseweb-alert-kind="warning"],
-.stWarning {
-    background-color: rgba(212, 168, 75, 0.1) !important;
-    border-left-color: var(--color-warning) !important;
+.comparison-attribute {
+    margin-bottom: 1rem;
 }
 
-/* Error alert */
-div[data-testid="stAlert"][data-baseweb-alert-kind="error"],
-.stError {
-    background-color: rgba(198, 93, 59, 0.1) !important;
-    border-left-color: var(--color-primary) !important;
+.comparison-attribute-label {
+    font-family: 'Source Sans 3', sans-serif;
+    font-size: 0.7rem;
+    text-transform: uppercase;
+    letter-spacing: 1px;
+    color: var(--gray);
+    margin-bottom: 0.4rem;
 }
 
-/* Info alert */
-div[data-testid="stAlert"][data-baseweb-alert-kind="info"],
-.stInfo {
-    background-color: rgba(139, 115, 85, 0.1) !important;
-    border-left-color: var(--color-secondary) !important;
+.comparison-attribute-value {
+    font-family: 'Source Sans 3', sans-serif;
+    font-size: 0.9rem;
+    color: var(--charcoal);
+    font-weight: 500;
 }
 
-/* ==========================================================================
-   PROGRESS BAR
-   ========================================================================== */
-div[data-testid="stProgress"] > div {
-    background-color: var(--color-light-gray) !important;
-    border-radius: var(--radius-full) !important;
-    overflow: hidden !important;
+.comparison-tags {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 0.4rem;
 }
 
-div[data-testid="stProgress"] > div > div {
-    background: linear-gradient(90deg, var(--color-primary) 0%, var(--color-primary-light) 100%) !important;
-    border-radius: var(--radius-full) !important;
+.comparison-tag {
+    background: var(--cream-dark);
+    color: var(--charcoal);
+    font-family: 'Source Sans 3', sans-serif;
+    font-size: 0.75rem;
+    padding: 0.25rem 0.6rem;
+    border-radius: 4px;
 }
 
-/* ==========================================================================
-   DIVIDER
-   ========================================================================== */
-hr {
-    border: none !important;
-    height: 1px !important;
-    background: linear-gradient(90deg, transparent, var(--color-light-gray), transparent) !important;
-    margin: var(--spacing-xl) 0 !important;
+.comparison-summary-box {
+    background: linear-gradient(135deg, var(--cream) 0%, var(--cream-dark) 100%);
+    border-radius: 12px;
+    padding: 2rem;
+    margin-top: 2rem;
+    border: 1px solid rgba(198, 93, 59, 0.15);
 }
 
-/* Decorative divider */
-.divider-decorative {
+.comparison-summary-title {
+    font-family: 'Playfair Display', 'Source Serif 4', Georgia, serif;
+    font-size: 1.4rem;
+    color: var(--charcoal);
+    margin-bottom: 1.5rem;
     display: flex;
     align-items: center;
-    margin: var(--spacing-xl) 0;
+    gap: 0.75rem;
 }
 
-.divider-decorative::before,
-.divider-decorative::after {
+.comparison-summary-title::before {
     content: '';
-    flex: 1;
-    height: 1px;
-    background: var(--color-light-gray);
+    display: inline-block;
+    width: 4px;
+    height: 24px;
+    background: var(--terracotta);
+    border-radius: 2px;
 }
 
-.divider-decorative span {
-    padding: 0 var(--spacing-md);
-    font-family: var(--font-heading);
-    color: var(--color-secondary);
-    font-size: 0.875rem;
+.comparison-summary-section {
+    margin-bottom: 1.5rem;
 }
 
-/* ==========================================================================
-   CHECKBOX & RADIO STYLING
-   ========================================================================== */
-div[data-testid="stCheckbox"] label span {
-    font-family: var(--font-body) !important;
-    color: var(--color-text) !important;
+.comparison-summary-section:last-child {
+    margin-bottom: 0;
 }
 
-div[data-testid="stCheckbox"] label span[data-baseweb="checkbox"] {
-    border-color: var(--color-secondary) !important;
-    border-radius: var(--radius-sm) !important;
+.comparison-summary-section h4 {
+    font-family: 'Source Sans 3', sans-serif;
+    font-size: 0.8rem;
+    text-transform: uppercase;
+    letter-spacing: 1.5px;
+    color: var(--terracotta);
+    margin-bottom: 0.75rem;
+    font-weight: 600;
 }
 
-div[data-testid="stCheckbox"] label span[data-baseweb="checkbox"]:checked,
-div[data-testid="stCheckbox"] label span[data-baseweb="checkbox"][aria-checked="true"] {
-    background-color: var(--color-primary) !important;
-    border-color: var(--color-primary) !important;
+.comparison-summary-section ul {
+    margin: 0;
+    padding-left: 1.25rem;
 }
 
-/* ==========================================================================
-   FILE UPLOADER
-   ========================================================================== */
-div[data-testid="stFileUploader"] {
-    border: 2px dashed var(--color-light-gray) !important;
-    border-radius: var(--radius-lg) !important;
-    background-color: rgba(253, 251, 247, 0.5) !important;
-    transition: all var(--transition-fast) !important;
+.comparison-summary-section li {
+    font-family: 'Source Sans 3', sans-serif;
+    font-size: 0.95rem;
+    color: var(--charcoal);
+    margin-bottom: 0.5rem;
+    line-height: 1.5;
 }
 
-div[data-testid="stFileUploader"]:hover {
-    border-color: var(--color-primary) !important;
-    background-color: rgba(198, 93, 59, 0.02) !important;
+.comparison-insight-card {
+    background: var(--white);
+    border-radius: 8px;
+    padding: 1.25rem;
+    border-left: 3px solid var(--terracotta);
+    margin-bottom: 1rem;
 }
 
-div[data-testid="stFileUploader"] label {
-    font-family: var(--font-body) !important;
-    color: var(--color-text-muted) !important;
+.comparison-insight-card h5 {
+    font-family: 'Playfair Display', 'Source Serif 4', Georgia, serif;
+    font-size: 1rem;
+    color: var(--charcoal);
+    margin-bottom: 0.5rem;
+    font-weight: 600;
 }
 
-/* ==========================================================================
-   SPINNER / LOADING
-   ========================================================================== */
-div[data-testid="stSpinner"] > div {
-    border-top-color: var(--color-primary) !important;
+.comparison-insight-card p {
+    font-family: 'Source Sans 3', sans-serif;
+    font-size: 0.9rem;
+    color: var(--gray);
+    line-height: 1.5;
+    margin: 0;
 }
 
-/* ==========================================================================
-   UTILITY CLASSES
-   ========================================================================== */
-.text-primary { color: var(--color-primary) !important; }
-.text-secondary { color: var(--color-secondary) !important; }
-.text-success { color: var(--color-success) !important; }
-.text-warning { color: var(--color-warning) !important; }
-.text-muted { color: var(--color-text-muted) !important; }
-
-.bg-primary { background-color: var(--color-primary) !important; }
-.bg-secondary { background-color: var(--color-secondary) !important; }
-.bg-card { background-color: var(--color-card-bg) !important; }
-.bg-light { background-color: var(--color-light-gray) !important; }
-
-.shadow-sm { box-shadow: var(--shadow-sm) !important; }
-.shadow-md { box-shadow: var(--shadow-md) !important; }
-.shadow-lg { box-shadow: var(--shadow-lg) !important; }
-
-.rounded-sm { border-radius: var(--radius-sm) !important; }
-.rounded-md { border-radius: var(--radius-md) !important; }
-.rounded-lg { border-radius: var(--radius-lg) !important; }
-.rounded-full { border-radius: var(--radius-full) !important; }
-
-.font-heading { font-family: var(--font-heading) !important; }
-.font-body { font-family: var(--font-body) !important; }
-
-.text-center { text-align: center !important; }
-.text-left { text-align: left !important; }
-.text-right { text-align: right !important; }
-
-/* Spacing utilities */
-.mt-sm { margin-top: var(--spacing-sm) !important; }
-.mt-md { margin-top: var(--spacing-md) !important; }
-.mt-lg { margin-top: var(--spacing-lg) !important; }
-.mt-xl { margin-top: var(--spacing-xl) !important; }
-
-.mb-sm { margin-bottom: var(--spacing-sm) !important; }
-.mb-md { margin-bottom: var(--spacing-md) !important; }
-.mb-lg { margin-bottom: var(--spacing-lg) !important; }
-.mb-xl { margin-bottom: var(--spacing-xl) !important; }
-
-.p-sm { padding: var(--spacing-sm) !important; }
-.p-md { padding: var(--spacing-md) !important; }
-.p-lg { padding: var(--spacing-lg) !important; }
-.p-xl { padding: var(--spacing-xl) !important; }
-
-/* ==========================================================================
-   RESPONSIVE ADJUSTMENTS
-   ========================================================================== */
-@media (max-width: 768px) {
-    .main .block-container {
-        padding: var(--spacing-md) var(--spacing-lg) !important;
-    }
-
-    h1, .stMarkdown h1 {
-        font-size: 2rem !important;
-    }
-
-    h2, .stMarkdown h2 {
-        font-size: 1.5rem !important;
-    }
-
-    div[data-testid="stMetric"] div[data-testid="stMetricValue"] {
-        font-size: 1.75rem !important;
-    }
+.color-swatch {
+    display: inline-block;
+    width: 16px;
+    height: 16px;
+    border-radius: 50%;
+    margin-right: 4px;
+    vertical-align: middle;
+    border: 1px solid rgba(0,0,0,0.1);
+}
 
-    .metric-value {
-        font-size: 1.75rem;
-    }
+.empty-comparison-state {
+    text-align: center;
+    padding: 4rem 2rem;
+    background: var(--cream-dark);
+    border-radius: 12px;
+    margin: 2rem 0;
+}
 
-    .hero-header {
-        padding: var(--spacing-xl) var(--spacing-lg);
-    }
+.empty-comparison-state h3 {
+    font-family: 'Playfair Display', 'Source Serif 4', Georgia, serif;
+    font-size: 1.5rem;
+    color: var(--charcoal);
+    margin-bottom: 1rem;
+}
 
-    .hero-header h1 {
-        font-size: 2.25rem !important;
-    }
+.empty-comparison-state p {
+    font-family: 'Source Sans 3', sans-serif;
+    color: var(--gray);
+    font-size: 1rem;
+    max-width: 400px;
+    margin: 0 auto;
 }
 
-/* ==========================================================================
-   PRINT STYLES
-   ========================================================================== */
-@media print {
-    .stButton,
-    section[data-testid="stSidebar"],
-    div[data-testid="stToolbar"] {
-        display: none !important;
-    }
+.comparison-no-image {
+    width: 100%;
+    aspect-ratio: 4/5;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    background: linear-gradient(135deg, var(--cream-dark) 0%, var(--cream) 100%);
+    color: var(--gray-light);
+    font-family: 'Playfair Display', 'Source Serif 4', Georgia, serif;
+    font-size: 0.9rem;
+    font-style: italic;
+    border-bottom: 1px solid rgba(45, 42, 38, 0.06);
+}
 
-    .main .block-container {
-        max-width: 100% !important;
-        padding: 0 !important;
-    }
+.performance-winner {
+    background: linear-gradient(135deg, #E8F5E9 0%, #C8E6C9 100%);
+    border: 1px solid #4CAF50;
+}
 
-    .card-item:hover {
-        transform: none !important;
-        box-shadow: var(--shadow-sm) !important;
-    }
+.performance-winner .comparison-card-rank {
+    background: #4CAF50;
 }
 """
 
 
-# Example usage in Streamlit app:
-#
-# import streamlit as st
-# from dashboard_styles import CSS_STYLES
-#
-# st.set_page_config(
-#     page_title="Greeting Card Analytics",
-#     page_icon="📊",
-#     layout="wide"
-# )
-#
-# # Inject CSS styles
-# st.markdown(f"<style>{CSS_STYLES}</style>", unsafe_allow_html=True)
-#
-# # Hero header example
-# st.markdown('''
-# <div class="hero-header">
-#     <h1>Greeting Card Analytics</h1>
-#     <p class="subtitle">Insights into card performance and trends</p>
-# </div>
-# ''', unsafe_allow_html=True)
-#
-# # Card grid example
-# st.markdown('''
-# <div class="card-grid">
-#     <div class="card-item">
-#         <div class="card-image-container">
-#             <span class="rank-badge">1</span>
-#             <span class="occasion-tag birthday">Birthday</span>
-#             <img class="card-image" src="image.jpg" alt="Card">
-#         </div>
-#         <div class="card-content">
-#             <h3 class="card-title">Birthday Celebration</h3>
-#             <p class="card-description">A cheerful card for birthday wishes.</p>
-#             <div class="card-meta">
-#                 <span>1,234 sales</span>
-#                 <span>4.8 rating</span>
-#             </div>
-#         </div>
-#     </div>
-# </div>
-# ''', unsafe_allow_html=True)
+def minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace (spaces before ':' are kept, they matter in selectors)."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    css = css.replace(";}", "}")
+    return css.strip()
+
+
+def font_face_css(font_url: str | None = "../fonts", embed: bool = False, fonts_dir: Path = FONTS_DIR) -> str:
+    """
+    @font-face rules for the font files present in static/fonts, loaded from font_url
+    (relative to where the CSS is served) or embedded as data URIs. Without either, no
+    rules are emitted and the font stacks fall back to system fonts.
+    """
+    if font_url is None and not embed:
+        return ""
+    rules = []
+    for family, name, weight, style in FONT_FACES:
+        path = fonts_dir / name
+        if not path.exists():
+            continue
+        font_format = FONT_FORMATS[path.suffix]
+        if embed:
+            src = f"data:font/{font_format};base64,{base64.b64encode(path.read_bytes()).decode()}"
+        else:
+            src = f"{font_url}/{name}"
+        rules.append(
+            f"@font-face {{ font-family: '{family}'; src: url('{src}') format('{font_format}'); "
+            f"font-weight: {weight}; font-style: {style}; font-display: swap; }}"
+        )
+    return "\n".join(rules) + "\n"
+
+
+def stylesheet_css(font_url: str | None = "../fonts", embed_fonts: bool = False) -> str:
+    """Full stylesheet source: the self-hosted font faces (see font_face_css) plus CSS_STYLES."""
+    return font_face_css(font_url, embed_fonts) + CSS_STYLES
+
+
+def build_stylesheet(css_dir: Path = CSS_DIR) -> Path:
+    """
+    Write the minified stylesheet as dashboard.<content hash>.min.css (unless it
+    already exists) and remove stale builds. Returns the stylesheet path.
+    """
+    css = minify_css(stylesheet_css())
+    digest = hashlib.sha256(css.encode()).hexdigest()[:12]
+    path = css_dir / f"{STYLESHEET_NAME}.{digest}.min.css"
+    if not path.exists():
+        css_dir.mkdir(parents=True, exist_ok=True)
+        path.write_text(css, encoding="utf-8")
+        for stale in css_dir.glob(f"{STYLESHEET_NAME}.*.min.css"):
+            if stale != path:
+                stale.unlink()
+    return path
+
+
+def download_fonts(fonts_dir: Path = FONTS_DIR) -> list:
+    """Download any missing font files into static/fonts. Returns the names downloaded."""
+    fonts_dir.mkdir(parents=True, exist_ok=True)
+    downloaded = []
+    for name, source in FONT_FILES.items():
+        target = fonts_dir / name
+        if target.exists():
+            continue
+        with urllib.request.urlopen(f"{FONT_SOURCE}/{source}", timeout=60) as response:
+            target.write_bytes(response.read())
+        downloaded.append(name)
+    return downloaded
+
+
+def main():
+    try:
+        downloaded = download_fonts()
+        print(f"Downloaded {len(downloaded)} font file(s)" if downloaded else "Fonts already present")
+    except OSError as e:
+        print(f"Could not download Playfair Display (headings use Source Serif 4): {e}", file=sys.stderr)
+    path = build_stylesheet()
+    print(f"Built {path.relative_to(BASE_DIR)} ({path.stat().st_size:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,8 @@ import json
 import subprocess
 from pathlib import Path
 
+from image_store import inspect_image
+
 def extract_card_ids(csv_path):
     """Extract card IDs from Column B of the CSV file."""
     card_ids = []
@@ -58,7 +60,13 @@ def download_image(url, output_path):
             timeout=60
         )
         if result.returncode == 0 and output_path.exists() and output_path.stat().st_size > 0:
-            return True
+            # A non-empty file can still be truncated or an error page: make sure it decodes
+            error = inspect_image(output_path)["error"]
+            if error is None:
+                return True
+            print(f"Error downloading image: {error}")
+            output_path.unlink()
+            return False
         else:
             print(f"Error downloading image: curl returned {result.returncode}")
             return False
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Extract dominant colors from card images and populate primary_colors in card_analysis.json.
+Runs k-means on downsampled pixels across all cores and caches results per image hash,
+so only new or changed images are processed on each refresh.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from vocabulary import COLOR_HEX
+
+BASE_DIR = Path(__file__).parent
+IMAGES_DIR = BASE_DIR / "card_images"
+ANALYSIS_FILE = BASE_DIR / "card_analysis.json"
+CACHE_FILE = BASE_DIR / "color_cache.json"
+
+IMAGE_EXTENSIONS = [".jpg", ".jpeg", ".png", ".gif", ".webp"]
+
+# Extraction settings - changing any of these invalidates the cache
+SAMPLE_SIZE = 64        # Images are downsampled to fit within SAMPLE_SIZE x SAMPLE_SIZE
+NUM_CLUSTERS = 6        # k for k-means
+KMEANS_ITERATIONS = 12
+MIN_COLOR_SHARE = 0.08  # Ignore named colors covering less than 8% of the pixels
+MAX_COLORS = 3          # Matches the hand-labelled card_analysis.json entries
+MERGE_DISTANCE = 48     # Palette colors closer than this (RGB distance) count as one color
+
+
+def load_color_palette(color_map=COLOR_HEX):
+    """The named color palette as (names, Nx3 RGB array)."""
+    names = []
+    rgb = []
+    for name, hex_color in color_map.items():
+        # Multicolor has no single RGB value
+        hex_color = hex_color.lstrip('#')
+        if len(hex_color) != 6:
+            continue
+        try:
+            rgb.append([int(hex_color[i:i+2], 16) for i in (0, 2, 4)])
+        except ValueError:
+            continue
+        names.append(name)
+
+    return names, np.array(rgb, dtype=np.float32)
+
+
+def image_hash(image_path):
+    """Return the SHA-256 hex digest of an image file's bytes."""
+    with open(image_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def load_pixels(image_path):
+    """Load an image downsampled to SAMPLE_SIZE and return its opaque pixels as an Nx3 array."""
+    with Image.open(image_path) as img:
+        # GIFs and animations: analyze the first frame
+        img = img.convert("RGBA")
+        img.thumbnail((SAMPLE_SIZE, SAMPLE_SIZE))
+        pixels = np.asarray(img, dtype=np.float32).reshape(-1, 4)
+
+    # Drop transparent pixels so backgrounds of cut-out PNGs don't count as black
+    opaque = pixels[pixels[:, 3] >= 128]
+    return opaque[:, :3]
+
+
+def kmeans(pixels, k=NUM_CLUSTERS, iterations=KMEANS_ITERATIONS, seed=0):
+    """
+    Vectorized k-means over an Nx3 pixel array.
+    Returns (centers, counts) where counts is the number of pixels assigned to each center.
+    """
+    rng = np.random.default_rng(seed)
+    k = min(k, len(pixels))
+    centers = pixels[rng.choice(len(pixels), size=k, replace=False)].copy()
+
+    for _ in range(iterations):
+        # N x k squared distances in one broadcast
+        distances = ((pixels[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+        labels = distances.argmin(axis=1)
+        counts = np.bincount(labels, minlength=k)
+        sums = np.zeros_like(centers)
+        np.add.at(sums, labels, pixels)
+
+        nonempty = counts > 0
+        new_centers = centers.copy()
+        new_centers[nonempty] = sums[nonempty] / counts[nonempty, None]
+        if np.allclose(new_centers, centers):
+            break
+        centers = new_centers
+
+    distances = ((pixels[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+    counts = np.bincount(distances.argmin(axis=1), minlength=k)
+    return centers, counts
+
+
+def name_colors(centers, counts, palette_names, palette_rgb):
+    """Map cluster centers to named palette colors, ordered by pixel share."""
+    # Nearest palette color for every center (Euclidean RGB, as in the dashboard's similarity score)
+    distances = ((centers[:, None, :] - palette_rgb[None, :, :]) ** 2).sum(axis=2)
+    nearest = distances.argmin(axis=1)
+
+    shares = np.bincount(nearest, weights=counts, minlength=len(palette_names))
+    shares = shares / shares.sum() if shares.sum() > 0 else shares
+
+    # Fold near-duplicate palette entries (off-white/ivory/cloud dancer...) into the first
+    # close entry in the palette, so they are reported as plain "white"
+    palette_distances = ((palette_rgb[:, None, :] - palette_rgb[None, :, :]) ** 2).sum(axis=2)
+    canonical = (palette_distances < MERGE_DISTANCE ** 2).argmax(axis=1)
+    shares = np.bincount(canonical, weights=shares, minlength=len(palette_names))
+
+    order = np.argsort(-shares)
+    significant = [palette_names[i] for i in order if shares[i] >= MIN_COLOR_SHARE]
+
+    # Many equally strong hues reads as a multicolor design
+    if len(significant) > MAX_COLORS + 1:
+        return significant[:MAX_COLORS - 1] + ["multicolor"]
+    return significant[:MAX_COLORS]
+
+
+def extract_dominant_colors(image_path, palette):
+    """Worker: compute the named dominant colors for one image. Returns (path, colors or None)."""
+    palette_names, palette_rgb = palette
+    try:
+        pixels = load_pixels(image_path)
+        if len(pixels) == 0:
+            return image_path, None
+        centers, counts = kmeans(pixels)
+        return image_path, name_colors(centers, counts, palette_names, palette_rgb)
+    except Exception as e:
+        print(f"  Error processing {Path(image_path).name}: {e}")
+        return image_path, None
+
+
+def cache_settings():
+    """Settings fingerprint stored alongside the cache."""
+    return {
+        "sample_size": SAMPLE_SIZE,
+        "clusters": NUM_CLUSTERS,
+        "iterations": KMEANS_ITERATIONS,
+        "min_share": MIN_COLOR_SHARE,
+        "max_colors": MAX_COLORS,
+        "merge_distance": MERGE_DISTANCE,
+    }
+
+
+def load_cache(palette_names):
+    """Load the per-image-hash color cache, discarding it if settings or palette changed."""
+    if not CACHE_FILE.exists():
+        return {}
+    try:
+        with open(CACHE_FILE, 'r') as f:
+            cache = json.load(f)
+    except Exception:
+        return {}
+    if cache.get("settings") != cache_settings() or cache.get("palette") != palette_names:
+        print("Extraction settings or palette changed - rebuilding color cache")
+        return {}
+    return cache.get("images", {})
+
+
+def save_cache(images, palette_names):
+    """Write the color cache to disk."""
+    with open(CACHE_FILE, 'w') as f:
+        json.dump({
+            "settings": cache_settings(),
+            "palette": palette_names,
+            "images": images,
+        }, f, indent=2)
+
+
+def find_images(images_dir=IMAGES_DIR):
+    """List card image files in the images directory."""
+    return sorted(
+        p for p in images_dir.iterdir()
+        if p.is_file() and p.suffix.lower() in IMAGE_EXTENSIONS
+    )
+
+
+def extract_all(image_paths, workers=None):
+    """
+    Return {card_id: colors} for all images, using the hash cache and a process pool
+    for anything not yet analyzed.
+    """
+    palette = load_color_palette()
+    palette_names = palette[0]
+    cached = load_cache(palette_names)
+
+    hashes = {str(p): image_hash(p) for p in image_paths}
+    pending = [path for path, digest in hashes.items() if digest not in cached]
+    print(f"Found {len(image_paths)} images ({len(image_paths) - len(pending)} cached, {len(pending)} to analyze)")
+
+    if pending:
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            worker = partial(extract_dominant_colors, palette=palette)
+            for i, (path, colors) in enumerate(executor.map(worker, pending, chunksize=8), 1):
+                if colors is not None:
+                    cached[hashes[path]] = {"file": Path(path).name, "colors": colors}
+                if i % 50 == 0 or i == len(pending):
+                    print(f"  [{i}/{len(pending)}] analyzed", flush=True)
+
+    # Drop entries for images that no longer exist so the cache doesn't grow forever
+    live = set(hashes.values())
+    cached = {digest: entry for digest, entry in cached.items() if digest in live}
+    save_cache(cached, palette_names)
+
+    card_colors = {}
+    for path, digest in hashes.items():
+        entry = cached.get(digest)
+        card_id = Path(path).name.split("_")[0]
+        if entry and card_id:
+            card_colors[card_id] = entry["colors"]
+    return card_colors
+
+
+def populate_analysis(card_colors, overwrite=False, dry_run=False):
+    """Fill primary_colors in card_analysis.json from extracted colors."""
+    with open(ANALYSIS_FILE, 'r') as f:
+        analysis_data = json.load(f)
+
+    updated = 0
+    for card in analysis_data:
+        colors = card_colors.get(str(card.get("card_id", "")))
+        if not colors:
+            continue
+        if card.get("primary_colors") and not overwrite:
+            continue
+        card["primary_colors"] = colors
+        updated += 1
+
+    print(f"\nUpdated primary_colors for {updated} of {len(analysis_data)} cards")
+
+    if updated and not dry_run:
+        with open(ANALYSIS_FILE, 'w') as f:
+            json.dump(analysis_data, f, indent=2)
+        print(f"Saved {ANALYSIS_FILE.name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract dominant card colors into card_analysis.json")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="Replace existing primary_colors instead of only filling missing ones")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of worker processes (default: all cores)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Analyze and report without writing card_analysis.json")
+    args = parser.parse_args()
+
+    card_colors = extract_all(find_images(), workers=args.workers)
+    populate_analysis(card_colors, overwrite=args.overwrite, dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Packed card image store and image catalog.
+
+The loose files in card_images are appended to one pack file with a JSON index of
+(offset, length, format) per image, keyed by file stem (the CSV card name) and by card ID.
+Reads are slices of a read-only mmap of the pack: no per-image open, stat or glob.
+
+The pack is append-only: a changed image is appended again and its index entry moved,
+and the pack is compacted only when dead bytes outweigh live ones. The index records a
+fingerprint of card_images, so a store built from an older directory is ignored (callers
+fall back to the loose files) until the pack is rebuilt.
+
+The catalog stage opens every image with Pillow across a process pool and records its real
+format and MIME type, dimensions, byte size and content hash, flagging files that fail to
+decode (e.g. truncated downloads). Render paths read MIME types and corrupt flags from the
+catalog in memory.
+
+Usage:
+    python image_store.py              # Catalog and pack new and changed images
+    python image_store.py --rebuild    # Re-inspect every image and rewrite the pack
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import mmap
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+IMAGES_DIR = BASE_DIR / "card_images"
+PACK_DIR = BASE_DIR / "image_cache"
+PACK_FILE = PACK_DIR / "card_images.pack"
+INDEX_FILE = PACK_DIR / "card_images.index.json"
+CATALOG_FILE = PACK_DIR / "catalog.json"
+INDEX_VERSION = 1
+CATALOG_WORKERS = os.cpu_count() or 1
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".webp")  # Lookup preference for a card name
+IMAGE_FORMATS = {".jpg": "jpeg", ".jpeg": "jpeg", ".png": "png", ".gif": "gif", ".webp": "webp"}
+
+
+def directory_fingerprint(images_dir: Path) -> str:
+    """Size and mtime of every image in the directory (changes on add, remove or rewrite)."""
+    parts = []
+    for entry in sorted(os.scandir(images_dir), key=lambda e: e.name):
+        if Path(entry.name).suffix.lower() in IMAGE_FORMATS:
+            stat = entry.stat()
+            parts.append(f"{entry.name}:{stat.st_size}:{stat.st_mtime_ns}")
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()[:16]
+
+
+def read_index(index_file: Path = INDEX_FILE) -> dict | None:
+    """The pack index, or None if missing, unreadable or from another index version."""
+    try:
+        with open(index_file, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return index if index.get("version") == INDEX_VERSION else None
+
+
+def card_id_of(stem: str) -> str:
+    """Card ID prefix of an image file stem ("1001_Dream Date" -> "1001")."""
+    return stem.split("_")[0] if "_" in stem else stem
+
+
+def resolve_names(file_names) -> tuple:
+    """
+    ({file stem: file name}, {card ID: file stem}) for a set of image file names. A card
+    stored in several formats resolves to the preferred extension.
+    """
+    rank = {ext: i for i, ext in enumerate(IMAGE_EXTENSIONS)}
+    by_stem, by_id = {}, {}
+    for name in sorted(file_names, key=lambda n: (Path(n).stem, rank.get(Path(n).suffix.lower(), 99))):
+        stem = Path(name).stem
+        if stem not in by_stem:
+            by_stem[stem] = name
+            by_id.setdefault(card_id_of(stem), stem)
+    return by_stem, by_id
+
+
+def build_pack(images_dir: Path = IMAGES_DIR, pack_dir: Path = PACK_DIR, rebuild: bool = False,
+               catalog: dict | None = None) -> dict:
+    """
+    Append new and changed images to the pack and rewrite the index.
+    Formats come from the catalog's sniffed format when given, otherwise the extension.
+    Returns counts of appended, unchanged and removed images plus the pack size.
+    """
+    pack_file = pack_dir / PACK_FILE.name
+    index_file = pack_dir / INDEX_FILE.name
+    index = None if rebuild else read_index(index_file)
+    if index is not None and (not pack_file.exists() or pack_file.stat().st_size != index["pack_size"]):
+        index = None  # Pack and index disagree (interrupted build): start over
+    files = index["files"] if index else {}
+
+    images = {
+        entry.name: entry for entry in os.scandir(images_dir)
+        if Path(entry.name).suffix.lower() in IMAGE_FORMATS
+    }
+    removed = [name for name in files if name not in images]
+    for name in removed:
+        del files[name]
+
+    live = sum(entry["length"] for entry in files.values())
+    dead = (index["pack_size"] if index else 0) - live
+    if index and dead > live:
+        return build_pack(images_dir, pack_dir, rebuild=True, catalog=catalog)  # Compact
+
+    pack_dir.mkdir(parents=True, exist_ok=True)
+    appended = unchanged = 0
+    # Appends extend the live pack (existing readers map only its old length); a rebuild
+    # writes a new file and swaps it in, so nothing mapped is ever truncated
+    target = pack_file if index else pack_file.with_suffix(".pack.tmp")
+    with open(target, "ab" if index else "wb") as pack:
+        offset = pack.tell()
+        for name in sorted(images):
+            stat = images[name].stat()
+            entry = files.get(name)
+            if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                unchanged += 1
+                continue
+            data = Path(images[name].path).read_bytes()
+            pack.write(data)
+            sniffed = (catalog or {}).get(name, {}).get("format")
+            files[name] = {
+                "offset": offset,
+                "length": len(data),
+                "format": sniffed.lower() if sniffed else IMAGE_FORMATS[Path(name).suffix.lower()],
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+            }
+            offset += len(data)
+            appended += 1
+        pack.flush()
+        os.fsync(pack.fileno())
+        pack_size = pack.tell()
+    if target != pack_file:
+        target.replace(pack_file)
+
+    index = {
+        "version": INDEX_VERSION,
+        "pack_size": pack_size,
+        "images_dir": directory_fingerprint(images_dir),
+        "files": files,
+    }
+    temporary = index_file.with_suffix(".tmp")
+    temporary.write_text(json.dumps(index), encoding="utf-8")
+    temporary.replace(index_file)  # Readers see the old index or the new one, never a partial write
+    return {"appended": appended, "unchanged": unchanged, "removed": len(removed), "pack_size": pack_size}
+
+
+class ImageStore:
+    """Read-only view of a pack: image bytes by card name or card ID as zero-copy memoryviews."""
+
+    def __init__(self, pack_file: Path, index: dict):
+        by_stem, self._by_id = resolve_names(index["files"])
+        files = {stem: index["files"][name] for stem, name in by_stem.items()}
+        self._entries = {stem: (entry["offset"], entry["length"]) for stem, entry in files.items()}
+        self.formats = {stem: entry["format"] for stem, entry in files.items()}
+
+        self._file = open(pack_file, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self._view = memoryview(self._map) if self._map is not None else memoryview(b"")
+
+    @classmethod
+    def open(cls, pack_dir: Path = PACK_DIR, images_dir: Path = IMAGES_DIR) -> "ImageStore | None":
+        """The store, or None if there is no pack or it was built from a different card_images."""
+        index = read_index(pack_dir / INDEX_FILE.name)
+        pack_file = pack_dir / PACK_FILE.name
+        # A size mismatch means the pack is mid-append or mid-rebuild relative to this index
+        if index is None or not pack_file.exists() or pack_file.stat().st_size != index["pack_size"]:
+            return None
+        if index["images_dir"] != directory_fingerprint(images_dir):
+            return None
+        return cls(pack_file, index)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, card_name: str) -> bool:
+        return card_name in self._entries
+
+    def get(self, card_name: str) -> memoryview | None:
+        """Image bytes for a card name (the image file stem)."""
+        entry = self._entries.get(card_name)
+        if entry is None:
+            return None
+        offset, length = entry
+        return self._view[offset:offset + length]
+
+    def get_by_id(self, card_id: str) -> memoryview | None:
+        """Image bytes for a card ID."""
+        stem = self._by_id.get(card_id)
+        return self.get(stem) if stem is not None else None
+
+    def format_of(self, card_name: str) -> str | None:
+        return self.formats.get(card_name)
+
+    def prefetch(self, card_names) -> int:
+        """Hint the kernel to page in these cards' images ahead of use; returns how many were found."""
+        if self._map is None or not hasattr(mmap, "MADV_WILLNEED"):
+            return 0
+        found = 0
+        for card_name in card_names:
+            entry = self._entries.get(card_name) or self._entries.get(self._by_id.get(card_id_of(card_name)))
+            if entry is None:
+                continue
+            offset, length = entry
+            start = offset - offset % mmap.PAGESIZE
+            self._map.madvise(mmap.MADV_WILLNEED, start, offset + length - start)
+            found += 1
+        return found
+
+
+def inspect_image(path) -> dict:
+    """
+    Format, MIME type, dimensions, frame count, byte size and SHA-256 of one image file.
+    The image is fully decoded (JPEGs at 1/8 scale, which still reads every byte), so
+    truncated or corrupt files get an error instead of passing as valid.
+    """
+    from PIL import Image  # Deferred so importing this module stays cheap at app startup
+
+    data = Path(path).read_bytes()
+    info = {
+        "bytes": len(data),
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "format": None, "mime": None, "width": None, "height": None, "frames": None,
+        "error": None,
+    }
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            info.update(format=img.format, mime=Image.MIME.get(img.format), width=img.width, height=img.height)
+            info["frames"] = getattr(img, "n_frames", 1)
+            img.draft("RGB", (max(1, img.width // 8), max(1, img.height // 8)))
+            img.load()
+    except Exception as e:
+        info["error"] = f"{type(e).__name__}: {e}"
+    return info
+
+
+def read_catalog(catalog_file: Path = CATALOG_FILE) -> dict | None:
+    """The catalog file, or None if missing, unreadable or from another index version."""
+    return read_index(catalog_file)
+
+
+def build_catalog(images_dir: Path = IMAGES_DIR, pack_dir: Path = PACK_DIR, rebuild: bool = False,
+                  workers: int = CATALOG_WORKERS) -> dict:
+    """
+    Inspect new and changed images across a process pool and rewrite catalog.json.
+    Returns {file name: image info} for every image in the directory.
+    """
+    catalog_file = pack_dir / CATALOG_FILE.name
+    previous = None if rebuild else read_catalog(catalog_file)
+    known = previous["files"] if previous else {}
+
+    files, pending = {}, []
+    for entry in sorted(os.scandir(images_dir), key=lambda e: e.name):
+        if Path(entry.name).suffix.lower() not in IMAGE_FORMATS:
+            continue
+        stat = entry.stat()
+        info = known.get(entry.name)
+        if info and info["size"] == stat.st_size and info["mtime_ns"] == stat.st_mtime_ns:
+            files[entry.name] = info
+        else:
+            files[entry.name] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+            pending.append(entry.name)
+
+    if pending:
+        paths = [str(images_dir / name) for name in pending]
+        if workers > 1 and len(pending) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(inspect_image, paths, chunksize=max(1, len(paths) // (workers * 4))))
+        else:
+            results = [inspect_image(path) for path in paths]
+        for name, info in zip(pending, results):
+            files[name].update(info)
+
+    catalog = {"version": INDEX_VERSION, "images_dir": directory_fingerprint(images_dir), "files": files}
+    pack_dir.mkdir(parents=True, exist_ok=True)
+    temporary = catalog_file.with_suffix(".tmp")
+    temporary.write_text(json.dumps(catalog), encoding="utf-8")
+    temporary.replace(catalog_file)
+    return files
+
+
+class ImageCatalog:
+    """Image info (format, MIME type, dimensions, hash, error) by card name or card ID, held in memory."""
+
+    def __init__(self, catalog: dict):
+        by_stem, self._by_id = resolve_names(catalog["files"])
+        self._info = {stem: catalog["files"][name] for stem, name in by_stem.items()}
+        self.corrupt = sorted(name for name, info in catalog["files"].items() if info.get("error"))
+
+    @classmethod
+    def open(cls, pack_dir: Path = PACK_DIR, images_dir: Path = IMAGES_DIR) -> "ImageCatalog | None":
+        """The catalog, or None if it hasn't been built or card_images changed since."""
+        catalog = read_catalog(pack_dir / CATALOG_FILE.name)
+        if catalog is None or catalog["images_dir"] != directory_fingerprint(images_dir):
+            return None
+        return cls(catalog)
+
+    def __len__(self):
+        return len(self._info)
+
+    def info(self, card_name: str) -> dict | None:
+        return self._info.get(card_name)
+
+    def info_by_id(self, card_id: str) -> dict | None:
+        stem = self._by_id.get(card_id)
+        return self._info.get(stem) if stem is not None else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Catalog card_images and pack them into one memory-mappable file.")
+    parser.add_argument("--images", type=Path, default=IMAGES_DIR, help="Directory of card images")
+    parser.add_argument("--output", type=Path, default=PACK_DIR, help="Directory for the pack, its index and the catalog")
+    parser.add_argument("--rebuild", action="store_true", help="Re-inspect every image and rewrite the pack")
+    parser.add_argument("--workers", type=int, default=CATALOG_WORKERS, help="Processes inspecting images")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    catalog = build_catalog(args.images, args.output, rebuild=args.rebuild, workers=args.workers)
+    corrupt = {name: info["error"] for name, info in catalog.items() if info.get("error")}
+    print(f"Cataloged {len(catalog)} images in {time.perf_counter() - started:.2f}s; {len(corrupt)} failed to decode")
+    for name, error in corrupt.items():
+        print(f"  {name}: {error}")
+
+    started = time.perf_counter()
+    result = build_pack(args.images, args.output, rebuild=args.rebuild, catalog=catalog)
+    print(
+        f"{result['appended']} appended, {result['unchanged']} unchanged, {result['removed']} removed; "
+        f"pack {result['pack_size'] / 1e6:.1f} MB in {time.perf_counter() - started:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Multi-session load test for the dashboard.
+
+Starts app.py under `streamlit run` in headless mode and connects N simulated
+browser sessions over Streamlit's websocket protocol. Each session works through
+a scripted mix of interactions: gallery page flips, comparison searches and
+picks, export format changes in the Data Table tab and brief regeneration.
+Streamlit runs every tab's body on each rerun, so switching tabs is client-side
+only; each tab is exercised through its own widgets instead.
+
+Sessions can be spread over several server processes (--servers), one app.py
+instance each. The report gives p50/p95 rerun latency per interaction (request
+sent to script finished) plus RSS and CPU for each server process. Everything
+runs locally; no browser or external service is needed.
+
+Usage:
+    python load_test.py --sessions 8 --iterations 20
+    python load_test.py --sessions 40 --servers 4 --output load_test.json
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+import numpy as np
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+BASE_DIR = Path(__file__).parent
+APP_FILE = BASE_DIR / "app.py"
+BASE_PORT = 8601
+SERVER_START_TIMEOUT = 60
+SAMPLE_INTERVAL = 0.25  # Seconds between server RSS samples
+
+WIDGET_TYPES = ("button", "multiselect", "selectbox", "text_input")
+SEARCH_QUERIES = ["#1", "birthday", "love", "12", "thank"]
+
+HAS_PSUTIL = importlib.util.find_spec("psutil") is not None
+
+
+# =============================================================================
+# SERVER PROCESSES
+# =============================================================================
+
+def start_server(port: int) -> subprocess.Popen:
+    """Launch a headless app.py server and wait until its health check passes."""
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", str(APP_FILE),
+            "--server.headless", "true",
+            "--server.port", str(port),
+            "--server.fileWatcherType", "none",
+            "--browser.gatherUsageStats", "false",
+        ],
+        cwd=BASE_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server on port {port} exited with code {process.returncode}")
+        try:
+            with urllib.request.urlopen(f"http://localhost:{port}/_stcore/health", timeout=1) as response:
+                if response.status == 200:
+                    return process
+        except OSError:
+            time.sleep(0.25)
+    process.terminate()
+    raise RuntimeError(f"Server on port {port} did not start within {SERVER_START_TIMEOUT}s")
+
+
+def process_usage(pid: int) -> tuple:
+    """(RSS bytes, CPU seconds) of a process, or (None, None) where it can't be read."""
+    if HAS_PSUTIL:
+        import psutil
+
+        try:
+            process = psutil.Process(pid)
+            cpu = process.cpu_times()
+            return process.memory_info().rss, cpu.user + cpu.system
+        except psutil.Error:
+            return None, None
+
+    try:
+        with open(f"/proc/{pid}/statm", "r") as f:
+            rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        with open(f"/proc/{pid}/stat", "r") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        cpu = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")  # utime + stime
+        return rss, cpu
+    except (OSError, ValueError, IndexError):
+        return None, None
+
+
+async def monitor_server(pid: int, samples: list, stop: asyncio.Event):
+    """Sample a server's RSS until stopped."""
+    while not stop.is_set():
+        rss, _ = process_usage(pid)
+        if rss is not None:
+            samples.append(rss)
+        try:
+            await asyncio.wait_for(stop.wait(), SAMPLE_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+
+
+# =============================================================================
+# SIMULATED SESSIONS
+# =============================================================================
+
+class Session:
+    """One browser session talking to the server over the websocket protocol."""
+
+    def __init__(self, port: int):
+        self.url = f"ws://localhost:{port}/_stcore/stream"
+        self.websocket = None
+        self.widgets = {}        # widget id -> (type, label, options) from the latest run
+        self.widget_values = {}  # widget id -> WidgetState sent on every rerun, as a browser would
+
+    async def connect(self):
+        self.websocket = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+
+    async def close(self):
+        await self.websocket.close()
+
+    def find(self, key: str = None, label: str = None) -> str:
+        """ID of a rendered widget by user key or label."""
+        for widget_id, (_, widget_label, _) in self.widgets.items():
+            if (key and widget_id.endswith(f"-{key}")) or (label and widget_label == label):
+                return widget_id
+        raise LookupError(f"Widget {key or label!r} not rendered")
+
+    def set_value(self, widget_id: str, state: WidgetState):
+        self.widget_values[widget_id] = state
+
+    async def rerun(self, trigger: str = None) -> str | None:
+        """Send a rerun with the current widget states. Returns the first script error, if any."""
+        message = BackMsg()
+        message.rerun_script.query_string = ""
+        message.rerun_script.page_script_hash = ""
+        states = message.rerun_script.widget_states.widgets
+        states.extend(self.widget_values.values())
+        if trigger:
+            states.append(WidgetState(id=trigger, trigger_value=True))
+        await self.websocket.send(message.SerializeToString())
+
+        self.widgets = {}
+        error = None
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await self.websocket.recv())
+            kind = forward.WhichOneof("type")
+            if kind == "script_finished":
+                # Widgets that weren't rendered this run (e.g. behind an early return) are dropped
+                self.widget_values = {k: v for k, v in self.widget_values.items() if k in self.widgets}
+                return error
+            if kind != "delta" or forward.delta.WhichOneof("type") != "new_element":
+                continue
+            element = forward.delta.new_element
+            element_type = element.WhichOneof("type")
+            if element_type in WIDGET_TYPES:
+                widget = getattr(element, element_type)
+                options = list(widget.options) if element_type in ("multiselect", "selectbox") else []
+                self.widgets[widget.id] = (element_type, widget.label, options)
+            elif element_type == "exception" and error is None:
+                error = f"{element.exception.type}: {element.exception.message}"
+
+
+async def flip_page(session: Session, rng: random.Random):
+    """Next gallery page (now and then back to the first one)."""
+    key = "gallery_first" if rng.random() < 0.2 else "gallery_next"
+    return await session.rerun(trigger=session.find(key=key))
+
+
+async def search_cards(session: Session, rng: random.Random):
+    """Type a query into the comparison type-ahead."""
+    widget_id = session.find(key="comparison_search")
+    session.set_value(widget_id, WidgetState(id=widget_id, string_value=rng.choice(SEARCH_QUERIES)))
+    return await session.rerun()
+
+
+async def compare_cards(session: Session, rng: random.Random):
+    """Pick 2-4 cards in the comparison selector."""
+    widget_id = session.find(key="comparison_selected_ids")
+    options = session.widgets[widget_id][2]
+    state = WidgetState(id=widget_id)
+    state.string_array_value.data.extend(rng.sample(options, k=min(len(options), rng.randint(2, 4))))
+    session.set_value(widget_id, state)
+    return await session.rerun()
+
+
+async def change_export_format(session: Session, rng: random.Random):
+    """Switch the Data Table export format."""
+    widget_id = session.find(key="export_format")
+    fmt = rng.choice(session.widgets[widget_id][2])
+    session.set_value(widget_id, WidgetState(id=widget_id, string_value=fmt))
+    return await session.rerun()
+
+
+async def regenerate_briefs(session: Session, rng: random.Random):
+    """Click Generate New Briefs."""
+    return await session.rerun(trigger=session.find(key="generate_briefs_btn"))
+
+
+INTERACTIONS = {
+    "page_flip": flip_page,
+    "search": search_cards,
+    "compare": compare_cards,
+    "export_format": change_export_format,
+    "regenerate_briefs": regenerate_briefs,
+}
+
+
+async def run_session(session_id: int, port: int, iterations: int, seed: int, ready: asyncio.Barrier) -> list:
+    """Load the app, wait for every session to load, then run scripted interactions."""
+    rng = random.Random(seed + session_id)
+    timings = []
+
+    session = Session(port)
+    await session.connect()
+    try:
+        start = time.perf_counter()
+        error = await session.rerun()
+        timings.append((port, "load", time.perf_counter() - start, error))
+        await ready.wait()  # Start interacting together
+
+        names = list(INTERACTIONS)
+        for _ in range(iterations):
+            name = rng.choice(names)
+            start = time.perf_counter()
+            try:
+                error = await INTERACTIONS[name](session, rng)
+            except LookupError as e:
+                error = str(e)
+            timings.append((port, name, time.perf_counter() - start, error))
+    finally:
+        await session.close()
+    return timings
+
+
+async def run_load_test(ports: list, pids: list, sessions: int, iterations: int, seed: int) -> tuple:
+    """Run all sessions concurrently against the servers while sampling their resource use."""
+    usage_before = {pid: process_usage(pid) for pid in pids}
+    samples = {pid: [] for pid in pids}
+    stop = asyncio.Event()
+    monitors = [asyncio.create_task(monitor_server(pid, samples[pid], stop)) for pid in pids]
+
+    ready = asyncio.Barrier(sessions)
+    start = time.perf_counter()
+    results = await asyncio.gather(*[
+        run_session(i, ports[i % len(ports)], iterations, seed, ready) for i in range(sessions)
+    ])
+    wall = time.perf_counter() - start
+    stop.set()
+    await asyncio.gather(*monitors)
+
+    servers = []
+    for i, (port, pid) in enumerate(zip(ports, pids)):
+        rss_start, cpu_start = usage_before[pid]
+        rss_end, cpu_end = process_usage(pid)
+        servers.append({
+            "port": port,
+            "pid": pid,
+            "sessions": len(range(i, sessions, len(ports))),
+            "rss_start": rss_start,
+            "rss_end": rss_end,
+            "rss_peak": max(samples[pid]) if samples[pid] else rss_end,
+            "cpu_seconds": cpu_end - cpu_start if cpu_end is not None and cpu_start is not None else None,
+            "wall_seconds": wall,
+        })
+    return [timing for session in results for timing in session], servers
+
+
+# =============================================================================
+# REPORT
+# =============================================================================
+
+def percentiles(seconds: list) -> dict:
+    values = np.array(seconds) * 1000
+    return {
+        "count": len(values),
+        "p50_ms": round(float(np.percentile(values, 50)), 1),
+        "p95_ms": round(float(np.percentile(values, 95)), 1),
+        "max_ms": round(float(values.max()), 1),
+    }
+
+
+def megabytes(value) -> float | None:
+    return round(value / 1e6, 1) if value is not None else None
+
+
+def summarize(timings: list, servers: list) -> dict:
+    """Latency percentiles per interaction plus per-server resource use."""
+    by_name = {}
+    errors = []
+    for port, name, seconds, error in timings:
+        by_name.setdefault(name, []).append(seconds)
+        if error:
+            errors.append({"port": port, "interaction": name, "error": error})
+
+    reruns = [seconds for _, name, seconds, _ in timings if name != "load"]
+    processes = []
+    for server in servers:
+        measured = server["rss_end"] is not None and server["rss_start"] is not None
+        processes.append({
+            "port": server["port"],
+            "pid": server["pid"],
+            "sessions": server["sessions"],
+            "rss_start_mb": megabytes(server["rss_start"]),
+            "rss_end_mb": megabytes(server["rss_end"]),
+            "rss_peak_mb": megabytes(server["rss_peak"]),
+            "rss_per_session_mb": (
+                round((server["rss_end"] - server["rss_start"]) / server["sessions"] / 1e6, 2) if measured else None
+            ),
+            "cpu_seconds": round(server["cpu_seconds"], 1) if server["cpu_seconds"] is not None else None,
+            "cpu_pct": (
+                round(server["cpu_seconds"] / server["wall_seconds"] * 100, 1)
+                if server["cpu_seconds"] is not None else None
+            ),
+        })
+
+    return {
+        "latency": {name: percentiles(values) for name, values in by_name.items()},
+        "reruns": percentiles(reruns) if reruns else {},
+        "processes": processes,
+        "errors": errors,
+    }
+
+
+def print_report(summary: dict, sessions: int, servers: int, iterations: int, elapsed: float):
+    print(f"\n{sessions} sessions x {iterations} interactions on {servers} server(s) in {elapsed:.1f}s\n")
+    print(f"{'Interaction':<20}{'Count':>8}{'p50 ms':>10}{'p95 ms':>10}{'Max ms':>10}")
+    rows = list(summary["latency"].items())
+    if summary["reruns"]:
+        rows.append(("all reruns", summary["reruns"]))
+    for name, stats in rows:
+        print(f"{name:<20}{stats['count']:>8}{stats['p50_ms']:>10}{stats['p95_ms']:>10}{stats['max_ms']:>10}")
+
+    columns = ["rss_start_mb", "rss_end_mb", "rss_peak_mb", "rss_per_session_mb", "cpu_seconds", "cpu_pct"]
+    print(f"\n{'Port':<8}{'PID':>8}{'Sessions':>10}{'RSS start':>11}{'RSS end':>9}{'RSS peak':>10}{'MB/session':>12}{'CPU s':>8}{'CPU %':>8}")
+    for proc in summary["processes"]:
+        values = ["n/a" if proc[column] is None else proc[column] for column in columns]
+        print(
+            f"{proc['port']:<8}{proc['pid']:>8}{proc['sessions']:>10}{values[0]:>11}{values[1]:>9}"
+            f"{values[2]:>10}{values[3]:>12}{values[4]:>8}{values[5]:>8}"
+        )
+
+    if summary["errors"]:
+        print(f"\n{len(summary['errors'])} interaction(s) failed, first: {summary['errors'][0]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the dashboard with concurrent simulated sessions")
+    parser.add_argument("--sessions", type=int, default=8, help="Concurrent sessions in total (default: 8)")
+    parser.add_argument("--iterations", type=int, default=20, help="Interactions per session (default: 20)")
+    parser.add_argument("--servers", type=int, default=1, help="app.py server processes to spread sessions over (default: 1)")
+    parser.add_argument("--port", type=int, default=BASE_PORT, help=f"First server port (default: {BASE_PORT})")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the interaction scripts (default: 0)")
+    parser.add_argument("--output", type=Path, help="Also write the summary as JSON to this path")
+    args = parser.parse_args()
+
+    server_count = max(1, min(args.servers, args.sessions))
+    ports = [args.port + i for i in range(server_count)]
+    print(f"Starting {server_count} server(s)...")
+    processes = []
+    try:
+        for port in ports:
+            processes.append(start_server(port))
+        start = time.perf_counter()
+        timings, servers = asyncio.run(run_load_test(
+            ports, [process.pid for process in processes], args.sessions, args.iterations, args.seed
+        ))
+        elapsed = time.perf_counter() - start
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.wait()
+
+    summary = summarize(timings, servers)
+    print_report(summary, args.sessions, server_count, args.iterations, elapsed)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2)
+        print(f"\nWrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Batched bootstrap confidence intervals.
+Groups of the same size are resampled together with one (groups x resamples x size) index
+matrix, so thousands of combinations cost a handful of NumPy gathers instead of a Python
+loop per combination. Batches hold at most MAX_BATCH_ELEMENTS resampled values.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+DEFAULT_RESAMPLES = 2000
+DEFAULT_CONFIDENCE = 0.9
+MIN_GROUP_SIZE = 2               # A single card has no spread to resample
+MAX_BATCH_ELEMENTS = 4_000_000   # Cap on resampled values held in memory at once
+
+
+def bootstrap_mean_intervals(
+    values: Sequence[float],
+    groups: Sequence[Sequence[int]],
+    n_resamples: int = DEFAULT_RESAMPLES,
+    confidence: float = DEFAULT_CONFIDENCE,
+    seed: int = 0,
+) -> np.ndarray:
+    """
+    Percentile bootstrap interval on the mean of each group.
+    groups are sequences of indices into values. Returns a (len(groups), 2) array of
+    (low, high); groups smaller than MIN_GROUP_SIZE get NaN.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    groups = [np.asarray(group, dtype=np.int64) for group in groups]
+    sizes = np.array([len(group) for group in groups], dtype=np.int64)
+    bounds = np.full((len(groups), 2), np.nan)
+    rng = np.random.default_rng(seed)
+    tail = (1 - confidence) / 2
+
+    for size in np.unique(sizes[sizes >= MIN_GROUP_SIZE]).tolist():
+        members = np.flatnonzero(sizes == size)
+        samples = values[np.stack([groups[i] for i in members])]  # groups x size
+        # Batch groups while all their resamples fit; a group too large for that is
+        # resampled in chunks along the resample axis instead
+        per_batch = max(1, MAX_BATCH_ELEMENTS // (n_resamples * size))
+        per_chunk = max(1, min(n_resamples, MAX_BATCH_ELEMENTS // size))
+        for start in range(0, len(members), per_batch):
+            batch = samples[start:start + per_batch]
+            means = np.concatenate([
+                np.take_along_axis(
+                    batch[:, None, :],
+                    rng.integers(0, size, size=(len(batch), min(per_chunk, n_resamples - done), size)),
+                    axis=2,
+                ).mean(axis=2)
+                for done in range(0, n_resamples, per_chunk)
+            ], axis=1)
+            bounds[members[start:start + per_batch]] = np.quantile(means, [tail, 1 - tail], axis=1).T
+    return bounds
+
+
+def lift_intervals(values: Sequence[float], groups: Sequence[Sequence[int]], baseline: float, **kwargs) -> np.ndarray:
+    """Bootstrap intervals on each group's mean expressed as % lift over baseline (NaN if baseline <= 0)."""
+    bounds = bootstrap_mean_intervals(values, groups, **kwargs)
+    if baseline <= 0:
+        return np.full_like(bounds, np.nan)
+    return (bounds - baseline) / baseline * 100
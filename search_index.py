@@ -0,0 +1,260 @@
+"""
+Search indexes for greeting cards.
+CardSearchIndex is the type-ahead index over rank, card ID and display name (prefix lookups
+plus a trigram inverted index). TextSearchIndex is a typo-tolerant full-text index over
+display name, artist, themes and occasion, ranked by trigram overlap.
+"""
+
+import heapq
+import math
+import re
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase and collapse punctuation/whitespace for matching."""
+    return re.sub(r"[^a-z0-9&']+", " ", str(text).lower()).strip()
+
+
+def trigrams(text: str) -> set:
+    """Return the set of character trigrams of a normalized string (padded at word edges)."""
+    grams = set()
+    for word in text.split():
+        padded = f" {word} "
+        for i in range(len(padded) - 2):
+            grams.add(padded[i:i+3])
+    return grams
+
+
+class CardSearchIndex:
+    """
+    In-memory search index over cards.
+
+    Numeric queries ("12", "#12", "18") are matched as prefixes of the rank and
+    the card ID; text queries must contain every trigram of the query, which
+    finds substrings anywhere in the display name. Results are ordered by rank.
+    """
+
+    def __init__(self):
+        self.card_ids: List[str] = []
+        self.ranks: List[int] = []
+        self.labels: List[str] = []
+        self.position: Dict[str, int] = {}
+        self.postings: Dict[str, set] = defaultdict(set)
+        self.words: List[tuple] = []         # sorted (word, position) pairs for short prefixes
+        self.sorted_ids: List[tuple] = []    # sorted (card_id, position) pairs
+        self.sorted_ranks: List[tuple] = []  # sorted (rank string, position) pairs
+
+    @classmethod
+    def from_dataframe(cls, df) -> "CardSearchIndex":
+        """Build an index from a DataFrame with Rank, Card ID and Display Name columns."""
+        index = cls()
+        for card_id, rank, display_name in zip(df["Card ID"], df["Rank"], df["Display Name"]):
+            index.add(str(card_id), int(rank), str(display_name))
+        index.finalize()
+        return index
+
+    def add(self, card_id: str, rank: int, display_name: str):
+        """Add a card to the index. Call finalize() after a batch of additions."""
+        if card_id in self.position:
+            return
+        pos = len(self.card_ids)
+        self.card_ids.append(card_id)
+        self.ranks.append(rank)
+        self.labels.append(f"#{rank} - {display_name[:50]}{'...' if len(display_name) > 50 else ''}")
+        self.position[card_id] = pos
+
+        normalized = normalize_text(display_name)
+        for gram in trigrams(normalized):
+            self.postings[gram].add(pos)
+        self.words.extend((word, pos) for word in set(normalized.split()))
+        self.sorted_ids.append((card_id, pos))
+        self.sorted_ranks.append((str(rank), pos))
+
+    def finalize(self):
+        """Sort the prefix tables after additions."""
+        self.words.sort()
+        self.sorted_ids.sort()
+        self.sorted_ranks.sort()
+
+    def label(self, card_id: str) -> str:
+        """Display label for a card ID (falls back to the ID itself)."""
+        pos = self.position.get(card_id)
+        return self.labels[pos] if pos is not None else card_id
+
+    @staticmethod
+    def _prefix_matches(table: List[tuple], prefix: str) -> Iterable[int]:
+        """Positions whose key in a sorted (key, position) table starts with prefix."""
+        i = bisect_left(table, (prefix,))
+        while i < len(table) and table[i][0].startswith(prefix):
+            yield table[i][1]
+            i += 1
+
+    def search(self, query: str, limit: int = 20, allowed: Optional[set] = None) -> List[str]:
+        """Return up to `limit` card IDs matching the query, best rank first."""
+        query = query.strip()
+        if not query:
+            candidates = range(len(self.card_ids))
+        elif query.lstrip("#").isdigit():
+            digits = query.lstrip("#")
+            candidates = set(self._prefix_matches(self.sorted_ranks, digits))
+            if not query.startswith("#"):
+                candidates |= set(self._prefix_matches(self.sorted_ids, digits))
+        else:
+            words = normalize_text(query).split()
+            if not words:
+                return []
+            # A one-character last word is still being typed: its only trigram is the
+            # closed " x " word, so match it as a word prefix instead
+            partial = words.pop() if len(words) > 1 and len(words[-1]) == 1 else None
+            if len(words) == 1 and len(words[0]) < 3:
+                # Too short for trigrams: match word prefixes instead
+                candidates = set(self._prefix_matches(self.words, words[0]))
+            else:
+                grams = trigrams(" ".join(words))
+                # The last word may still be being typed, so don't require its closing edge gram
+                grams.discard(f"{words[-1][-2:]} ")
+                postings = sorted((self.postings.get(g, set()) for g in grams), key=len)
+                candidates = set.intersection(*postings) if postings else set()
+            if partial:
+                candidates &= set(self._prefix_matches(self.words, partial))
+
+        if allowed is not None:
+            candidates = [pos for pos in candidates if self.card_ids[pos] in allowed]
+        best = heapq.nsmallest(limit, candidates, key=lambda pos: self.ranks[pos])
+        return [self.card_ids[pos] for pos in best]
+
+
+EMPTY_POSTING = np.zeros(0, dtype=np.int32)
+
+
+class TextSearchIndex:
+    """
+    Full-text trigram index over card documents (display name, artist, themes, occasion).
+
+    Postings are sorted numpy arrays of document positions. A document matches when it
+    contains at least MIN_SIMILARITY of the query's trigrams, so small typos still match;
+    results are ordered by that overlap, then by insertion order (best-selling first when
+    cards are added in rank order). Cards can be added incrementally: new documents are
+    appended to the postings without touching existing ones.
+    """
+
+    MIN_SIMILARITY = 0.6
+
+    def __init__(self):
+        self.card_ids: List[str] = []
+        self.texts: List[str] = []
+        self.position: Dict[str, int] = {}
+        self.postings: Dict[str, np.ndarray] = {}
+        self.words: List[tuple] = []  # sorted (word, position) pairs for short prefixes
+        self.version = None
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def document_text(name: str, artist: str = "", themes: Iterable[str] = (), occasion: str = "") -> str:
+        """Normalized searchable text for one card."""
+        parts = [name, artist, *themes, str(occasion or "").replace("_", " ")]
+        return normalize_text(" ".join(str(part) for part in parts if part))
+
+    def update(self, documents: Iterable[tuple], version=None) -> int:
+        """
+        Index (card_id, text) documents that aren't in the index yet and return how many were added.
+        If an indexed card's text has changed, the index is rebuilt from the given documents.
+        """
+        documents = list(documents)
+        with self.lock:
+            if any(self.texts[self.position[card_id]] != text
+                   for card_id, text in documents if card_id in self.position):
+                self._reset()
+
+            pending = defaultdict(list)
+            new_words = []
+            added = 0
+            for card_id, text in documents:
+                if card_id in self.position:
+                    continue
+                pos = len(self.card_ids)
+                self.card_ids.append(card_id)
+                self.texts.append(text)
+                self.position[card_id] = pos
+                for gram in trigrams(text):
+                    pending[gram].append(pos)
+                new_words.extend((word, pos) for word in set(text.split()))
+                added += 1
+
+            # Positions only grow, so appending keeps every posting sorted
+            for gram, positions in pending.items():
+                new = np.array(positions, dtype=np.int32)
+                old = self.postings.get(gram)
+                self.postings[gram] = new if old is None else np.concatenate([old, new])
+            if new_words:
+                self.words = sorted(self.words + new_words)
+            self.version = version
+            return added
+
+    def _reset(self):
+        self.card_ids = []
+        self.texts = []
+        self.position = {}
+        self.postings = {}
+        self.words = []
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """Card IDs matching the query, best match first (all matches when limit is None)."""
+        words = normalize_text(query).split()
+        if not words:
+            return []
+        # A one-character last word is still being typed: match it as a word prefix, not a trigram
+        partial = words.pop() if len(words) > 1 and len(words[-1]) == 1 else None
+
+        with self.lock:
+            allowed = None
+            if partial:
+                allowed = np.unique(np.fromiter(
+                    CardSearchIndex._prefix_matches(self.words, partial), dtype=np.int32
+                ))
+            if len(words) == 1 and len(words[0]) < 3:
+                # Too short for trigrams: match word prefixes instead
+                positions = np.unique(np.fromiter(
+                    CardSearchIndex._prefix_matches(self.words, words[0]), dtype=np.int32
+                ))
+                if allowed is not None:
+                    positions = np.intersect1d(positions, allowed)
+                return [self.card_ids[pos] for pos in positions[:limit].tolist()]
+
+            grams = trigrams(" ".join(words))
+            # The last word may still be being typed, so don't require its closing edge gram
+            if len(grams) > 1:
+                grams.discard(f"{words[-1][-2:]} ")
+            postings = sorted((self.postings.get(gram, EMPTY_POSTING) for gram in grams), key=len)
+            card_ids = self.card_ids
+
+        # A document with `need` of the query's grams must appear in at least one of the
+        # len(grams) - need + 1 shortest postings, so candidates come from those alone
+        need = max(1, math.ceil(len(postings) * self.MIN_SIMILARITY))
+        seeds = postings[:len(postings) - need + 1]
+        candidates = seeds[0] if len(seeds) == 1 else np.unique(np.concatenate(seeds))
+        if allowed is not None:
+            candidates = candidates[np.isin(candidates, allowed)]
+        if not len(candidates):
+            return []
+
+        counts = np.zeros(len(candidates), dtype=np.int32)
+        for posting in postings:
+            if not len(posting):
+                continue
+            idx = np.searchsorted(posting, candidates)
+            counts += posting[np.minimum(idx, len(posting) - 1)] == candidates
+
+        keep = counts >= need
+        candidates, counts = candidates[keep], counts[keep]
+        order = np.lexsort((candidates, -counts))[:limit]
+        return [card_ids[pos] for pos in candidates[order].tolist()]
+
+    def __len__(self) -> int:
+        return len(self.card_ids)
@@ -0,0 +1,130 @@
+"""
+Sprite sheets for card thumbnail grids.
+A grid's thumbnails are composed into one compressed image with a coordinate map, cached
+on disk and rebuilt only when the grid's ranking (or one of its images) changes. Sheets are
+written under static/sprites/ with a content-hashed name, so the dashboard can link them
+through Streamlit's static file serving and browsers cache each version.
+"""
+
+import hashlib
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+SPRITE_DIR = BASE_DIR / "static" / "sprites"
+
+TILE_WIDTH = 240   # 4:5 tiles, matching .card-image-container
+TILE_HEIGHT = 300
+SHEET_COLUMNS = 10
+SHEET_FORMAT = "WEBP"
+SHEET_MIME = "image/webp"
+SHEET_QUALITY = 80
+LOAD_WORKERS = 8
+
+
+def ranking_key(entries: list) -> str:
+    """
+    Fingerprint of a grid: card names in rank order plus each image's size and mtime.
+    entries is a list of (card_name, image_path or None).
+    """
+    digest = hashlib.sha256()
+    for card_name, image_path in entries:
+        digest.update(str(card_name).encode())
+        if image_path:
+            try:
+                stat = Path(image_path).stat()
+                digest.update(f":{stat.st_size}:{stat.st_mtime_ns}".encode())
+            except OSError:
+                digest.update(b":missing")
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def load_tile(image_path) -> "Image.Image | None":
+    """Load one image cropped/scaled to the tile size (first frame for GIFs)."""
+    from PIL import Image, ImageOps  # Deferred so importing this module stays cheap at app startup
+
+    try:
+        with Image.open(image_path) as img:
+            img.draft("RGB", (TILE_WIDTH * 2, TILE_HEIGHT * 2))  # Fast JPEG downscale on decode
+            return ImageOps.fit(img.convert("RGB"), (TILE_WIDTH, TILE_HEIGHT), Image.LANCZOS)
+    except Exception:
+        return None
+
+
+def build_sprite_sheet(entries: list) -> tuple:
+    """
+    Compose the thumbnails for entries into one sheet.
+    Returns (sheet bytes, coordinate map {card_name: [column, row]}, columns, rows).
+    """
+    from PIL import Image
+
+    paths = [image_path for _, image_path in entries]
+    with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+        tiles = list(executor.map(lambda path: load_tile(path) if path else None, paths))
+
+    placed = [(card_name, tile) for (card_name, _), tile in zip(entries, tiles) if tile is not None]
+    columns = max(1, min(SHEET_COLUMNS, len(placed)))
+    rows = max(1, -(-len(placed) // columns))
+
+    sheet = Image.new("RGB", (columns * TILE_WIDTH, rows * TILE_HEIGHT), (245, 240, 232))
+    coordinates = {}
+    for i, (card_name, tile) in enumerate(placed):
+        column, row = i % columns, i // columns
+        sheet.paste(tile, (column * TILE_WIDTH, row * TILE_HEIGHT))
+        coordinates[str(card_name)] = [column, row]
+
+    buffer = io.BytesIO()
+    sheet.save(buffer, SHEET_FORMAT, quality=SHEET_QUALITY, method=4)
+    return buffer.getvalue(), coordinates, columns, rows
+
+
+def load_sprite_sheet(name: str, entries: list, sprite_dir: Path = SPRITE_DIR) -> dict | None:
+    """
+    Return the sprite sheet for a grid, rebuilding it only if the ranking key changed.
+    The result has image (bytes), mime, columns, rows, coordinates and file (the sheet's
+    path on disk, None if it couldn't be written). Returns None if none of the entries
+    has a usable image.
+    """
+    key = ranking_key(entries)
+    image_file = sprite_dir / f"{name}.{key[:12]}.webp"
+    map_file = sprite_dir / f"{name}.json"
+
+    if image_file.exists() and map_file.exists():
+        try:
+            with open(map_file, "r") as f:
+                sprite_map = json.load(f)
+            if sprite_map.get("key") == key:
+                return {**sprite_map, "image": image_file.read_bytes(), "mime": SHEET_MIME, "file": image_file}
+        except Exception:
+            pass
+
+    image_bytes, coordinates, columns, rows = build_sprite_sheet(entries)
+    if not coordinates:
+        return None
+
+    sprite_map = {"key": key, "columns": columns, "rows": rows, "coordinates": coordinates}
+    try:
+        sprite_dir.mkdir(parents=True, exist_ok=True)
+        image_file.write_bytes(image_bytes)
+        with open(map_file, "w") as f:
+            json.dump(sprite_map, f)
+        for stale in sprite_dir.glob(f"{name}.*.webp"):
+            if stale != image_file:
+                stale.unlink()
+    except OSError:
+        image_file = None  # Read-only deployments still get the in-memory sheet
+    return {**sprite_map, "image": image_bytes, "mime": SHEET_MIME, "file": image_file}
+
+
+def tile_position(sprite: dict, card_name: str) -> str | None:
+    """CSS background-position for a card's tile (percentages, so tiles scale with the grid)."""
+    coordinate = sprite["coordinates"].get(str(card_name))
+    if coordinate is None:
+        return None
+    column, row = coordinate
+    x = column / (sprite["columns"] - 1) * 100 if sprite["columns"] > 1 else 0
+    y = row / (sprite["rows"] - 1) * 100 if sprite["rows"] > 1 else 0
+    return f"{x:.4f}% {y:.4f}%"
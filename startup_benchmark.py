@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the dashboard.
+
+1. Import time: runs the top-level imports of app.py in a fresh interpreter under
+   `python -X importtime` and reports the total and the slowest modules.
+2. Time to first paint: starts a fresh headless server and measures, for a cold
+   first session and a warm second one, the time from requesting the page until
+   the hero section arrives and until the script finishes.
+
+Exits non-zero if a measurement exceeds its bound, so it can gate changes.
+
+Usage:
+    python startup_benchmark.py
+    python startup_benchmark.py --max-import 1.5 --max-first-paint 2.0 --runs 3
+"""
+
+import argparse
+import ast
+import asyncio
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+from load_test import BASE_PORT, start_server
+
+BASE_DIR = Path(__file__).parent
+APP_FILE = BASE_DIR / "app.py"
+FIRST_PAINT_MARKER = 'class="hero-section"'
+
+# Default bounds in seconds
+MAX_IMPORT_SECONDS = 2.0
+MAX_FIRST_PAINT_SECONDS = 3.0
+
+
+# =============================================================================
+# IMPORT TIME
+# =============================================================================
+
+def app_import_statements() -> str:
+    """The module-level import statements of app.py, as source."""
+    tree = ast.parse(APP_FILE.read_text(encoding="utf-8"))
+    nodes = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    return "\n".join(ast.unparse(node) for node in nodes)
+
+
+def measure_imports(top: int = 10) -> dict:
+    """Run app.py's imports under -X importtime. Returns total seconds and the slowest modules."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", app_import_statements()],
+        cwd=BASE_DIR, capture_output=True, text=True, check=True,
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        # "import time:   self_us |   cumulative_us |   <indented module name>"
+        parts = line.split("|")
+        if not line.startswith("import time:") or len(parts) != 3:
+            continue
+        self_us, cumulative_us = parts[0].split(":")[1].strip(), parts[1].strip()
+        if not (self_us.isdigit() and cumulative_us.isdigit()):
+            continue
+        depth = len(parts[2]) - len(parts[2].lstrip())
+        modules.append((parts[2].strip(), int(self_us), int(cumulative_us), depth))
+
+    top_level = [m for m in modules if m[3] == min(module[3] for module in modules)]
+    return {
+        "total": sum(cumulative for _, _, cumulative, _ in top_level) / 1e6,
+        "slowest": sorted(top_level, key=lambda m: -m[2])[:top],
+    }
+
+
+# =============================================================================
+# TIME TO FIRST PAINT
+# =============================================================================
+
+async def measure_page_load(port: int) -> tuple:
+    """Open a session and request the page. Returns (seconds to hero, seconds to script finished)."""
+    async with websockets.connect(f"ws://localhost:{port}/_stcore/stream", subprotocols=["streamlit"], max_size=None) as ws:
+        message = BackMsg()
+        message.rerun_script.query_string = ""
+        message.rerun_script.page_script_hash = ""
+        start = time.perf_counter()
+        await ws.send(message.SerializeToString())
+
+        first_paint = None
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await ws.recv())
+            kind = forward.WhichOneof("type")
+            if kind == "script_finished":
+                return first_paint, time.perf_counter() - start
+            if (first_paint is None and kind == "delta"
+                    and forward.delta.WhichOneof("type") == "new_element"
+                    and forward.delta.new_element.WhichOneof("type") == "markdown"
+                    and FIRST_PAINT_MARKER in forward.delta.new_element.markdown.body):
+                first_paint = time.perf_counter() - start
+
+
+def measure_first_paint(port: int) -> dict:
+    """Cold (first session after server start) and warm (second session) page loads."""
+    process = start_server(port)
+    try:
+        cold = asyncio.run(measure_page_load(port))
+        warm = asyncio.run(measure_page_load(port))
+    finally:
+        process.terminate()
+        process.wait()
+    return {"cold": cold, "warm": warm}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure dashboard import time and time to first paint")
+    parser.add_argument("--runs", type=int, default=1, help="Repeat measurements and report the best run (default: 1)")
+    parser.add_argument("--max-import", type=float, default=MAX_IMPORT_SECONDS,
+                        help=f"Bound for app.py's import time in seconds (default: {MAX_IMPORT_SECONDS})")
+    parser.add_argument("--max-first-paint", type=float, default=MAX_FIRST_PAINT_SECONDS,
+                        help=f"Bound for cold time to first paint in seconds (default: {MAX_FIRST_PAINT_SECONDS})")
+    parser.add_argument("--port", type=int, default=BASE_PORT, help=f"Server port (default: {BASE_PORT})")
+    args = parser.parse_args()
+
+    imports = min((measure_imports() for _ in range(args.runs)), key=lambda result: result["total"])
+    print(f"Import time: {imports['total']:.3f}s")
+    for name, self_us, cumulative_us, _ in imports["slowest"]:
+        print(f"  {name:<32}{cumulative_us / 1000:>9.1f} ms cumulative{self_us / 1000:>9.1f} ms self")
+
+    loads = min((measure_first_paint(args.port) for _ in range(args.runs)), key=lambda result: result["cold"][0] or 0)
+    print("\nTime to first paint (hero) / script finished:")
+    for label, (first_paint, finished) in loads.items():
+        paint = f"{first_paint:.3f}s" if first_paint is not None else "not rendered"
+        print(f"  {label:<6}{paint:>14} / {finished:.3f}s")
+
+    failures = []
+    if imports["total"] > args.max_import:
+        failures.append(f"import time {imports['total']:.3f}s exceeds {args.max_import}s")
+    cold_paint = loads["cold"][0]
+    if cold_paint is None or cold_paint > args.max_first_paint:
+        failures.append(f"cold first paint {'missing' if cold_paint is None else f'{cold_paint:.3f}s'} exceeds {args.max_first_paint}s")
+
+    if failures:
+        print("\nFAILED: " + "; ".join(failures))
+        sys.exit(1)
+    print("\nWithin bounds")
+
+
+if __name__ == "__main__":
+    main()
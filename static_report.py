@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Static HTML report of the dashboard.
+
+Renders the hero, performance charts, executive insights, a top-cards grid, artist
+leaderboard, portfolio gap heatmap and trend hub into one self-contained HTML file (styles,
+figures and thumbnails inline), so readers who only need the numbers open a file instead
+of running the Streamlit script.
+
+Sections are built in parallel worker processes from the same figure builders the
+dashboard uses. Thumbnails come from the on-disk sprite sheet cache. The report records
+the version of its source files and is only rebuilt when they change.
+
+Usage:
+    python static_report.py
+    python static_report.py --output reports/weekly.html --workers 4
+    python static_report.py --cdn --force
+"""
+
+import argparse
+import base64
+import html
+import multiprocessing
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+REPORT_DIR = BASE_DIR / "reports"
+DEFAULT_OUTPUT = REPORT_DIR / "dashboard_report.html"
+PLOTLY_CDN = "https://cdn.plot.ly/plotly-2.35.2.min.js"
+FIGURE_CONFIG = {"displayModeBar": False, "responsive": True}
+VERSION_PATTERN = re.compile(r'<meta name="data-version" content="([^"]*)">')
+TOP_CARDS = 20
+
+# Report sections in page order
+SECTIONS = ("hero", "charts", "insights", "top_cards", "artists", "gaps", "trends")
+
+REPORT_CSS = """
+body { background: #FDFBF7; margin: 0; }
+.report-page { max-width: 1200px; margin: 0 auto; padding: 2rem 2.5rem 4rem; }
+.report-columns { display: grid; grid-template-columns: repeat(2, minmax(0, 1fr)); gap: 2rem; }
+.report-stats { display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem; }
+.report-findings { display: grid; grid-template-columns: repeat(2, 1fr); gap: 1rem; margin-bottom: 2rem; }
+.report-finding { background: white; padding: 1rem; border-radius: 8px; border-left: 3px solid #C65D3B; }
+.report-finding-value { font-family: 'Playfair Display', 'Source Serif 4', serif; font-size: 1.1rem; color: #2D2A26; font-weight: 600; }
+.report-finding-label { font-size: 0.75rem; color: #8B8680; text-transform: uppercase; letter-spacing: 0.5px; }
+.report-finding-detail { font-size: 0.85rem; color: #5C5955; margin-top: 0.25rem; }
+.report-table { width: 100%; border-collapse: collapse; font-family: 'Source Sans 3', sans-serif; font-size: 0.9rem; }
+.report-table th { text-align: left; color: #8B8680; font-weight: 500; text-transform: uppercase; font-size: 0.7rem; }
+.report-table td, .report-table th { padding: 0.4rem 0.5rem; border-bottom: 1px solid rgba(45,42,38,0.06); }
+.report-table td.number { text-align: right; color: #C65D3B; font-weight: 600; }
+.report-footer { margin-top: 3rem; font-size: 0.8rem; color: #8B8680; text-align: center; }
+"""
+
+_DATA = None  # Loaded once in the parent; forked workers inherit it
+
+
+def load_app():
+    """The dashboard module, imported without a Streamlit server (bare mode; its warnings are harmless)."""
+    import app
+    return app
+
+
+def report_data() -> dict:
+    """Cards, analysis and trend data shared by every section."""
+    global _DATA
+    if _DATA is None:
+        app = load_app()
+        data_version = app.get_data_version()
+        analysis_data = app.load_analysis_data(data_version)
+        _DATA = {
+            "df": app.load_csv_data(data_version),
+            "analysis_data": analysis_data,
+            "analysis_lookup": app.load_analysis_lookup(analysis_data, data_version),
+            "trend_data": app.load_trend_data(app.get_trend_file_version()),
+        }
+    return _DATA
+
+
+def report_version() -> str:
+    """Fingerprint of every file the report is built from."""
+    app = load_app()
+    return app.get_file_version((app.CSV_FILE, app.ANALYSIS_FILE, app.TREND_DATA_FILE, app.IMAGES_DIR))
+
+
+def existing_version(output: Path) -> str | None:
+    """Data version recorded in a previously written report, if any."""
+    try:
+        with open(output, "r", encoding="utf-8") as f:
+            match = VERSION_PATTERN.search(f.read(4096))
+    except OSError:
+        return None
+    return match.group(1) if match else None
+
+
+# =============================================================================
+# SECTION BUILDERS
+# =============================================================================
+
+def section_header(number: str, title: str) -> str:
+    return f"""
+    <div class="section-container">
+        <div class="section-header">
+            <span class="section-number">{number}</span>
+            <h2 class="section-title">{title}</h2>
+            <div class="section-line"></div>
+        </div>
+    </div>
+    """
+
+
+def chart(title: str, subtitle: str, fig) -> str:
+    """Chart container heading plus the figure as a plotly.js div (the library is loaded once per page)."""
+    figure_html = "" if fig is None else fig.to_html(
+        full_html=False, include_plotlyjs=False, config=FIGURE_CONFIG, default_width="100%"
+    )
+    return f"""
+    <div class="chart-container">
+        <div class="chart-title">{title}</div>
+        <div class="chart-subtitle">{subtitle}</div>
+    </div>
+    {figure_html}
+    """
+
+
+def finding(value, label: str, detail: str) -> str:
+    return (
+        f'<div class="report-finding"><div class="report-finding-value">{html.escape(str(value))}</div>'
+        f'<div class="report-finding-label">{label}</div>'
+        f'<div class="report-finding-detail">{html.escape(str(detail))}</div></div>'
+    )
+
+
+def build_hero(app, data: dict) -> str:
+    stats = "".join(
+        f'<div class="hero-stat"><div class="hero-stat-value">{value}</div><div class="hero-stat-label">{label}</div></div>'
+        for value, label in app.get_hero_stats(data["df"])
+    )
+    return f'{app.HERO_HEADER}<div class="hero-stats-container report-stats">{stats}</div>'
+
+
+def build_charts(app, data: dict) -> str:
+    df = data["df"]
+    parts = [section_header("01", "Performance Analytics"), '<div class="report-columns"><div>']
+    if not df.empty:
+        parts.append(chart("Top Performers", "The ten most-sent cards this period", app.build_top_performers_figure(df)))
+    parts.append("</div><div>")
+    parts.append(chart("Category Distribution", "Sends by occasion type",
+                       app.build_occasion_donut_figure(df, data["analysis_lookup"])))
+    parts.append("</div></div>")
+
+    history = app.timeseries_store.load_rollup("weekly")
+    if history is not None and len(history["periods"]) >= 2:
+        fig = app.create_time_series_chart(app.timeseries_store.portfolio_series(history), title="")
+        parts.append(chart("Portfolio Trend", "Trailing-year sends across all cards, by weekly export", fig))
+    return "".join(parts)
+
+
+def build_insights(app, data: dict) -> str:
+    analysis_lookup = data["analysis_lookup"]
+    attribute_counts = app.count_card_attributes(analysis_lookup)
+    findings = "".join(finding(*row) for row in app.get_key_findings(attribute_counts, max(1, len(analysis_lookup))))
+    parts = [section_header("02", "Executive Insights"), f'<div class="report-findings">{findings}</div>']
+    if attribute_counts["design_styles"]:
+        parts.append(chart("Design Style Breakdown", "Distribution of visual approaches across all cards",
+                           app.build_style_breakdown_figure(attribute_counts["design_styles"])))
+    return "".join(parts)
+
+
+def build_artists(app, data: dict) -> str:
+    artist_df = app.build_artist_stats(data["analysis_data"], data["df"])
+    if artist_df.empty:
+        return section_header("05", "Artist Performance Intelligence") + "<p>No artist data available.</p>"
+
+    top_artists = artist_df.head(15)
+    rows = "".join(
+        f"<tr><td>{int(row['Rank'])}</td><td>{html.escape(str(row['Artist']))}</td>"
+        f"<td>{int(row['Card Count'])}</td><td>{html.escape(str(row['Primary Style']))}</td>"
+        f"<td class=\"number\">{int(row['Avg Sends per Card']):,}</td><td class=\"number\">{int(row['Total Sends']):,}</td></tr>"
+        for _, row in top_artists.iterrows()
+    )
+    leaderboard = (
+        '<table class="report-table"><tr><th>#</th><th>Artist</th><th>Cards</th><th>Style</th>'
+        f'<th>Avg/Card</th><th>Sends</th></tr>{rows}</table>'
+    )
+    return (
+        section_header("05", "Artist Performance Intelligence")
+        + '<div class="report-columns"><div>'
+        + '<div class="chart-container"><div class="chart-title">Artist Leaderboard</div>'
+        + '<div class="chart-subtitle">Top 15 artists ranked by total sends</div></div>'
+        + leaderboard + "</div><div>"
+        + chart("Top Artists by Total Sends", "Horizontal bar chart visualization", app.build_artist_bar_figure(top_artists))
+        + "</div></div>"
+    )
+
+
+def build_gaps(app, data: dict) -> str:
+    cube = app.load_aggregate_cube(data["analysis_data"], app.get_view_version(data["df"]))
+    combo_cells, count_matrix, sum_matrix = app.build_coverage_matrices(cube)
+    fig = app.build_coverage_heatmap_figure(cube, combo_cells, count_matrix, sum_matrix)
+    empty_cells = int((count_matrix.values == 0).sum())
+    return (
+        section_header("06", "Portfolio Gap Analysis")
+        + chart("Occasion x Design Style Coverage Matrix",
+                f"Cell intensity indicates portfolio depth; {empty_cells} empty cells reveal market opportunities", fig)
+    )
+
+
+def build_trends(app, data: dict) -> str:
+    trend_data = data["trend_data"]
+    portfolio_stats = app.aggregate_portfolio_trends(data["analysis_data"], trend_data)
+    tiers = "".join(finding(portfolio_stats.get(key, 0), label, "cards") for key, label in (
+        ("strong_aligned", "Strong"), ("moderate_aligned", "Moderate"),
+        ("weak_aligned", "Weak"), ("not_aligned", "Not Aligned"),
+    ))
+    leaders = "".join(
+        f"<tr><td>{html.escape(str(card['card_name']))}</td><td class=\"number\">{card['overall_score']:.0f}</td></tr>"
+        for card in portfolio_stats.get("trend_leaders", [])[:5]
+    )
+    return (
+        section_header("08", "Trend Intelligence Hub")
+        + f'<p class="chart-subtitle">Trend data version {html.escape(str(trend_data.get("version", "N/A")))}, '
+        + f'last updated {html.escape(str(trend_data.get("last_updated", "N/A")))}. '
+        + f'Average alignment score {portfolio_stats["average_score"]} across {portfolio_stats["total_cards"]} cards.</p>'
+        + '<div class="report-columns"><div>'
+        + chart("Portfolio Trend Alignment", "Cards per alignment tier", app.build_alignment_donut_figure(portfolio_stats))
+        + f'</div><div><div class="report-findings">{tiers}</div>'
+        + '<table class="report-table"><tr><th>Trend Leaders</th><th>Score</th></tr>' + leaders + "</table>"
+        + "</div></div>"
+    )
+
+
+def build_top_cards(app, data: dict) -> str:
+    """Top cards grid; every thumbnail is a tile of one cached sprite sheet."""
+    top = data["df"].head(TOP_CARDS)
+    entries = [
+        (card_name, str(image_path) if image_path else None)
+        for card_name, image_path in ((name, app.get_card_image_path(name)) for name in top["Card Name"])
+    ]
+    sprite = app.sprite_sheets.load_sprite_sheet("report_top_cards", entries)
+
+    cards = []
+    for _, row in top.iterrows():
+        title = html.escape(str(row["Display Name"])[:45], quote=True)
+        position = app.sprite_sheets.tile_position(sprite, row["Card Name"]) if sprite else None
+        if position:
+            image = f'<div class="sprite-tile sprite-report" role="img" aria-label="{title}" style="background-position: {position};"></div>'
+        else:
+            image = '<div class="no-image-placeholder">No Preview</div>'
+        cards.append(
+            f'<div class="card-item"><div class="card-image-container">{image}'
+            f'<div class="card-occasion-tag">#{int(row["Rank"])}</div></div>'
+            f'<div class="card-info"><div class="card-title">{title}</div>'
+            f'<div class="card-sends"><span class="card-sends-value">{int(row["Current Period"]):,}</span>'
+            f'<span class="card-sends-label">sends</span></div></div></div>'
+        )
+
+    sprite_style = ""
+    if sprite:
+        encoded = base64.b64encode(sprite["image"]).decode()
+        sprite_style = (
+            f'<style>.sprite-report {{ background-image: url(data:{sprite["mime"]};base64,{encoded}); '
+            f'background-size: {sprite["columns"] * 100}% {sprite["rows"] * 100}%; }}</style>'
+        )
+    return (
+        section_header("04", f"Top {len(top)} Cards")
+        + f'{sprite_style}<div class="gallery-grid">{"".join(cards)}</div>'
+    )
+
+
+SECTION_BUILDERS = {
+    "hero": build_hero,
+    "charts": build_charts,
+    "insights": build_insights,
+    "top_cards": build_top_cards,
+    "artists": build_artists,
+    "gaps": build_gaps,
+    "trends": build_trends,
+}
+
+
+def build_section(name: str) -> tuple:
+    """Worker entry point: (section HTML, build seconds)."""
+    started = time.perf_counter()
+    section_html = SECTION_BUILDERS[name](load_app(), report_data())
+    return section_html, time.perf_counter() - started
+
+
+# =============================================================================
+# REPORT
+# =============================================================================
+
+def build_sections(sections: list, workers: int) -> dict:
+    """Build sections in a process pool (forked after the data is loaded, where available)."""
+    report_data()
+    if workers <= 1:
+        return {name: build_section(name) for name in sections}
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = {name: executor.submit(build_section, name) for name in sections}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def render_report(sections: dict, version: str, cdn: bool) -> str:
+    """Assemble the full page around the section HTML."""
+    import dashboard_styles
+
+    if cdn:
+        plotly_js = f'<script src="{PLOTLY_CDN}"></script>'
+    else:
+        from plotly.offline import get_plotlyjs
+        plotly_js = f"<script>{get_plotlyjs()}</script>"
+
+    css = dashboard_styles.minify_css(dashboard_styles.stylesheet_css(embed_fonts=True) + REPORT_CSS)
+    generated = time.strftime("%Y-%m-%d %H:%M")
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="data-version" content="{version}">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Greeting Cards Performance Report</title>
+<style>{css}</style>
+{plotly_js}
+</head>
+<body>
+<div class="report-page">
+{"".join(sections.values())}
+<div class="report-footer">Static report generated {generated}. Open the live dashboard for filters and drill-downs.</div>
+</div>
+</body>
+</html>
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render the dashboard into a self-contained static HTML report.")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Report file to write")
+    parser.add_argument("--workers", type=int, default=min(len(SECTIONS), os.cpu_count() or 1),
+                        help="Worker processes building sections (1 builds in-process)")
+    parser.add_argument("--sections", nargs="+", choices=SECTIONS, default=list(SECTIONS),
+                        help="Sections to include, in page order")
+    parser.add_argument("--cdn", action="store_true", help="Load plotly.js from the CDN instead of inlining it")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if the report is up to date")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    sections = [name for name in SECTIONS if name in args.sections]
+    version = f"{report_version()}:{','.join(sections)}:{'cdn' if args.cdn else 'inline'}"
+    if not args.force and existing_version(args.output) == version:
+        print(f"{args.output} is up to date")
+        return
+
+    if report_data()["df"].empty:
+        print("Unable to load data. Please ensure the CSV file exists.", file=sys.stderr)
+        sys.exit(1)
+
+    built = build_sections(sections, args.workers)
+    for name, (_, seconds) in built.items():
+        print(f"  {name:<10} {seconds:6.2f}s")
+
+    page = render_report({name: section_html for name, (section_html, _) in built.items()}, version, args.cdn)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    temporary = args.output.with_suffix(".tmp")
+    temporary.write_text(page, encoding="utf-8")
+    temporary.replace(args.output)  # Readers never see a half-written report
+    print(f"Wrote {args.output} ({len(page) / 1e6:.1f} MB) in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
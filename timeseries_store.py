@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Append-only per-card sends history.
+
+Each export CSV is ingested as (card_id, day, sends) int32 records appended to
+monthly partition files (timeseries/<series>/sends_YYYY-MM.bin). Weekly and monthly
+rollups are precomputed at ingest time as dense card x period matrices, so the
+dashboard can pull any card's sparkline in constant time.
+
+Exports report trailing-window totals ending on the date in each column
+header, so a record is the card's sends "as of" that day and rollups keep the
+latest value in each period rather than summing.
+
+Each series has its own directory: the all-occasion export feeds the
+"portfolio" series the dashboard reads, while category reports (*_cards.csv)
+count only one occasion's sends and go to a series named after the file
+(birthday_cards.csv -> "birthday"), so they never overwrite portfolio totals.
+
+Ingestion is an explicit step; the dashboard only reads the rollups.
+
+Usage:
+    python timeseries_store.py ingest "Top 300 Cards - 2025.csv"
+    python timeseries_store.py ingest birthday_cards.csv thankyou_cards.csv
+    python timeseries_store.py rebuild
+"""
+
+import hashlib
+import json
+import sys
+from datetime import date, datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = Path(__file__).parent
+STORE_DIR = BASE_DIR / "timeseries"
+MANIFEST_FILE = "manifest.json"
+PORTFOLIO_SERIES = "portfolio"
+PORTFOLIO_DIR = STORE_DIR / PORTFOLIO_SERIES
+CATEGORY_SUFFIX = "_cards"  # Category report file names end with this (birthday_cards.csv)
+
+RECORD_DTYPE = np.dtype([("card_id", "<i4"), ("day", "<i4"), ("sends", "<i4")])
+ROLLUP_FREQUENCIES = ("weekly", "monthly")
+EPOCH = date(1970, 1, 1)
+
+
+# =============================================================================
+# EXPORT PARSING
+# =============================================================================
+
+def parse_window_end(header: str) -> date | None:
+    """
+    Parse the end date of an export column header such as
+    "Jan 12 2025, 12:00AM - Jan 7 2026, 8:39AM". Returns None if it isn't a date range.
+    """
+    if " - " not in str(header):
+        return None
+    end = str(header).split(" - ")[-1].split(",")[0].strip()
+    try:
+        return datetime.strptime(end, "%b %d %Y").date()
+    except ValueError:
+        return None
+
+
+def read_export(csv_path: Path) -> list:
+    """
+    Read an export CSV (Metric, Card Name, one or more date-range sends columns).
+    Returns a list of (day, card_ids int32 array, sends int32 array), one per sends column.
+    """
+    df = pd.read_csv(csv_path)
+    cols = df.columns.tolist()
+    df = df[df[cols[0]] == "Total Events of Sent"]
+    card_ids = pd.to_numeric(df[cols[1]].astype(str).str.split("_").str[0], errors="coerce")
+    valid = card_ids.notna()
+
+    snapshots = []
+    for col in cols[2:]:
+        day = parse_window_end(col)
+        if day is None:
+            continue
+        sends = pd.to_numeric(df[col], errors="coerce").fillna(0)
+        snapshots.append((
+            day,
+            card_ids[valid].to_numpy(dtype=np.int32),
+            sends[valid].to_numpy(dtype=np.int32),
+        ))
+    return snapshots
+
+
+# =============================================================================
+# STORAGE
+# =============================================================================
+
+def export_series(csv_path: Path) -> str:
+    """Series an export belongs to: its occasion for a category report, otherwise the portfolio."""
+    stem = Path(csv_path).stem
+    if stem.endswith(CATEGORY_SUFFIX) and len(stem) > len(CATEGORY_SUFFIX):
+        return stem[:-len(CATEGORY_SUFFIX)]
+    return PORTFOLIO_SERIES
+
+
+def series_dir(series: str = PORTFOLIO_SERIES, store_dir: Path = STORE_DIR) -> Path:
+    """Directory holding one series' partitions, manifest and rollups."""
+    return store_dir / series
+
+
+def rollup_path(frequency: str = "weekly", series: str = PORTFOLIO_SERIES, store_dir: Path = STORE_DIR) -> Path:
+    return series_dir(series, store_dir) / f"rollup_{frequency}.npz"
+
+
+def day_number(day: date) -> int:
+    """Days since 1970-01-01."""
+    return (day - EPOCH).days
+
+
+def partition_path(store_dir: Path, day: int) -> Path:
+    """Monthly partition file holding records for a day number."""
+    month = np.datetime64(int(day), "D").astype("datetime64[M]")
+    return store_dir / f"sends_{month}.bin"
+
+
+def load_manifest(store_dir: Path = PORTFOLIO_DIR) -> dict:
+    """Load a series' ingest manifest (source file hashes already appended)."""
+    path = store_dir / MANIFEST_FILE
+    if not path.exists():
+        return {"ingested": {}}
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def save_manifest(manifest: dict, store_dir: Path = PORTFOLIO_DIR):
+    with open(store_dir / MANIFEST_FILE, "w") as f:
+        json.dump(manifest, f, indent=2)
+
+
+def ingest_export(csv_path: Path, series: str | None = None, store_dir: Path = STORE_DIR) -> int:
+    """
+    Append an export's records to a series (by default export_series(csv_path)) and rebuild
+    its rollups. Files are identified by content hash, so re-ingesting the same export is a no-op.
+    Returns the number of records appended.
+    """
+    csv_path = Path(csv_path)
+    store_dir = series_dir(series or export_series(csv_path), store_dir)
+    store_dir.mkdir(parents=True, exist_ok=True)
+
+    with open(csv_path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    manifest = load_manifest(store_dir)
+    if digest in manifest["ingested"]:
+        return 0
+
+    appended = 0
+    for day, card_ids, sends in read_export(csv_path):
+        if not len(card_ids):
+            continue
+        records = np.empty(len(card_ids), dtype=RECORD_DTYPE)
+        records["card_id"] = card_ids
+        records["day"] = day_number(day)
+        records["sends"] = sends
+        with open(partition_path(store_dir, day_number(day)), "ab") as f:
+            records.tofile(f)
+        appended += len(records)
+
+    manifest["ingested"][digest] = {
+        "file": csv_path.name,
+        "records": appended,
+        "ingested_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    save_manifest(manifest, store_dir)
+    if appended:
+        build_rollups(store_dir)
+    return appended
+
+
+def load_records(store_dir: Path = PORTFOLIO_DIR) -> np.ndarray:
+    """
+    Load a series' records, keeping only the most recently appended value for each (card, day).
+    """
+    parts = [np.fromfile(path, dtype=RECORD_DTYPE) for path in sorted(store_dir.glob("sends_*.bin"))]
+    if not parts:
+        return np.empty(0, dtype=RECORD_DTYPE)
+    records = np.concatenate(parts)
+
+    # Later appends win: dedupe on the reversed array, then restore order
+    reversed_records = records[::-1]
+    keys = reversed_records["card_id"].astype(np.int64) << 32 | reversed_records["day"].astype(np.int64)
+    _, first = np.unique(keys, return_index=True)
+    return reversed_records[np.sort(first)][::-1]
+
+
+# =============================================================================
+# ROLLUPS
+# =============================================================================
+
+def period_start(days: np.ndarray, frequency: str) -> np.ndarray:
+    """Map day numbers to the day number their week (Monday) or month starts on."""
+    if frequency == "weekly":
+        # 1970-01-01 was a Thursday
+        return days - (days + 3) % 7
+    if frequency == "monthly":
+        months = days.astype("datetime64[D]").astype("datetime64[M]")
+        return months.astype("datetime64[D]").astype(np.int32)
+    raise ValueError(f"Unknown rollup frequency: {frequency}")
+
+
+def build_rollups(store_dir: Path = PORTFOLIO_DIR):
+    """Precompute dense card x period matrices (latest value per period, forward-filled)."""
+    records = load_records(store_dir)
+
+    for frequency in ROLLUP_FREQUENCIES:
+        card_ids, card_idx = np.unique(records["card_id"], return_inverse=True)
+        periods = period_start(records["day"], frequency)
+        period_values, period_idx = np.unique(periods, return_inverse=True)
+
+        # Keep the latest day's value for each (card, period)
+        order = np.lexsort((records["day"], period_idx, card_idx))
+        rows, cols = card_idx[order], period_idx[order]
+        last = np.ones(len(order), dtype=bool)
+        last[:-1] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+
+        values = np.zeros((len(card_ids), len(period_values)), dtype=np.int32)
+        observed = np.zeros(values.shape, dtype=bool)
+        values[rows[last], cols[last]] = records["sends"][order][last]
+        observed[rows[last], cols[last]] = True
+
+        # Forward-fill periods with no new export for a card
+        last_seen = np.where(observed, np.arange(len(period_values)), 0)
+        np.maximum.accumulate(last_seen, axis=1, out=last_seen)
+        values = np.take_along_axis(values, last_seen, axis=1)
+
+        np.savez_compressed(
+            store_dir / f"rollup_{frequency}.npz",
+            card_ids=card_ids,
+            periods=period_values.astype("datetime64[D]"),
+            values=values,
+            totals=values.sum(axis=0, dtype=np.int64),
+        )
+
+
+def load_rollup(frequency: str = "weekly", series: str = PORTFOLIO_SERIES,
+                store_dir: Path = STORE_DIR) -> dict | None:
+    """
+    Load a series' precomputed rollup as a dict with card_index, periods, values and totals.
+    Returns None if nothing has been ingested into the series yet.
+    """
+    path = rollup_path(frequency, series, store_dir)
+    if not path.exists():
+        return None
+    with np.load(path) as data:
+        card_ids = data["card_ids"]
+        return {
+            "card_index": {str(card_id): row for row, card_id in enumerate(card_ids)},
+            "periods": pd.to_datetime(data["periods"]),
+            "values": data["values"],
+            "totals": data["totals"],
+        }
+
+
+def card_series(rollup: dict, card_id: str) -> list:
+    """Sends per period for one card (empty if the card has no history)."""
+    row = rollup["card_index"].get(str(card_id))
+    if row is None:
+        return []
+    return rollup["values"][row].tolist()
+
+
+def portfolio_series(rollup: dict) -> pd.DataFrame:
+    """Portfolio-wide sends per period as a DataFrame with date and sends columns."""
+    return pd.DataFrame({"date": rollup["periods"], "sends": rollup["totals"]})
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in ("ingest", "rebuild"):
+        print(__doc__)
+        return
+
+    if sys.argv[1] == "rebuild":
+        for manifest_path in sorted(STORE_DIR.glob(f"*/{MANIFEST_FILE}")):
+            build_rollups(manifest_path.parent)
+            print(f"Rebuilt {manifest_path.parent.name} rollups")
+        return
+
+    for csv_path in sys.argv[2:]:
+        series = export_series(Path(csv_path))
+        appended = ingest_export(Path(csv_path), series)
+        if appended:
+            print(f"Ingested {appended} records from {Path(csv_path).name} into {series}")
+        else:
+            print(f"Skipped {Path(csv_path).name} (already ingested or no sends columns)")
+
+
+if __name__ == "__main__":
+    main()
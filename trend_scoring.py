@@ -0,0 +1,541 @@
+"""
+Trend alignment scoring.
+Scores each card against the trend data (color, style, typography and theme matches) and
+summarizes the portfolio in one pass: tier counts, the running score total, per-trend card
+counts and top/bottom-k heaps. Large portfolios are sharded across a process pool; each
+worker receives the trend data once and returns a partial summary that merges exactly.
+
+Category scores are memoized per trend data section and card attribute (TrendScoreCache),
+so editing one section of the trend file rescores only that category. CategoryScoreMatrix
+holds those scores per card so the overall score can be re-weighted without rescoring.
+"""
+
+import hashlib
+import heapq
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from multiprocessing import get_context
+
+import numpy as np
+
+from vocabulary import COLOR_HEX, normalize_color
+
+LEADER_COUNT = 10
+OPPORTUNITY_TRENDS = 3       # Leading illustration and theme trends checked for coverage gaps
+PARALLEL_MIN_CARDS = 20_000  # Below this, process start-up costs more than it saves
+SHARD_SIZE = 5_000
+CATEGORY_WEIGHTS = {"color": 0.30, "style": 0.30, "typography": 0.15, "theme": 0.25}
+SINGLE_CATEGORY_PENALTY = 0.7  # Overall multiplier when at most one category matches
+MATCH_SCORE = 40               # Category score that counts as a meaningful match
+SCORING_FIELDS = ("card_id", "card_name", "rank", "sends_current",
+                  "primary_colors", "design_style", "typography_style", "themes")
+
+
+def hex_to_rgb(hex_color: str) -> tuple:
+    """Convert hex color to RGB tuple."""
+    hex_color = hex_color.lstrip('#')
+    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+
+
+def calculate_color_similarity(hex1: str, hex2: str) -> float:
+    """Calculate similarity between two hex colors (0-100 scale)."""
+    try:
+        r1, g1, b1 = hex_to_rgb(hex1)
+        r2, g2, b2 = hex_to_rgb(hex2)
+        distance = ((r1-r2)**2 + (g1-g2)**2 + (b1-b2)**2) ** 0.5
+        # Max distance is ~441 (black to white), normalize to 0-100
+        return max(0, 100 - (distance / 441 * 100))
+    except:
+        return 0
+
+
+def color_alignment(card_colors: tuple, trend_data: dict) -> tuple:
+    """(score, matching trends) for a card's colors against the Pantone color and emerging palettes."""
+    color_scores = []
+    matching_trends = []
+
+    # Color trend alignment - check Pantone 2026 match
+    pantone = trend_data.get("color_trends", {}).get("pantone_color_of_year", {}) or {}
+    pantone_hex = pantone.get("hex", "#888888")
+
+    for color_name in card_colors:
+        card_hex = COLOR_HEX.get(normalize_color(color_name), "#888888")
+        if card_hex.startswith("#"):  # Multicolor is a gradient, not one color
+            sim = calculate_color_similarity(card_hex, pantone_hex)
+            # Only count strong color matches (>70% similarity)
+            if sim > 70:
+                color_scores.append(sim)
+                matching_trends.append(f"Pantone {pantone.get('name', '')}")
+
+    # Check emerging palettes - require strong match
+    for palette in (trend_data.get("color_trends", {}).get("emerging_palettes") or []):
+        palette_matches = 0
+        for p_color in (palette.get("colors") or []):
+            for color_name in card_colors:
+                card_hex = COLOR_HEX.get(normalize_color(color_name), "#888888")
+                if card_hex.startswith("#"):
+                    sim = calculate_color_similarity(card_hex, p_color.get("hex", "#888888"))
+                    if sim > 75:
+                        palette_matches += 1
+        # Award points based on how many palette colors match
+        if palette_matches >= 2:
+            color_scores.append(min(90, 50 + palette_matches * 15))
+            matching_trends.append(palette.get("name", ""))
+        elif palette_matches == 1:
+            color_scores.append(40)
+
+    return (max(color_scores) if color_scores else 0), matching_trends
+
+
+def style_alignment(design_style: str, trend_data: dict) -> tuple:
+    """(score, matching trends) for a card's design style against the illustration trends."""
+    style_scores = []
+    matching_trends = []
+
+    # Style trend alignment - stricter matching
+    card_style = design_style.lower()
+    if card_style:
+        for trend in (trend_data.get("illustration_trends") or []):
+            compatible = [s.lower() for s in (trend.get("compatible_styles") or [])]
+            # Exact match in compatible styles
+            if card_style in compatible:
+                # Score based on how specific the match is (not just raw weight)
+                base_score = 70 + (len(compatible) <= 3) * 15  # More specific = higher score
+                style_scores.append(base_score)
+                matching_trends.append(trend.get("name", ""))
+            # Partial match
+            elif any(card_style in c or c in card_style for c in compatible):
+                style_scores.append(40)
+
+    return (max(style_scores) if style_scores else 0), matching_trends
+
+
+def typography_alignment(typography_style: str, trend_data: dict) -> tuple:
+    """(score, matching trends) for a card's typography against the typography trends."""
+    typo_scores = []
+    matching_trends = []
+
+    card_typo = typography_style.lower()
+    if card_typo:
+        for trend in (trend_data.get("typography_trends") or []):
+            compatible = [t.lower() for t in (trend.get("compatible_typography") or [])]
+            if card_typo in compatible:
+                typo_scores.append(75)
+                matching_trends.append(trend.get("name", ""))
+            elif any(card_typo in c or c in card_typo for c in compatible):
+                typo_scores.append(40)
+
+    return (max(typo_scores) if typo_scores else 0), matching_trends
+
+
+def theme_alignment(themes: tuple, trend_data: dict) -> tuple:
+    """(score, matching trends) for a card's themes against the theme and motif trends."""
+    theme_scores = []
+    matching_trends = []
+
+    # Theme trend alignment - based on keyword overlap percentage
+    card_themes = [t.lower() for t in themes]
+    if card_themes:
+        for trend in (trend_data.get("theme_motif_trends") or []):
+            keywords = [k.lower() for k in (trend.get("keywords") or [])]
+            compatible = [t.lower() for t in (trend.get("compatible_themes") or [])]
+            all_trend_terms = set(keywords) | set(compatible)
+            matches = set(card_themes) & all_trend_terms
+
+            if matches:
+                # Score based on match percentage, not raw weight
+                match_ratio = len(matches) / max(len(card_themes), 1)
+                coverage_ratio = len(matches) / max(len(all_trend_terms), 1)
+
+                # Require meaningful overlap
+                if match_ratio >= 0.3 and len(matches) >= 2:
+                    score = min(85, 40 + match_ratio * 30 + coverage_ratio * 20)
+                    theme_scores.append(score)
+                    matching_trends.append(trend.get("name", ""))
+                elif len(matches) >= 1:
+                    theme_scores.append(25 + match_ratio * 20)
+
+    return (max(theme_scores) if theme_scores else 0), matching_trends
+
+
+# Per category: scorer, the card field it reads and the trend data sections it depends on
+CATEGORY_SCORERS = {
+    "color": color_alignment,
+    "style": style_alignment,
+    "typography": typography_alignment,
+    "theme": theme_alignment,
+}
+CATEGORY_FIELDS = {
+    "color": "primary_colors",
+    "style": "design_style",
+    "typography": "typography_style",
+    "theme": "themes",
+}
+CATEGORY_SECTIONS = {
+    "color": ("color_trends",),
+    "style": ("illustration_trends",),
+    "typography": ("typography_trends",),
+    "theme": ("theme_motif_trends",),
+}
+
+
+def category_input(card_data: dict, category: str):
+    """The (hashable) card attribute a category is scored from."""
+    value = card_data.get(CATEGORY_FIELDS[category])
+    if category in ("color", "theme"):
+        return tuple(value or ())
+    return value or ""
+
+
+def section_hash(trend_data: dict, category: str) -> str:
+    """Fingerprint of the trend data sections a category's scores depend on."""
+    sections = {key: trend_data.get(key) for key in CATEGORY_SECTIONS[category]}
+    return hashlib.sha256(json.dumps(sections, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class TrendScoreCache:
+    """
+    Memo of category scores, keyed by the hash of the category's trend sections and then by
+    the card attribute scored.
+
+    Editing one trend section only invalidates that category, and a new card is scored
+    only for attribute values no earlier card had. The last max_versions section versions
+    per category are kept, so switching back to a recent trend file is free.
+    """
+
+    def __init__(self, max_versions: int = 2):
+        self.max_versions = max_versions
+        self._tables = {category: OrderedDict() for category in CATEGORY_SCORERS}
+        self._lock = threading.Lock()
+
+    def tables(self, trend_data: dict) -> dict:
+        """{category: {attribute value: (score, matching trends)}} for the given trend data."""
+        tables = {}
+        with self._lock:
+            for category, versions in self._tables.items():
+                key = section_hash(trend_data, category)
+                if key in versions:
+                    versions.move_to_end(key)
+                else:
+                    versions[key] = {}
+                    while len(versions) > self.max_versions:
+                        versions.popitem(last=False)
+                tables[category] = versions[key]
+        return tables
+
+
+def combine_alignment(categories: dict) -> dict:
+    """Weighted overall alignment from the per-category (score, matching trends) results."""
+    color_score, style_score, typo_score, theme_score = (
+        categories[category][0] for category in ("color", "style", "typography", "theme")
+    )
+    matching_trends = [name for _, names in categories.values() for name in names]
+
+    # Count how many categories have meaningful matches
+    categories_matched = sum([
+        color_score >= MATCH_SCORE,
+        style_score >= MATCH_SCORE,
+        typo_score >= MATCH_SCORE,
+        theme_score >= MATCH_SCORE
+    ])
+
+    # Weighted overall score with bonus for multi-category alignment
+    base_overall = (color_score * CATEGORY_WEIGHTS["color"] + style_score * CATEGORY_WEIGHTS["style"] +
+                    typo_score * CATEGORY_WEIGHTS["typography"] + theme_score * CATEGORY_WEIGHTS["theme"])
+
+    # Apply penalty if only 1 category matches (single-dimension alignment)
+    if categories_matched <= 1:
+        overall = base_overall * SINGLE_CATEGORY_PENALTY
+    else:
+        overall = base_overall
+
+    return {
+        "color_score": round(color_score, 1),
+        "style_score": round(style_score, 1),
+        "typography_score": round(typo_score, 1),
+        "theme_score": round(theme_score, 1),
+        "overall_score": round(overall, 1),
+        "categories_matched": categories_matched,
+        "matching_trends": list(dict.fromkeys(matching_trends))[:5]  # First-seen order, the same in every process
+    }
+
+
+def get_card_trend_alignment(card_data: dict, trend_data: dict, tables: dict | None = None) -> dict:
+    """Calculate how well a card aligns with current trends.
+
+    Scoring methodology:
+    - Each category scored 0-100 based on match quality
+    - No match = 0, partial match = 30-60, strong match = 60-90, exact match = 90-100
+    - Overall score is weighted average requiring multiple category matches for high scores
+
+    tables (from TrendScoreCache.tables) memoizes category scores across cards and calls.
+    """
+    return combine_alignment(category_scores(card_data, trend_data, tables))
+
+
+def category_scores(card_data: dict, trend_data: dict, tables: dict | None = None) -> dict:
+    """{category: (score, matching trends)} for one card, memoized in tables when given."""
+    categories = {}
+    for category, scorer in CATEGORY_SCORERS.items():
+        value = category_input(card_data, category)
+        if tables is None:
+            categories[category] = scorer(value, trend_data)
+            continue
+        table = tables[category]
+        result = table.get(value)
+        if result is None:
+            result = table[value] = scorer(value, trend_data)
+        categories[category] = result
+    return categories
+
+
+# =============================================================================
+# WEIGHT SIMULATION
+# =============================================================================
+
+def weight_grid(step: float = 0.05) -> np.ndarray:
+    """Every category weight vector on a step grid that sums to 1, as rows (color, style, typography, theme)."""
+    n = round(1 / step)
+    rows = [(a, b, c, n - a - b - c) for a in range(n + 1) for b in range(n + 1 - a) for c in range(n + 1 - a - b)]
+    return np.array(rows, dtype=np.float64) / n
+
+
+class CategoryScoreMatrix:
+    """
+    Per-card category scores (cards x categories, columns in CATEGORY_SCORERS order).
+
+    The overall score for any weight vector is scores @ weights with the single-category
+    penalty applied, so a whole grid of weight vectors is one matrix product and tier counts,
+    leaders and laggards can be recomputed without rescoring a card.
+    """
+
+    def __init__(self, scores: np.ndarray, cards: list):
+        self.scores = scores
+        self.cards = cards  # card_name, card_id, sends, rank per row
+        self.matched = (scores >= MATCH_SCORE).sum(axis=1)
+        self.single = self.matched <= 1
+
+    @classmethod
+    def from_cards(cls, cards, trend_data: dict, tables: dict | None = None) -> "CategoryScoreMatrix":
+        if tables is None:
+            tables = {category: {} for category in CATEGORY_SCORERS}
+        rows, info = [], []
+        for card in cards:
+            categories = category_scores(card, trend_data, tables)
+            rows.append([categories[category][0] for category in CATEGORY_SCORERS])
+            info.append({
+                "card_name": card.get("card_name", "Unknown"),
+                "card_id": card.get("card_id", ""),
+                "sends": card.get("sends_current", 0),
+                "rank": card.get("rank", 999),
+            })
+        scores = np.array(rows, dtype=np.float64).reshape(len(rows), len(CATEGORY_SCORERS))
+        return cls(scores, info)
+
+    def __len__(self):
+        return len(self.cards)
+
+    def overall(self, weights, penalty: float = SINGLE_CATEGORY_PENALTY) -> np.ndarray:
+        """Overall scores (rounded like the dashboard's), one row per weight vector."""
+        weights = np.atleast_2d(np.asarray(weights, dtype=np.float64))
+        overall = weights @ self.scores.T
+        return np.round(np.where(self.single, overall * penalty, overall), 1)
+
+    def tier_counts(self, overall: np.ndarray) -> dict:
+        """Cards per alignment tier for each row of overall scores (same thresholds as alignment_tier)."""
+        strong = overall >= 60
+        multi = self.matched >= 2
+        return {
+            "strong_aligned": (strong & multi).sum(axis=1),
+            "moderate_aligned": ((overall >= 40) & ~(strong & multi)).sum(axis=1),
+            "weak_aligned": ((overall >= 20) & (overall < 40)).sum(axis=1),
+            "not_aligned": (overall < 20).sum(axis=1),
+        }
+
+    def sweep(self, weight_grid: np.ndarray, penalty: float = SINGLE_CATEGORY_PENALTY) -> dict:
+        """Tier counts and average score for every weight vector in the grid (arrays over grid rows)."""
+        overall = self.overall(weight_grid, penalty)
+        return {
+            **self.tier_counts(overall),
+            "average_score": overall.mean(axis=1) if len(self) else np.zeros(len(overall)),
+        }
+
+    def summarize(self, weights, penalty: float = SINGLE_CATEGORY_PENALTY) -> dict:
+        """Tier counts, average score, leaders and laggards under one weight vector."""
+        overall = self.overall(weights, penalty)[0]
+        tiers = {key: int(counts[0]) for key, counts in self.tier_counts(overall[None, :]).items()}
+        # Highest score first, ties in portfolio order (as the stable sort in the hub)
+        order = np.lexsort((np.arange(len(overall)), -overall))
+        ranked = lambda rows: [{**self.cards[i], "overall_score": float(overall[i])} for i in rows.tolist()]
+        total = len(overall)
+        return {
+            "total_cards": total,
+            "average_score": round(float(overall.mean()), 1) if total else 0,
+            **tiers,
+            "aligned_pct": round(tiers["strong_aligned"] / total * 100, 1) if total else 0,
+            "trend_leaders": ranked(order[:LEADER_COUNT]),
+            "trend_laggards": ranked(order[-LEADER_COUNT:]),
+        }
+
+
+# =============================================================================
+# PORTFOLIO SUMMARY
+# =============================================================================
+
+def alignment_tier(alignment: dict) -> str:
+    """Strong / moderate / weak / not aligned, using the stricter multi-category thresholds."""
+    score = alignment["overall_score"]
+    if score >= 60:
+        return "strong_aligned" if alignment.get("categories_matched", 0) >= 2 else "moderate_aligned"
+    if score >= 40:
+        return "moderate_aligned"
+    if score >= 20:
+        return "weak_aligned"
+    return "not_aligned"
+
+
+def opportunity_trends(trend_data: dict) -> list:
+    """(trend, card threshold) for the trends whose coverage is checked for opportunities."""
+    return (
+        [(trend, 10) for trend in (trend_data.get("illustration_trends") or [])[:OPPORTUNITY_TRENDS]]
+        + [(trend, 15) for trend in (trend_data.get("theme_motif_trends") or [])[:OPPORTUNITY_TRENDS]]
+    )
+
+
+def score_shard(cards, start: int, trend_data: dict, tables: dict) -> dict:
+    """
+    Score a run of cards in one pass into a mergeable partial summary.
+    Heap entries are (score, -position, alignment) so ties keep portfolio order.
+    """
+    tiers = {"strong_aligned": 0, "moderate_aligned": 0, "weak_aligned": 0, "not_aligned": 0}
+    trend_cards = dict.fromkeys((trend.get("name", "") for trend, _ in opportunity_trends(trend_data)), 0)
+    score_sum = 0.0
+    leaders, laggards = [], []
+    count = 0
+
+    for position, card in enumerate(cards, start):
+        alignment = {
+            "card_name": card.get("card_name", "Unknown"),
+            "card_id": card.get("card_id", ""),
+            "sends": card.get("sends_current", 0),
+            "rank": card.get("rank", 999),
+            **get_card_trend_alignment(card, trend_data, tables)
+        }
+        score = alignment["overall_score"]
+        score_sum += score
+        tiers[alignment_tier(alignment)] += 1
+        for name in trend_cards:
+            if name in alignment["matching_trends"]:
+                trend_cards[name] += 1
+
+        # Min-heaps keeping the k highest (score, -position) and the k lowest via negation
+        push = heapq.heappush if len(leaders) < LEADER_COUNT else heapq.heappushpop
+        push(leaders, (score, -position, alignment))
+        push(laggards, (-score, position, alignment))
+        count += 1
+
+    return {
+        "count": count,
+        "score_sum": score_sum,
+        "tiers": tiers,
+        "trend_cards": trend_cards,
+        "leaders": leaders,
+        "laggards": [(-score, -position, alignment) for score, position, alignment in laggards],
+    }
+
+
+def merge_shards(shards: list, trend_data: dict) -> dict:
+    """Combine partial summaries into the portfolio stats the Trend Intelligence Hub shows."""
+    total = sum(shard["count"] for shard in shards)
+    tiers = {key: sum(shard["tiers"][key] for shard in shards) for key in shards[0]["tiers"]} if shards else {}
+    key = lambda entry: entry[:2]
+    leaders = heapq.nlargest(LEADER_COUNT, (e for shard in shards for e in shard["leaders"]), key=key)
+    laggards = heapq.nsmallest(LEADER_COUNT, (e for shard in shards for e in shard["laggards"]), key=key)[::-1]
+
+    # Opportunities - trends with high relevance but low card coverage
+    opportunities = []
+    for trend, threshold in opportunity_trends(trend_data):
+        name = trend.get("name", "")
+        your_cards = sum(shard["trend_cards"][name] for shard in shards)
+        relevance = trend.get("relevance_weight", trend.get("popularity_score", 0))
+        if your_cards < threshold:
+            opportunities.append({
+                "trend": name,
+                "relevance": relevance,
+                "your_cards": your_cards,
+                "opportunity": "High" if relevance > 85 else "Medium"
+            })
+
+    strong_aligned = tiers.get("strong_aligned", 0)
+    avg_score = sum(shard["score_sum"] for shard in shards) / total if total else 0
+    return {
+        "total_cards": total,
+        "average_score": round(avg_score, 1),
+        "strong_aligned": strong_aligned,
+        "moderate_aligned": tiers.get("moderate_aligned", 0),
+        "weak_aligned": tiers.get("weak_aligned", 0),
+        "not_aligned": tiers.get("not_aligned", 0),
+        "aligned_count": strong_aligned,  # For backward compat, use strong as "aligned"
+        "aligned_pct": round(strong_aligned / total * 100, 1) if total else 0,
+        "trend_leaders": [alignment for _, _, alignment in leaders],
+        "trend_laggards": [alignment for _, _, alignment in laggards],
+        "opportunities": opportunities[:5]
+    }
+
+
+_WORKER_TRENDS = None  # Trend data and score tables sent once per worker process
+_WORKER_TABLES = None
+
+
+def init_worker(trend_data: dict, tables: dict):
+    global _WORKER_TRENDS, _WORKER_TABLES
+    _WORKER_TRENDS, _WORKER_TABLES = trend_data, tables
+
+
+def score_worker_shard(cards: list, start: int) -> dict:
+    sizes = {category: len(table) for category, table in _WORKER_TABLES.items()}
+    shard = score_shard(cards, start, _WORKER_TRENDS, _WORKER_TABLES)
+    # Category scores first computed for this shard, returned so the parent's cache keeps them
+    shard["scored"] = {
+        category: dict(islice(table.items(), sizes[category], None)) for category, table in _WORKER_TABLES.items()
+    }
+    return shard
+
+
+def aggregate_portfolio_trends(cards, trend_data: dict, workers: int | None = None,
+                               score_cache: TrendScoreCache | None = None) -> dict:
+    """
+    Analyze the entire portfolio against trends.
+    workers=None scores in-process below PARALLEL_MIN_CARDS and on every CPU above it.
+    Workers are spawned (not forked), so this is safe to call from the threaded Streamlit server.
+    score_cache carries category scores over from earlier calls; without one, scores are
+    still shared between cards with the same attributes within this call.
+    """
+    cards = list(cards)
+    if score_cache is not None:
+        tables = score_cache.tables(trend_data)
+    else:
+        tables = {category: {} for category in CATEGORY_SCORERS}
+    if workers is None:
+        workers = (os.cpu_count() or 1) if len(cards) >= PARALLEL_MIN_CARDS else 1
+    if workers <= 1 or len(cards) <= SHARD_SIZE:
+        return merge_shards([score_shard(cards, 0, trend_data, tables)], trend_data)
+
+    starts = range(0, len(cards), SHARD_SIZE)
+    snapshot = {category: dict(table) for category, table in tables.items()}
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"),
+                             initializer=init_worker, initargs=(trend_data, snapshot)) as executor:
+        shards = list(executor.map(
+            score_worker_shard,
+            ([{field: card[field] for field in SCORING_FIELDS if field in card} for card in cards[start:start + SHARD_SIZE]]
+             for start in starts),
+            starts,
+        ))
+    for shard in shards:
+        for category, scored in shard.pop("scored").items():
+            tables[category].update(scored)
+    return merge_shards(shards, trend_data)
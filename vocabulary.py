@@ -0,0 +1,164 @@
+"""
+Canonical vocabulary for card attributes.
+Normalizes colors, themes and style-like keys (occasion, design style, typography) once at
+ingest, interns them as process-wide integer codes, and holds the single color -> hex table
+used for swatches, charts, trend color similarity and color extraction, plus the known
+artist/studio names.
+"""
+
+import re
+import sys
+import threading
+from typing import Dict, List
+
+# Canonical color names and their colors: swatches, chart marks, trend similarity and the
+# palette extract_colors.py names pixels against. Multicolor has no single RGB value.
+COLOR_HEX = {
+    "white": "#FFFFFF", "cloud dancer": "#F0EEE9", "cream": "#FFFDD0", "ivory": "#FFFFF0",
+    "off-white": "#FAF9F6", "beige": "#F5F5DC", "tan": "#D2B48C", "pink": "#FFC0CB",
+    "hot pink": "#FF69B4", "blush": "#DE5D83", "coral": "#FF7F50", "salmon": "#FA8072",
+    "red": "#DC143C", "burgundy": "#800020", "maroon": "#800000", "orange": "#FF8C00",
+    "peach": "#FFCBA4", "gold": "#FFD700", "yellow": "#FFD93D", "mustard": "#FFDB58",
+    "brown": "#8B4513", "terracotta": "#C65D3B", "green": "#228B22", "sage": "#9DC183",
+    "mint": "#98FF98", "teal": "#008080", "turquoise": "#40E0D0", "blue": "#4169E1",
+    "navy": "#000080", "sky blue": "#87CEEB", "lavender": "#E6E6FA", "purple": "#9370DB",
+    "violet": "#8B00FF", "plum": "#DDA0DD", "magenta": "#FF00FF", "black": "#000000",
+    "gray": "#808080", "silver": "#C0C0C0",
+    "multicolor": "linear-gradient(90deg, #FF6B6B, #4ECDC4, #45B7D1)",
+}
+DEFAULT_HEX = "#CCC"
+MULTICOLOR_SOLID = "#9B59B6"  # Stand-in for the multicolor gradient where a solid color is required
+CHART_WHITE = "#E8E8E8"       # White bars/markers would disappear on the cream background
+LIGHT_COLORS = {"white", "cloud dancer", "cream", "ivory", "off-white", "beige"}
+
+# Spelling variants that name the same color
+COLOR_ALIASES = {
+    "sage green": "sage",
+    "navy blue": "navy",
+    "mint green": "mint",
+    "olive green": "olive",
+    "grey": "gray",
+    "multi color": "multicolor",
+    "multi-color": "multicolor",
+    "rainbow": "multicolor",
+}
+
+# Known artist names and studio brands for extraction
+KNOWN_ARTISTS = (
+    "Paper&Stuff", "Spaghetti & Meatballs", "Karen Schipper", "Melanie Johnsson",
+    "Darlin' Spotted", "Aviva Atri", "Poketo", "jordan gadeke", "Jordan Gadeke",
+    "Lucy Maggie", "Emily McDowell", "Rifle Paper Co", "Lisa Congdon",
+    "Jess Phoenix", "Red Cap Cards", "Wrap Magazine", "1canoe2", "Egg Press",
+    "Idlewild Co", "Slightly Stationery", "Dahlia Press", "Clap Clap Design",
+    "Good Paper", "The Good Twin", "Belle & Union", "Bench Pressed",
+    "Ladyfingers Letterpress", "Paper Bandit Press", "Printerette Press",
+    "Blackbird Letterpress", "Hello Lucky", "Igloo Letterpress", "Paper Parasol Press",
+    "Sapling Press", "The Social Type", "Wit & Whistle", "Yellow Owl Workshop",
+    "Moglea", "Shorthand Press", "Thimblepress", "The Paper Cub",
+    "Antiquaria", "Ilee Papergoods", "Pike Street Press", "Fugu Fugu Press",
+    "The Little Red House", "Sycamore Street Press", "Happy Cactus Designs",
+    "Quill & Fox", "Calliope Paperie", "Olive & Company", "E. Frances Paper",
+    "Bloomwolf Studio", "Girl w/ Knife", "Elana Gabrielle", "Hatch Inc",
+    "Fifty Five Hi's", "Ramona & Ruth", "And Here We Are", "Ohh Deer",
+    "Gemma Correll", "Able & Game", "La Familia Green", "Near Modern Disaster"
+)
+KNOWN_ARTISTS_LOWER = tuple((artist, artist.lower()) for artist in KNOWN_ARTISTS)
+
+# Common card title endings that are never an artist name
+TITLE_SKIP_WORDS = (
+    "birthday", "cake", "wishes", "day", "happy", "you", "love",
+    "thanks", "thank", "card", "gradient", "balloon", "floral",
+    "flowers", "hearts", "confetti", "party", "celebration",
+)
+
+
+def normalize_color(value) -> str:
+    """Canonical color name: lowercase, spaces instead of underscores, aliases resolved."""
+    name = re.sub(r"[\s_]+", " ", str(value).strip().lower())
+    return COLOR_ALIASES.get(name, name)
+
+
+def normalize_theme(value) -> str:
+    """Canonical theme: lowercase with collapsed whitespace."""
+    return re.sub(r"\s+", " ", str(value).strip().lower())
+
+
+def normalize_key(value) -> str:
+    """Canonical snake_case key for occasion, design style and typography values."""
+    return re.sub(r"[\s\-]+", "_", str(value).strip().lower())
+
+
+class Vocabulary:
+    """Interns normalized values of one attribute as small integer codes."""
+
+    __slots__ = ("values", "codes", "lock")
+
+    def __init__(self, values: List = ()):
+        self.values: List = []
+        self.codes: Dict = {}
+        self.lock = threading.Lock()
+        for value in values:
+            self.code(value)
+
+    def code(self, value) -> int:
+        """Return the code for a value, adding it if new."""
+        code = self.codes.get(value)
+        if code is None:
+            with self.lock:
+                code = self.codes.get(value)
+                if code is None:
+                    code = len(self.values)
+                    self.values.append(sys.intern(value) if isinstance(value, str) else value)
+                    self.codes[value] = code
+        return code
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getstate__(self):
+        return self.values, self.codes
+
+    def __setstate__(self, state):
+        self.values, self.codes = state
+        self.lock = threading.Lock()
+
+
+# Process-wide vocabularies, so codes are comparable across tables and caches
+VOCABULARIES = {
+    "occasion": Vocabulary(),
+    "design_style": Vocabulary(),
+    "typography_style": Vocabulary(),
+    "primary_colors": Vocabulary(COLOR_HEX),
+    "themes": Vocabulary(),
+}
+
+NORMALIZERS = {
+    "occasion": normalize_key,
+    "design_style": normalize_key,
+    "typography_style": normalize_key,
+    "primary_colors": normalize_color,
+    "themes": normalize_theme,
+}
+
+
+def color_hex(name, default: str = DEFAULT_HEX) -> str:
+    """Swatch color (hex or CSS gradient) for any spelling of a color name."""
+    return COLOR_HEX.get(normalize_color(name), default)
+
+
+def chart_color(name, default: str = DEFAULT_HEX) -> str:
+    """Solid color for chart marks, with readable stand-ins for white and multicolor."""
+    color = normalize_color(name)
+    if color == "white":
+        return CHART_WHITE
+    hex_value = COLOR_HEX.get(color, default)
+    return MULTICOLOR_SOLID if "gradient" in hex_value else hex_value
+
+
+def swatch_css(name) -> str:
+    """Inline CSS (background plus a border for light colors) for a round color swatch."""
+    color = normalize_color(name)
+    hex_value = COLOR_HEX.get(color, DEFAULT_HEX)
+    background = f"background: {hex_value};" if "gradient" in hex_value else f"background-color: {hex_value};"
+    border = "border: 1px solid #DDD;" if color in LIGHT_COLORS else ""
+    return f"{background} {border}"